@@ -0,0 +1,200 @@
+"""application/analytics_service.py"""
+
+from datetime import datetime, timedelta
+import numpy as np
+
+from domain.booking_repository import to_epoch
+from domain.space_meetingroom import SpaceMeetingRoom
+
+_HOUR = 3600
+_DAY = 24 * _HOUR
+_BUCKETS = {"hour": _HOUR, "day": _DAY}
+
+
+def occupied_seconds(groups, starts, ends, n_groups, t0, bucket_seconds, n_buckets):
+    """Computes the booked seconds of every group in every time bucket.
+
+    The timelines of all groups are laid end to end (group ``g`` is shifted
+    by ``g`` times the window length), so a single sorted pass covers them
+    all. For any instant ``t`` the total booked time before ``t`` is
+    ``sum(t - s for s < t) - sum(t - e for e < t)``, which ``searchsorted``
+    and ``cumsum`` over the sorted starts and ends evaluate at every bucket
+    edge at once. Bucket occupancy is the difference between consecutive edges.
+
+    Args:
+        groups: Integer array with the group index of each interval.
+        starts: Epoch seconds where each interval starts.
+        ends: Epoch seconds where each interval ends.
+        n_groups: Number of groups.
+        t0: Epoch seconds of the first bucket edge.
+        bucket_seconds: Width of a bucket in seconds.
+        n_buckets: Number of buckets.
+
+    Returns:
+        A ``(n_groups, n_buckets)`` int64 array of booked seconds.
+    """
+    span = bucket_seconds * n_buckets
+    offsets = groups.astype(np.int64) * span
+    starts = np.clip(starts - t0, 0, span) + offsets
+    ends = np.clip(ends - t0, 0, span) + offsets
+    starts.sort()
+    ends.sort()
+
+    edges = (np.arange(n_groups, dtype=np.int64)[:, None] * span
+             + np.arange(n_buckets + 1, dtype=np.int64) * bucket_seconds).ravel()
+    booked_before = (_sum_elapsed(starts, edges) - _sum_elapsed(ends, edges)).reshape(n_groups, n_buckets + 1)
+    return np.diff(booked_before, axis=1)
+
+
+def hour_of_day_seconds(groups, starts, ends, n_groups, t0, n_days):
+    """Computes the booked seconds of every group in each hour of the day.
+
+    Each interval is clipped to the window and folded onto a single day:
+    every whole day it spans adds an hour to each hour of the day, and the
+    remainder (shorter than a day) is split at midnight into at most two
+    pieces. The pieces are then bucketed with ``occupied_seconds`` over one
+    day, so memory grows with the intervals, not with the window length.
+
+    Args:
+        groups: Integer array with the group index of each interval.
+        starts: Epoch seconds where each interval starts.
+        ends: Epoch seconds where each interval ends.
+        n_groups: Number of groups.
+        t0: Epoch seconds of the window start (a midnight).
+        n_days: Length of the window in days.
+
+    Returns:
+        A ``(n_groups, 24)`` int64 array of booked seconds.
+    """
+    starts = np.clip(starts - t0, 0, n_days * _DAY)
+    lengths = np.clip(ends - t0, 0, n_days * _DAY) - starts
+    whole_days, remainders = np.divmod(lengths, _DAY)
+    heads = starts % _DAY
+    tails = heads + remainders
+    pieces = occupied_seconds(np.concatenate((groups, groups)),
+                              np.concatenate((heads, np.zeros_like(heads))),
+                              np.concatenate((np.minimum(tails, _DAY), np.maximum(tails - _DAY, 0))),
+                              n_groups, 0, _HOUR, 24)
+    return pieces + np.bincount(groups, weights=whole_days, minlength=n_groups).astype(np.int64)[:, None] * _HOUR
+
+
+def _sum_elapsed(times, edges):
+    """Returns ``sum(edge - t for t in times if t < edge)`` for every edge."""
+    prefix = np.concatenate(([0], np.cumsum(times)))
+    counts = np.searchsorted(times, edges, side="left")
+    return edges * counts - prefix[counts]
+
+
+class AnalyticsService:
+    """Application service computing occupancy and utilization statistics.
+
+    Bookings are loaded as epoch arrays through the booking repository and
+    aggregated with vectorized NumPy operations, so a year of history for
+    hundreds of rooms is processed without looping over bookings in Python.
+
+    Args:
+        booking_repo: Repository providing booking intervals as arrays.
+        space_repo: Repository providing the spaces (and their floors).
+    """
+
+    GROUP_BY_SPACE, GROUP_BY_FLOOR = "space", "floor"
+    NO_FLOOR = "-"
+    MAX_RANGE_DAYS = 366
+
+    def __init__(self, booking_repo, space_repo):
+        """Initializes the analytics service with its repositories.
+
+        Args:
+            booking_repo: Repository used to load booking intervals.
+            space_repo: Repository used to list spaces.
+        """
+        self._booking_repo = booking_repo
+        self._space_repo = space_repo
+
+    def occupancy(self, start_time: datetime, end_time: datetime, bucket="hour", group_by="space"):
+        """Computes occupancy per space or floor over a time range.
+
+        The range is aligned to whole days and limited to ``MAX_RANGE_DAYS``.
+        Cancelled bookings are ignored; active and finished bookings count as
+        occupied time. Only the requested buckets and a 24-hour profile per
+        group are computed, so a day series does not build an hourly one.
+
+        Args:
+            start_time: Start of the range (floored to midnight).
+            end_time: End of the range (ceiled to the next midnight).
+            bucket: "hour" or "day"; size of the occupancy series buckets.
+            group_by: "space" or "floor".
+
+        Returns:
+            A dictionary with the aligned range, the bucket edges and one entry
+            per group with its occupancy series (occupied fraction of each
+            bucket, averaged over the spaces of the group), its overall
+            utilization, its busiest hour of the day and its hour-of-day
+            profile. The busiest hour across all spaces is also included.
+
+        Raises:
+            ValueError: If the range is empty or longer than ``MAX_RANGE_DAYS``,
+                or bucket/group_by are unknown.
+        """
+        if bucket not in _BUCKETS:
+            raise ValueError(f"Unknown bucket '{bucket}'. Use one of: {', '.join(_BUCKETS)}.")
+        if group_by not in (self.GROUP_BY_SPACE, self.GROUP_BY_FLOOR):
+            raise ValueError(f"Unknown grouping '{group_by}'. Use 'space' or 'floor'.")
+        first_day = datetime.combine(start_time.date(), datetime.min.time())
+        last_day = datetime.combine(end_time.date(), datetime.min.time())
+        if last_day < end_time:
+            last_day += timedelta(days=1)
+        days = (last_day - first_day).days
+        if days < 1 or start_time >= end_time:
+            raise ValueError("Start time must be before end time.")
+        if days > self.MAX_RANGE_DAYS:
+            raise ValueError(f"The range cannot exceed {self.MAX_RANGE_DAYS} days.")
+
+        labels, space_group = self._groups(group_by)
+        space_ids, starts, ends = self._booking_repo.load_intervals(first_day, last_day)
+        known = np.isin(space_ids, list(space_group))
+        unique_ids, inverse = np.unique(space_ids[known], return_inverse=True)
+        groups = np.array([space_group[space_id] for space_id in unique_ids], dtype=np.int64)[inverse]
+
+        starts, ends, t0 = starts[known], ends[known], to_epoch(first_day)
+        width = _BUCKETS[bucket]
+        series = occupied_seconds(groups, starts, ends, len(labels), t0, width, days * _DAY // width)
+        profile = hour_of_day_seconds(groups, starts, ends, len(labels), t0, days)
+        occupied = series.sum(axis=1)
+        sizes = np.bincount(list(space_group.values()), minlength=len(labels)).astype(float)
+        series_ratio = series / (width * sizes[:, None])
+        utilization = occupied / (days * _DAY * sizes)
+
+        return {
+            "start_time": first_day.isoformat(),
+            "end_time": last_day.isoformat(),
+            "bucket": bucket,
+            "group_by": group_by,
+            "bucket_starts": [(first_day + timedelta(seconds=width * i)).isoformat()
+                              for i in range(series.shape[1])],
+            "peak_hour": int(profile.sum(axis=0).argmax()) if occupied.any() else None,
+            "groups": [
+                {
+                    "key": label,
+                    "spaces": int(sizes[g]),
+                    "occupied_hours": round(float(occupied[g]) / _HOUR, 2),
+                    "utilization": round(float(utilization[g]), 4),
+                    "peak_hour": int(profile[g].argmax()) if occupied[g] else None,
+                    "hour_of_day_hours": [round(float(v) / _HOUR, 2) for v in profile[g]],
+                    "occupancy": [round(float(v), 4) for v in series_ratio[g]],
+                }
+                for g, label in enumerate(labels)
+            ],
+        }
+
+    def _groups(self, group_by):
+        """Returns the group labels and a mapping of space_id to group index."""
+        spaces = self._space_repo.list()
+        if group_by == self.GROUP_BY_SPACE:
+            keys = {space.space_id: space.space_id for space in spaces}
+        else:
+            keys = {space.space_id: str(space.floor) if isinstance(space, SpaceMeetingRoom) else self.NO_FLOOR
+                    for space in spaces}
+        labels = sorted(set(keys.values()))
+        index = {label: i for i, label in enumerate(labels)}
+        return labels, {space_id: index[key] for space_id, key in keys.items()}
@@ -1,11 +1,55 @@
 """application/booking_service.py"""
 
+from bisect import bisect_left, bisect_right
 from domain import booking
 from domain.booking import Booking
 from datetime import datetime
 from domain.exceptions import BookingNotFoundError, BookingConflictError
 
 
+class _BatchOverlapView:
+    """Overlap view used to validate a batch of new bookings in one sweep.
+
+    Holds, per space, the stored active bookings inside the batch time span
+    (one query per space) plus the bookings accepted so far in the batch,
+    sorted by start time. Active bookings of a space never overlap, so each
+    check only inspects the neighbours of the insertion point.
+    It implements the ``find_overlapping`` method used by ``Booking.create``.
+    """
+
+    def __init__(self, booking_repo, spans):
+        """Loads the stored active bookings of each space in its batch span.
+
+        Args:
+            booking_repo: Repository holding the stored bookings.
+            spans: Dictionary of space_id to the (earliest start, latest end)
+                requested for that space in the batch.
+        """
+        self._timelines = {}
+        for space_id, (start_time, end_time) in spans.items():
+            for stored in booking_repo.find_overlapping(space_id, start_time, end_time):
+                self.add(stored)
+
+    def add(self, booking):
+        """Adds an accepted booking to its space timeline."""
+        starts, bookings = self._timelines.setdefault(booking.space.space_id, ([], []))
+        i = bisect_right(starts, booking.start_time)
+        starts.insert(i, booking.start_time)
+        bookings.insert(i, booking)
+
+    def find_overlapping(self, space_id, start_time, end_time, exclude_booking_id=None):
+        """Returns the stored or accepted bookings of a space overlapping a range."""
+        starts, bookings = self._timelines.get(space_id, ((), ()))
+        i = max(bisect_left(starts, start_time) - 1, 0)
+        conflicts = []
+        while i < len(starts) and starts[i] < end_time:
+            if bookings[i].end_time > start_time and (
+                    exclude_booking_id is None or bookings[i].booking_id != exclude_booking_id):
+                conflicts.append(bookings[i])
+            i += 1
+        return conflicts
+
+
 class BookingService:
     """Application service responsible for managing space bookings.
 
@@ -18,21 +62,28 @@ class BookingService:
         booking_repo: Repository responsible for storing and retrieving bookings.
         space_repo: Repository responsible for storing and retrieving spaces.
         user_repo: Repository responsible for storing and retrieving users.
+        availability_repo: Repository that resolves free spaces for a time range.
+        availability_index: Optional slot index kept up to date with every booking
+            change and used instead of availability_repo for availability queries.
     """
 
-    def __init__(self, booking_repo, space_repo, user_repo):
+    def __init__(self, booking_repo, space_repo, user_repo, availability_repo, availability_index=None):
         """Initializes the booking service with its repositories.
 
         Args:
             booking_repo: Repository used to manage booking persistence.
             space_repo: Repository used to manage space persistence.
             user_repo: Repository used to manage user persistence.
+            availability_repo: Repository used for availability checks.
+            availability_index: Optional incrementally updated availability index.
         """
         self._booking_repo, self._space_repo, self._user_repo = (
             booking_repo,
             space_repo,
             user_repo,
         )
+        self._availability_repo = availability_repo
+        self._availability_index = availability_index
 
     def create_booking(self, user_name, space_name, start_time, end_time):
         """Creates a new booking for a user in a specific space and time range.
@@ -43,8 +94,8 @@ class BookingService:
         delegated to the domain layer via Booking.create.
 
         Args:
-            user_name: Full name of the user making the booking.
-            space_name: Name of the space to be booked.
+            user_name: Full name of the user making the booking (case-insensitive).
+            space_name: Name of the space to be booked (case-insensitive).
             start_time: Booking start datetime.
             end_time: Booking end datetime.
 
@@ -57,29 +108,14 @@ class BookingService:
             ValueError: If the requested duration exceeds the user's maximum booking duration.
             ValueError: If the booking time overlaps with an existing active booking.
         """
-        user = next(
-            (user for user in self._user_repo.list() if user.full_name() == user_name),
-            None,
-        )
+        user = self._user_repo.find_by_full_name(user_name)
         if not user:
             raise ValueError("User not found")
-        space = next(
-            (
-                space
-                for space in self._space_repo.list()
-                if space.space_name == space_name
-            ),
-            None,
-        )
+        space = self._space_repo.find_by_name(space_name)
         if not space:
             raise ValueError("Space not found")
 
-        active_user_bookings = [
-            booking
-            for booking in self._booking_repo.list()
-            if booking.user.user_id == user.user_id and booking.is_active()
-        ]
-        if len(active_user_bookings) >= user.max_active_bookings:
+        if self._booking_repo.count_active_for_user(user.user_id) >= user.max_active_bookings:
             raise BookingConflictError(
                 f"User '{user_name}' has reached the maximum of {user.max_active_bookings} active booking(s)."
             )
@@ -98,9 +134,135 @@ class BookingService:
             booking_repo=self._booking_repo,
         )
         self._booking_repo.save(booking)
+        self._reindex(booking)
 
         return booking
 
+    def create_bookings(self, requests):
+        """Creates a batch of bookings, validating the whole batch in one sweep.
+
+        Each request is checked with the same rules as ``create_booking``:
+        user and space existence, active booking limit, maximum duration, and
+        overlaps against both stored bookings and the earlier requests of the
+        batch. Names are resolved and stored bookings are loaded once per
+        distinct user and space. The accepted bookings are then stored with a
+        single ``save_many`` call (one transaction).
+
+        Args:
+            requests: Iterable of mappings with ``user_name``, ``space_name``,
+                ``start_time`` and ``end_time`` keys.
+
+        Returns:
+            A list with one result per request, in request order: either
+            ``{"status": "created", "booking": booking}`` or
+            ``{"status": "rejected", "reason": message}``.
+        """
+        requests = list(requests)
+        users, spaces, spans = {}, {}, {}
+        for request in requests:
+            user_name, space_name = request["user_name"], request["space_name"]
+            if user_name not in users:
+                users[user_name] = self._user_repo.find_by_full_name(user_name)
+            if space_name not in spaces:
+                spaces[space_name] = self._space_repo.find_by_name(space_name)
+            space = spaces[space_name]
+            if space is not None:
+                start, end = spans.get(space.space_id, (request["start_time"], request["end_time"]))
+                spans[space.space_id] = (min(start, request["start_time"]), max(end, request["end_time"]))
+
+        view = _BatchOverlapView(self._booking_repo, spans)
+        active_counts, results, accepted = {}, [], []
+        for request in requests:
+            user, space = users[request["user_name"]], spaces[request["space_name"]]
+            try:
+                if not user:
+                    raise ValueError("User not found")
+                if not space:
+                    raise ValueError("Space not found")
+                if user.user_id not in active_counts:
+                    active_counts[user.user_id] = self._booking_repo.count_active_for_user(user.user_id)
+                if active_counts[user.user_id] >= user.max_active_bookings:
+                    raise BookingConflictError(
+                        f"User '{request['user_name']}' has reached the maximum of "
+                        f"{user.max_active_bookings} active booking(s)."
+                    )
+                if request["end_time"] - request["start_time"] > user.max_booking_duration:
+                    raise ValueError(
+                        f"Booking duration exceeds the allowed maximum of {user.max_booking_duration} "
+                        f"for user '{request['user_name']}'."
+                    )
+                booking = Booking.create(space, user, request["start_time"], request["end_time"], view)
+            except (ValueError, BookingConflictError) as e:
+                results.append({"status": "rejected", "reason": str(e)})
+                continue
+            view.add(booking)
+            active_counts[user.user_id] += 1
+            accepted.append(booking)
+            results.append({"status": "created", "booking": booking})
+
+        if accepted:
+            self._booking_repo.save_many(accepted)
+            self._reindex(*accepted)
+        return results
+
+    def create_recurring_booking(self, user_name, space_name, start_time, end_time, rule):
+        """Creates every occurrence of a recurring booking as one atomic series.
+
+        A series counts as one booking against the active booking limit: the
+        user must have a free slot, exactly as for ``create_booking``, and the
+        series length is capped separately by ``user.max_series_occurrences``.
+        The occurrences are stored as individual active bookings, so while any
+        of them is active the user's other bookings are limited as usual.
+        Overlap checks are delegated to ``Booking.create_series``,
+        which validates all occurrences with a single repository query, and
+        the series is stored with one ``save_many`` call.
+
+        Args:
+            user_name: Full name of the user making the bookings (case-insensitive).
+            space_name: Name of the space to be booked (case-insensitive).
+            start_time: Start datetime of the first occurrence.
+            end_time: End datetime of the first occurrence.
+            rule: RecurrenceRule describing how the booking repeats.
+
+        Returns:
+            The list of created bookings, in time order.
+
+        Raises:
+            ValueError: If the user or space does not exist.
+            ValueError: If the duration exceeds the user's maximum booking duration.
+            BookingConflictError: If the user has reached their active booking limit.
+            BookingConflictError: If the series has more occurrences than the user's series limit.
+            BookingConflictError: If any occurrence overlaps an existing active booking.
+        """
+        user = self._user_repo.find_by_full_name(user_name)
+        if not user:
+            raise ValueError("User not found")
+        space = self._space_repo.find_by_name(space_name)
+        if not space:
+            raise ValueError("Space not found")
+
+        if self._booking_repo.count_active_for_user(user.user_id) >= user.max_active_bookings:
+            raise BookingConflictError(
+                f"User '{user_name}' has reached the maximum of {user.max_active_bookings} active booking(s)."
+            )
+        occurrences = rule.occurrence_count(start_time)
+        if occurrences > user.max_series_occurrences:
+            raise BookingConflictError(
+                f"A series of {occurrences} occurrences exceeds the maximum of "
+                f"{user.max_series_occurrences} for user '{user_name}'."
+            )
+
+        duration = end_time - start_time
+        if duration > user.max_booking_duration:
+            raise ValueError(
+                f"Booking duration exceeds the allowed maximum of {user.max_booking_duration} for user '{user_name}'."
+            )
+
+        bookings = Booking.create_series(space, user, start_time, end_time, rule, self._booking_repo)
+        self._booking_repo.save_many(bookings)
+        self._reindex(*bookings)
+        return bookings
+
     def modify_booking(self, booking_id: str, new_start, new_end):
         """Modifies the schedule of an existing booking.
 
@@ -119,6 +281,7 @@ class BookingService:
         booking = self._booking_repo.get(booking_id)
         booking.reschedule(new_start, new_end, self._booking_repo)
         self._booking_repo.update(booking)
+        self._reindex(booking)
         return booking
 
     def cancel_booking(self, booking_id: str):
@@ -142,6 +305,7 @@ class BookingService:
             raise ValueError("Only active bookings can be cancelled")
         booking.cancel()
         self._booking_repo.update(booking)
+        self._reindex(booking)
         return booking
 
     def finish_booking(self, booking_id: str):
@@ -165,6 +329,7 @@ class BookingService:
             raise ValueError("Only active bookings can be finished")
         booking.finish()
         self._booking_repo.update(booking)
+        self._reindex(booking)
         return booking
 
     def list_bookings(self):
@@ -175,6 +340,31 @@ class BookingService:
         """
         return self._booking_repo.list()
 
+    def iter_bookings(self, after: str | None = None, limit: int | None = None):
+        """Iterates over stored bookings in identifier order without loading them all.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of bookings to return, or None for all.
+
+        Returns:
+            An iterator over the bookings, streamed page by page.
+        """
+        return self._booking_repo.iter_bookings(after, limit)
+
+    def iter_booking_records(self, after: str | None = None, limit: int | None = None):
+        """Iterates over stored bookings as plain dictionaries, for serialization.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of records to return, or None for all.
+
+        Returns:
+            An iterator over the ``to_record`` dictionaries of the bookings,
+            built by the repository without constructing entities when possible.
+        """
+        return self._booking_repo.iter_records(after, limit)
+
     def get_booking(self, booking_id: str):
         """Retrieves a booking by its identifier.
 
@@ -196,18 +386,11 @@ class BookingService:
             user_name: Full name of the user.
 
         Returns:
-            A list of bookings belonging to the user. Returns an empty list if the user is not found.
+            A list of bookings belonging to the user, ordered by start time, read
+            from the repository's per-user index. Returns an empty list if the user is not found.
         """
-        user = self._find_user_by_name(user_name)
-        return (
-            [
-                booking
-                for booking in self._booking_repo.list()
-                if booking.user.user_id == user.user_id
-            ]
-            if user
-            else []
-        )
+        user = self._user_repo.find_by_full_name(user_name)
+        return self._booking_repo.find_by_user(user.user_id) if user else []
 
     def get_bookings_for_space(self, space_name: str):
         """Retrieves all bookings associated with a specific space.
@@ -216,18 +399,11 @@ class BookingService:
             space_name: Name of the space.
 
         Returns:
-            A list of bookings for the space. Returns an empty list if the space is not found.
+            A list of bookings for the space, ordered by start time, read from
+            the repository's per-space index. Returns an empty list if the space is not found.
         """
-        space = self._find_space_by_name(space_name)
-        return (
-            [
-                booking
-                for booking in self._booking_repo.list()
-                if booking.space.space_id == space.space_id
-            ]
-            if space
-            else []
-        )
+        space = self._space_repo.find_by_name(space_name)
+        return self._booking_repo.find_by_space(space.space_id) if space else []
 
     def get_available_spaces(self, start_time: datetime, end_time: datetime):
         """Retrieves all spaces available for a given time range.
@@ -239,51 +415,11 @@ class BookingService:
         Returns:
             A list of spaces that are not booked during the specified time range.
         """
-        available_spaces = []
-        for space in self._space_repo.list():
-            overlapping = any(
-                booking.is_active()
-                and booking.space.space_id == space.space_id
-                and start_time < booking.end_time
-                and booking.start_time < end_time
-                for booking in self._booking_repo.list()
-            )
-            if not overlapping:
-                available_spaces.append(space)
-        return available_spaces
-
-    def _find_user_by_name(self, full_name: str):
-        """Finds a user by full name.
-
-        Args:
-            full_name: Full name of the user.
-
-        Returns:
-            The user instance if found, otherwise None.
-        """
-        return next(
-            (
-                user
-                for user in self._user_repo.list()
-                if user.full_name().lower() == full_name.lower()
-            ),
-            None,
-        )
-
-    def _find_space_by_name(self, space_name: str):
-        """Finds a space by name.
-
-        Args:
-            space_name: Name of the space.
-
-        Returns:
-            The space instance if found, otherwise None.
-        """
-        return next(
-            (
-                space
-                for space in self._space_repo.list()
-                if space.space_name.lower() == space_name.lower()
-            ),
-            None,
-        )
+        if self._availability_index is not None:
+            return self._availability_index.list_available_spaces(start_time, end_time)
+        return self._availability_repo.list_available_spaces(start_time, end_time)
+
+    def _reindex(self, *bookings):
+        """Propagates stored booking changes to the availability index, if any."""
+        if self._availability_index is not None:
+            self._availability_index.update(*bookings)
@@ -2,8 +2,9 @@
 
 from domain.space import Space
 from domain.space_meetingroom import SpaceMeetingRoom
-from datetime import datetime
+from datetime import datetime, timedelta
 from domain.exceptions import SpaceNotFoundError
+from domain.user import User
 
 
 class SpaceService:
@@ -16,17 +17,24 @@ class SpaceService:
     Args:
         space_repo: Repository responsible for storing and retrieving spaces.
         booking_repo: Repository responsible for storing and retrieving bookings.
+        availability_repo: Repository that resolves free spaces for a time range.
+        availability_index: Optional slot index used instead of availability_repo
+            for availability queries (kept up to date by BookingService).
     """
 
-    def __init__(self, space_repo, booking_repo):
+    def __init__(self, space_repo, booking_repo, availability_repo, availability_index=None):
         """Initializes the space service with its repositories.
 
         Args:
             space_repo: Repository used to manage space persistence.
-            booking_repo: Repository used to retrieve bookings for availability checks.
+            booking_repo: Repository used to retrieve bookings.
+            availability_repo: Repository used for availability checks.
+            availability_index: Optional incrementally updated availability index.
         """
         self._space_repo = space_repo
         self._booking_repo = booking_repo
+        self._availability_repo = availability_repo
+        self._availability_index = availability_index
 
     def create_space(self, space_name, capacity, space_type):
         """Creates a new generic space.
@@ -75,9 +83,38 @@ class SpaceService:
         """
         return self._space_repo.list()
 
+    def iter_spaces(self, after: str | None = None, limit: int | None = None):
+        """Iterates over stored spaces in identifier order without loading them all.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of spaces to return, or None for all.
+
+        Returns:
+            An iterator over the spaces, streamed page by page.
+        """
+        return self._space_repo.iter_spaces(after, limit)
+
+    def iter_space_records(self, after: str | None = None, limit: int | None = None):
+        """Iterates over stored spaces as plain dictionaries, for serialization.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of records to return, or None for all.
+
+        Returns:
+            An iterator over the ``to_record`` dictionaries of the spaces,
+            built by the repository without constructing entities when possible.
+        """
+        return self._space_repo.iter_records(after, limit)
+
     def get_available_spaces(self, start: datetime, end: datetime):
         """Retrieves spaces that do not have overlapping active bookings.
 
+        The check is delegated to the availability index when one is
+        configured, or else to the availability repository, which resolves
+        all spaces in a single query.
+
         Args:
             start: Desired booking start datetime.
             end: Desired booking end datetime.
@@ -85,16 +122,62 @@ class SpaceService:
         Returns:
             A list of spaces available during the specified time range.
         """
-        available_spaces = []
-        for space in self._space_repo.list():
-            bookings_for_space = [
-                booking for booking in self._booking_repo.list()
-                if booking.space.space_id == space.space_id and booking.is_active()
-            ]
-            if all(end <= booking.start_time or start >= booking.end_time for booking in bookings_for_space):
-                available_spaces.append(space)
-        return available_spaces
-    
+        if self._availability_index is not None:
+            return self._availability_index.list_available_spaces(start, end)
+        return self._availability_repo.list_available_spaces(start, end)
+
+    def find_free_slots(self, space: Space, window_start: datetime, window_end: datetime,
+                        min_duration: timedelta, limit: int, max_duration: timedelta | None = None):
+        """Finds the next open windows of a space inside a time range.
+
+        The space is the one the caller already loaded (e.g. with
+        ``get_space``), so it is not looked up again. The active bookings of
+        the space in the range are loaded with a single overlap query and
+        swept once in start order; every gap of at least ``min_duration``
+        becomes one or more consecutive windows no longer than the maximum
+        booking duration, so each returned window can be booked as is.
+
+        Args:
+            space: Space to search.
+            window_start: Start of the range to search.
+            window_end: End of the range to search.
+            min_duration: Shortest window worth returning.
+            limit: Maximum number of windows to return.
+            max_duration: Longest bookable window. Defaults to
+                ``User.DEFAULT_MAX_BOOKING_DURATION``.
+
+        Returns:
+            A list of up to ``limit`` ``(start, end)`` tuples in time order.
+            A space under maintenance has no free windows.
+
+        Raises:
+            ValueError: If the range, durations or limit are invalid.
+        """
+        max_duration = max_duration or User.DEFAULT_MAX_BOOKING_DURATION
+        if window_start >= window_end:
+            raise ValueError("Start time must be before end time.")
+        if not timedelta(0) < min_duration <= max_duration:
+            raise ValueError(f"Minimum duration must be positive and at most {max_duration}.")
+        if limit < 1:
+            raise ValueError("Limit must be at least 1.")
+
+        if space.is_maintenance():
+            return []
+
+        bookings = sorted(self._booking_repo.find_overlapping(space.space_id, window_start, window_end),
+                          key=lambda booking: booking.start_time)
+        slots, cursor = [], window_start
+        for busy_start, busy_end in [(b.start_time, b.end_time) for b in bookings] + [(window_end, window_end)]:
+            gap_end = min(busy_start, window_end)
+            while gap_end - cursor >= min_duration and len(slots) < limit:
+                slot_end = min(cursor + max_duration, gap_end)
+                slots.append((cursor, slot_end))
+                cursor = slot_end
+            if len(slots) == limit:
+                break
+            cursor = max(cursor, busy_end)
+        return slots
+
     def get_space(self, space_id: str):
         """Recupera un espacio por su ID.
         
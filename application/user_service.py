@@ -29,6 +29,31 @@ class UserService:
         """
         return self._user_repo.list()
 
+    def iter_users(self, after: str | None = None, limit: int | None = None):
+        """Iterates over stored users in identifier order without loading them all.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of users to return, or None for all.
+
+        Returns:
+            An iterator over the users, streamed page by page.
+        """
+        return self._user_repo.iter_users(after, limit)
+
+    def iter_user_records(self, after: str | None = None, limit: int | None = None):
+        """Iterates over stored users as plain dictionaries, for serialization.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of records to return, or None for all.
+
+        Returns:
+            An iterator over the ``to_record`` dictionaries of the users,
+            built by the repository without constructing entities when possible.
+        """
+        return self._user_repo.iter_records(after, limit)
+
     def get_user(self, user_id: str):
         """Recupera un usuario por su ID.
 
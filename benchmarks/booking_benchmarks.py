@@ -0,0 +1,302 @@
+"""benchmarks/booking_benchmarks.py
+
+Benchmarks of the booking hot paths over the memory and SQLite repositories.
+
+Seeds a configurable volume of spaces, users and bookings into each backend,
+times the BookingService operations and repository ``list()``, and writes the
+results as JSON. A previous results file can be passed as a baseline: any
+operation whose median got slower than the tolerance allows is reported and
+makes the command exit with status 1.
+
+Usage:
+    python -m benchmarks.booking_benchmarks --bookings 100000 --output results.json
+    python -m benchmarks.booking_benchmarks --bookings 100000 --baseline results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from application.booking_service import BookingService
+from create_db import create_schema
+from domain.booking import Booking
+from domain.space import Space
+from domain.user import User
+from infrastructure.availability_memory_repository import AvailabilityMemoryRepository
+from infrastructure.availability_sqlite_repository import AvailabilitySQLiteRepository
+from infrastructure.booking_memory_repository import BookingMemoryRepository
+from infrastructure.booking_sqlite_repository import BookingSQLiteRepository
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+from infrastructure.space_sqlite_repository import SpaceSQLiteRepository
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+from infrastructure.user_memory_repository import UserMemoryRepository
+from infrastructure.user_sqlite_repository import UserSQLiteRepository
+
+BACKENDS = ("memory", "sqlite")
+SEED_BATCH = 10000
+
+# Seeded history ends here; active bookings and benchmark writes go after it
+_NOW = datetime(2026, 1, 1)
+_HOUR = timedelta(hours=1)
+
+
+class Dataset:
+    """Repositories and service of one backend, seeded with synthetic data.
+
+    Attributes:
+        service: BookingService over the seeded repositories.
+        booking_repo: Booking repository of the backend.
+        space_names: Names of the seeded spaces.
+        user_names: Full names of the users with seeded bookings.
+        free_user_names: Full names of users without active bookings, used
+            by the create_booking benchmark (one per run).
+        active_ids: IDs of the seeded active bookings, used by modify_booking.
+    """
+
+    def __init__(self, backend, spaces, users, bookings, runs, active_ratio=0.1):
+        """Builds the repositories of a backend and seeds them.
+
+        Args:
+            backend: "memory" or "sqlite".
+            spaces: Number of spaces.
+            users: Number of users.
+            bookings: Number of seeded bookings.
+            runs: Largest number of runs of any benchmark (users are reserved for it).
+            active_ratio: Fraction of the bookings that are active (future) ones.
+
+        Raises:
+            ValueError: If the backend is unknown or there are not enough users.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Use one of: {', '.join(BACKENDS)}.")
+        if users <= runs:
+            raise ValueError("There must be more users than benchmark runs.")
+        self.backend = backend
+        self._db_path = None
+        if backend == "memory":
+            space_repo, user_repo = SpaceMemoryRepository(), UserMemoryRepository()
+            self.booking_repo = BookingMemoryRepository()
+            availability_repo = AvailabilityMemoryRepository(space_repo, self.booking_repo)
+        else:
+            handle, self._db_path = tempfile.mkstemp(suffix=".db")
+            os.close(handle)
+            conn = sqlite3.connect(self._db_path)
+            create_schema(conn.cursor())
+            conn.commit()
+            conn.close()
+            space_repo, user_repo = SpaceSQLiteRepository(self._db_path), UserSQLiteRepository(self._db_path)
+            self.booking_repo = BookingSQLiteRepository(self._db_path)
+            availability_repo = AvailabilitySQLiteRepository(self._db_path)
+        self.service = BookingService(self.booking_repo, space_repo, user_repo, availability_repo)
+        self._seed(space_repo, user_repo, spaces, users, bookings, runs, active_ratio)
+
+    def _seed(self, space_repo, user_repo, n_spaces, n_users, n_bookings, runs, active_ratio):
+        spaces = [Space(f"S{n}", f"Room {n}", 10) for n in range(1, n_spaces + 1)]
+        users = [User(f"U{n}", "Bench", "User", f"N{n}") for n in range(1, n_users + 1)]
+        for space in spaces:
+            space_repo.save(space)
+        for user in users:
+            user_repo.save(user)
+
+        # Users 0..runs-1 never get seeded bookings; at most one active booking per other user
+        booked_users = users[runs:]
+        n_active = min(int(n_bookings * active_ratio), len(booked_users))
+        batch = []
+        for booking in self._synthetic_bookings(spaces, booked_users, n_bookings - n_active, n_active):
+            batch.append(booking)
+            if len(batch) == SEED_BATCH:
+                self.booking_repo.save_many(batch)
+                batch = []
+        self.booking_repo.save_many(batch)
+
+        self.space_names = [space.space_name for space in spaces]
+        self.user_names = [user.full_name() for user in booked_users]
+        self.free_user_names = [user.full_name() for user in users[:runs]]
+        self.active_ids = [booking.booking_id for booking in self.booking_repo.list() if booking.is_active()]
+
+    @staticmethod
+    def _synthetic_bookings(spaces, users, n_past, n_active):
+        """Yields non-overlapping past bookings (finished or cancelled) and then active future ones."""
+        for i in range(n_past):
+            space, slot = spaces[i % len(spaces)], i // len(spaces)
+            start = _NOW - (slot + 1) * _HOUR
+            booking = Booking(space, users[i % len(users)], start, start + _HOUR)
+            # Past bookings are loaded with their final status, as a history import would
+            booking._booking_status = Booking.STATUS_CANCELLED if i % 10 == 0 else Booking.STATUS_FINISHED
+            yield booking
+        for j in range(n_active):
+            space, slot = spaces[j % len(spaces)], j // len(spaces)
+            start = _NOW + timedelta(days=1) + slot * 2 * _HOUR
+            yield Booking(space, users[j], start, start + _HOUR)
+
+    def close(self):
+        """Closes the SQLite pool and removes the temporary database, if any."""
+        if self._db_path is None:
+            return
+        SQLiteConnectionPool.for_path(self._db_path).close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self._db_path + suffix):
+                os.remove(self._db_path + suffix)
+
+
+def benchmark_operations(dataset):
+    """Returns the benchmarked operations of a dataset.
+
+    Returns:
+        A list of ``(name, call, kind)`` tuples, where ``call(k)`` performs the
+        k-th run and ``kind`` is "point" (fast, many runs) or "scan" (reads
+        every booking, fewer runs).
+    """
+    service, spaces = dataset.service, dataset.space_names
+    far_future = _NOW + timedelta(days=365)
+    window = _NOW + timedelta(days=1) + 2 * _HOUR
+
+    def create_booking(k):
+        start = far_future + (k // len(spaces)) * 2 * _HOUR
+        service.create_booking(dataset.free_user_names[k], spaces[k % len(spaces)], start, start + _HOUR)
+
+    def modify_booking(k):
+        start = far_future + timedelta(days=30) + k * 2 * _HOUR
+        service.modify_booking(dataset.active_ids[k % len(dataset.active_ids)], start, start + _HOUR)
+
+    operations = [
+        ("create_booking", create_booking, "point"),
+        ("get_available_spaces", lambda k: service.get_available_spaces(window, window + _HOUR), "point"),
+        ("get_bookings_for_user",
+         lambda k: service.get_bookings_for_user(dataset.user_names[k % len(dataset.user_names)]), "point"),
+        ("get_bookings_for_space", lambda k: service.get_bookings_for_space(spaces[k % len(spaces)]), "point"),
+        ("booking_repo.list", lambda k: dataset.booking_repo.list(), "scan"),
+    ]
+    if dataset.active_ids:
+        operations.insert(1, ("modify_booking", modify_booking, "point"))
+    return operations
+
+
+def time_operation(call, runs, clock=time.perf_counter):
+    """Runs an operation ``runs`` times and summarizes its latency.
+
+    Returns:
+        A dictionary with the number of runs and the min, median, p95, mean
+        and max latency in milliseconds.
+    """
+    samples = []
+    for k in range(runs):
+        started = clock()
+        call(k)
+        samples.append((clock() - started) * 1000)
+    ordered = sorted(samples)
+    return {
+        "runs": runs,
+        "min_ms": round(ordered[0], 4),
+        "median_ms": round(statistics.median(ordered), 4),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        "mean_ms": round(statistics.fmean(ordered), 4),
+        "max_ms": round(ordered[-1], 4),
+    }
+
+
+def run_benchmarks(backends=BACKENDS, spaces=50, users=500, bookings=10000, runs=50, scan_runs=5,
+                   active_ratio=0.1, log=print):
+    """Seeds every backend and times every operation.
+
+    Returns:
+        A results dictionary with a ``meta`` section (volumes and environment)
+        and one ``results`` entry per backend and operation.
+    """
+    results = []
+    for backend in backends:
+        started = time.perf_counter()
+        dataset = Dataset(backend, spaces, users, bookings, runs, active_ratio)
+        seed_seconds = time.perf_counter() - started
+        log(f"[{backend}] seeded {bookings} bookings in {seed_seconds:.2f} s")
+        try:
+            for name, call, kind in benchmark_operations(dataset):
+                summary = time_operation(call, runs if kind == "point" else scan_runs)
+                results.append({"backend": backend, "operation": name, **summary})
+                log(f"[{backend}] {name:<24} median {summary['median_ms']:>10.3f} ms  p95 {summary['p95_ms']:>10.3f} ms")
+        finally:
+            dataset.close()
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "volumes": {"spaces": spaces, "users": users, "bookings": bookings, "active_ratio": active_ratio},
+            "runs": {"point": runs, "scan": scan_runs},
+        },
+        "results": results,
+    }
+
+
+def compare_to_baseline(current, baseline, tolerance=0.25):
+    """Lists the operations whose median latency regressed against a baseline.
+
+    Operations missing from either side are ignored. A warning is not raised
+    when the volumes differ, but they are expected to match.
+
+    Args:
+        current: Results of this run.
+        baseline: Results of a previous run.
+        tolerance: Allowed relative slowdown (0.25 means 25 % slower).
+
+    Returns:
+        A list of dictionaries with backend, operation, baseline and current
+        medians and the relative change, for the regressed operations.
+    """
+    previous = {(r["backend"], r["operation"]): r["median_ms"] for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get((result["backend"], result["operation"]))
+        if before is None or before <= 0:
+            continue
+        change = result["median_ms"] / before - 1
+        if change > tolerance:
+            regressions.append({"backend": result["backend"], "operation": result["operation"],
+                                "baseline_ms": before, "current_ms": result["median_ms"],
+                                "change": round(change, 4)})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the SmartSpaces booking hot paths.")
+    parser.add_argument("--backend", choices=BACKENDS, action="append",
+                        help="Backend to benchmark (repeatable; all by default).")
+    parser.add_argument("--spaces", type=int, default=50)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--bookings", type=int, default=10000)
+    parser.add_argument("--active-ratio", type=float, default=0.1,
+                        help="Fraction of the seeded bookings that are active.")
+    parser.add_argument("--runs", type=int, default=50, help="Runs of each point operation.")
+    parser.add_argument("--scan-runs", type=int, default=5, help="Runs of each operation that reads every booking.")
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--baseline", help="Results file to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown of the median against the baseline.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(tuple(args.backend or BACKENDS), args.spaces, args.users, args.bookings,
+                             args.runs, args.scan_runs, args.active_ratio)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            regressions = compare_to_baseline(results, json.load(baseline_file), args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION [{r['backend']}] {r['operation']}: "
+                  f"{r['baseline_ms']:.3f} ms -> {r['current_ms']:.3f} ms (+{r['change']:.0%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,168 +3,162 @@
 import sqlite3
 import os
 from datetime import datetime, timedelta
-
-# Eliminar la base de datos si ya existe (para recrearla limpia)
-if os.path.exists("smartspaces.db"):
-    os.remove("smartspaces.db")
-
-conn = sqlite3.connect("smartspaces.db")
-cursor = conn.cursor()
-cursor.execute("PRAGMA foreign_keys = ON")
-
-# ===========================================================================
-# CREAR TABLAS
-# ===========================================================================
-
-# Tabla base para todos los espacios (Space y SpaceMeetingRoom)
-cursor.execute("""
-    CREATE TABLE IF NOT EXISTS spaces (
-        space_id     TEXT    PRIMARY KEY,
-        space_name   TEXT    NOT NULL,
-        capacity     INTEGER NOT NULL,
-        space_type   TEXT    NOT NULL,
-        space_status TEXT    NOT NULL
-    )
-""")
-
-# Tabla para los datos extra de SpaceMeetingRoom (herencia → dos tablas relacionadas)
-cursor.execute("""
-    CREATE TABLE IF NOT EXISTS meeting_rooms (
-        space_id          TEXT    PRIMARY KEY,
-        room_number       TEXT    NOT NULL,
-        floor             INTEGER NOT NULL,
-        equipment_list    TEXT    NOT NULL,
-        num_power_outlets INTEGER NOT NULL,
-        FOREIGN KEY (space_id) REFERENCES spaces(space_id)
-               ON DELETE CASCADE
-    )
-""")
-
-# Tabla de usuarios
-cursor.execute("""
-    CREATE TABLE IF NOT EXISTS users (
-        user_id  TEXT PRIMARY KEY,
-        name     TEXT    NOT NULL,
-        surname1 TEXT    NOT NULL,
-        surname2 TEXT    NOT NULL,
-        active   INTEGER NOT NULL
+from domain.space import Space
+from domain.user import User
+from infrastructure.sqlite_id_sequence import sync_id_sequences
+from infrastructure.sqlite_migrations import apply_migrations
+
+DB_PATH = "smartspaces.db"
+
+
+def create_schema(cursor):
+    """Crea o actualiza el esquema de SmartSpaces aplicando las migraciones pendientes.
+
+    Las tablas, triggers e índices se definen en infrastructure/sqlite_migrations.py;
+    la migración de id_sequences ya ajusta los contadores a los IDs existentes.
+    """
+    apply_migrations(cursor)
+
+
+def insert_initial_data(cursor):
+    """Inserta los espacios, usuarios y reservas iniciales."""
+    # ===========================================================================
+    # INSERTAR ESPACIOS (equivalente a seed_spaces)
+    # Los Space normales solo van a 'spaces'.
+    # Los SpaceMeetingRoom van a 'spaces' + 'meeting_rooms'.
+    # ===========================================================================
+
+    # Space("S1", "Conference Room", 5, "Basic")
+    cursor.execute("INSERT INTO spaces VALUES (?, ?, ?, ?, ?, ?)",
+                   ("S1", "Conference Room", 5, "Basic", "AVAILABLE", Space.normalize_name("Conference Room")))
+
+    # Space("S2", "Open Space", 10, "Basic")
+    cursor.execute("INSERT INTO spaces VALUES (?, ?, ?, ?, ?, ?)",
+                   ("S2", "Open Space", 10, "Basic", "AVAILABLE", Space.normalize_name("Open Space")))
+
+    # SpaceMeetingRoom("SM1", "Main Meeting Room", 8, "101", 1, ["Projector", "Whiteboard"], 4)
+    cursor.execute("INSERT INTO spaces VALUES (?, ?, ?, ?, ?, ?)",
+                   ("SM1", "Main Meeting Room", 8, "Meeting room", "AVAILABLE", Space.normalize_name("Main Meeting Room")))
+    cursor.execute("INSERT INTO meeting_rooms VALUES (?, ?, ?, ?, ?)",
+                   ("SM1", "101", 1, "Projector,Whiteboard", 4))
+
+    # SpaceMeetingRoom("SM2", "Small Meeting Room", 4, "102", 1, ["TV"], 2)
+    cursor.execute("INSERT INTO spaces VALUES (?, ?, ?, ?, ?, ?)",
+                   ("SM2", "Small Meeting Room", 4, "Meeting room", "AVAILABLE", Space.normalize_name("Small Meeting Room")))
+    cursor.execute("INSERT INTO meeting_rooms VALUES (?, ?, ?, ?, ?)",
+                   ("SM2", "102", 1, "TV", 2))
+
+    # Space("S3", "Private Office", 2, "Private")
+    cursor.execute("INSERT INTO spaces VALUES (?, ?, ?, ?, ?, ?)",
+                   ("S3", "Private Office", 2, "Private", "AVAILABLE", Space.normalize_name("Private Office")))
+
+    # ===========================================================================
+    # INSERTAR USUARIOS (equivalente a seed_users)
+    # ===========================================================================
+
+    users = [
+        ("U1", "Alice",   "Smith",    "Johnson",  1),
+        ("U2", "Bob",     "Brown",    "Taylor",   1),
+        ("U3", "Charlie", "Wilson",   "Anderson", 1),
+        ("U4", "Diana",   "Martinez", "Lopez",    1),
+        ("U5", "Eve",     "Davis",    "Clark",    1),
+    ]
+    # full_name_normalized se calcula igual que en los repositorios
+    cursor.executemany(
+        "INSERT INTO users VALUES (?, ?, ?, ?, ?, ?)",
+        [(*user, User.normalize_full_name(f"{user[1]} {user[2]} {user[3]}")) for user in users],
     )
-""")
-
-# Tabla de reservas
-cursor.execute("""
-    CREATE TABLE IF NOT EXISTS bookings (
-        booking_id     TEXT PRIMARY KEY,
-        space_id       TEXT NOT NULL,
-        user_id        TEXT NOT NULL,
-        start_time     TEXT NOT NULL,
-        end_time       TEXT NOT NULL,
-        booking_status TEXT NOT NULL,
-        FOREIGN KEY (space_id) REFERENCES spaces(space_id),
-        FOREIGN KEY (user_id)  REFERENCES users(user_id)
-    )
-""")
-
-# ===========================================================================
-# INSERTAR ESPACIOS (equivalente a seed_spaces)
-# Los Space normales solo van a 'spaces'.
-# Los SpaceMeetingRoom van a 'spaces' + 'meeting_rooms'.
-# ===========================================================================
-
-# Space("S1", "Conference Room", 5, "Basic")
-cursor.execute("INSERT INTO spaces VALUES (?, ?, ?, ?, ?)",
-               ("S1", "Conference Room", 5, "Basic", "AVAILABLE"))
-
-# Space("S2", "Open Space", 10, "Basic")
-cursor.execute("INSERT INTO spaces VALUES (?, ?, ?, ?, ?)",
-               ("S2", "Open Space", 10, "Basic", "AVAILABLE"))
-
-# SpaceMeetingRoom("SM1", "Main Meeting Room", 8, "101", 1, ["Projector", "Whiteboard"], 4)
-cursor.execute("INSERT INTO spaces VALUES (?, ?, ?, ?, ?)",
-               ("SM1", "Main Meeting Room", 8, "Meeting room", "AVAILABLE"))
-cursor.execute("INSERT INTO meeting_rooms VALUES (?, ?, ?, ?, ?)",
-               ("SM1", "101", 1, "Projector,Whiteboard", 4))
-
-# SpaceMeetingRoom("SM2", "Small Meeting Room", 4, "102", 1, ["TV"], 2)
-cursor.execute("INSERT INTO spaces VALUES (?, ?, ?, ?, ?)",
-               ("SM2", "Small Meeting Room", 4, "Meeting room", "AVAILABLE"))
-cursor.execute("INSERT INTO meeting_rooms VALUES (?, ?, ?, ?, ?)",
-               ("SM2", "102", 1, "TV", 2))
-
-# Space("S3", "Private Office", 2, "Private")
-cursor.execute("INSERT INTO spaces VALUES (?, ?, ?, ?, ?)",
-               ("S3", "Private Office", 2, "Private", "AVAILABLE"))
-
-# ===========================================================================
-# INSERTAR USUARIOS (equivalente a seed_users)
-# ===========================================================================
-
-users = [
-    ("U1", "Alice",   "Smith",    "Johnson",  1),
-    ("U2", "Bob",     "Brown",    "Taylor",   1),
-    ("U3", "Charlie", "Wilson",   "Anderson", 1),
-    ("U4", "Diana",   "Martinez", "Lopez",    1),
-    ("U5", "Eve",     "Davis",    "Clark",    1),
-]
-cursor.executemany("INSERT INTO users VALUES (?, ?, ?, ?, ?)", users)
-
-# ===========================================================================
-# INSERTAR RESERVAS (equivalente a seed_bookings)
-# Las fechas se guardan como texto ISO 8601.
-# ===========================================================================
-
-now = datetime.now()
-bookings = [
-    ("B1", "S1", "U1",
-     (now + timedelta(hours=1)).isoformat(),
-     (now + timedelta(hours=2)).isoformat(),
-     "ACTIVE"),
-    ("B2", "SM1", "U2",  # se cambia S3 → SM1
-     (now + timedelta(days=1)).isoformat(),
-     (now + timedelta(days=1, hours=2)).isoformat(),
-     "ACTIVE"),
-    ("B3", "S2", "U3",
-     (now + timedelta(hours=3)).isoformat(),
-     (now + timedelta(hours=5)).isoformat(),
-     "ACTIVE"),
-]
-
-cursor.executemany("INSERT INTO bookings VALUES (?, ?, ?, ?, ?, ?)", bookings)
-
-# Actualizar el status de los espacios que quedan reservados
-for _, space_id, *_ in bookings:
-    cursor.execute(
-        "UPDATE spaces SET space_status = 'RESERVED' WHERE space_id = ?",
-        (space_id,)
-    )
-
-conn.commit()
-print("Base de datos creada con datos iniciales.")
-
-# ===========================================================================
-# VERIFICACIÓN: mostrar contenido de todas las tablas
-# ===========================================================================
-
-print("\n--- Spaces ---")
-cursor.execute("SELECT * FROM spaces")
-for fila in cursor.fetchall():
-    print(f"  {fila[0]} | {fila[1]} | cap:{fila[2]} | tipo:{fila[3]} | estado:{fila[4]}")
-
-print("\n--- Meeting Rooms ---")
-cursor.execute("SELECT * FROM meeting_rooms")
-for fila in cursor.fetchall():
-    print(f"  {fila[0]} | sala:{fila[1]} | planta:{fila[2]} | equipamiento:{fila[3]} | enchufes:{fila[4]}")
-
-print("\n--- Users ---")
-cursor.execute("SELECT * FROM users")
-for fila in cursor.fetchall():
-    activo = "activo" if fila[4] else "inactivo"
-    print(f"  {fila[0]} | {fila[1]} {fila[2]} {fila[3]} | {activo}")
-
-print("\n--- Bookings ---")
-cursor.execute("SELECT * FROM bookings")
-for fila in cursor.fetchall():
-    print(f"  {fila[0]} | espacio:{fila[1]} | usuario:{fila[2]} | {fila[3][:16]} → {fila[4][11:16]} | {fila[5]}")
 
-conn.close()
-print("\nBase de datos guardada en smartspaces.db")
\ No newline at end of file
+    # ===========================================================================
+    # INSERTAR RESERVAS (equivalente a seed_bookings)
+    # Las fechas se guardan como texto ISO 8601.
+    # ===========================================================================
+
+    now = datetime.now()
+    bookings = [
+        ("B1", "S1", "U1",
+         (now + timedelta(hours=1)).isoformat(),
+         (now + timedelta(hours=2)).isoformat(),
+         "ACTIVE"),
+        ("B2", "SM1", "U2",  # se cambia S3 → SM1
+         (now + timedelta(days=1)).isoformat(),
+         (now + timedelta(days=1, hours=2)).isoformat(),
+         "ACTIVE"),
+        ("B3", "S2", "U3",
+         (now + timedelta(hours=3)).isoformat(),
+         (now + timedelta(hours=5)).isoformat(),
+         "ACTIVE"),
+    ]
+
+    cursor.executemany("INSERT INTO bookings VALUES (?, ?, ?, ?, ?, ?)", bookings)
+
+    # Actualizar el status de los espacios que quedan reservados
+    for _, space_id, *_ in bookings:
+        cursor.execute(
+            "UPDATE spaces SET space_status = 'RESERVED' WHERE space_id = ?",
+            (space_id,)
+        )
+
+    sync_id_sequences(cursor)
+
+
+def print_tables(cursor):
+    """Muestra el contenido de todas las tablas."""
+    print("\n--- Spaces ---")
+    cursor.execute("SELECT * FROM spaces")
+    for fila in cursor.fetchall():
+        print(f"  {fila[0]} | {fila[1]} | cap:{fila[2]} | tipo:{fila[3]} | estado:{fila[4]}")
+
+    print("\n--- Meeting Rooms ---")
+    cursor.execute("SELECT * FROM meeting_rooms")
+    for fila in cursor.fetchall():
+        print(f"  {fila[0]} | sala:{fila[1]} | planta:{fila[2]} | equipamiento:{fila[3]} | enchufes:{fila[4]}")
+
+    print("\n--- Users ---")
+    cursor.execute("SELECT * FROM users")
+    for fila in cursor.fetchall():
+        activo = "activo" if fila[4] else "inactivo"
+        print(f"  {fila[0]} | {fila[1]} {fila[2]} {fila[3]} | {activo}")
+
+    print("\n--- Bookings ---")
+    cursor.execute("SELECT * FROM bookings")
+    for fila in cursor.fetchall():
+        print(f"  {fila[0]} | espacio:{fila[1]} | usuario:{fila[2]} | {fila[3][:16]} → {fila[4][11:16]} | {fila[5]}")
+
+    print("\n--- Data Versions ---")
+    cursor.execute("SELECT * FROM data_versions")
+    for fila in cursor.fetchall():
+        print(f"  {fila[0]} | versión:{fila[1]}")
+
+    print("\n--- ID Sequences ---")
+    cursor.execute("SELECT * FROM id_sequences")
+    for fila in cursor.fetchall():
+        print(f"  {fila[0]} | último:{fila[1]}")
+
+
+def main():
+    # Eliminar la base de datos si ya existe (para recrearla limpia)
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA foreign_keys = ON")
+
+    create_schema(cursor)
+    insert_initial_data(cursor)
+
+    conn.commit()
+    print("Base de datos creada con datos iniciales.")
+
+    # =======================================================================
+    # VERIFICACIÓN: mostrar contenido de todas las tablas
+    # =======================================================================
+    print_tables(cursor)
+
+    conn.close()
+    print("\nBase de datos guardada en smartspaces.db")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""domain/availability_repository.py"""
+
+from domain.space import Space
+
+
+class AvailabilityRepository:
+    """Abstract repository interface for space availability queries.
+
+    Resolves which spaces have no overlapping active booking in a time range
+    with a single set-based query, instead of checking the bookings of each
+    space one by one. Concrete implementations must provide the actual query.
+
+    Methods:
+        list_available_spaces: Retrieves the spaces free during a time range.
+    """
+
+    def list_available_spaces(self, start_time, end_time) -> list[Space]:
+        """Retrieves the spaces without overlapping active bookings.
+
+        Args:
+            start_time: Desired booking start datetime.
+            end_time: Desired booking end datetime.
+
+        Returns:
+            A list of spaces available during the specified time range.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
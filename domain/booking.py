@@ -21,6 +21,8 @@ class Booking:
         STATUS_FINISHED: Indicates that the booking has been completed.
     """
 
+    __slots__ = ("_booking_id", "_space", "_user", "_start_time", "_end_time", "_booking_status")
+
     STATUS_ACTIVE, STATUS_CANCELLED, STATUS_FINISHED = "ACTIVE", "CANCELLED", "FINISHED"
 
     def __init__(self, space, user, start_time, end_time):
@@ -55,8 +57,8 @@ class Booking:
             user: User requesting the booking.
             start_time: Booking start datetime.
             end_time: Booking end datetime.
-            booking_repo: Repository used to validate existing bookings
-                          and persist the new booking.
+            booking_repo: Repository queried for active bookings of the space
+                          that overlap the requested range.
 
         Returns:
             The newly created booking instance.
@@ -72,15 +74,66 @@ class Booking:
             raise ValueError("Space is under maintenance and cannot be booked")
 
         new_booking = Booking(space, user, start_time, end_time)
-        for booking in booking_repo.list():
-            if booking.space.space_id == space.space_id and new_booking.overlaps_with(
-                booking
-            ):
+        if booking_repo.find_overlapping(space.space_id, start_time, end_time):
+            raise BookingConflictError(
+                f"Space '{space.space_name}' already booked."
+            )
+        space.reserve()
+        return new_booking
+
+    @staticmethod
+    def create_series(space, user, start_time, end_time, rule, booking_repo):
+        """Creates and validates every occurrence of a recurring booking.
+
+        Stored bookings of the space are loaded with a single query covering
+        the whole series window. Occurrences are then expanded lazily and
+        checked against them in one merged pass over both start-ordered
+        sequences, so a long series costs about one overlap query.
+
+        Args:
+            space: Space to be booked.
+            user: User requesting the bookings.
+            start_time: Start datetime of the first occurrence.
+            end_time: End datetime of the first occurrence.
+            rule: RecurrenceRule describing how the booking repeats.
+            booking_repo: Repository queried for active bookings of the space
+                          that overlap the series window.
+
+        Returns:
+            A list with one new booking per occurrence, in time order.
+
+        Raises:
+            ValueError: If the user is inactive or the space is under maintenance.
+            ValueError: If the time range is invalid, the rule yields no
+                occurrences, or consecutive occurrences overlap each other.
+            BookingConflictError: If any occurrence overlaps an existing active booking.
+        """
+        if not user.is_active():
+            raise ValueError("User is inactive")
+        if space.is_maintenance():
+            raise ValueError("Space is under maintenance and cannot be booked")
+        if start_time >= end_time:
+            raise ValueError("Start time must be before end time.")
+        if end_time - start_time > rule.step:
+            raise ValueError("Occurrences of a recurring booking cannot overlap each other.")
+        window = rule.window(start_time, end_time)
+        if window is None:
+            raise ValueError("The recurrence rule yields no occurrences.")
+
+        existing = sorted(booking_repo.find_overlapping(space.space_id, *window),
+                          key=lambda booking: booking.start_time)
+        bookings, i = [], 0
+        for occurrence_start, occurrence_end in rule.occurrences(start_time, end_time):
+            while i < len(existing) and existing[i].end_time <= occurrence_start:
+                i += 1
+            if i < len(existing) and existing[i].start_time < occurrence_end:
                 raise BookingConflictError(
-                    f"Space '{space.space_name}' already booked."
+                    f"Space '{space.space_name}' is already booked from "
+                    f"{existing[i].start_time} to {existing[i].end_time}"
                 )
+            bookings.append(Booking(space, user, occurrence_start, occurrence_end))
         space.reserve()
-        return new_booking
+        return bookings
 
     @property
     def booking_id(self):
@@ -144,6 +197,27 @@ class Booking:
         """
         return self._booking_status == Booking.STATUS_ACTIVE
 
+    def to_record(self):
+        """Returns the booking as a flat dictionary of its fields.
+
+        The space and user are reduced to their IDs and display names, and
+        the times to ISO 8601 strings.
+
+        Returns:
+            A dictionary with the booking ID, space ID and name, user ID and
+            full name, start and end times, and status.
+        """
+        return {
+            "booking_id": self._booking_id,
+            "space_id": self._space.space_id,
+            "space_name": self._space.space_name,
+            "user_id": self._user.user_id,
+            "user_name": self._user.full_name(),
+            "start_time": self._start_time.isoformat(),
+            "end_time": self._end_time.isoformat(),
+            "booking_status": self._booking_status,
+        }
+
     def cancel(self):
         """Cancels an active booking and releases the associated space.
 
@@ -188,7 +262,8 @@ class Booking:
         Args:
             new_start: New booking start datetime.
             new_end: New booking end datetime.
-            booking_repo: Repository used to validate booking overlaps.
+            booking_repo: Repository queried for other active bookings of the
+                          space that overlap the new range.
 
         Raises:
             ValueError: If the booking is not active.
@@ -200,16 +275,14 @@ class Booking:
         if new_start >= new_end:
             raise ValueError("Start time must be before end time.")
 
-        for booking in booking_repo.list():
-            if (
-                booking.space.space_id == self.space.space_id
-                and booking != self
-                and booking.is_active()
-            ):
-                if new_start < booking.end_time and booking.start_time < new_end:
-                    raise BookingConflictError(
-                        f"Space '{self.space.space_name}' is already booked from {booking.start_time} to {booking.end_time}"
-                    )
+        conflicts = booking_repo.find_overlapping(
+            self.space.space_id, new_start, new_end, exclude_booking_id=self.booking_id
+        )
+        if conflicts:
+            booking = conflicts[0]
+            raise BookingConflictError(
+                f"Space '{self.space.space_name}' is already booked from {booking.start_time} to {booking.end_time}"
+            )
 
         self._start_time = new_start
         self._end_time = new_end
@@ -1,7 +1,23 @@
 """domain/booking_repository.py"""
 
+from collections.abc import Iterator
+from datetime import datetime
 from domain.booking import Booking
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(moment: datetime) -> int:
+    """Converts a naive datetime to the epoch seconds used by ``load_intervals``.
+
+    Args:
+        moment: Naive datetime, as stored with the bookings.
+
+    Returns:
+        Whole seconds since 1970-01-01 00:00, without any time zone shift.
+    """
+    return int((moment - _EPOCH).total_seconds())
+
 
 class BookingRepository:
     """Abstract repository interface for Booking instances.
@@ -12,8 +28,17 @@ class BookingRepository:
 
     Methods:
         save: Stores or updates a booking.
+        save_many: Stores several new bookings atomically.
         get: Retrieves a booking by its identifier.
         list: Retrieves all stored bookings.
+        iter_bookings: Iterates over stored bookings with keyset pagination.
+        iter_records: Iterates over stored bookings as plain dictionaries.
+        find_overlapping: Retrieves active bookings of a space overlapping a time range.
+        count_active_for_user: Counts the active bookings of a user.
+        find_by_user: Retrieves every booking of a user.
+        find_by_space: Retrieves every booking of a space.
+        load_intervals: Loads booking intervals as arrays for analytics.
+        load_active_intervals: Loads the intervals of active bookings in a time range.
         delete: Removes a booking by its identifier.
     """
 
@@ -28,6 +53,20 @@ class BookingRepository:
         """
         raise NotImplementedError
 
+    def save_many(self, bookings: list[Booking]):
+        """Stores several new bookings atomically.
+
+        Either every booking is stored or none is. Bookings without an
+        identifier receive one.
+
+        Args:
+            bookings: Booking instances to persist.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
     def get(self, booking_id: str) -> Booking | None:
         """Retrieves a booking by its identifier.
 
@@ -42,6 +81,159 @@ class BookingRepository:
         """
         raise NotImplementedError
 
+    def find_overlapping(self, space_id: str, start_time, end_time,
+                         exclude_booking_id: str | None = None) -> list[Booking]:
+        """Retrieves the active bookings of a space that overlap a time range.
+
+        Implementations must only consider the given space's active bookings
+        instead of scanning every stored booking.
+
+        Args:
+            space_id: Identifier of the space.
+            start_time: Range start datetime.
+            end_time: Range end datetime.
+            exclude_booking_id: Optional booking ID to leave out of the result,
+                                used when rescheduling an existing booking.
+
+        Returns:
+            A list of overlapping active bookings ordered by start time.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def count_active_for_user(self, user_id: str) -> int:
+        """Counts the active bookings of a user.
+
+        Implementations must answer without listing the booking history
+        (an indexed count or a maintained counter).
+
+        Args:
+            user_id: Unique identifier of the user.
+
+        Returns:
+            Number of active bookings owned by the user.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def find_by_user(self, user_id: str) -> list[Booking]:
+        """Retrieves every booking of a user, whatever its status.
+
+        Implementations must answer from an index on the user instead of
+        scanning every stored booking.
+
+        Args:
+            user_id: Unique identifier of the user.
+
+        Returns:
+            The user's bookings ordered by start time.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def find_by_space(self, space_id: str) -> list[Booking]:
+        """Retrieves every booking of a space, whatever its status.
+
+        Implementations must answer from an index on the space instead of
+        scanning every stored booking.
+
+        Args:
+            space_id: Identifier of the space.
+
+        Returns:
+            The space's bookings ordered by start time.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def iter_bookings(self, after: str | None = None, limit: int | None = None) -> Iterator[Booking]:
+        """Iterates over stored bookings in identifier order.
+
+        Implementations must stream results with keyset pagination instead of
+        materializing every booking at once. Identifier order is by sequence
+        number within a series: identifier length first, then the identifier
+        (``B2`` before ``B10``).
+
+        Args:
+            after: Identifier after which to start (exclusive), or None to
+                start from the first booking.
+            limit: Maximum number of bookings to yield, or None for all.
+
+        Yields:
+            Booking instances ordered by identifier.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def load_intervals(self, start_time, end_time):
+        """Loads the time intervals of non-cancelled bookings as NumPy arrays.
+
+        Used by analytics: no Booking entities are built.
+
+        Args:
+            start_time: Range start datetime.
+            end_time: Range end datetime.
+
+        Returns:
+            A ``(space_ids, starts, ends)`` tuple of arrays with one element
+            per booking overlapping the range; times are epoch seconds of the
+            stored naive datetimes (see ``to_epoch``).
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def load_active_intervals(self, start_time, end_time) -> list[tuple]:
+        """Loads the intervals of the active bookings overlapping a time range.
+
+        Used to build availability indexes: no Booking entities are built,
+        and implementations must answer from an index on the booking times
+        instead of scanning every stored booking.
+
+        Args:
+            start_time: Range start datetime.
+            end_time: Range end datetime.
+
+        Returns:
+            A list of ``(booking_id, space_id, start_time, end_time)`` tuples
+            with naive datetimes.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def iter_records(self, after: str | None = None, limit: int | None = None) -> Iterator[dict]:
+        """Iterates over stored bookings as plain dictionaries, in identifier order.
+
+        Meant for serializing large listings: implementations backed by a
+        database should build the dictionaries straight from the rows,
+        without constructing entities. Records have the fields of ``Booking.to_record``.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None to
+                start from the first booking.
+            limit: Maximum number of records to yield, or None for all.
+
+        Yields:
+            One dictionary per booking, ordered by identifier.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
     def list(self) -> list[Booking]:
         """Retrieves all stored bookings.
 
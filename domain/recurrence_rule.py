@@ -0,0 +1,114 @@
+"""domain/recurrence_rule.py"""
+
+from datetime import date, datetime, time, timedelta
+
+
+class RecurrenceRule:
+    """Value object describing how a booking repeats over time.
+
+    A rule repeats a time range every ``step`` (one day, one week, or any
+    custom interval) and stops either after ``count`` occurrences or at the
+    last occurrence starting on or before ``until``. Occurrences are expanded
+    lazily, and the time window they cover can be computed without expanding
+    them.
+
+    Attributes:
+        step: Time between the starts of two consecutive occurrences.
+        until: Latest allowed start of an occurrence, or None.
+        count: Number of occurrences, or None.
+    """
+
+    __slots__ = ("_step", "_until", "_count")
+
+    def __init__(self, step, until=None, count=None):
+        """Initializes a recurrence rule.
+
+        Args:
+            step: Positive timedelta between consecutive occurrences.
+            until: Datetime (or date, meaning the end of that day) after which
+                no occurrence may start.
+            count: Total number of occurrences.
+
+        Raises:
+            ValueError: If step is not positive.
+            ValueError: If not exactly one of until and count is given.
+            ValueError: If count is lower than one.
+        """
+        if step <= timedelta(0):
+            raise ValueError("Recurrence step must be positive.")
+        if (until is None) == (count is None):
+            raise ValueError("A recurrence needs either an until date or a count, not both.")
+        if count is not None and count < 1:
+            raise ValueError("Recurrence count must be at least 1.")
+        if isinstance(until, date) and not isinstance(until, datetime):
+            until = datetime.combine(until, time.max)
+        self._step, self._until, self._count = step, until, count
+
+    @classmethod
+    def daily(cls, interval=1, until=None, count=None):
+        """Creates a rule repeating every ``interval`` days."""
+        return cls(timedelta(days=interval), until=until, count=count)
+
+    @classmethod
+    def weekly(cls, interval=1, until=None, count=None):
+        """Creates a rule repeating every ``interval`` weeks."""
+        return cls(timedelta(weeks=interval), until=until, count=count)
+
+    @property
+    def step(self):
+        """Returns the time between two consecutive occurrences."""
+        return self._step
+
+    @property
+    def until(self):
+        """Returns the latest allowed occurrence start, or None."""
+        return self._until
+
+    @property
+    def count(self):
+        """Returns the number of occurrences, or None."""
+        return self._count
+
+    def occurrence_count(self, start_time):
+        """Returns how many occurrences the rule yields from a first start.
+
+        Args:
+            start_time: Start datetime of the first occurrence.
+
+        Returns:
+            Number of occurrences, computed without expanding them.
+        """
+        if self._count is not None:
+            return self._count
+        if self._until < start_time:
+            return 0
+        return (self._until - start_time) // self._step + 1
+
+    def window(self, start_time, end_time):
+        """Returns the time range covered by all occurrences.
+
+        Args:
+            start_time: Start datetime of the first occurrence.
+            end_time: End datetime of the first occurrence.
+
+        Returns:
+            A ``(first start, last end)`` tuple, or None if there are no occurrences.
+        """
+        count = self.occurrence_count(start_time)
+        if not count:
+            return None
+        return start_time, end_time + (count - 1) * self._step
+
+    def occurrences(self, start_time, end_time):
+        """Lazily yields the time ranges of every occurrence in order.
+
+        Args:
+            start_time: Start datetime of the first occurrence.
+            end_time: End datetime of the first occurrence.
+
+        Yields:
+            ``(start, end)`` tuples, one per occurrence.
+        """
+        for n in range(self.occurrence_count(start_time)):
+            offset = n * self._step
+            yield start_time + offset, end_time + offset
@@ -20,6 +20,8 @@ class Space:
         TYPE_GENERIC: Default type assigned to spaces when no type is provided.
     """
 
+    __slots__ = ("__space_id", "__space_name", "__capacity", "_space_status", "_space_type")
+
     STATUS_AVAILABLE = "AVAILABLE"
     STATUS_RESERVED = "RESERVED"
     STATUS_MAINTENANCE = "MAINTENANCE"
@@ -50,6 +52,18 @@ class Space:
         self._space_status = Space.STATUS_AVAILABLE
         self._space_type = space_type or Space.TYPE_GENERIC
 
+    @staticmethod
+    def normalize_name(space_name):
+        """Returns the case-insensitive lookup key for a space name.
+
+        Args:
+            space_name: Space name as typed by the caller.
+
+        Returns:
+            The name lowercased (accented letters included).
+        """
+        return space_name.lower()
+
     def __str__(self):
         """Returns a human-readable representation of the space.
 
@@ -114,6 +128,23 @@ class Space:
         """Returns the type of the space."""
         return self._space_type
 
+    def to_record(self):
+        """Returns the space as a flat dictionary of its fields.
+
+        Reads the attributes directly instead of going through the properties,
+        since it is used to serialize whole listings.
+
+        Returns:
+            A dictionary with the space ID, name, capacity, type and status.
+        """
+        return {
+            "space_id": self.__space_id,
+            "space_name": self.__space_name,
+            "capacity": self.__capacity,
+            "space_type": self._space_type,
+            "space_status": self._space_status,
+        }
+
     def is_available(self):
         """Checks whether the space has no active bookings.
 
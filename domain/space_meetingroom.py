@@ -15,6 +15,8 @@ class SpaceMeetingRoom(Space):
         TYPE: Constant indicating the type of space as a meeting room.
     """
 
+    __slots__ = ("__room_number", "__floor", "__num_power_outlets", "__equipment_list")
+
     TYPE = "Meeting room"
 
     def __init__(self, space_id, space_name, capacity, room_number, floor, equipment_list, num_power_outlets):
@@ -123,6 +125,20 @@ class SpaceMeetingRoom(Space):
         """
         return list(self.__equipment_list)
 
+    def to_record(self):
+        """Returns the meeting room as a flat dictionary of its fields.
+
+        Returns:
+            The space fields plus room number, floor, equipment list and
+            number of power outlets.
+        """
+        record = super().to_record()
+        record["room_number"] = self.__room_number
+        record["floor"] = self.__floor
+        record["equipment_list"] = list(self.__equipment_list)
+        record["num_power_outlets"] = self.__num_power_outlets
+        return record
+
     def _validate_room_number(self, room_number):
         """Validates the meeting room number.
 
@@ -1,5 +1,6 @@
 """domain/space_repository.py"""
 
+from collections.abc import Iterator
 from domain.space import Space
 
 
@@ -14,6 +15,9 @@ class SpaceRepository:
         save: Stores or updates a space.
         get: Retrieves a space by its identifier.
         list: Retrieves all stored spaces.
+        iter_spaces: Iterates over stored spaces with keyset pagination.
+        iter_records: Iterates over stored spaces as plain dictionaries.
+        find_by_name: Retrieves a space by name, ignoring case.
         delete: Removes a space by its identifier.
     """
 
@@ -42,6 +46,64 @@ class SpaceRepository:
         """
         raise NotImplementedError
 
+    def find_by_name(self, space_name: str) -> Space | None:
+        """Retrieves a space by name, ignoring case.
+
+        Implementations must resolve the lookup through a case-insensitive
+        index on the name instead of listing every space.
+
+        Args:
+            space_name: Name of the space.
+
+        Returns:
+            The space instance if found, otherwise None.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def iter_spaces(self, after: str | None = None, limit: int | None = None) -> Iterator[Space]:
+        """Iterates over stored spaces in identifier order.
+
+        Implementations must stream results with keyset pagination instead of
+        materializing every space at once. Identifier order is by sequence
+        number within a series: identifier length first, then the identifier
+        (``B2`` before ``B10``).
+
+        Args:
+            after: Identifier after which to start (exclusive), or None to
+                start from the first space.
+            limit: Maximum number of spaces to yield, or None for all.
+
+        Yields:
+            Space instances ordered by identifier.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def iter_records(self, after: str | None = None, limit: int | None = None) -> Iterator[dict]:
+        """Iterates over stored spaces as plain dictionaries, in identifier order.
+
+        Meant for serializing large listings: implementations backed by a
+        database should build the dictionaries straight from the rows,
+        without constructing entities. Records have the fields of ``Space.to_record`` (or ``SpaceMeetingRoom.to_record``).
+
+        Args:
+            after: Identifier after which to start (exclusive), or None to
+                start from the first space.
+            limit: Maximum number of records to yield, or None for all.
+
+        Yields:
+            One dictionary per space, ordered by identifier.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
     def list(self) -> list[Space]:
         """Retrieves all stored spaces.
 
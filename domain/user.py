@@ -10,12 +10,22 @@ class User:
     also defines booking-related constraints such as maximum active
     bookings and maximum booking duration.
 
+    Instances use ``__slots__``; the booking policy is shared by all users
+    through immutable class-level defaults instead of per-instance copies.
+
     Attributes:
+        DEFAULT_MAX_ACTIVE_BOOKINGS: Maximum number of concurrent active bookings allowed.
+        DEFAULT_MAX_BOOKING_DURATION: Maximum allowed duration for a single booking.
+        DEFAULT_MAX_SERIES_OCCURRENCES: Maximum number of occurrences in one recurring series.
         _active: Indicates whether the user is active.
-        _max_active_bookings: Maximum number of concurrent active bookings allowed.
-        _max_booking_duration: Maximum allowed duration for a single booking.
     """
 
+    __slots__ = ("__user_id", "_name", "_surname1", "_surname2", "_active")
+
+    DEFAULT_MAX_ACTIVE_BOOKINGS = 1
+    DEFAULT_MAX_BOOKING_DURATION = timedelta(hours=2)
+    DEFAULT_MAX_SERIES_OCCURRENCES = 52
+
     def __init__(self, user_id, name, surname1, surname2):
         """Initializes a user instance.
 
@@ -34,8 +44,6 @@ class User:
             raise ValueError("All user fields must be non-empty.")
         self.__user_id, self._name, self._surname1, self._surname2 = user_id, name, surname1, surname2
         self._active = True
-        self._max_active_bookings = 1
-        self._max_booking_duration = timedelta(hours=2)
 
     @property
     def user_id(self):
@@ -65,6 +73,18 @@ class User:
         """
         return f"{self.name} {self.surname1} {self.surname2}"
 
+    @staticmethod
+    def normalize_full_name(full_name):
+        """Returns the case-insensitive lookup key for a full name.
+
+        Args:
+            full_name: Full name as typed by the caller.
+
+        Returns:
+            The full name lowercased and with whitespace collapsed.
+        """
+        return " ".join(full_name.split()).lower()
+
     def is_active(self):
         """Checks if the user is active.
 
@@ -73,6 +93,21 @@ class User:
         """
         return self._active
 
+    def to_record(self):
+        """Returns the user as a flat dictionary of its fields.
+
+        Returns:
+            A dictionary with the user ID, name, surnames, full name and active flag.
+        """
+        return {
+            "user_id": self.__user_id,
+            "name": self._name,
+            "surname1": self._surname1,
+            "surname2": self._surname2,
+            "full_name": f"{self._name} {self._surname1} {self._surname2}",
+            "active": self._active,
+        }
+
     def deactivate(self):
         """Deactivates the user account."""
         self._active = False
@@ -88,9 +123,14 @@ class User:
     @property
     def max_active_bookings(self):
         """Returns the maximum number of active bookings the user can have."""
-        return self._max_active_bookings
+        return self.DEFAULT_MAX_ACTIVE_BOOKINGS
 
     @property
     def max_booking_duration(self):
         """Returns the maximum allowed duration for a single booking."""
-        return self._max_booking_duration
+        return self.DEFAULT_MAX_BOOKING_DURATION
+
+    @property
+    def max_series_occurrences(self):
+        """Returns the maximum number of occurrences in one recurring series."""
+        return self.DEFAULT_MAX_SERIES_OCCURRENCES
@@ -1,5 +1,6 @@
 """domain/user_repository.py"""
 
+from collections.abc import Iterator
 from domain.user import User
 
 
@@ -14,6 +15,9 @@ class UserRepository:
         save: Stores or updates a user.
         get: Retrieves a user by its identifier.
         list: Retrieves all stored users.
+        iter_users: Iterates over stored users with keyset pagination.
+        iter_records: Iterates over stored users as plain dictionaries.
+        find_by_full_name: Retrieves a user by full name, ignoring case.
         delete: Removes a user by its identifier.
     """
 
@@ -42,6 +46,64 @@ class UserRepository:
         """
         raise NotImplementedError
 
+    def find_by_full_name(self, full_name: str) -> User | None:
+        """Retrieves a user by full name, ignoring case.
+
+        Implementations must resolve the lookup through an index on the
+        normalized full name instead of listing every user.
+
+        Args:
+            full_name: Full name of the user ("name surname1 surname2").
+
+        Returns:
+            The user instance if found, otherwise None.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def iter_users(self, after: str | None = None, limit: int | None = None) -> Iterator[User]:
+        """Iterates over stored users in identifier order.
+
+        Implementations must stream results with keyset pagination instead of
+        materializing every user at once. Identifier order is by sequence
+        number within a series: identifier length first, then the identifier
+        (``B2`` before ``B10``).
+
+        Args:
+            after: Identifier after which to start (exclusive), or None to
+                start from the first user.
+            limit: Maximum number of users to yield, or None for all.
+
+        Yields:
+            User instances ordered by identifier.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def iter_records(self, after: str | None = None, limit: int | None = None) -> Iterator[dict]:
+        """Iterates over stored users as plain dictionaries, in identifier order.
+
+        Meant for serializing large listings: implementations backed by a
+        database should build the dictionaries straight from the rows,
+        without constructing entities. Records have the fields of ``User.to_record``.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None to
+                start from the first user.
+            limit: Maximum number of records to yield, or None for all.
+
+        Yields:
+            One dictionary per user, ordered by identifier.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
     def list(self) -> list[User]:
         """Retrieves all stored users.
 
@@ -0,0 +1,43 @@
+"""infrastructure/availability_memory_repository.py"""
+
+from domain.availability_repository import AvailabilityRepository
+
+
+class AvailabilityMemoryRepository(AvailabilityRepository):
+    """In-memory implementation of the AvailabilityRepository interface.
+
+    Works on top of a space repository and a booking repository: the bookings
+    are read once and grouped into the set of busy space IDs, which is then
+    used to filter the spaces.
+    """
+
+    def __init__(self, space_repo, booking_repo):
+        """Initializes the availability repository.
+
+        Args:
+            space_repo: Repository used to list the spaces.
+            booking_repo: Repository used to list the bookings.
+        """
+        self._space_repo, self._booking_repo = space_repo, booking_repo
+
+    def list_available_spaces(self, start_time, end_time):
+        """Retrieves the spaces without overlapping active bookings.
+
+        Args:
+            start_time: Desired booking start datetime.
+            end_time: Desired booking end datetime.
+
+        Returns:
+            A list of spaces available during the specified time range.
+        """
+        busy_space_ids = {
+            booking.space.space_id
+            for booking in self._booking_repo.list()
+            if booking.is_active()
+            and booking.start_time < end_time
+            and start_time < booking.end_time
+        }
+        return [
+            space for space in self._space_repo.list()
+            if space.space_id not in busy_space_ids
+        ]
@@ -0,0 +1,47 @@
+"""infrastructure/availability_sqlite_repository.py
+
+Repositorio SQLite para consultas de disponibilidad de espacios.
+"""
+
+import sqlite3
+from domain.availability_repository import AvailabilityRepository
+from domain.booking import Booking
+from domain.exceptions import PersistenceException
+from infrastructure.space_sqlite_repository import SpaceSQLiteRepository, _SELECT_SPACES
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+
+# Anti-join: un espacio está libre si no existe ninguna reserva activa que se
+# solape con el rango. La subconsulta usa idx_bookings_space_status_time.
+_WHERE_AVAILABLE = """
+    WHERE NOT EXISTS (
+        SELECT 1 FROM bookings b
+        WHERE b.space_id = s.space_id
+          AND b.booking_status = ?
+          AND b.start_time < ?
+          AND b.end_time > ?
+    )
+"""
+
+
+class AvailabilitySQLiteRepository(AvailabilityRepository):
+    """Repositorio SQLite que resuelve la disponibilidad en una sola consulta."""
+
+    def __init__(self, db_path: str = "smartspaces.db", pool: SQLiteConnectionPool | None = None):
+        self._db_path = db_path
+        self._pool = pool or SQLiteConnectionPool.for_path(db_path)
+
+    def list_available_spaces(self, start_time, end_time) -> list:
+        """Recupera los espacios sin reservas activas solapadas en el rango."""
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(_SELECT_SPACES + _WHERE_AVAILABLE, (
+                Booking.STATUS_ACTIVE,
+                end_time.isoformat(),
+                start_time.isoformat(),
+            ))
+            return [SpaceSQLiteRepository._row_to_space(row) for row in cursor.fetchall()]
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al buscar espacios disponibles: {e}")
+        finally:
+            self._pool.release(conn)
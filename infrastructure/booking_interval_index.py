@@ -0,0 +1,70 @@
+"""infrastructure/booking_interval_index.py"""
+
+from bisect import bisect_left, insort
+from datetime import timedelta
+
+
+class BookingIntervalIndex:
+    """Per-space interval index over active bookings.
+
+    Each space keeps its active bookings as ``(start_time, end_time, booking_id)``
+    entries sorted by start time, together with the longest duration indexed
+    for that space. An overlap query binary-searches the window of entries that
+    can still intersect the requested range, so it only touches that space's
+    bookings and runs in O(log n + k). Active bookings of a space never overlap
+    each other, which keeps the scanned window at k (+1) entries.
+    """
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._entries, self._max_duration, self._keys = {}, {}, {}
+
+    def add(self, booking):
+        """Indexes a booking, replacing any previous entry with the same ID.
+
+        Inactive bookings are only removed from the index.
+
+        Args:
+            booking: Booking instance with an assigned ID.
+        """
+        self.remove(booking.booking_id)
+        if not booking.is_active():
+            return
+        space_id = booking.space.space_id
+        entry = (booking.start_time, booking.end_time, booking.booking_id)
+        insort(self._entries.setdefault(space_id, []), entry)
+        duration = booking.end_time - booking.start_time
+        if duration > self._max_duration.get(space_id, timedelta(0)):
+            self._max_duration[space_id] = duration
+        self._keys[booking.booking_id] = (space_id, entry)
+
+    def remove(self, booking_id):
+        """Removes a booking from the index if it is indexed.
+
+        Args:
+            booking_id: Unique identifier of the booking.
+        """
+        key = self._keys.pop(booking_id, None)
+        if key is None:
+            return
+        space_id, entry = key
+        entries = self._entries[space_id]
+        del entries[bisect_left(entries, entry)]
+
+    def overlapping(self, space_id, start_time, end_time):
+        """Returns the IDs of indexed bookings of a space overlapping a range.
+
+        Args:
+            space_id: Identifier of the space.
+            start_time: Range start datetime.
+            end_time: Range end datetime.
+
+        Returns:
+            A list of booking IDs ordered by start time.
+        """
+        entries = self._entries.get(space_id)
+        if not entries:
+            return []
+        lo = bisect_left(entries, (start_time - self._max_duration[space_id],))
+        hi = bisect_left(entries, (end_time,), lo)
+        return [booking_id for _, end, booking_id in entries[lo:hi] if end > start_time]
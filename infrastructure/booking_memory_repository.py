@@ -1,22 +1,34 @@
 """infrastructure/booking_memory_repository.py"""
 
-from domain.booking_repository import BookingRepository
+import numpy as np
+from domain.booking import Booking
+from domain.booking_repository import BookingRepository, to_epoch
+from infrastructure.booking_interval_index import BookingIntervalIndex
 from domain.exceptions import (
     BookingAlreadyExistsException,
     BookingNotFoundError,
 )
+from infrastructure.id_order import IdOrder
 
 
 class BookingMemoryRepository(BookingRepository):
     """In-memory implementation of the BookingRepository interface.
 
     Stores bookings in a dictionary and assigns unique IDs to new bookings.
-    Suitable for testing or ephemeral data storage without a persistent database.
+    Active bookings are also kept in a per-space interval index used for
+    overlap checks, and counted per user. Booking IDs are grouped by user and
+    by space for the per-user and per-space listings, and kept in sequence
+    order for keyset iteration. Suitable for testing or ephemeral
+    data storage without a persistent database.
     """
 
     def __init__(self):
         """Initializes an empty in-memory repository with auto-increment ID tracking."""
         self._bookings, self._last_id = {}, 0
+        self._index = BookingIntervalIndex()
+        self._active_owners, self._active_counts = {}, {}
+        self._ids_by_user, self._ids_by_space = {}, {}
+        self._order = IdOrder()
 
     def save(self, booking):
         """Stores a new booking in memory.
@@ -35,6 +47,28 @@ class BookingMemoryRepository(BookingRepository):
         elif booking.booking_id in self._bookings:
             raise BookingAlreadyExistsException(f"Ya existe una reserva con ID '{booking.booking_id}'")
         self._bookings[booking.booking_id] = booking
+        self._order.add(booking.booking_id)
+        self._index.add(booking)
+        self._track_active(booking)
+        self._group(booking)
+
+    def save_many(self, bookings):
+        """Stores several new bookings, or none if any of them already exists.
+
+        Args:
+            bookings: Booking instances to save.
+
+        Raises:
+            BookingAlreadyExistsException: If a booking ID is already stored or repeated.
+        """
+        booking_ids = [b.booking_id for b in bookings if b.booking_id is not None]
+        for booking_id in booking_ids:
+            if booking_id in self._bookings:
+                raise BookingAlreadyExistsException(f"Ya existe una reserva con ID '{booking_id}'")
+        if len(set(booking_ids)) != len(booking_ids):
+            raise BookingAlreadyExistsException("El lote contiene IDs de reserva repetidos")
+        for booking in bookings:
+            self.save(booking)
 
     def update(self, booking):
         """Updates a booking in memory.
@@ -47,7 +81,13 @@ class BookingMemoryRepository(BookingRepository):
         """
         if booking.booking_id not in self._bookings:
             raise BookingNotFoundError(f"No existe ninguna reserva con ID '{booking.booking_id}'")
+        previous = self._bookings[booking.booking_id]
         self._bookings[booking.booking_id] = booking
+        self._index.add(booking)
+        self._track_active(booking)
+        if (previous.user.user_id, previous.space.space_id) != (booking.user.user_id, booking.space.space_id):
+            self._ungroup(previous)
+            self._group(booking)
 
     def get(self, booking_id):
         """Retrieves a booking by its ID.
@@ -68,6 +108,71 @@ class BookingMemoryRepository(BookingRepository):
             )
         return booking
 
+    def iter_bookings(self, after=None, limit=None):
+        """Iterates over stored bookings in identifier order.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of bookings to yield, or None for all.
+
+        Yields:
+            Stored bookings ordered by identifier.
+        """
+        for key in self._order.page(after, limit):
+            yield self._bookings[key]
+
+    def load_intervals(self, start_time, end_time):
+        """Returns the intervals of non-cancelled bookings overlapping a range.
+
+        Args:
+            start_time: Range start datetime.
+            end_time: Range end datetime.
+
+        Returns:
+            A ``(space_ids, starts, ends)`` tuple of NumPy arrays, times in epoch seconds.
+        """
+        rows = [
+            (booking.space.space_id, to_epoch(booking.start_time), to_epoch(booking.end_time))
+            for booking in self._bookings.values()
+            if booking.status != Booking.STATUS_CANCELLED
+            and booking.start_time < end_time and booking.end_time > start_time
+        ]
+        if not rows:
+            return np.array([], dtype=str), np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        space_ids, starts, ends = zip(*rows)
+        return np.array(space_ids), np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64)
+
+    def load_active_intervals(self, start_time, end_time):
+        """Returns the intervals of the active bookings overlapping a range.
+
+        Only the bookings in the per-user active counter are visited.
+
+        Args:
+            start_time: Range start datetime.
+            end_time: Range end datetime.
+
+        Returns:
+            A list of ``(booking_id, space_id, start_time, end_time)`` tuples.
+        """
+        return [
+            (booking.booking_id, booking.space.space_id, booking.start_time, booking.end_time)
+            for booking in map(self._bookings.__getitem__, self._active_owners)
+            if booking.start_time < end_time and booking.end_time > start_time
+        ]
+
+    def iter_records(self, after=None, limit=None):
+        """Iterates over stored bookings as plain dictionaries, in identifier order.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of records to yield, or None for all.
+
+        Yields:
+            The ``to_record`` dictionary of each stored booking.
+        """
+        for booking in self.iter_bookings(after, limit):
+            yield booking.to_record()
+
     def list(self):
         """Retrieves all stored bookings.
 
@@ -76,10 +181,101 @@ class BookingMemoryRepository(BookingRepository):
         """
         return list(self._bookings.values())
 
+    def count_active_for_user(self, user_id):
+        """Counts the active bookings of a user from the maintained counter.
+
+        Args:
+            user_id: Unique identifier of the user.
+
+        Returns:
+            Number of active bookings owned by the user.
+        """
+        return self._active_counts.get(user_id, 0)
+
+    def find_by_user(self, user_id):
+        """Retrieves every booking of a user.
+
+        Args:
+            user_id: Unique identifier of the user.
+
+        Returns:
+            The user's bookings ordered by start time.
+        """
+        return self._grouped(self._ids_by_user.get(user_id, ()))
+
+    def find_by_space(self, space_id):
+        """Retrieves every booking of a space.
+
+        Args:
+            space_id: Identifier of the space.
+
+        Returns:
+            The space's bookings ordered by start time.
+        """
+        return self._grouped(self._ids_by_space.get(space_id, ()))
+
+    def find_overlapping(self, space_id, start_time, end_time, exclude_booking_id=None):
+        """Retrieves the active bookings of a space that overlap a time range.
+
+        Args:
+            space_id: Identifier of the space.
+            start_time: Range start datetime.
+            end_time: Range end datetime.
+            exclude_booking_id: Optional booking ID to leave out of the result.
+
+        Returns:
+            A list of overlapping active bookings ordered by start time.
+        """
+        return [
+            self._bookings[booking_id]
+            for booking_id in self._index.overlapping(space_id, start_time, end_time)
+            if booking_id != exclude_booking_id and self._bookings[booking_id].is_active()
+        ]
+
     def delete(self, booking_id):
         """Deletes a booking by its ID if it exists.
 
         Args:
             booking_id: Unique identifier of the booking to delete.
         """
-        self._bookings.pop(booking_id, None)
+        booking = self._bookings.pop(booking_id, None)
+        self._order.discard(booking_id)
+        self._index.remove(booking_id)
+        self._untrack_active(booking_id)
+        if booking is not None:
+            self._ungroup(booking)
+
+    def _track_active(self, booking):
+        """Updates the per-user active counter with the booking's current status."""
+        self._untrack_active(booking.booking_id)
+        if booking.is_active():
+            user_id = booking.user.user_id
+            self._active_owners[booking.booking_id] = user_id
+            self._active_counts[user_id] = self._active_counts.get(user_id, 0) + 1
+
+    def _untrack_active(self, booking_id):
+        """Removes a booking from the per-user active counter if it was counted."""
+        user_id = self._active_owners.pop(booking_id, None)
+        if user_id is not None:
+            self._active_counts[user_id] -= 1
+
+    def _group(self, booking):
+        """Appends a booking to the ID lists of its user and its space.
+
+        Lists cost one pointer per booking, a fraction of a set entry; removing
+        from them is linear in the group, but only deletes (and updates that
+        change the user or space) need it.
+        """
+        self._ids_by_user.setdefault(booking.user.user_id, []).append(booking.booking_id)
+        self._ids_by_space.setdefault(booking.space.space_id, []).append(booking.booking_id)
+
+    def _ungroup(self, booking):
+        """Removes a booking from the ID lists of its user and its space."""
+        for groups, key in ((self._ids_by_user, booking.user.user_id), (self._ids_by_space, booking.space.space_id)):
+            ids = groups.get(key)
+            if ids and booking.booking_id in ids:
+                ids.remove(booking.booking_id)
+
+    def _grouped(self, booking_ids):
+        """Returns the bookings with the given IDs ordered by start time."""
+        return sorted((self._bookings[booking_id] for booking_id in booking_ids), key=lambda b: b.start_time)
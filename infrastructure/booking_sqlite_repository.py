@@ -4,41 +4,112 @@ Repositorio SQLite para persistencia de reservas.
 """
 
 import sqlite3
+from collections.abc import Iterator
 from datetime import datetime
+from operator import itemgetter
+import numpy as np
 from domain.booking import Booking
 from domain.user import User
-from domain.space import Space
-from domain.space_meetingroom import SpaceMeetingRoom
 from domain.booking_repository import BookingRepository
 from domain.exceptions import (
     BookingAlreadyExistsException,
     BookingNotFoundError,
     PersistenceException,
 )
+from infrastructure.space_sqlite_repository import SpaceSQLiteRepository
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+from infrastructure.sqlite_id_sequence import BOOKING_IDS
+from infrastructure.sqlite_keyset import fetch_keyset_rows, iter_keyset, keyset_clauses
+
+_SELECT_BOOKINGS = """
+    SELECT 
+        b.booking_id, b.start_time, b.end_time, b.booking_status,
+        u.user_id, u.name, u.surname1, u.surname2, u.active,
+        s.space_id, s.space_name, s.capacity, s.space_type, s.space_status,
+        mr.room_number, mr.floor, mr.equipment_list, mr.num_power_outlets
+    FROM bookings b
+    JOIN users u ON b.user_id = u.user_id
+    JOIN spaces s ON b.space_id = s.space_id
+    LEFT JOIN meeting_rooms mr ON s.space_id = mr.space_id
+"""
+
+# Columnas de Booking.to_record, leídas directamente de las filas (iter_records)
+_SELECT_BOOKING_RECORDS = """
+    SELECT
+        b.booking_id, b.space_id, s.space_name,
+        b.user_id, u.name || ' ' || u.surname1 || ' ' || u.surname2,
+        b.start_time, b.end_time, b.booking_status
+    FROM bookings b
+    JOIN users u ON b.user_id = u.user_id
+    JOIN spaces s ON b.space_id = s.space_id
+"""
+_BOOKING_RECORD_FIELDS = (
+    "booking_id", "space_id", "space_name", "user_id", "user_name",
+    "start_time", "end_time", "booking_status",
+)
+
+# Resuelto con idx_bookings_space_status_time (space_id, booking_status, start_time, end_time)
+_WHERE_OVERLAPPING = """
+    WHERE b.space_id = ? AND b.booking_status = ?
+      AND b.start_time < ? AND b.end_time > ?
+      AND b.booking_id IS NOT ?
+    ORDER BY b.start_time
+"""
+
+# Historial de un usuario o de un espacio; resueltos con el prefijo user_id de
+# idx_bookings_user_status y el prefijo space_id de idx_bookings_space_status_time
+_WHERE_USER = """
+    WHERE b.user_id = ?
+    ORDER BY b.start_time
+"""
+_WHERE_SPACE = """
+    WHERE b.space_id = ?
+    ORDER BY b.start_time
+"""
+
+# Resuelto sin leer la tabla con idx_bookings_user_status (user_id, booking_status)
+_COUNT_ACTIVE_FOR_USER = "SELECT COUNT(*) FROM bookings WHERE user_id = ? AND booking_status = ?"
+
+# Resuelto con idx_bookings_time_range (end_time, start_time, booking_status,
+# space_id): solo se recorren las reservas que terminan después del rango
+_SELECT_INTERVALS = """
+    SELECT space_id,
+           CAST(strftime('%s', start_time) AS INTEGER),
+           CAST(strftime('%s', end_time) AS INTEGER)
+    FROM bookings
+    WHERE booking_status != ? AND start_time < ? AND end_time > ?
+"""
+
+# Intervalos de las reservas activas de un rango (índices de disponibilidad);
+# resuelto con idx_bookings_time_range
+_SELECT_ACTIVE_INTERVALS = """
+    SELECT booking_id, space_id, start_time, end_time
+    FROM bookings
+    WHERE booking_status = ? AND start_time < ? AND end_time > ?
+"""
+
+# Página de un recorrido keyset en orden de ID; resuelto con idx_bookings_id_order
+_WHERE_AFTER = keyset_clauses("b.booking_id")
 
 
 class BookingSQLiteRepository(BookingRepository):
     """Repositorio SQLite para persistencia de reservas."""
 
-    def __init__(self, db_path: str = "smartspaces.db"):
+    def __init__(self, db_path: str = "smartspaces.db", pool: SQLiteConnectionPool | None = None):
         self._db_path = db_path
-
-    def _connect(self):
-        conn = sqlite3.connect(self._db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        self._pool = pool or SQLiteConnectionPool.for_path(db_path)
 
     def save(self, booking: Booking) -> None:
         """Persiste una reserva en la base de datos."""
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             with conn:
                 cursor = conn.cursor()
                 if booking.booking_id is None:
-                    cursor.execute("SELECT MAX(CAST(SUBSTR(booking_id,2) AS INTEGER)) FROM bookings")
-                    max_id = cursor.fetchone()[0] or 0
-                    booking._booking_id = f"B{max_id + 1}"
-                    
+                    booking._booking_id = BOOKING_IDS.next_id(cursor)
+                else:
+                    BOOKING_IDS.observe(cursor, booking.booking_id)
+
                 cursor.execute("""
                     INSERT INTO bookings 
                     (booking_id, user_id, space_id, start_time, end_time, booking_status)
@@ -56,11 +127,49 @@ class BookingSQLiteRepository(BookingRepository):
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al guardar la reserva: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
+
+    def save_many(self, bookings: list[Booking]) -> None:
+        """Persiste un lote de reservas en una única transacción.
+
+        Los IDs que faltan se reservan en bloque en id_sequences y las filas se
+        insertan con executemany; si alguna falla no se guarda ninguna.
+        """
+        unassigned = [b for b in bookings if b.booking_id is None]
+        conn = self._pool.acquire()
+        try:
+            with conn:
+                cursor = conn.cursor()
+                for booking in bookings:
+                    if booking.booking_id is not None:
+                        BOOKING_IDS.observe(cursor, booking.booking_id)
+                for booking, booking_id in zip(unassigned, BOOKING_IDS.reserve(cursor, len(unassigned))):
+                    booking._booking_id = booking_id
+                cursor.executemany("""
+                    INSERT INTO bookings 
+                    (booking_id, user_id, space_id, start_time, end_time, booking_status)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [(
+                    booking.booking_id,
+                    booking.user.user_id,
+                    booking.space.space_id,
+                    booking.start_time.isoformat(),
+                    booking.end_time.isoformat(),
+                    booking.status,
+                ) for booking in bookings])
+        except sqlite3.Error as e:
+            # La transacción se ha deshecho: los IDs asignados no llegaron a usarse
+            for booking in unassigned:
+                booking._booking_id = None
+            if isinstance(e, sqlite3.IntegrityError):
+                raise BookingAlreadyExistsException(f"No se pudo guardar el lote de reservas: {e}")
+            raise PersistenceException(f"Error al guardar el lote de reservas: {e}")
+        finally:
+            self._pool.release(conn)
 
     def update(self, booking: Booking) -> None:
         """Actualiza una reserva existente en la base de datos."""
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             with conn:
                 cursor = conn.cursor()
@@ -83,73 +192,32 @@ class BookingSQLiteRepository(BookingRepository):
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al actualizar la reserva: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
 
     def get(self, booking_id: str) -> Booking:
         """Recupera una reserva por su ID y reconstruye la entidad Booking."""
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    b.booking_id, b.start_time, b.end_time, b.booking_status,
-                    u.user_id, u.name, u.surname1, u.surname2, u.active,
-                    s.space_id, s.space_name, s.capacity, s.space_type, s.space_status,
-                    mr.room_number, mr.floor, mr.equipment_list, mr.num_power_outlets
-                FROM bookings b
-                JOIN users u ON b.user_id = u.user_id
-                JOIN spaces s ON b.space_id = s.space_id
-                LEFT JOIN meeting_rooms mr ON s.space_id = mr.space_id
-                WHERE b.booking_id = ?
-            """, (booking_id,))
-            
+            cursor.execute(_SELECT_BOOKINGS + " WHERE b.booking_id = ?", (booking_id,))
+
             row = cursor.fetchone()
             if row is None:
                 raise BookingNotFoundError(
                     f"No existe ninguna reserva con ID '{booking_id}'"
                 )
-            
-            (bid, start_time, end_time, booking_status,
-             user_id, name, surname1, surname2, active,
-             space_id, space_name, capacity, space_type, space_status,
-             room_number, floor, equipment_str, num_power_outlets) = row
-
-            user = User(user_id, name, surname1, surname2)
-            if not active:
-                user.deactivate()
-
-            if room_number is not None:
-                equipment_list = equipment_str.split(",") if equipment_str else []
-                space = SpaceMeetingRoom(
-                    space_id=space_id,
-                    space_name=space_name,
-                    capacity=capacity,
-                    room_number=room_number,
-                    floor=floor,
-                    equipment_list=equipment_list,
-                    num_power_outlets=num_power_outlets,
-                )
-            else:
-                space = Space(space_id, space_name, capacity, space_type)
-            space._space_status = space_status
-
-            booking = Booking(space, user,
-                            datetime.fromisoformat(start_time),
-                            datetime.fromisoformat(end_time))
-            booking._booking_id = bid
-            booking._booking_status = booking_status
-            return booking
+            return self._row_to_booking(row)
 
         except BookingNotFoundError:
             raise
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al leer la reserva: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
 
     def delete(self, booking_id: str) -> None:
         """Elimina una reserva de la base de datos."""
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             with conn:
                 cursor = conn.cursor()
@@ -157,60 +225,192 @@ class BookingSQLiteRepository(BookingRepository):
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al eliminar la reserva: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
 
-    def list(self) -> list[Booking]:
-        """Recupera todas las reservas usando JOINs para reconstruir entidades."""
-        conn = self._connect()
-        reservas = []
+    def find_overlapping(self, space_id: str, start_time, end_time,
+                         exclude_booking_id: str | None = None) -> list[Booking]:
+        """Recupera las reservas activas de un espacio que se solapan con un rango.
+
+        El filtro de solapamiento se resuelve en SQLite con una única búsqueda
+        sobre el índice (space_id, booking_status, start_time, end_time), de modo
+        que solo se hidratan las filas en conflicto.
+        """
+        conn = self._pool.acquire()
         try:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    b.booking_id, b.start_time, b.end_time, b.booking_status,
-                    u.user_id, u.name, u.surname1, u.surname2, u.active,
-                    s.space_id, s.space_name, s.capacity, s.space_type, s.space_status,
-                    mr.room_number, mr.floor, mr.equipment_list, mr.num_power_outlets
-                FROM bookings b
-                JOIN users u ON b.user_id = u.user_id
-                JOIN spaces s ON b.space_id = s.space_id
-                LEFT JOIN meeting_rooms mr ON s.space_id = mr.space_id
-            """)
-
-            for row in cursor.fetchall():
-                (bid, start_time, end_time, booking_status,
-                 user_id, name, surname1, surname2, active,
-                 space_id, space_name, capacity, space_type, space_status,
-                 room_number, floor, equipment_str, num_power_outlets) = row
-
-                user = User(user_id, name, surname1, surname2)
-                if not active:
-                    user.deactivate()
-
-                if room_number is not None:
-                    equipment_list = equipment_str.split(",") if equipment_str else []
-                    space = SpaceMeetingRoom(
-                        space_id=space_id,
-                        space_name=space_name,
-                        capacity=capacity,
-                        room_number=room_number,
-                        floor=floor,
-                        equipment_list=equipment_list,
-                        num_power_outlets=num_power_outlets,
-                    )
-                else:
-                    space = Space(space_id, space_name, capacity, space_type)
-                space._space_status = space_status
+            cursor.execute(_SELECT_BOOKINGS + _WHERE_OVERLAPPING, (
+                space_id,
+                Booking.STATUS_ACTIVE,
+                end_time.isoformat(),
+                start_time.isoformat(),
+                exclude_booking_id,
+            ))
+            identity_map = {}
+            return [self._row_to_booking(row, identity_map) for row in cursor.fetchall()]
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al buscar solapamientos: {e}")
+        finally:
+            self._pool.release(conn)
 
-                booking = Booking(space, user,
-                                datetime.fromisoformat(start_time),
-                                datetime.fromisoformat(end_time))
-                booking._booking_id = bid
-                booking._booking_status = booking_status
-                reservas.append(booking)
+    def find_by_user(self, user_id: str) -> list[Booking]:
+        """Recupera todas las reservas de un usuario, ordenadas por inicio."""
+        return self._find(_WHERE_USER, user_id, "Error al buscar reservas del usuario")
 
-            return reservas
+    def find_by_space(self, space_id: str) -> list[Booking]:
+        """Recupera todas las reservas de un espacio, ordenadas por inicio."""
+        return self._find(_WHERE_SPACE, space_id, "Error al buscar reservas del espacio")
+
+    def _find(self, where: str, key: str, error: str) -> list[Booking]:
+        """Ejecuta _SELECT_BOOKINGS con un filtro indexado y construye las reservas."""
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(_SELECT_BOOKINGS + where, (key,))
+            identity_map = {}
+            return [self._row_to_booking(row, identity_map) for row in cursor.fetchall()]
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"{error}: {e}")
+        finally:
+            self._pool.release(conn)
+
+    def count_active_for_user(self, user_id: str) -> int:
+        """Cuenta las reservas activas de un usuario.
+
+        El COUNT(*) se resuelve sobre el índice idx_bookings_user_status
+        (user_id, booking_status) sin leer la tabla.
+        """
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(_COUNT_ACTIVE_FOR_USER, (user_id, Booking.STATUS_ACTIVE))
+            return cursor.fetchone()[0]
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al contar reservas activas: {e}")
+        finally:
+            self._pool.release(conn)
+
+    def iter_bookings(self, after: str | None = None, limit: int | None = None) -> Iterator[Booking]:
+        """Recorre las reservas en orden de ID con paginación por clave.
+
+        Cada página se lee con una conexión propia del pool, de modo que la
+        memoria y el tiempo hasta la primera reserva no dependen del tamaño
+        de la tabla.
+        """
+        return iter_keyset(self._fetch_page, lambda booking: booking.booking_id, after, limit)
+
+    def _fetch_page(self, after: str, size: int) -> list[Booking]:
+        """Lee una página de reservas con ID posterior a ``after``."""
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            identity_map = {}
+            return [self._row_to_booking(row, identity_map)
+                    for row in fetch_keyset_rows(cursor, _SELECT_BOOKINGS, _WHERE_AFTER, after, size)]
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al listar reservas: {e}")
+        finally:
+            self._pool.release(conn)
+
+    def iter_records(self, after: str | None = None, limit: int | None = None) -> Iterator[dict]:
+        """Recorre las reservas como diccionarios, construidos directamente desde las filas.
+
+        Las fechas ya están guardadas en ISO 8601 y el nombre del usuario se
+        concatena en SQL, así que no se crea ninguna entidad.
+        """
+        return iter_keyset(self._fetch_record_page, itemgetter("booking_id"), after, limit)
+
+    def _fetch_record_page(self, after: str, size: int) -> list[dict]:
+        """Lee una página de registros de reservas con ID posterior a ``after``."""
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            return [dict(zip(_BOOKING_RECORD_FIELDS, row))
+                    for row in fetch_keyset_rows(cursor, _SELECT_BOOKING_RECORDS, _WHERE_AFTER, after, size)]
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al listar reservas: {e}")
+        finally:
+            self._pool.release(conn)
+
+    def load_intervals(self, start_time, end_time):
+        """Carga los intervalos de las reservas no canceladas como arrays de NumPy.
+
+        SQLite convierte las fechas ISO a segundos epoch (strftime('%s')), de
+        modo que no se construye ninguna entidad ni se parsean fechas en Python.
+        """
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(_SELECT_INTERVALS, (Booking.STATUS_CANCELLED, end_time.isoformat(), start_time.isoformat()))
+            rows = cursor.fetchall()
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al cargar intervalos de reservas: {e}")
+        finally:
+            self._pool.release(conn)
+        if not rows:
+            return np.array([], dtype=str), np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        space_ids, starts, ends = zip(*rows)
+        return np.array(space_ids), np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64)
+
+    def load_active_intervals(self, start_time, end_time) -> list[tuple]:
+        """Carga los intervalos de las reservas activas que se solapan con un rango.
+
+        Solo se leen cuatro columnas de bookings, sin JOINs ni entidades.
+        """
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(_SELECT_ACTIVE_INTERVALS,
+                           (Booking.STATUS_ACTIVE, end_time.isoformat(), start_time.isoformat()))
+            rows = cursor.fetchall()
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al cargar intervalos de reservas activas: {e}")
+        finally:
+            self._pool.release(conn)
+        return [(booking_id, space_id, datetime.fromisoformat(start), datetime.fromisoformat(end))
+                for booking_id, space_id, start, end in rows]
+
+    def list(self) -> list[Booking]:
+        """Recupera todas las reservas usando JOINs para reconstruir entidades.
+
+        Las reservas devueltas comparten un único objeto por cada User y Space.
+        """
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(_SELECT_BOOKINGS)
+            identity_map = {}
+            return [self._row_to_booking(row, identity_map) for row in cursor.fetchall()]
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al listar reservas: {e}")
         finally:
-            conn.close()
\ No newline at end of file
+            self._pool.release(conn)
+
+    @staticmethod
+    def _row_to_booking(row, identity_map: dict | None = None) -> Booking:
+        """Reconstruye una entidad Booking (con su User y Space) a partir de una fila.
+
+        Si se pasa un identity_map (un dict compartido por todas las filas de una
+        misma consulta), cada User y Space distinto se construye una sola vez y
+        las reservas que apuntan a él comparten el mismo objeto.
+        """
+        if identity_map is None:
+            identity_map = {}
+        bid, start_time, end_time, booking_status = row[:4]
+
+        user = identity_map.get(("user", row[4]))
+        if user is None:
+            user_id, name, surname1, surname2, active = row[4:9]
+            user = identity_map[("user", user_id)] = User(user_id, name, surname1, surname2)
+            if not active:
+                user.deactivate()
+
+        space = identity_map.get(("space", row[9]))
+        if space is None:
+            space = identity_map[("space", row[9])] = SpaceSQLiteRepository._row_to_space(row[9:])
+
+        booking = Booking(space, user,
+                        datetime.fromisoformat(start_time),
+                        datetime.fromisoformat(end_time))
+        booking._booking_id = bid
+        booking._booking_status = booking_status
+        return booking
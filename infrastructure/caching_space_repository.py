@@ -0,0 +1,26 @@
+"""infrastructure/caching_space_repository.py"""
+
+from collections.abc import Iterator
+from domain.space import Space
+from domain.space_repository import SpaceRepository
+from infrastructure.repository_cache import CachingRepository
+
+
+class CachingSpaceRepository(CachingRepository, SpaceRepository):
+    """Read-through caching decorator for any SpaceRepository.
+
+    The caching and invalidation are inherited from CachingRepository; name
+    lookups are cached under ``Space.normalize_name``.
+    """
+
+    def find_by_name(self, space_name: str) -> Space | None:
+        """Retrieves a space by name, from the cache when possible."""
+        return self._lookup_by_name(space_name, self._repo.find_by_name)
+
+    def iter_spaces(self, after: str | None = None, limit: int | None = None) -> Iterator[Space]:
+        """Iterates over the spaces of the wrapped repository."""
+        return self._repo.iter_spaces(after, limit)
+
+    @staticmethod
+    def _name_key(name: str) -> str:
+        return Space.normalize_name(name)
@@ -0,0 +1,26 @@
+"""infrastructure/caching_user_repository.py"""
+
+from collections.abc import Iterator
+from domain.user import User
+from domain.user_repository import UserRepository
+from infrastructure.repository_cache import CachingRepository
+
+
+class CachingUserRepository(CachingRepository, UserRepository):
+    """Read-through caching decorator for any UserRepository.
+
+    The caching and invalidation are inherited from CachingRepository; name
+    lookups are cached under ``User.normalize_full_name``.
+    """
+
+    def find_by_full_name(self, full_name: str) -> User | None:
+        """Retrieves a user by full name, from the cache when possible."""
+        return self._lookup_by_name(full_name, self._repo.find_by_full_name)
+
+    def iter_users(self, after: str | None = None, limit: int | None = None) -> Iterator[User]:
+        """Iterates over the users of the wrapped repository."""
+        return self._repo.iter_users(after, limit)
+
+    @staticmethod
+    def _name_key(name: str) -> str:
+        return User.normalize_full_name(name)
@@ -0,0 +1,66 @@
+"""infrastructure/id_order.py"""
+
+from bisect import bisect_left, bisect_right, insort
+
+
+def id_order_key(entity_id: str) -> tuple[int, str]:
+    """Returns the sort key that puts entity IDs in sequence order.
+
+    IDs are a prefix followed by a sequence number (``B1``, ``S2``, ``SM3``),
+    so comparing them as text would put ``B10`` before ``B2``. Comparing the
+    length first orders each series by its number; series sharing a length
+    (``S10`` and ``SM1``) are ordered as text. The SQLite repositories page in
+    the same order (infrastructure/sqlite_keyset.py).
+
+    Args:
+        entity_id: Identifier of a booking, space or user.
+
+    Returns:
+        A ``(length, id)`` tuple.
+    """
+    return len(entity_id), entity_id
+
+
+class IdOrder:
+    """Identifiers kept sorted by ``id_order_key`` for keyset pages over a dict.
+
+    The memory repositories store entities in dictionaries; this list lets
+    ``iter_*`` bisect to the position after ``after`` instead of sorting every
+    key on each page. Identifiers are normally allocated in sequence, so
+    ``add`` appends at the end of the list.
+    """
+
+    def __init__(self):
+        """Initializes an empty order."""
+        self._ids = []
+
+    def add(self, entity_id):
+        """Inserts an identifier at its position.
+
+        Args:
+            entity_id: Identifier not yet in the order.
+        """
+        insort(self._ids, entity_id, key=id_order_key)
+
+    def discard(self, entity_id):
+        """Removes an identifier if it is in the order.
+
+        Args:
+            entity_id: Identifier to remove.
+        """
+        position = bisect_left(self._ids, id_order_key(entity_id), key=id_order_key)
+        if position < len(self._ids) and self._ids[position] == entity_id:
+            del self._ids[position]
+
+    def page(self, after=None, limit=None):
+        """Returns the identifiers that follow ``after``, in sequence order.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of identifiers to return, or None for all.
+
+        Returns:
+            A new list, so the caller may change the repository while iterating it.
+        """
+        start = 0 if after is None else bisect_right(self._ids, id_order_key(after), key=id_order_key)
+        return self._ids[start:] if limit is None else self._ids[start:start + limit]
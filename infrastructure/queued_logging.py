@@ -0,0 +1,137 @@
+"""infrastructure/queued_logging.py"""
+
+import atexit
+import json
+import logging
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line.
+
+    The object holds the timestamp (UTC, ISO 8601), level, logger name and
+    message, the traceback when there is one, and every field passed through
+    ``extra`` (for example ``status`` or ``duration_ms`` on access lines).
+    """
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps only a fraction of the records below a level.
+
+    Records at ``keep_level`` or above (warnings and errors by default) always
+    pass, so sampling never hides a failure.
+    """
+
+    def __init__(self, rate, keep_level=logging.WARNING, random_source=random.random):
+        """Initializes the filter.
+
+        Args:
+            rate: Fraction of records to keep, between 0 and 1.
+            keep_level: Level from which every record is kept.
+            random_source: Callable returning a float in [0, 1).
+
+        Raises:
+            ValueError: If rate is not between 0 and 1.
+        """
+        super().__init__()
+        if not 0 <= rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1.")
+        self._rate, self._keep_level, self._random = rate, keep_level, random_source
+
+    def filter(self, record):
+        return record.levelno >= self._keep_level or self._rate >= 1 or self._random() < self._rate
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the logging thread.
+
+    Records are put on a bounded queue without waiting; if the writer has
+    fallen behind (a stalled log volume) and the queue is full, the record is
+    dropped and counted in ``dropped`` instead of delaying the request.
+    The message is merged with its arguments here, but JSON encoding and the
+    file write happen on the listener thread.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.listener = None
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(vars(record))
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(filename, level=logging.INFO, max_bytes=10 * 1024 * 1024, backup_count=5,
+                      queue_size=10000, logger=None):
+    """Routes the records of a logger through a queue to a rotating JSON file.
+
+    The logger only gets a DroppingQueueHandler; a QueueListener thread owns
+    the RotatingFileHandler and does all formatting and disk I/O. The listener
+    is stopped (and the queue flushed) at interpreter exit. Calling it again
+    on the same logger replaces the previous handler and stops its listener,
+    so records are never written twice.
+
+    Args:
+        filename: Path of the log file.
+        level: Minimum level of the logger.
+        max_bytes: Size at which the file is rotated.
+        backup_count: Number of rotated files kept.
+        queue_size: Maximum number of pending records before dropping.
+        logger: Logger to configure; the root logger by default.
+
+    Returns:
+        A ``(handler, listener)`` tuple, already started.
+    """
+    file_handler = RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backup_count,
+                                       encoding="utf-8", delay=True)
+    file_handler.setFormatter(JsonFormatter())
+    handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    listener = QueueListener(handler.queue, file_handler, respect_handler_level=True)
+
+    handler.listener = listener
+
+    logger = logger or logging.getLogger()
+    for previous in [h for h in logger.handlers if isinstance(h, DroppingQueueHandler)]:
+        logger.removeHandler(previous)
+        _stop_listener(previous.listener)
+    logger.setLevel(level)
+    logger.addHandler(handler)
+    listener.start()
+    atexit.register(_stop_listener, listener)
+    return handler, listener
+
+
+def _stop_listener(listener):
+    """Flushes and stops a listener unless it was already stopped."""
+    if listener is not None and listener._thread is not None:
+        listener.stop()
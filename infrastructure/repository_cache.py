@@ -0,0 +1,162 @@
+"""infrastructure/repository_cache.py"""
+
+import copy
+import threading
+import time
+
+
+class RepositoryCache:
+    """Read-through cache for the results of a repository's read methods.
+
+    Results are memoized by key until one of these happens:
+
+    * ``invalidate`` is called (the caching repositories do so on every write);
+    * the entries are older than ``ttl`` seconds;
+    * the optional ``version`` source returns a different value than when the
+      entries were loaded, which lets other processes sharing the same
+      database signal their writes (see SQLiteDataVersion).
+
+    Entities are handed out as shallow copies, so callers that change an
+    entity in memory (e.g. ``Space.reserve`` during booking creation) never
+    alter the cached state seen by other callers.
+    """
+
+    def __init__(self, ttl=30.0, version=None, clock=time.monotonic):
+        """Initializes an empty cache.
+
+        Args:
+            ttl: Maximum age of the entries in seconds, or None for no expiry.
+            version: Optional callable returning the current data version.
+            clock: Callable returning the current time in seconds.
+        """
+        self._ttl, self._version, self._clock = ttl, version, clock
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._loaded_at, self._loaded_version = None, None
+        self._generation = 0
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def lookup(self, key, loader):
+        """Returns the cached result for a key, loading it on a miss.
+
+        Args:
+            key: Hashable key identifying the read (method and arguments).
+            loader: Callable producing the result from the wrapped repository.
+
+        Returns:
+            A copy of the cached entity, a list of copies, or None.
+        """
+        version = self._version() if self._version is not None else None
+        with self._lock:
+            self._expire(version)
+            if key in self._entries:
+                self._stats["hits"] += 1
+                return self._copy(self._entries[key])
+            self._stats["misses"] += 1
+            generation = self._generation
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                if not self._entries:
+                    self._loaded_at, self._loaded_version = self._clock(), version
+                self._entries[key] = value
+        return self._copy(value)
+
+    def invalidate(self):
+        """Drops every cached result."""
+        with self._lock:
+            self._clear()
+            self._stats["invalidations"] += 1
+
+    def stats(self) -> dict:
+        """Returns the hit, miss and invalidation counters and the number of entries."""
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+
+    def _expire(self, version):
+        if not self._entries:
+            return
+        expired = self._ttl is not None and self._clock() - self._loaded_at >= self._ttl
+        if expired or version != self._loaded_version:
+            self._clear()
+
+    def _clear(self):
+        self._entries.clear()
+        self._generation += 1
+
+    @staticmethod
+    def _copy(value):
+        if isinstance(value, list):
+            return [copy.copy(item) for item in value]
+        return copy.copy(value)
+
+
+class CachingRepository:
+    """Read-through caching decorator shared by the entity repositories.
+
+    ``get``, the name lookup and ``list`` are served from a RepositoryCache;
+    ``save``, ``update`` and ``delete`` go to the wrapped repository and then
+    invalidate the cache. Keyset iteration (of entities and of records) is
+    delegated unchanged, since each page is already a bounded query.
+
+    Subclasses mix this class in before their repository contract and only
+    provide ``_name_key``, which maps a name to the key its lookup is cached
+    under, plus the entity-specific name lookup and iteration methods.
+    """
+
+    def __init__(self, repo, ttl=30.0, version=None, cache: RepositoryCache | None = None):
+        """Initializes the decorator.
+
+        Args:
+            repo: Repository whose reads are cached.
+            ttl: Maximum age of cached results in seconds, or None for no expiry.
+            version: Optional callable returning the current data version of the
+                entities, used to detect writes made by other processes.
+            cache: Optional cache instance; built from ttl and version if omitted.
+        """
+        self._repo = repo
+        self._cache = cache or RepositoryCache(ttl=ttl, version=version)
+
+    def save(self, entity):
+        """Stores an entity in the wrapped repository and invalidates the cache."""
+        self._write(self._repo.save, entity)
+
+    def get(self, entity_id: str):
+        """Retrieves an entity by its identifier, from the cache when possible."""
+        return self._cache.lookup(("get", entity_id), lambda: self._repo.get(entity_id))
+
+    def iter_records(self, after: str | None = None, limit: int | None = None):
+        """Iterates over the entities of the wrapped repository as dictionaries."""
+        return self._repo.iter_records(after, limit)
+
+    def list(self) -> list:
+        """Retrieves all entities, from the cache when possible."""
+        return self._cache.lookup(("list",), self._repo.list)
+
+    def delete(self, entity_id: str):
+        """Deletes an entity in the wrapped repository and invalidates the cache."""
+        self._write(self._repo.delete, entity_id)
+
+    def update(self, entity):
+        """Updates an entity in the wrapped repository and invalidates the cache."""
+        self._write(self._repo.update, entity)
+
+    def cache_stats(self) -> dict:
+        """Returns the counters of the underlying cache."""
+        return self._cache.stats()
+
+    def _lookup_by_name(self, name: str, loader):
+        """Returns the entity with a name, cached under its ``_name_key``."""
+        return self._cache.lookup(("name", self._name_key(name)), lambda: loader(name))
+
+    @staticmethod
+    def _name_key(name: str) -> str:
+        """Returns the key a name lookup is cached under."""
+        raise NotImplementedError
+
+    def _write(self, operation, argument):
+        """Runs a write on the wrapped repository, invalidating the cache even if it fails."""
+        try:
+            operation(argument)
+        finally:
+            self._cache.invalidate()
@@ -0,0 +1,237 @@
+"""infrastructure/request_metrics.py"""
+
+import threading
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+_current = ContextVar("request_tally", default=None)
+
+
+class RequestTally:
+    """Per-request counters filled while a request is being served.
+
+    Attributes:
+        started: ``time.perf_counter()`` value when the request started.
+        sql_statements: Number of SQL statements executed.
+        repository_calls: Mapping of ``(repository, operation)`` to call count.
+    """
+
+    __slots__ = ("started", "sql_statements", "repository_calls")
+
+    def __init__(self, started):
+        self.started = started
+        self.sql_statements = 0
+        self.repository_calls = {}
+
+
+class _Histogram:
+    """Cumulative histogram with fixed upper bounds, as exposed by Prometheus."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size):
+        self.counts = [0] * size
+        self.total = 0
+        self.count = 0
+
+    def observe(self, bounds, value):
+        for i, bound in enumerate(bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.total += value
+        self.count += 1
+
+
+class RequestMetrics:
+    """Thread-safe registry of HTTP request metrics in Prometheus text format.
+
+    A request is opened with ``start`` and closed with ``observe`` (latency,
+    status and per-request counters) and ``end`` (in-flight gauge). While it
+    is open, SQL statements and repository calls made by the same thread or
+    task are attributed to it through a context variable, so concurrent
+    requests never mix their counts. Routes are labelled with their URL rule
+    (``/users/<user_id>``) to keep the number of series bounded.
+
+    Exposed series:
+
+    * ``smartspaces_http_request_duration_seconds{route,method,status}``
+    * ``smartspaces_http_request_sql_statements{route,method}``
+    * ``smartspaces_repository_calls_total{route,repository,operation}``
+    * ``smartspaces_http_requests_in_flight``
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """Initializes an empty registry.
+
+        Args:
+            clock: Callable returning a monotonic time in seconds.
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latency = {}
+        self._statements = {}
+        self._repository_calls = {}
+        self._in_flight = 0
+
+    def start(self) -> RequestTally:
+        """Opens a request: bumps the in-flight gauge and starts its tally.
+
+        Returns:
+            The tally that collects the counters of the request.
+        """
+        tally = RequestTally(self._clock())
+        _current.set(tally)
+        with self._lock:
+            self._in_flight += 1
+        return tally
+
+    def observe(self, tally: RequestTally, route: str, method: str, status: int) -> float:
+        """Records the latency and counters of a finished request.
+
+        Args:
+            tally: Tally returned by ``start``.
+            route: URL rule of the matched route.
+            method: HTTP method.
+            status: HTTP status code of the response.
+
+        Returns:
+            The request duration in seconds.
+        """
+        elapsed = self._clock() - tally.started
+        with self._lock:
+            latency = self._latency.get((route, method, str(status)))
+            if latency is None:
+                latency = self._latency[route, method, str(status)] = _Histogram(len(LATENCY_BUCKETS))
+            latency.observe(LATENCY_BUCKETS, elapsed)
+            statements = self._statements.get((route, method))
+            if statements is None:
+                statements = self._statements[route, method] = _Histogram(len(STATEMENT_BUCKETS))
+            statements.observe(STATEMENT_BUCKETS, tally.sql_statements)
+            for (repository, operation), calls in tally.repository_calls.items():
+                key = (route, repository, operation)
+                self._repository_calls[key] = self._repository_calls.get(key, 0) + calls
+        return elapsed
+
+    def end(self, tally: RequestTally) -> None:
+        """Closes a request opened with ``start`` (decrements the in-flight gauge)."""
+        if _current.get() is tally:
+            _current.set(None)
+        with self._lock:
+            self._in_flight -= 1
+
+    @staticmethod
+    def count_statement(sql: str) -> None:
+        """Counts an SQL statement against the current request, if any.
+
+        Meant to be registered with ``SQLiteConnectionPool.add_statement_listener``.
+        """
+        tally = _current.get()
+        if tally is not None:
+            tally.sql_statements += 1
+
+    @staticmethod
+    def count_repository_call(repository: str, operation: str) -> None:
+        """Counts a repository call against the current request, if any."""
+        tally = _current.get()
+        if tally is not None:
+            key = (repository, operation)
+            tally.repository_calls[key] = tally.repository_calls.get(key, 0) + 1
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            latency = {key: (list(h.counts), h.total, h.count) for key, h in self._latency.items()}
+            statements = {key: (list(h.counts), h.total, h.count) for key, h in self._statements.items()}
+            repository_calls = dict(self._repository_calls)
+            in_flight = self._in_flight
+
+        lines = [
+            "# HELP smartspaces_http_request_duration_seconds HTTP request latency.",
+            "# TYPE smartspaces_http_request_duration_seconds histogram",
+        ]
+        for (route, method, status), values in sorted(latency.items()):
+            lines += _histogram_lines("smartspaces_http_request_duration_seconds", LATENCY_BUCKETS,
+                                      {"route": route, "method": method, "status": status}, values)
+        lines += [
+            "# HELP smartspaces_http_request_sql_statements SQL statements executed per HTTP request.",
+            "# TYPE smartspaces_http_request_sql_statements histogram",
+        ]
+        for (route, method), values in sorted(statements.items()):
+            lines += _histogram_lines("smartspaces_http_request_sql_statements", STATEMENT_BUCKETS,
+                                      {"route": route, "method": method}, values)
+        lines += [
+            "# HELP smartspaces_repository_calls_total Repository calls made while serving HTTP requests.",
+            "# TYPE smartspaces_repository_calls_total counter",
+        ]
+        for (route, repository, operation), calls in sorted(repository_calls.items()):
+            labels = _labels({"route": route, "repository": repository, "operation": operation})
+            lines.append(f"smartspaces_repository_calls_total{labels} {calls}")
+        lines += [
+            "# HELP smartspaces_http_requests_in_flight HTTP requests currently being served.",
+            "# TYPE smartspaces_http_requests_in_flight gauge",
+            f"smartspaces_http_requests_in_flight {in_flight}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class InstrumentedRepository:
+    """Proxy counting the calls made to any repository.
+
+    Every public method of the wrapped repository is forwarded unchanged and
+    counted with ``RequestMetrics.count_repository_call`` under the given
+    repository name. Wrapped methods are cached, so the cost per call is one
+    extra function call and a context variable lookup.
+    """
+
+    def __init__(self, repo, name: str):
+        """Initializes the proxy.
+
+        Args:
+            repo: Repository to instrument.
+            name: Label used for the repository in the metrics.
+        """
+        self._repo = repo
+        self._name = name
+
+    def __getattr__(self, attribute):
+        target = getattr(self._repo, attribute)
+        if attribute.startswith("_") or not callable(target):
+            return target
+
+        @wraps(target)
+        def counted(*args, **kwargs):
+            RequestMetrics.count_repository_call(self._name, attribute)
+            return target(*args, **kwargs)
+
+        setattr(self, attribute, counted)
+        return counted
+
+
+def _labels(labels):
+    escaped = (f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _histogram_lines(name, bounds, labels, values):
+    counts, total, count = values
+    lines, cumulative = [], 0
+    for bound, bucket_count in zip(bounds, counts):
+        cumulative += bucket_count
+        lines.append(f"{name}_bucket{_labels({**labels, 'le': _format(bound)})} {cumulative}")
+    lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {count}")
+    lines.append(f"{name}_sum{_labels(labels)} {_format(total)}")
+    lines.append(f"{name}_count{_labels(labels)} {count}")
+    return lines
@@ -0,0 +1,187 @@
+"""infrastructure/slot_availability_index.py"""
+
+import threading
+from datetime import datetime, time, timedelta
+
+from domain.availability_repository import AvailabilityRepository
+
+
+class SlotAvailabilityIndex(AvailabilityRepository):
+    """Availability index keeping a bitmap of occupied time slots per space.
+
+    The booking grid is divided into fixed slots (15 minutes by default) over
+    a rolling horizon that starts at midnight of the current day. Each space
+    has two bitmaps, stored as Python integers with one bit per slot:
+
+    * ``busy``: slots touched by an active booking.
+    * ``full``: slots entirely covered by an active booking.
+
+    A range query builds the mask of slots the range touches and ANDs it with
+    each space's bitmaps: no busy bit means the space is free, a full bit means
+    it is taken. Only bookings that do not fall on slot boundaries can leave a
+    partially covered slot as the sole conflict; those spaces are resolved with
+    an exact ``find_overlapping`` call on the booking repository. Two active
+    bookings of a space never overlap, so a slot can only be shared as a
+    partial slot; those are reference counted so that removing one booking
+    keeps the bit set for the other.
+
+    The index is updated incrementally through ``update`` whenever a booking
+    is created, cancelled, finished or rescheduled, and is rebuilt when the
+    horizon rolls over to a new day. A rebuild loads only the intervals of
+    the active bookings inside the horizon (``load_active_intervals``). Ranges
+    outside the horizon are delegated to a fallback availability repository.
+
+    With a ``version`` source (the bookings counter of data_versions), writes
+    made by other processes sharing the database are detected too. ``update``
+    and ``remove`` follow the caller's own stored writes, which advance the
+    counter by one per booking; any other change rebuilds the index.
+    """
+
+    def __init__(self, space_repo, booking_repo, fallback, slot_minutes=15, horizon_days=90, clock=datetime.now,
+                 version=None):
+        """Initializes an empty index; it is built on first use.
+
+        Args:
+            space_repo: Repository used to list the spaces.
+            booking_repo: Repository used to load active intervals and check overlaps.
+            fallback: AvailabilityRepository used for ranges outside the horizon.
+            slot_minutes: Size of a slot in minutes.
+            horizon_days: Number of days covered by the bitmaps.
+            clock: Callable returning the current datetime.
+            version: Optional callable returning the current data version of
+                the bookings (see SQLiteDataVersion).
+        """
+        self._space_repo, self._booking_repo, self._fallback = space_repo, booking_repo, fallback
+        self._slot = timedelta(minutes=slot_minutes)
+        self._horizon = timedelta(days=horizon_days)
+        self._clock, self._version = clock, version
+        self._lock = threading.Lock()
+        self._origin, self._loaded_version = None, None
+        self._busy, self._full, self._shared, self._entries = {}, {}, {}, {}
+
+    def update(self, *bookings):
+        """Re-indexes bookings after they were created or changed.
+
+        The previous slots of each booking are cleared and, if it is still
+        active, its current slots are marked as occupied.
+
+        Args:
+            *bookings: Booking instances with an assigned ID, stored by the
+                caller (one write per booking).
+        """
+        with self._lock:
+            if self._ensure_current(own_writes=len(bookings)):
+                return
+            for booking in bookings:
+                self._remove(booking.booking_id)
+                if booking.is_active():
+                    self._add(booking.booking_id, booking.space.space_id, booking.start_time, booking.end_time)
+
+    def remove(self, booking_id):
+        """Removes a booking from the index if it is indexed.
+
+        Args:
+            booking_id: Unique identifier of the booking.
+        """
+        with self._lock:
+            if not self._ensure_current(own_writes=1):
+                self._remove(booking_id)
+
+    def list_available_spaces(self, start_time, end_time):
+        """Retrieves the spaces without overlapping active bookings.
+
+        Args:
+            start_time: Desired booking start datetime.
+            end_time: Desired booking end datetime.
+
+        Returns:
+            A list of spaces available during the specified time range.
+        """
+        spaces = self._space_repo.list()
+        with self._lock:
+            self._ensure_current()
+            if start_time >= end_time or start_time < self._origin or end_time > self._origin + self._horizon:
+                busy = None
+            else:
+                touched, _, _ = self._masks(start_time, end_time)
+                busy, partial = set(), set()
+                for space in spaces:
+                    if self._busy.get(space.space_id, 0) & touched:
+                        (busy if self._full.get(space.space_id, 0) & touched else partial).add(space.space_id)
+        if busy is None:
+            return self._fallback.list_available_spaces(start_time, end_time)
+        return [
+            space for space in spaces
+            if space.space_id not in busy
+            and (space.space_id not in partial
+                 or not self._booking_repo.find_overlapping(space.space_id, start_time, end_time))
+        ]
+
+    def _ensure_current(self, own_writes=0):
+        """Rebuilds the index if it was never built, the day has changed or
+        the data version moved by other than the caller's own writes.
+
+        A rebuild reads the active intervals inside the horizon, not the
+        booking history.
+
+        An unchanged version is also accepted: the own writes were then
+        already loaded by a rebuild made after them (e.g. by another thread).
+
+        Args:
+            own_writes: Stored writes the caller is about to apply itself.
+
+        Returns:
+            True if the index was rebuilt from the booking repository.
+        """
+        origin = datetime.combine(self._clock().date(), time.min)
+        version = self._version() if self._version is not None else None
+        if origin == self._origin and (version is None
+                                       or version in (self._loaded_version, self._loaded_version + own_writes)):
+            self._loaded_version = version
+            return False
+        self._origin, self._loaded_version = origin, version
+        self._busy, self._full, self._shared, self._entries = {}, {}, {}, {}
+        for interval in self._booking_repo.load_active_intervals(origin, origin + self._horizon):
+            self._add(*interval)
+        return True
+
+    def _masks(self, start_time, end_time):
+        """Returns the touched mask, the fully covered mask and the partial slots of a range.
+
+        The range is clipped to the horizon; an empty range yields empty masks.
+        """
+        start = max(start_time, self._origin) - self._origin
+        end = min(end_time, self._origin + self._horizon) - self._origin
+        if start >= end:
+            return 0, 0, ()
+        first, last = start // self._slot, -(-end // self._slot)
+        full_first, full_last = -(-start // self._slot), end // self._slot
+        touched = ((1 << (last - first)) - 1) << first
+        full = ((1 << (full_last - full_first)) - 1) << full_first if full_last > full_first else 0
+        partial = tuple(sorted({slot for slot in (first, last - 1) if not full >> slot & 1}))
+        return touched, full, partial
+
+    def _add(self, booking_id, space_id, start_time, end_time):
+        touched, full, partial = self._masks(start_time, end_time)
+        if not touched:
+            return
+        self._busy[space_id] = self._busy.get(space_id, 0) | touched
+        self._full[space_id] = self._full.get(space_id, 0) | full
+        for slot in partial:
+            self._shared[space_id, slot] = self._shared.get((space_id, slot), 0) + 1
+        self._entries[booking_id] = (space_id, full, partial)
+
+    def _remove(self, booking_id):
+        entry = self._entries.pop(booking_id, None)
+        if entry is None:
+            return
+        space_id, full, partial = entry
+        cleared = full
+        for slot in partial:
+            remaining = self._shared.pop((space_id, slot)) - 1
+            if remaining:
+                self._shared[space_id, slot] = remaining
+            else:
+                cleared |= 1 << slot
+        self._busy[space_id] &= ~cleared
+        self._full[space_id] &= ~full
@@ -1,16 +1,20 @@
 """infrastructure/space_memory_repository.py"""
 
+from domain.space import Space
 from domain.space_repository import SpaceRepository
 from domain.exceptions import (
     SpaceAlreadyExistsException,
     SpaceNotFoundError,
 )
+from infrastructure.id_order import IdOrder
 
 
 class SpaceMemoryRepository(SpaceRepository):
     """In-memory implementation of the SpaceRepository interface.
 
-    Stores spaces in a dictionary using their IDs as keys. Assigns unique
+    Stores spaces in a dictionary using their IDs as keys, plus an index from
+    normalized name to space IDs for name lookups and the IDs in sequence
+    order for keyset iteration. Assigns unique
     auto-incremented IDs to new spaces. Useful for testing or scenarios
     without a persistent storage backend.
     """
@@ -19,6 +23,8 @@ class SpaceMemoryRepository(SpaceRepository):
         """Initializes an empty in-memory space repository with auto-increment ID tracking."""
         self._spaces = {}
         self._last_id = 0
+        self._ids_by_name, self._indexed_names = {}, {}
+        self._order = IdOrder()
 
     def save(self, space):
         """Stores or updates a space in memory.
@@ -33,10 +39,12 @@ class SpaceMemoryRepository(SpaceRepository):
         """
         if space.space_id is None:
             self._last_id += 1
-            space._space_id = f"S{self._last_id}"
+            space.space_id = f"S{self._last_id}"
         elif space.space_id in self._spaces:
             raise SpaceAlreadyExistsException(f"Ya existe un espacio con ID '{space.space_id}'")
         self._spaces[space.space_id] = space
+        self._order.add(space.space_id)
+        self._index_name(space)
 
     def update(self, space):
         """Updates a space in memory.
@@ -50,6 +58,7 @@ class SpaceMemoryRepository(SpaceRepository):
         if space.space_id not in self._spaces:
             raise SpaceNotFoundError(f"No existe ningún espacio con ID '{space.space_id}'")
         self._spaces[space.space_id] = space
+        self._index_name(space)
 
     def get(self, space_id):
         """Retrieves a space by its ID.
@@ -70,6 +79,32 @@ class SpaceMemoryRepository(SpaceRepository):
             )
         return space
 
+    def iter_spaces(self, after=None, limit=None):
+        """Iterates over stored spaces in identifier order.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of spaces to yield, or None for all.
+
+        Yields:
+            Stored spaces ordered by identifier.
+        """
+        for key in self._order.page(after, limit):
+            yield self._spaces[key]
+
+    def iter_records(self, after=None, limit=None):
+        """Iterates over stored spaces as plain dictionaries, in identifier order.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of records to yield, or None for all.
+
+        Yields:
+            The ``to_record`` dictionary of each stored space.
+        """
+        for space in self.iter_spaces(after, limit):
+            yield space.to_record()
+
     def list(self):
         """Retrieves all stored spaces.
 
@@ -78,6 +113,18 @@ class SpaceMemoryRepository(SpaceRepository):
         """
         return list(self._spaces.values())
 
+    def find_by_name(self, space_name):
+        """Retrieves a space by name, ignoring case.
+
+        Args:
+            space_name: Name of the space.
+
+        Returns:
+            The first stored space with that name, or None if there is none.
+        """
+        space_ids = self._ids_by_name.get(Space.normalize_name(space_name))
+        return self._spaces[space_ids[0]] if space_ids else None
+
     def delete(self, space_id):
         """Deletes a space by its ID if it exists.
 
@@ -85,3 +132,20 @@ class SpaceMemoryRepository(SpaceRepository):
             space_id: Unique identifier of the space to delete.
         """
         self._spaces.pop(space_id, None)
+        self._order.discard(space_id)
+        self._unindex_name(space_id)
+
+    def _index_name(self, space):
+        """Indexes the current name of a space, dropping its previous name."""
+        self._unindex_name(space.space_id)
+        key = Space.normalize_name(space.space_name)
+        self._ids_by_name.setdefault(key, []).append(space.space_id)
+        self._indexed_names[space.space_id] = key
+
+    def _unindex_name(self, space_id):
+        """Removes a space from the name index if it is indexed."""
+        key = self._indexed_names.pop(space_id, None)
+        if key is not None:
+            self._ids_by_name[key].remove(space_id)
+            if not self._ids_by_name[key]:
+                del self._ids_by_name[key]
@@ -5,6 +5,8 @@ Transforma excepciones sqlite3 en excepciones de dominio.
 """
 
 import sqlite3
+from collections.abc import Iterator
+from operator import itemgetter
 from domain import space
 from domain.space import Space
 from domain.space_meetingroom import SpaceMeetingRoom
@@ -14,43 +16,61 @@ from domain.exceptions import (
     SpaceNotFoundError,
     PersistenceException,
 )
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+from infrastructure.sqlite_id_sequence import MEETING_ROOM_IDS, SPACE_IDS
+from infrastructure.sqlite_keyset import fetch_keyset_rows, iter_keyset, keyset_clauses
+
+_SELECT_SPACES = """
+    SELECT 
+        s.space_id,
+        s.space_name,
+        s.capacity,
+        s.space_type,
+        s.space_status,
+        mr.room_number,
+        mr.floor,
+        mr.equipment_list,
+        mr.num_power_outlets
+    FROM spaces s
+    LEFT JOIN meeting_rooms mr 
+        ON s.space_id = mr.space_id
+"""
+
+# Campos de Space.to_record y los añadidos por SpaceMeetingRoom.to_record,
+# en el orden de las columnas de _SELECT_SPACES
+_SPACE_RECORD_FIELDS = ("space_id", "space_name", "capacity", "space_type", "space_status")
+_MEETING_ROOM_RECORD_FIELDS = ("room_number", "floor", "equipment_list", "num_power_outlets")
+
+# Búsqueda por nombre normalizado (Space.normalize_name); resuelta con idx_spaces_name_normalized
+_WHERE_NAME = " WHERE s.space_name_normalized = ? LIMIT 1"
+
+# Página de un recorrido keyset en orden de ID; resuelto con idx_spaces_id_order
+_WHERE_AFTER = keyset_clauses("s.space_id")
 
 
 class SpaceSQLiteRepository(SpaceRepository):
-    def __init__(self, db_path: str = "smartspaces.db"):
+    def __init__(self, db_path: str = "smartspaces.db", pool: SQLiteConnectionPool | None = None):
         self._db_path = db_path
-
-    def _connect(self):
-        conn = sqlite3.connect(self._db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        self._pool = pool or SQLiteConnectionPool.for_path(db_path)
 
     def save(self, space: Space) -> None:
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             with conn:
                 cursor = conn.cursor()
 
-                # Asignar ID automático si es None
+                # Asignar ID automático si es None (secuencia en id_sequences)
+                sequence = MEETING_ROOM_IDS if isinstance(space, SpaceMeetingRoom) else SPACE_IDS
                 if space.space_id is None:
-                    if isinstance(space, SpaceMeetingRoom):
-                        cursor.execute(
-                            "SELECT MAX(CAST(SUBSTR(space_id, 3) AS INTEGER)) FROM spaces WHERE space_id LIKE 'SM%'"
-                        )
-                        max_id = cursor.fetchone()[0] or 0
-                        space.space_id = f"SM{max_id + 1}"
-                    else:
-                        cursor.execute(
-                            "SELECT MAX(CAST(SUBSTR(space_id, 2) AS INTEGER)) FROM spaces WHERE space_id LIKE 'S%' AND space_id NOT LIKE 'SM%'"
-                        )
-                        max_id = cursor.fetchone()[0] or 0
-                        space.space_id = f"S{max_id + 1}"
+                    space.space_id = sequence.next_id(cursor)
+                else:
+                    sequence.observe(cursor, space.space_id)
 
                 cursor.execute(
                     """
                     INSERT INTO spaces
-                    (space_id, space_name, capacity, space_type, space_status)
-                    VALUES (?, ?, ?, ?, ?)
+                    (space_id, space_name, capacity, space_type, space_status, space_name_normalized)
+                    VALUES (?, ?, ?, ?, ?, ?)
                     """,
                     (
                         space.space_id,
@@ -58,6 +78,7 @@ class SpaceSQLiteRepository(SpaceRepository):
                         space.capacity,
                         space.space_type,
                         space.space_status,
+                        Space.normalize_name(space.space_name),
                     ),
                 )
 
@@ -83,10 +104,10 @@ class SpaceSQLiteRepository(SpaceRepository):
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al guardar el espacio: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
 
     def get(self, space_id: str) -> Space:
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             cursor = conn.cursor()
 
@@ -143,79 +164,119 @@ class SpaceSQLiteRepository(SpaceRepository):
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al leer el espacio: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
 
-    def list(self) -> list:
-        conn = self._connect()
-        espacios = []
+    def find_by_name(self, space_name: str) -> Space | None:
+        """Recupera un espacio por su nombre, sin distinguir mayúsculas (también las acentuadas).
 
+        La búsqueda usa el índice sobre la columna space_name_normalized.
+        """
+        conn = self._pool.acquire()
         try:
             cursor = conn.cursor()
+            cursor.execute(_SELECT_SPACES + _WHERE_NAME, (Space.normalize_name(space_name),))
+            row = cursor.fetchone()
+            return self._row_to_space(row) if row else None
 
-            cursor.execute(
-                """
-                SELECT 
-                    s.space_id,
-                    s.space_name,
-                    s.capacity,
-                    s.space_type,
-                    s.space_status,
-                    mr.room_number,
-                    mr.floor,
-                    mr.equipment_list,
-                    mr.num_power_outlets
-                FROM spaces s
-                LEFT JOIN meeting_rooms mr 
-                    ON s.space_id = mr.space_id
-                """
-            )
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al buscar el espacio: {e}")
+        finally:
+            self._pool.release(conn)
 
-            for row in cursor.fetchall():
-                (
-                    sid,
-                    space_name,
-                    capacity,
-                    space_type,
-                    space_status,
-                    room_number,
-                    floor,
-                    equipment_str,
-                    num_power_outlets,
-                ) = row
-
-                if room_number is not None:
-                    equipment_list = (
-                        equipment_str.split(",") if equipment_str else []
-                    )
-                    obj = SpaceMeetingRoom(
-                        space_id=sid,
-                        space_name=space_name,
-                        capacity=capacity,
-                        room_number=room_number,
-                        floor=floor,
-                        equipment_list=equipment_list,
-                        num_power_outlets=num_power_outlets,
-                    )
-                else:
-                    obj = Space(
-                        space_id=sid,
-                        space_name=space_name,
-                        capacity=capacity,
-                        space_type=space_type,
-                    )
+    def iter_spaces(self, after: str | None = None, limit: int | None = None) -> Iterator[Space]:
+        """Recorre los espacios en orden de ID con paginación por clave."""
+        return iter_keyset(self._fetch_page, lambda space: space.space_id, after, limit)
+
+    def _fetch_page(self, after: str, size: int) -> list[Space]:
+        """Lee una página de espacios con ID posterior a ``after``."""
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            return [self._row_to_space(row)
+                    for row in fetch_keyset_rows(cursor, _SELECT_SPACES, _WHERE_AFTER, after, size)]
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al listar espacios: {e}")
+        finally:
+            self._pool.release(conn)
 
-                obj._space_status = space_status
-                espacios.append(obj)
+    def iter_records(self, after: str | None = None, limit: int | None = None) -> Iterator[dict]:
+        """Recorre los espacios como diccionarios, construidos directamente desde las filas."""
+        return iter_keyset(self._fetch_record_page, itemgetter("space_id"), after, limit)
 
-            return espacios
+    def _fetch_record_page(self, after: str, size: int) -> list[dict]:
+        """Lee una página de registros de espacios con ID posterior a ``after``."""
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            return [self._row_to_record(row)
+                    for row in fetch_keyset_rows(cursor, _SELECT_SPACES, _WHERE_AFTER, after, size)]
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al listar espacios: {e}")
+        finally:
+            self._pool.release(conn)
+
+    def list(self) -> list:
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(_SELECT_SPACES)
+            return [self._row_to_space(row) for row in cursor.fetchall()]
 
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al listar espacios: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
+
+    @staticmethod
+    def _row_to_space(row) -> Space:
+        """Reconstruye un Space o SpaceMeetingRoom a partir de una fila de _SELECT_SPACES."""
+        (
+            sid,
+            space_name,
+            capacity,
+            space_type,
+            space_status,
+            room_number,
+            floor,
+            equipment_str,
+            num_power_outlets,
+        ) = row
+
+        if room_number is not None:
+            equipment_list = (
+                equipment_str.split(",") if equipment_str else []
+            )
+            obj = SpaceMeetingRoom(
+                space_id=sid,
+                space_name=space_name,
+                capacity=capacity,
+                room_number=room_number,
+                floor=floor,
+                equipment_list=equipment_list,
+                num_power_outlets=num_power_outlets,
+            )
+        else:
+            obj = Space(
+                space_id=sid,
+                space_name=space_name,
+                capacity=capacity,
+                space_type=space_type,
+            )
+
+        obj._space_status = space_status
+        return obj
+
+    @staticmethod
+    def _row_to_record(row) -> dict:
+        """Convierte una fila de _SELECT_SPACES en el diccionario de to_record."""
+        record = dict(zip(_SPACE_RECORD_FIELDS, row))
+        if row[5] is not None:
+            record.update(zip(_MEETING_ROOM_RECORD_FIELDS, row[5:]))
+            record["equipment_list"] = row[7].split(",") if row[7] else []
+        return record
 
     def delete(self, space_id: str) -> None:
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             with conn:
                 cursor = conn.cursor()
@@ -227,10 +288,10 @@ class SpaceSQLiteRepository(SpaceRepository):
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al eliminar el espacio: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
 
     def update(self, space: Space) -> None:
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             with conn:
                 cursor = conn.cursor()
@@ -238,7 +299,7 @@ class SpaceSQLiteRepository(SpaceRepository):
                 cursor.execute(
                     """
                     UPDATE spaces
-                    SET space_name = ?, capacity = ?, space_type = ?, space_status = ?
+                    SET space_name = ?, capacity = ?, space_type = ?, space_status = ?, space_name_normalized = ?
                     WHERE space_id = ?
                     """,
                     (
@@ -246,6 +307,7 @@ class SpaceSQLiteRepository(SpaceRepository):
                         space.capacity,
                         space.space_type,
                         space.space_status,
+                        Space.normalize_name(space.space_name),
                         space.space_id,
                     ),
                 )
@@ -276,4 +338,4 @@ class SpaceSQLiteRepository(SpaceRepository):
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al actualizar el espacio: {e}")
         finally:
-            conn.close()
\ No newline at end of file
+            self._pool.release(conn)
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""infrastructure/sqlite_connection_pool.py
+
+Pool de conexiones SQLite compartido por los repositorios.
+
+Las conexiones se crean y configuran una sola vez (claves foráneas, modo WAL,
+synchronous=NORMAL, busy_timeout y tamaño de caché) y se reutilizan entre
+peticiones en lugar de abrir y cerrar una conexión por operación.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from infrastructure.sqlite_query_profiler import ProfiledConnection
+
+
+class SQLiteConnectionPool:
+    """Pool de conexiones SQLite seguro entre hilos.
+
+    Cada conexión se presta a un único hilo a la vez. Si un hilo que ya tiene
+    una conexión prestada vuelve a pedir otra (p. ej. un repositorio que llama
+    a otro), recibe la misma, de modo que nunca bloquea contra sí mismo.
+
+    Los repositorios obtienen el pool compartido de su base de datos mediante
+    ``SQLiteConnectionPool.for_path(db_path)``.
+    """
+
+    # Conexiones abiertas a la vez por defecto (también el tamaño del pool de hilos ASGI)
+    DEFAULT_MAX_SIZE = 8
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, db_path: str, max_size: int = DEFAULT_MAX_SIZE, timeout: float = 30.0,
+                 busy_timeout_ms: int = 5000, cache_size_kib: int = 16384):
+        """Inicializa un pool vacío; las conexiones se crean bajo demanda.
+
+        Args:
+            db_path: Ruta del fichero SQLite.
+            max_size: Número máximo de conexiones abiertas a la vez.
+            timeout: Segundos que se espera por una conexión libre.
+            busy_timeout_ms: Espera de SQLite ante un bloqueo de escritura.
+            cache_size_kib: Caché de páginas por conexión, en KiB.
+        """
+        self._db_path, self._max_size, self._timeout = db_path, max_size, timeout
+        self._busy_timeout_ms, self._cache_size_kib = busy_timeout_ms, cache_size_kib
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._statement_listeners = []
+        self._profiler = None
+        self._stats = {
+            "created": 0,
+            "acquired": 0,
+            "reused": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "in_use": 0,
+            "peak_in_use": 0,
+        }
+
+    @classmethod
+    def for_path(cls, db_path: str) -> "SQLiteConnectionPool":
+        """Devuelve el pool compartido de una base de datos, creándolo si no existe."""
+        with cls._pools_lock:
+            pool = cls._pools.get(db_path)
+            if pool is None:
+                pool = cls._pools[db_path] = cls(db_path)
+            return pool
+
+    def acquire(self) -> sqlite3.Connection:
+        """Presta una conexión al hilo actual.
+
+        Returns:
+            Una conexión configurada.
+
+        Raises:
+            sqlite3.OperationalError: Si no queda ninguna conexión libre tras
+                esperar ``timeout`` segundos.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.depth += 1
+            return conn
+
+        if not self._slots.acquire(blocking=False):
+            self._count("waits")
+            if not self._slots.acquire(timeout=self._timeout):
+                self._count("timeouts")
+                raise sqlite3.OperationalError(
+                    f"No hay conexiones libres en el pool ({self._max_size})"
+                )
+        try:
+            conn = self._idle.get_nowait()
+            self._count("reused")
+        except queue.Empty:
+            try:
+                conn = self._create_connection()
+            except sqlite3.Error:
+                self._slots.release()
+                raise
+            self._count("created")
+
+        if self._statement_listeners:
+            conn.set_trace_callback(self._trace)
+        conn.profiler = self._profiler
+        with self._lock:
+            self._stats["acquired"] += 1
+            self._stats["in_use"] += 1
+            self._stats["peak_in_use"] = max(self._stats["peak_in_use"], self._stats["in_use"])
+        self._local.conn, self._local.depth = conn, 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Devuelve al pool una conexión obtenida con ``acquire``."""
+        self._local.depth -= 1
+        if self._local.depth:
+            return
+        self._local.conn = None
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            self._stats["in_use"] -= 1
+        self._idle.put(conn)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Context manager que presta una conexión y la devuelve al salir."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def add_statement_listener(self, listener) -> None:
+        """Registra una función que recibe el texto de cada sentencia SQL ejecutada.
+
+        Se instala con ``set_trace_callback`` al prestar cada conexión, por lo
+        que sin oyentes no tiene ningún coste. Se usa para las métricas por
+        petición (sentencias SQL ejecutadas).
+        """
+        self._statement_listeners.append(listener)
+
+    def set_profiler(self, profiler) -> None:
+        """Asigna (o retira, con None) el perfilador de sentencias de las conexiones.
+
+        Se aplica a cada conexión al prestarla; ver infrastructure/sqlite_query_profiler.py.
+        """
+        self._profiler = profiler
+
+    @property
+    def profiler(self):
+        """Devuelve el perfilador de sentencias asignado, o None."""
+        return self._profiler
+
+    def stats(self) -> dict:
+        """Devuelve las estadísticas del pool para dimensionarlo.
+
+        Returns:
+            Un diccionario con el tamaño máximo, las conexiones libres y en uso,
+            el pico de uso y los contadores de conexiones creadas, préstamos,
+            reutilizaciones, esperas y timeouts.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["max_size"] = self._max_size
+        stats["idle"] = self._idle.qsize()
+        return stats
+
+    def close(self) -> None:
+        """Cierra las conexiones libres y retira el pool del registro compartido."""
+        with SQLiteConnectionPool._pools_lock:
+            if SQLiteConnectionPool._pools.get(self._db_path) is self:
+                del SQLiteConnectionPool._pools[self._db_path]
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _create_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, check_same_thread=False, factory=ProfiledConnection)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+        conn.execute(f"PRAGMA cache_size = -{int(self._cache_size_kib)}")
+        return conn
+
+    def _trace(self, sql: str) -> None:
+        for listener in self._statement_listeners:
+            listener(sql)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
@@ -0,0 +1,45 @@
+"""infrastructure/sqlite_data_version.py
+
+Contadores de versión de datos persistidos en la tabla data_versions.
+
+Los triggers creados en create_db.py incrementan el contador de una entidad
+('spaces', 'users' o 'bookings') en cada INSERT, UPDATE o DELETE de sus
+tablas, venga de este proceso o de cualquier otro que comparta la base de
+datos. Las cachés en memoria comparan el contador con el que tenían al cargar
+sus datos para saber si siguen siendo válidos, y la API lo usa como ETag de
+sus rutas GET.
+"""
+
+import sqlite3
+from domain.exceptions import PersistenceException
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+
+
+class SQLiteDataVersion:
+    """Lee el contador de versión de una entidad.
+
+    Las instancias son invocables, de modo que se pueden pasar directamente
+    como fuente de versión a RepositoryCache.
+    """
+
+    def __init__(self, name: str, db_path: str = "smartspaces.db", pool: SQLiteConnectionPool | None = None):
+        """Inicializa la fuente de versión.
+
+        Args:
+            name: Nombre de la fila en data_versions ('spaces', 'users' o 'bookings').
+            db_path: Ruta del fichero SQLite.
+            pool: Pool de conexiones; por defecto el compartido de db_path.
+        """
+        self._name = name
+        self._pool = pool or SQLiteConnectionPool.for_path(db_path)
+
+    def __call__(self) -> int:
+        """Devuelve la versión actual (una lectura por clave primaria)."""
+        conn = self._pool.acquire()
+        try:
+            row = conn.execute("SELECT version FROM data_versions WHERE name = ?", (self._name,)).fetchone()
+            return 0 if row is None else row[0]
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al leer la versión de datos: {e}")
+        finally:
+            self._pool.release(conn)
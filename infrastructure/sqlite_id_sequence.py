@@ -0,0 +1,89 @@
+"""infrastructure/sqlite_id_sequence.py
+
+Secuencias de IDs persistidas en la tabla id_sequences.
+
+Cada secuencia es una fila (name, value) que se incrementa con un único
+UPSERT ... RETURNING dentro de la transacción del INSERT que usa el ID, por lo
+que asignar un ID es O(1) y dos escritores concurrentes nunca obtienen el
+mismo: SQLite serializa las transacciones de escritura.
+"""
+
+import sqlite3
+
+_UPSERT_SEQUENCE = """
+    INSERT INTO id_sequences (name, value) VALUES (?, ?)
+    ON CONFLICT (name) DO UPDATE SET value = value + excluded.value
+    RETURNING value
+"""
+
+_OBSERVE_SEQUENCE = """
+    INSERT INTO id_sequences (name, value) VALUES (?, ?)
+    ON CONFLICT (name) DO UPDATE SET value = MAX(value, excluded.value)
+"""
+
+
+class SQLiteIdSequence:
+    """Genera IDs con prefijo (``B1``, ``S2``, ``SM3``...) a partir de una secuencia.
+
+    Los métodos reciben el cursor de la transacción en curso: el contador solo
+    avanza si esa transacción hace commit.
+    """
+
+    def __init__(self, name: str, prefix: str):
+        """Inicializa la secuencia.
+
+        Args:
+            name: Nombre de la fila en id_sequences.
+            prefix: Prefijo de los IDs generados.
+        """
+        self._name, self._prefix = name, prefix
+
+    def next_id(self, cursor: sqlite3.Cursor) -> str:
+        """Reserva y devuelve el siguiente ID de la secuencia."""
+        return self.reserve(cursor, 1)[0]
+
+    def reserve(self, cursor: sqlite3.Cursor, count: int) -> list[str]:
+        """Reserva un bloque de ``count`` IDs consecutivos con una sola sentencia.
+
+        Pensado para importaciones masivas: el coste no depende de ``count``.
+        """
+        if count < 1:
+            return []
+        cursor.execute(_UPSERT_SEQUENCE, (self._name, count))
+        last = cursor.fetchone()[0]
+        return [f"{self._prefix}{n}" for n in range(last - count + 1, last + 1)]
+
+    def observe(self, cursor: sqlite3.Cursor, entity_id: str) -> None:
+        """Adelanta la secuencia si se guarda un ID explícito de la misma serie.
+
+        Evita que un ID asignado a mano (p. ej. ``S7``) se vuelva a generar más
+        adelante. Los IDs de otra serie (``SM1`` para el prefijo ``S``) se ignoran.
+        """
+        number = self.number_of(entity_id)
+        if number is not None:
+            cursor.execute(_OBSERVE_SEQUENCE, (self._name, number))
+
+    def number_of(self, entity_id: str) -> int | None:
+        """Devuelve el número de un ID de esta serie, o None si es de otra."""
+        suffix = entity_id[len(self._prefix):] if entity_id.startswith(self._prefix) else ""
+        return int(suffix) if suffix.isdigit() else None
+
+
+BOOKING_IDS = SQLiteIdSequence("bookings", "B")
+SPACE_IDS = SQLiteIdSequence("spaces", "S")
+MEETING_ROOM_IDS = SQLiteIdSequence("meeting_rooms", "SM")
+
+
+def sync_id_sequences(cursor: sqlite3.Cursor) -> None:
+    """Ajusta las secuencias a los IDs ya existentes en las tablas.
+
+    Recorre las tablas una sola vez; se usa al crear o actualizar el esquema
+    de una base de datos que ya tiene datos.
+    """
+    for sequence, query in (
+        (BOOKING_IDS, "SELECT booking_id FROM bookings"),
+        (SPACE_IDS, "SELECT space_id FROM spaces"),
+        (MEETING_ROOM_IDS, "SELECT space_id FROM spaces"),
+    ):
+        numbers = [sequence.number_of(entity_id) for (entity_id,) in cursor.execute(query).fetchall()]
+        cursor.execute(_OBSERVE_SEQUENCE, (sequence._name, max(filter(None, numbers), default=0)))
@@ -0,0 +1,89 @@
+"""infrastructure/sqlite_keyset.py
+
+Recorrido de tablas con paginación por clave (keyset pagination).
+
+En lugar de cargar la tabla entera con fetchall(), se piden páginas de tamaño
+fijo a partir del último ID leído: cada página es una búsqueda sobre un índice,
+así que el coste de obtener la primera fila y la memoria usada no dependen del
+tamaño de la tabla.
+
+Los IDs son texto con prefijo y número de secuencia (``B1``, ``S2``, ``SM3``).
+Ordenados como texto, ``B10`` quedaría antes que ``B2``; por eso el orden de
+recorrido es longitud del ID y después el ID (infrastructure/id_order.py),
+que equivale al número de secuencia dentro de cada serie. Cada tabla tiene un
+índice ``(length(id), id)`` (idx_*_id_order) y una página se lee con dos
+búsquedas sobre él: el resto de IDs de la misma longitud que el último leído
+y, si no basta, los IDs más largos.
+"""
+
+from collections.abc import Callable, Iterator
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def keyset_clauses(column: str) -> tuple[str, str]:
+    """Devuelve las cláusulas WHERE/ORDER BY/LIMIT de una página sobre ``column``.
+
+    Returns:
+        Una tupla (IDs de la misma longitud que ``after`` y mayores,
+        IDs más largos que ``after``); la primera recibe los parámetros
+        ``(after, after, tamaño)`` y la segunda ``(after, tamaño)``.
+    """
+    return (
+        f"""
+    WHERE length({column}) = length(?) AND {column} > ?
+    ORDER BY {column}
+    LIMIT ?
+""",
+        f"""
+    WHERE length({column}) > length(?)
+    ORDER BY length({column}), {column}
+    LIMIT ?
+""",
+    )
+
+
+def fetch_keyset_rows(cursor, select: str, clauses: tuple[str, str], after: str, size: int) -> list:
+    """Lee como mucho ``size`` filas con ID posterior a ``after`` en el orden de recorrido.
+
+    Args:
+        cursor: Cursor de la conexión prestada para la página.
+        select: Sentencia SELECT sin cláusula WHERE.
+        clauses: Cláusulas devueltas por keyset_clauses para la columna del ID.
+        after: Último ID leído ("" desde el principio).
+        size: Número máximo de filas.
+    """
+    same_length, longer = clauses
+    rows = cursor.execute(select + same_length, (after, after, size)).fetchall()
+    if len(rows) < size:
+        rows += cursor.execute(select + longer, (after, size - len(rows))).fetchall()
+    return rows
+
+
+def iter_keyset(fetch_page: Callable[[str, int], list], key: Callable[[object], str],
+                after: str | None = None, limit: int | None = None,
+                batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator:
+    """Genera las entidades de una tabla página a página.
+
+    La conexión solo se usa dentro de ``fetch_page``: entre páginas no queda
+    ninguna conexión del pool prestada mientras el consumidor procesa filas.
+
+    Args:
+        fetch_page: Función ``(after, size)`` que devuelve como mucho ``size``
+            entidades con clave posterior a ``after``, en orden de recorrido.
+        key: Función que devuelve la clave de una entidad.
+        after: Clave a partir de la cual empezar (exclusiva); None desde el principio.
+        limit: Número máximo de entidades a devolver; None para todas.
+        batch_size: Filas pedidas a SQLite en cada página.
+    """
+    after = after or ""
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        page = fetch_page(after, size)
+        yield from page
+        if len(page) < size:
+            return
+        after = key(page[-1])
+        if remaining is not None:
+            remaining -= len(page)
@@ -0,0 +1,284 @@
+"""infrastructure/sqlite_migrations.py
+
+Migraciones versionadas del esquema SQLite.
+
+La versión del esquema se guarda en la cabecera de la base de datos
+(``PRAGMA user_version``). Cada migración sube la versión en uno y se aplica
+en la misma transacción que actualiza ``user_version``, de modo que una
+migración interrumpida no deja el esquema a medias. Las migraciones son
+idempotentes (``IF NOT EXISTS`` y comprobación de columnas), así que una base
+de datos creada antes de existir este módulo, con versión 0 pero con parte
+del esquema, se actualiza sin perder datos.
+
+Para añadir un cambio de esquema se añade una función al final de MIGRATIONS;
+nunca se modifica una migración ya publicada.
+"""
+
+import sqlite3
+from domain.space import Space
+from domain.user import User
+from infrastructure.sqlite_id_sequence import sync_id_sequences
+
+# Tablas cuyas escrituras incrementan cada contador de data_versions
+DATA_VERSION_TABLES = {
+    "spaces": ("spaces", "meeting_rooms"),
+    "users": ("users",),
+    "bookings": ("bookings",),
+}
+
+
+def _create_base_tables(cursor):
+    """Crea las tablas de espacios, salas de reuniones, usuarios y reservas."""
+    # Tabla base para todos los espacios (Space y SpaceMeetingRoom)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS spaces (
+            space_id     TEXT    PRIMARY KEY,
+            space_name   TEXT    NOT NULL,
+            capacity     INTEGER NOT NULL,
+            space_type   TEXT    NOT NULL,
+            space_status TEXT    NOT NULL
+        )
+    """)
+
+    # Tabla para los datos extra de SpaceMeetingRoom (herencia → dos tablas relacionadas)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS meeting_rooms (
+            space_id          TEXT    PRIMARY KEY,
+            room_number       TEXT    NOT NULL,
+            floor             INTEGER NOT NULL,
+            equipment_list    TEXT    NOT NULL,
+            num_power_outlets INTEGER NOT NULL,
+            FOREIGN KEY (space_id) REFERENCES spaces(space_id)
+                   ON DELETE CASCADE
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            user_id  TEXT PRIMARY KEY,
+            name     TEXT    NOT NULL,
+            surname1 TEXT    NOT NULL,
+            surname2 TEXT    NOT NULL,
+            active   INTEGER NOT NULL
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS bookings (
+            booking_id     TEXT PRIMARY KEY,
+            space_id       TEXT NOT NULL,
+            user_id        TEXT NOT NULL,
+            start_time     TEXT NOT NULL,
+            end_time       TEXT NOT NULL,
+            booking_status TEXT NOT NULL,
+            FOREIGN KEY (space_id) REFERENCES spaces(space_id),
+            FOREIGN KEY (user_id)  REFERENCES users(user_id)
+        )
+    """)
+
+
+def _add_full_name_normalized(cursor):
+    """Añade a users el nombre completo normalizado para las búsquedas por nombre.
+
+    Las filas existentes se rellenan con User.normalize_full_name, igual que
+    las que guarda UserSQLiteRepository.
+    """
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(users)").fetchall()}
+    if "full_name_normalized" in columns:
+        return
+    cursor.execute("ALTER TABLE users ADD COLUMN full_name_normalized TEXT NOT NULL DEFAULT ''")
+    rows = cursor.execute("SELECT user_id, name, surname1, surname2 FROM users").fetchall()
+    cursor.executemany(
+        "UPDATE users SET full_name_normalized = ? WHERE user_id = ?",
+        [(User.normalize_full_name(f"{name} {surname1} {surname2}"), user_id)
+         for user_id, name, surname1, surname2 in rows],
+    )
+
+
+def _create_id_sequences(cursor):
+    """Crea los contadores de IDs (infrastructure/sqlite_id_sequence.py) y los ajusta a los datos."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS id_sequences (
+            name  TEXT    PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+    """)
+    sync_id_sequences(cursor)
+
+
+def _create_data_versions(cursor):
+    """Crea los contadores de data_versions y los triggers que los incrementan.
+
+    Sirven para invalidar las cachés de otros procesos
+    (infrastructure/sqlite_data_version.py).
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS data_versions (
+            name    TEXT    PRIMARY KEY,
+            version INTEGER NOT NULL
+        )
+    """)
+    for name, tables in DATA_VERSION_TABLES.items():
+        cursor.execute("INSERT OR IGNORE INTO data_versions (name, version) VALUES (?, 0)", (name,))
+        for table in tables:
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_version
+                    AFTER {event} ON {table}
+                    BEGIN
+                        UPDATE data_versions SET version = version + 1 WHERE name = '{name}';
+                    END
+                """)
+
+
+def _create_lookup_indexes(cursor):
+    """Crea los índices de solapamientos, reservas activas por usuario y búsquedas por nombre."""
+    # Detección de solapamientos y disponibilidad
+    # (BookingSQLiteRepository.find_overlapping / AvailabilitySQLiteRepository)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_bookings_space_status_time
+            ON bookings (space_id, booking_status, start_time, end_time)
+    """)
+
+    # Conteo de reservas activas por usuario (BookingSQLiteRepository.count_active_for_user)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_bookings_user_status
+            ON bookings (user_id, booking_status)
+    """)
+
+    # Búsquedas por nombre sin distinguir mayúsculas
+    # (SpaceSQLiteRepository.find_by_name / UserSQLiteRepository.find_by_full_name)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_spaces_name_nocase
+            ON spaces (space_name COLLATE NOCASE)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_users_full_name_normalized
+            ON users (full_name_normalized)
+    """)
+
+
+def _create_time_range_index(cursor):
+    """Crea el índice de rango temporal de las reservas (BookingSQLiteRepository.load_intervals).
+
+    Empieza por end_time porque el histórico crece hacia el pasado: las
+    reservas que terminan después del inicio del rango son pocas, mientras que
+    las que empiezan antes de su fin son casi todas. Incluye el resto de
+    columnas de la consulta para no leer la tabla.
+    """
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_bookings_time_range
+            ON bookings (end_time, start_time, booking_status, space_id)
+    """)
+
+
+def _create_id_order_indexes(cursor):
+    """Crea los índices del orden de recorrido por ID (infrastructure/sqlite_keyset.py).
+
+    Ordenan por longitud del ID y después por el ID, es decir, por número de
+    secuencia dentro de cada serie (``B2`` antes que ``B10``).
+    """
+    for table, column in (("bookings", "booking_id"), ("spaces", "space_id"), ("users", "user_id")):
+        cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_{table}_id_order
+                ON {table} (length({column}), {column})
+        """)
+
+
+def _add_space_name_normalized(cursor):
+    """Añade a spaces el nombre normalizado para las búsquedas por nombre.
+
+    COLLATE NOCASE solo pliega las mayúsculas ASCII, así que "Sala Ñandú" y
+    "sala ñandú" no coincidían. Como en users, la clave se calcula en Python
+    (Space.normalize_name) y se indexa; las filas existentes se rellenan y
+    idx_spaces_name_nocase se sustituye por idx_spaces_name_normalized.
+    """
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(spaces)").fetchall()}
+    if "space_name_normalized" not in columns:
+        cursor.execute("ALTER TABLE spaces ADD COLUMN space_name_normalized TEXT NOT NULL DEFAULT ''")
+        rows = cursor.execute("SELECT space_id, space_name FROM spaces").fetchall()
+        cursor.executemany(
+            "UPDATE spaces SET space_name_normalized = ? WHERE space_id = ?",
+            [(Space.normalize_name(space_name), space_id) for space_id, space_name in rows],
+        )
+    cursor.execute("DROP INDEX IF EXISTS idx_spaces_name_nocase")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_spaces_name_normalized
+            ON spaces (space_name_normalized)
+    """)
+
+
+# Migración n → versión n del esquema (la posición 0 lleva a la versión 1)
+MIGRATIONS = (
+    _create_base_tables,
+    _add_full_name_normalized,
+    _create_id_sequences,
+    _create_data_versions,
+    _create_lookup_indexes,
+    _create_time_range_index,
+    _create_id_order_indexes,
+    _add_space_name_normalized,
+)
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(cursor) -> int:
+    """Devuelve la versión del esquema de la base de datos (0 si nunca se ha migrado)."""
+    return cursor.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(cursor) -> list[int]:
+    """Aplica las migraciones pendientes dentro de la transacción del llamador.
+
+    Args:
+        cursor: Cursor de la conexión; el llamador hace commit.
+
+    Returns:
+        Las versiones aplicadas, en orden (vacía si el esquema ya estaba al día).
+
+    Raises:
+        sqlite3.DatabaseError: Si la base de datos tiene una versión posterior
+            a la que conoce este código.
+    """
+    current = schema_version(cursor)
+    if current > SCHEMA_VERSION:
+        raise sqlite3.DatabaseError(
+            f"El esquema de la base de datos (versión {current}) es posterior al soportado ({SCHEMA_VERSION})")
+    applied = []
+    for version in range(current + 1, SCHEMA_VERSION + 1):
+        MIGRATIONS[version - 1](cursor)
+        cursor.execute(f"PRAGMA user_version = {version}")
+        applied.append(version)
+    return applied
+
+
+def migrate_database(db_path: str, timeout: float = 30.0) -> list[int]:
+    """Actualiza el esquema de una base de datos a SCHEMA_VERSION, creándola si no existe.
+
+    Todas las migraciones pendientes se aplican en una única transacción
+    ``BEGIN IMMEDIATE``: si varios procesos arrancan a la vez, el primero
+    migra y los demás esperan el bloqueo y encuentran el esquema al día.
+
+    Args:
+        db_path: Ruta del fichero SQLite.
+        timeout: Segundos que se espera por el bloqueo de escritura.
+
+    Returns:
+        Las versiones aplicadas, en orden.
+    """
+    conn = sqlite3.connect(db_path, timeout=timeout, isolation_level=None)
+    try:
+        cursor = conn.cursor()
+        if schema_version(cursor) == SCHEMA_VERSION:
+            return []
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            applied = apply_migrations(cursor)
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        return applied
+    finally:
+        conn.close()
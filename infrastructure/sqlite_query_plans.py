@@ -0,0 +1,110 @@
+"""infrastructure/sqlite_query_plans.py
+
+Comprobación de que las consultas críticas de los repositorios SQLite usan
+sus índices.
+
+Cada consulta se pasa por EXPLAIN QUERY PLAN con las mismas sentencias que
+ejecutan los repositorios y se comprueba que el plan busca en el índice
+esperado en lugar de recorrer la tabla. Si un cambio de consulta o de esquema
+deja de usar el índice, la comprobación lo detecta sin necesidad de datos.
+"""
+
+from datetime import datetime
+from domain.booking import Booking
+from infrastructure.availability_sqlite_repository import _WHERE_AVAILABLE
+from infrastructure.booking_sqlite_repository import (
+    _COUNT_ACTIVE_FOR_USER,
+    _SELECT_ACTIVE_INTERVALS,
+    _SELECT_BOOKINGS,
+    _WHERE_AFTER as _BOOKINGS_AFTER,
+    _SELECT_INTERVALS,
+    _WHERE_OVERLAPPING,
+    _WHERE_SPACE,
+    _WHERE_USER,
+)
+from infrastructure.space_sqlite_repository import _SELECT_SPACES, _WHERE_AFTER as _SPACES_AFTER, _WHERE_NAME
+from infrastructure.sqlite_query_profiler import explain
+from infrastructure.user_sqlite_repository import _SELECT_USERS, _WHERE_AFTER as _USERS_AFTER, _WHERE_FULL_NAME
+
+_START = datetime(2025, 1, 1, 9).isoformat()
+_END = datetime(2025, 1, 1, 10).isoformat()
+
+
+def _keyset_pages(table, select, clauses):
+    """Entradas de las dos búsquedas de una página keyset (sqlite_keyset.py) sobre una tabla."""
+    same_length, longer = clauses
+    return {
+        f"page_{table}_same_length": (select + same_length, ("X9", "X9", 500), f"idx_{table}_id_order"),
+        f"page_{table}_longer": (select + longer, ("X9", 500), f"idx_{table}_id_order"),
+    }
+
+
+# Consulta → (sentencia, parámetros, índice que debe aparecer en su plan)
+HOT_QUERIES = {
+    "find_overlapping": (
+        _SELECT_BOOKINGS + _WHERE_OVERLAPPING,
+        ("S1", Booking.STATUS_ACTIVE, _END, _START, None),
+        "idx_bookings_space_status_time",
+    ),
+    "list_available_spaces": (
+        _SELECT_SPACES + _WHERE_AVAILABLE,
+        (Booking.STATUS_ACTIVE, _END, _START),
+        "idx_bookings_space_status_time",
+    ),
+    "find_bookings_by_user": (
+        _SELECT_BOOKINGS + _WHERE_USER,
+        ("U1",),
+        "idx_bookings_user_status",
+    ),
+    "find_bookings_by_space": (
+        _SELECT_BOOKINGS + _WHERE_SPACE,
+        ("S1",),
+        "idx_bookings_space_status_time",
+    ),
+    "count_active_for_user": (
+        _COUNT_ACTIVE_FOR_USER,
+        ("U1", Booking.STATUS_ACTIVE),
+        "idx_bookings_user_status",
+    ),
+    "load_intervals": (
+        _SELECT_INTERVALS,
+        (Booking.STATUS_CANCELLED, _END, _START),
+        "idx_bookings_time_range",
+    ),
+    "load_active_intervals": (
+        _SELECT_ACTIVE_INTERVALS,
+        (Booking.STATUS_ACTIVE, _END, _START),
+        "idx_bookings_time_range",
+    ),
+    "find_space_by_name": (
+        _SELECT_SPACES + _WHERE_NAME,
+        ("conference room",),
+        "idx_spaces_name_normalized",
+    ),
+    "find_user_by_full_name": (
+        _SELECT_USERS + _WHERE_FULL_NAME,
+        ("alice smith johnson",),
+        "idx_users_full_name_normalized",
+    ),
+    **_keyset_pages("bookings", _SELECT_BOOKINGS, _BOOKINGS_AFTER),
+    **_keyset_pages("spaces", _SELECT_SPACES, _SPACES_AFTER),
+    **_keyset_pages("users", _SELECT_USERS, _USERS_AFTER),
+}
+
+
+def check_hot_query_plans(cursor) -> dict:
+    """Comprueba que cada consulta de HOT_QUERIES usa su índice.
+
+    Args:
+        cursor: Cursor de una base de datos con el esquema al día.
+
+    Returns:
+        Un diccionario con el plan de cada consulta que no usa su índice
+        (vacío si todas lo usan).
+    """
+    failures = {}
+    for name, (sql, params, index) in HOT_QUERIES.items():
+        plan = explain(cursor, sql, params)
+        if not any(f"INDEX {index}" in line for line in plan):
+            failures[name] = plan
+    return failures
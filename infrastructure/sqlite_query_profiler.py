@@ -0,0 +1,230 @@
+"""infrastructure/sqlite_query_profiler.py
+
+Perfilado de las sentencias SQL que ejecutan los repositorios SQLite.
+
+El pool de conexiones crea conexiones ``ProfiledConnection``; cuando tiene un
+perfilador asignado (``SQLiteConnectionPool.set_profiler``), sus cursores
+miden cada ``execute``/``executemany`` y cada ``fetch*`` y los acumulan por
+plantilla de sentencia (el SQL normalizado, sin literales). Las sentencias
+cuya ejecución supera el umbral se escriben en el registro de consultas
+lentas junto con su ``EXPLAIN QUERY PLAN``.
+
+Sin perfilador los cursores son los de sqlite3, sin ningún coste añadido.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACES = re.compile(r"\s+")
+
+slow_query_logger = logging.getLogger("infrastructure.sqlite.slow_queries")
+
+
+def statement_template(sql: str) -> str:
+    """Normaliza una sentencia: espacios colapsados y literales sustituidos por ``?``."""
+    return _SPACES.sub(" ", _LITERALS.sub("?", sql)).strip()
+
+
+def explain(cursor, sql, params=()) -> list[str]:
+    """Devuelve las líneas (columna detail) del EXPLAIN QUERY PLAN de una sentencia.
+
+    Lo usan el registro de consultas lentas y la comprobación de índices de
+    sqlite_query_plans.py.
+    """
+    return [row[3] for row in cursor.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()]
+
+
+class SQLiteQueryProfiler:
+    """Agrega contadores y latencias por plantilla de sentencia SQL.
+
+    Es seguro entre hilos y se comparte entre todas las conexiones del pool.
+    El tiempo de ``execute`` incluye la preparación de la sentencia y, en un
+    SELECT, el cálculo de la primera fila; el de los ``fetch*`` se suma aparte
+    (``fetch_seconds``) a la misma plantilla. El umbral de consulta lenta se
+    aplica al tiempo de ``execute``.
+    """
+
+    def __init__(self, slow_threshold_ms: float = 100.0, explain_slow: bool = True,
+                 clock=time.perf_counter, logger: logging.Logger = slow_query_logger):
+        """Inicializa el perfilador.
+
+        Args:
+            slow_threshold_ms: Milisegundos a partir de los que una sentencia es lenta.
+            explain_slow: Si se adjunta el EXPLAIN QUERY PLAN a las consultas lentas.
+            clock: Reloj monotónico en segundos.
+            logger: Registro de las consultas lentas.
+        """
+        self.slow_threshold = slow_threshold_ms / 1000
+        self._explain_slow = explain_slow
+        self.clock = clock
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._templates = {}
+        self._stats = {}
+        self._slow_count = 0
+
+    def template(self, sql: str) -> str:
+        """Devuelve la plantilla de una sentencia (cacheada: el SQL de los repositorios es fijo)."""
+        template = self._templates.get(sql)
+        if template is None:
+            template = self._templates[sql] = statement_template(sql)
+        return template
+
+    def record_execute(self, conn: sqlite3.Connection, sql: str, parameters, elapsed: float) -> str:
+        """Registra una ejecución y, si es lenta, la escribe con su plan de consulta.
+
+        Args:
+            conn: Conexión en la que se ejecutó (para el EXPLAIN QUERY PLAN).
+            sql: Texto de la sentencia.
+            parameters: Parámetros de la ejecución.
+            elapsed: Segundos que tardó ``execute``.
+
+        Returns:
+            La plantilla de la sentencia, para asociarle el tiempo de los ``fetch*``.
+        """
+        template = self.template(sql)
+        slow = elapsed >= self.slow_threshold
+        with self._lock:
+            stats = self._stats.get(template)
+            if stats is None:
+                stats = self._stats[template] = {"count": 0, "seconds": 0.0, "max_seconds": 0.0,
+                                                 "fetch_seconds": 0.0, "slow": 0}
+            stats["count"] += 1
+            stats["seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+            if slow:
+                stats["slow"] += 1
+                self._slow_count += 1
+        if slow:
+            plan = self._slow_plan(conn, sql, parameters) if self._explain_slow else []
+            self._logger.warning("Consulta lenta (%.1f ms): %s", elapsed * 1000, template,
+                                 extra={"duration_ms": round(elapsed * 1000, 3), "sql": template, "plan": plan})
+        return template
+
+    def record_fetch(self, template: str, elapsed: float) -> None:
+        """Suma el tiempo de un ``fetch*`` a la plantilla de la última ejecución."""
+        with self._lock:
+            stats = self._stats.get(template)
+            if stats is not None:
+                stats["seconds"] += elapsed
+                stats["fetch_seconds"] += elapsed
+
+    @staticmethod
+    def _slow_plan(conn: sqlite3.Connection, sql: str, parameters) -> list[str]:
+        """Plan de una consulta lenta, con un cursor sin perfilar.
+
+        Las sentencias que no admiten EXPLAIN (BEGIN, COMMIT, PRAGMA...) devuelven
+        una lista vacía.
+        """
+        try:
+            return explain(conn.cursor(sqlite3.Cursor), sql, parameters)
+        except sqlite3.Error:
+            return []
+
+    def snapshot(self, sort_by: str = "seconds", limit: int | None = None) -> list[dict]:
+        """Devuelve los agregados por plantilla, de mayor a menor según ``sort_by``.
+
+        Args:
+            sort_by: 'seconds' (tiempo total), 'count', 'mean_ms', 'max_ms' o 'slow'.
+            limit: Número máximo de plantillas devueltas.
+
+        Raises:
+            ValueError: Si sort_by no es uno de los criterios admitidos.
+        """
+        if sort_by not in ("seconds", "count", "mean_ms", "max_ms", "slow"):
+            raise ValueError(f"Criterio de orden desconocido: {sort_by}")
+        with self._lock:
+            items = [(template, dict(stats)) for template, stats in self._stats.items()]
+        rows = [
+            {
+                "sql": template,
+                "count": stats["count"],
+                "total_ms": round(stats["seconds"] * 1000, 3),
+                "mean_ms": round(stats["seconds"] * 1000 / stats["count"], 3),
+                "max_ms": round(stats["max_seconds"] * 1000, 3),
+                "fetch_ms": round(stats["fetch_seconds"] * 1000, 3),
+                "slow": stats["slow"],
+                "seconds": stats["seconds"],
+            }
+            for template, stats in items
+        ]
+        rows.sort(key=lambda row: row[sort_by], reverse=True)
+        for row in rows:
+            del row["seconds"]
+        return rows[:limit] if limit is not None else rows
+
+    def slow_count(self) -> int:
+        """Devuelve el número de ejecuciones lentas registradas."""
+        with self._lock:
+            return self._slow_count
+
+    def reset(self) -> None:
+        """Borra los agregados acumulados."""
+        with self._lock:
+            self._stats.clear()
+            self._slow_count = 0
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor que mide sus ejecuciones y lecturas con el perfilador de su conexión."""
+
+    _template = None
+
+    def execute(self, sql, parameters=()):
+        profiler = self.connection.profiler
+        if profiler is None:
+            return super().execute(sql, parameters)
+        started = profiler.clock()
+        result = super().execute(sql, parameters)
+        self._template = profiler.record_execute(self.connection, sql, parameters, profiler.clock() - started)
+        return result
+
+    def executemany(self, sql, seq_of_parameters):
+        profiler = self.connection.profiler
+        if profiler is None:
+            return super().executemany(sql, seq_of_parameters)
+        seq_of_parameters = list(seq_of_parameters)
+        started = profiler.clock()
+        result = super().executemany(sql, seq_of_parameters)
+        self._template = profiler.record_execute(self.connection, sql, seq_of_parameters[0] if seq_of_parameters else (),
+                                                 profiler.clock() - started)
+        return result
+
+    def fetchone(self):
+        return self._timed(super().fetchone)
+
+    def fetchmany(self, size=None):
+        return self._timed(super().fetchmany, self.arraysize if size is None else size)
+
+    def fetchall(self):
+        return self._timed(super().fetchall)
+
+    def _timed(self, fetch, *args):
+        profiler = self.connection.profiler
+        if profiler is None or self._template is None:
+            return fetch(*args)
+        started = profiler.clock()
+        rows = fetch(*args)
+        profiler.record_fetch(self._template, profiler.clock() - started)
+        return rows
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Conexión cuyos cursores se perfilan mientras ``profiler`` no sea None."""
+
+    profiler = None
+
+    def cursor(self, factory=None):
+        if factory is None and self.profiler is not None:
+            factory = ProfiledCursor
+        return super().cursor(factory) if factory is not None else super().cursor()
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
@@ -1,22 +1,28 @@
 """infrastructure/user_memory_repository.py"""
 
+from domain.user import User
 from domain.user_repository import UserRepository
 from domain.exceptions import (
     UserAlreadyExistsException,
     UserNotFoundError,
 )
+from infrastructure.id_order import IdOrder
 
 
 class UserMemoryRepository(UserRepository):
     """In-memory implementation of the UserRepository interface.
 
-    Stores users in a dictionary using their IDs as keys. Useful for testing
+    Stores users in a dictionary using their IDs as keys, plus an index from
+    normalized full name to user IDs for name lookups and the IDs in
+    sequence order for keyset iteration. Useful for testing
     or scenarios without a persistent storage backend.
     """
 
     def __init__(self):
         """Initializes an empty in-memory user repository."""
         self._users = {}
+        self._ids_by_full_name = {}
+        self._order = IdOrder()
 
     def save(self, user):
         """Stores a new user in memory.
@@ -30,6 +36,8 @@ class UserMemoryRepository(UserRepository):
         if user.user_id in self._users:
             raise UserAlreadyExistsException(f"Ya existe un usuario con ID '{user.user_id}'")
         self._users[user.user_id] = user
+        self._order.add(user.user_id)
+        self._ids_by_full_name.setdefault(User.normalize_full_name(user.full_name()), []).append(user.user_id)
 
     def update(self, user):
         """Updates a user in memory.
@@ -63,6 +71,32 @@ class UserMemoryRepository(UserRepository):
             )
         return user
 
+    def iter_users(self, after=None, limit=None):
+        """Iterates over stored users in identifier order.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of users to yield, or None for all.
+
+        Yields:
+            Stored users ordered by identifier.
+        """
+        for key in self._order.page(after, limit):
+            yield self._users[key]
+
+    def iter_records(self, after=None, limit=None):
+        """Iterates over stored users as plain dictionaries, in identifier order.
+
+        Args:
+            after: Identifier after which to start (exclusive), or None.
+            limit: Maximum number of records to yield, or None for all.
+
+        Yields:
+            The ``to_record`` dictionary of each stored user.
+        """
+        for user in self.iter_users(after, limit):
+            yield user.to_record()
+
     def list(self):
         """Retrieves all stored users.
 
@@ -71,10 +105,28 @@ class UserMemoryRepository(UserRepository):
         """
         return list(self._users.values())
 
+    def find_by_full_name(self, full_name):
+        """Retrieves a user by full name, ignoring case.
+
+        Args:
+            full_name: Full name of the user.
+
+        Returns:
+            The first stored user with that name, or None if there is none.
+        """
+        user_ids = self._ids_by_full_name.get(User.normalize_full_name(full_name))
+        return self._users[user_ids[0]] if user_ids else None
+
     def delete(self, user_id):
         """Deletes a user by its ID if it exists.
 
         Args:
             user_id: Unique identifier of the user to delete.
         """
-        self._users.pop(user_id, None)
+        user = self._users.pop(user_id, None)
+        self._order.discard(user_id)
+        if user is not None:
+            key = User.normalize_full_name(user.full_name())
+            self._ids_by_full_name[key].remove(user_id)
+            if not self._ids_by_full_name[key]:
+                del self._ids_by_full_name[key]
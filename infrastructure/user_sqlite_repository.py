@@ -4,6 +4,8 @@ Repositorio SQLite para persistencia de usuarios basado en el dominio real.
 """
 
 import sqlite3
+from collections.abc import Iterator
+from operator import itemgetter
 from domain.user import User
 from domain.user_repository import UserRepository
 from domain.exceptions import (
@@ -11,49 +13,64 @@ from domain.exceptions import (
     UserNotFoundError,
     PersistenceException,
 )
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+from infrastructure.sqlite_keyset import fetch_keyset_rows, iter_keyset, keyset_clauses
+
+_SELECT_USERS = "SELECT user_id, name, surname1, surname2, active FROM users"
+
+# Búsqueda por nombre completo normalizado; resuelta con idx_users_full_name_normalized
+_WHERE_FULL_NAME = " WHERE full_name_normalized = ? LIMIT 1"
+
+# Página de un recorrido keyset en orden de ID; resuelto con idx_users_id_order
+_WHERE_AFTER = keyset_clauses("user_id")
+
+# Columnas de User.to_record, leídas directamente de las filas (iter_records)
+_SELECT_USER_RECORDS = """
+    SELECT user_id, name, surname1, surname2, name || ' ' || surname1 || ' ' || surname2, active
+    FROM users
+"""
+_USER_RECORD_FIELDS = ("user_id", "name", "surname1", "surname2", "full_name")
 
 
 class UserSQLiteRepository(UserRepository):
     """Repositorio SQLite para persistencia de usuarios."""
 
-    def __init__(self, db_path: str = "smartspaces.db"):
+    def __init__(self, db_path: str = "smartspaces.db", pool: SQLiteConnectionPool | None = None):
         self._db_path = db_path
-
-    def _connect(self):
-        conn = sqlite3.connect(self._db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        self._pool = pool or SQLiteConnectionPool.for_path(db_path)
 
     def save(self, user: User) -> None:
         """Persiste un usuario en la base de datos."""
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             with conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    INSERT INTO users (user_id, name, surname1, surname2, active)
-                    VALUES (?, ?, ?, ?, ?)
+                    INSERT INTO users (user_id, name, surname1, surname2, active, full_name_normalized)
+                    VALUES (?, ?, ?, ?, ?, ?)
                 """, (user.user_id, user.name, user.surname1, user.surname2,
-                      1 if user.is_active() else 0))
+                      1 if user.is_active() else 0,
+                      User.normalize_full_name(user.full_name())))
         except sqlite3.IntegrityError:
             raise UserAlreadyExistsException(f"Ya existe un usuario con ID '{user.user_id}'")
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al guardar el usuario: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
 
     def update(self, user: User) -> None:
         """Actualiza un usuario existente en la base de datos."""
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             with conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     UPDATE users
-                    SET name = ?, surname1 = ?, surname2 = ?, active = ?
+                    SET name = ?, surname1 = ?, surname2 = ?, active = ?, full_name_normalized = ?
                     WHERE user_id = ?
                 """, (user.name, user.surname1, user.surname2,
-                      1 if user.is_active() else 0, user.user_id))
+                      1 if user.is_active() else 0,
+                      User.normalize_full_name(user.full_name()), user.user_id))
                 if cursor.rowcount == 0:
                     raise UserNotFoundError(f"No existe ningún usuario con ID '{user.user_id}'")
         except UserNotFoundError:
@@ -61,60 +78,97 @@ class UserSQLiteRepository(UserRepository):
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al actualizar el usuario: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
 
     def get(self, user_id: str) -> User:
         """Recupera un usuario por su ID."""
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT user_id, name, surname1, surname2, active
-                FROM users WHERE user_id = ?
-            """, (user_id,))
+            cursor.execute(_SELECT_USERS + " WHERE user_id = ?", (user_id,))
             
             row = cursor.fetchone()
             if row is None:
                 raise UserNotFoundError(
                     f"No existe ningún usuario con ID '{user_id}'"
                 )
-            
-            user_id, name, surname1, surname2, active = row
-            user = User(user_id, name, surname1, surname2)
-            if not active:
-                user.deactivate()
-            return user
+            return self._row_to_user(row)
             
         except UserNotFoundError:
             raise
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al leer el usuario: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
+
+    def find_by_full_name(self, full_name: str) -> User | None:
+        """Recupera un usuario por su nombre completo, sin distinguir mayúsculas.
+
+        La búsqueda usa el índice sobre la columna full_name_normalized.
+        """
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(_SELECT_USERS + _WHERE_FULL_NAME, (User.normalize_full_name(full_name),))
+
+            row = cursor.fetchone()
+            return None if row is None else self._row_to_user(row)
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al buscar el usuario: {e}")
+        finally:
+            self._pool.release(conn)
+
+    def iter_users(self, after: str | None = None, limit: int | None = None) -> Iterator[User]:
+        """Recorre los usuarios en orden de ID con paginación por clave."""
+        return iter_keyset(self._fetch_page, lambda user: user.user_id, after, limit)
+
+    def _fetch_page(self, after: str, size: int) -> list[User]:
+        """Lee una página de usuarios con ID posterior a ``after``."""
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            return [self._row_to_user(row)
+                    for row in fetch_keyset_rows(cursor, _SELECT_USERS, _WHERE_AFTER, after, size)]
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al listar usuarios: {e}")
+        finally:
+            self._pool.release(conn)
+
+    def iter_records(self, after: str | None = None, limit: int | None = None) -> Iterator[dict]:
+        """Recorre los usuarios como diccionarios, construidos directamente desde las filas."""
+        return iter_keyset(self._fetch_record_page, itemgetter("user_id"), after, limit)
+
+    def _fetch_record_page(self, after: str, size: int) -> list[dict]:
+        """Lee una página de registros de usuarios con ID posterior a ``after``."""
+        conn = self._pool.acquire()
+        try:
+            cursor = conn.cursor()
+            records = []
+            for row in fetch_keyset_rows(cursor, _SELECT_USER_RECORDS, _WHERE_AFTER, after, size):
+                record = dict(zip(_USER_RECORD_FIELDS, row))
+                record["active"] = bool(row[5])
+                records.append(record)
+            return records
+        except sqlite3.OperationalError as e:
+            raise PersistenceException(f"Error al listar usuarios: {e}")
+        finally:
+            self._pool.release(conn)
 
     def list(self) -> list[User]:
         """Recupera todos los usuarios."""
-        conn = self._connect()
-        usuarios = []
+        conn = self._pool.acquire()
         try:
             cursor = conn.cursor()
-            cursor.execute("SELECT user_id, name, surname1, surname2, active FROM users")
-            
-            for user_id, name, surname1, surname2, active in cursor.fetchall():
-                user = User(user_id, name, surname1, surname2)
-                if not active:
-                    user.deactivate()
-                usuarios.append(user)
-            
-            return usuarios
+            cursor.execute(_SELECT_USERS)
+            return [self._row_to_user(row) for row in cursor.fetchall()]
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al listar usuarios: {e}")
         finally:
-            conn.close()
+            self._pool.release(conn)
 
     def delete(self, user_id: str) -> None:
         """Elimina un usuario de la base de datos."""
-        conn = self._connect()
+        conn = self._pool.acquire()
         try:
             with conn:
                 cursor = conn.cursor()
@@ -122,4 +176,13 @@ class UserSQLiteRepository(UserRepository):
         except sqlite3.OperationalError as e:
             raise PersistenceException(f"Error al eliminar el usuario: {e}")
         finally:
-            conn.close()
\ No newline at end of file
+            self._pool.release(conn)
+
+    @staticmethod
+    def _row_to_user(row) -> User:
+        """Reconstruye un User a partir de una fila de _SELECT_USERS."""
+        user_id, name, surname1, surname2, active = row
+        user = User(user_id, name, surname1, surname2)
+        if not active:
+            user.deactivate()
+        return user
@@ -3,15 +3,32 @@ SmartSpaces REST API - Versión con Jinja2 templates (Lab A4 patrones)
 Actividad UT4E3: Plantillas base, herencia, y renderizado dinámico
 """
 
+import json
 import logging
-from flask import Flask, request, jsonify, redirect, url_for, render_template
-from datetime import datetime
+import os
+import threading
+from functools import wraps
+from operator import itemgetter
+from flask import Flask, request, jsonify, redirect, url_for, render_template, make_response, g
+from datetime import datetime, timedelta, timezone
 from infrastructure.space_sqlite_repository import SpaceSQLiteRepository
 from infrastructure.user_sqlite_repository import UserSQLiteRepository
 from infrastructure.booking_sqlite_repository import BookingSQLiteRepository
+from infrastructure.availability_sqlite_repository import AvailabilitySQLiteRepository
+from infrastructure.slot_availability_index import SlotAvailabilityIndex
+from infrastructure.caching_space_repository import CachingSpaceRepository
+from infrastructure.caching_user_repository import CachingUserRepository
+from infrastructure.sqlite_data_version import SQLiteDataVersion
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+from infrastructure.request_metrics import RequestMetrics, InstrumentedRepository
+from infrastructure.queued_logging import configure_logging, SamplingFilter
+from infrastructure.sqlite_query_profiler import SQLiteQueryProfiler, slow_query_logger
+from infrastructure.sqlite_migrations import migrate_database
+from infrastructure.sqlite_query_plans import check_hot_query_plans
 from application.space_service import SpaceService
 from application.user_service import UserService
 from application.booking_service import BookingService
+from application.analytics_service import AnalyticsService
 from domain.exceptions import (
     RepositoryException,
     UserNotFoundError,
@@ -28,42 +45,119 @@ from domain.space_meetingroom import SpaceMeetingRoom
 # CONFIGURACIÓN DE LOGGING
 # ============================================================================
 
-logging.basicConfig(
-    filename='smartspaces.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+# Registro asíncrono: los hilos de petición solo encolan; un hilo aparte
+# escribe JSON (una línea por registro) en un fichero rotado por tamaño.
+# El fichero se abre en create_app(), no al importar el módulo.
+LOG_FILE = os.environ.get("SMARTSPACES_LOG_FILE", "smartspaces.log")
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+# Fracción de líneas de acceso (una por petición) que se registran; los
+# errores y avisos se registran siempre
+ACCESS_LOG_SAMPLE_RATE = float(os.environ.get("SMARTSPACES_ACCESS_LOG_SAMPLE_RATE", "1.0"))
+
+# Consultas lentas (con su plan) en un fichero propio, fuera del registro de la aplicación
+SLOW_QUERY_LOG_FILE = os.environ.get("SMARTSPACES_SLOW_QUERY_LOG_FILE", "smartspaces-slow-queries.log")
+
+log_handler = slow_query_log_handler = None
 logger = logging.getLogger(__name__)
-logger.info("=" * 80)
-logger.info("SmartSpaces API iniciada (UT4E3 - Templates)")
-logger.info("=" * 80)
+access_logger = logger.getChild("access")
+access_logger.addFilter(SamplingFilter(ACCESS_LOG_SAMPLE_RATE))
 
 # ============================================================================
 # CONFIGURACIÓN DE FLASK
 # ============================================================================
 
 app = Flask(__name__)
-DB_PATH = "smartspaces.db"
-
-# Crear repositorios
-space_repo = SpaceSQLiteRepository(DB_PATH)
-user_repo = UserSQLiteRepository(DB_PATH)
-booking_repo = BookingSQLiteRepository(DB_PATH)
+# Fichero SQLite; SMARTSPACES_DB permite apuntar a otra base de datos (p. ej. en los tests)
+DB_PATH = os.environ.get("SMARTSPACES_DB", "smartspaces.db")
+
+# Métricas por petición (latencia, sentencias SQL y llamadas a repositorios)
+request_metrics = RequestMetrics()
+SQLiteConnectionPool.for_path(DB_PATH).add_statement_listener(RequestMetrics.count_statement)
+
+# Perfilado de sentencias SQL: agregados por plantilla en /admin/consultas y
+# sentencias de más de SLOW_QUERY_MS, con su plan, en SLOW_QUERY_LOG_FILE
+SLOW_QUERY_MS = 100
+# Las rutas /admin/* exponen el SQL y los planes de consulta: solo se sirven
+# con SMARTSPACES_ADMIN_ROUTES=1 o con la aplicación en modo debug
+app.config["ADMIN_ROUTES"] = os.environ.get("SMARTSPACES_ADMIN_ROUTES") == "1"
+query_profiler = SQLiteQueryProfiler(slow_threshold_ms=SLOW_QUERY_MS)
+SQLiteConnectionPool.for_path(DB_PATH).set_profiler(query_profiler)
+
+# Crear repositorios (espacios y usuarios con caché de lectura invalidada
+# por escrituras propias, TTL y el contador de data_versions), instrumentados
+# para contar las llamadas de cada petición
+space_repo = InstrumentedRepository(
+    CachingSpaceRepository(SpaceSQLiteRepository(DB_PATH), version=SQLiteDataVersion("spaces", DB_PATH)), "spaces")
+user_repo = InstrumentedRepository(
+    CachingUserRepository(UserSQLiteRepository(DB_PATH), version=SQLiteDataVersion("users", DB_PATH)), "users")
+booking_repo = InstrumentedRepository(BookingSQLiteRepository(DB_PATH), "bookings")
+availability_repo = InstrumentedRepository(AvailabilitySQLiteRepository(DB_PATH), "availability")
+
+# Índice de disponibilidad por tramos: se construye en la primera consulta, lo
+# actualiza BookingService en cada escritura y se reconstruye si otro proceso
+# escribe reservas (contador de data_versions)
+availability_index = SlotAvailabilityIndex(space_repo, booking_repo, availability_repo,
+                                           version=SQLiteDataVersion("bookings", DB_PATH))
 
 # Crear servicios - Bootstrap
 user_service = UserService(user_repo)
-space_service = SpaceService(space_repo, booking_repo)
-booking_service = BookingService(booking_repo, space_repo, user_repo)
+space_service = SpaceService(space_repo, booking_repo, availability_repo, availability_index)
+booking_service = BookingService(booking_repo, space_repo, user_repo, availability_repo, availability_index)
+analytics_service = AnalyticsService(booking_repo, space_repo)
 
 # ============================================================================
-# HOOK: Logging de peticiones
+# HOOKS: Métricas y registro de peticiones (/metrics en formato Prometheus)
 # ============================================================================
 
+
+UNMATCHED_ROUTE = "<sin ruta>"
+
+
 @app.before_request
-def log_request():
-    """Registra cada petición: método y ruta."""
-    logger.info(f"{request.method} {request.path}")
+def start_request_metrics():
+    """Abre el recuento de la petición (en curso, sentencias SQL, repositorios)."""
+    g.metrics_tally = request_metrics.start()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """Registra la latencia de la petición y escribe su línea de acceso (muestreada)."""
+    tally = g.pop("metrics_tally", None)
+    if tally is not None:
+        route = request.url_rule.rule if request.url_rule else UNMATCHED_ROUTE
+        elapsed = request_metrics.observe(tally, route, request.method, response.status_code)
+        request_metrics.end(tally)
+        access_logger.log(
+            logging.INFO if response.status_code < 500 else logging.WARNING,
+            "%s %s -> %s", request.method, request.path, response.status_code,
+            extra={"method": request.method, "path": request.path, "route": route,
+                   "status": response.status_code, "duration_ms": round(elapsed * 1000, 2),
+                   "sql_statements": tally.sql_statements},
+        )
+    return response
+
+
+@app.teardown_request
+def end_request_metrics(error=None):
+    """Cierra el recuento si la petición terminó sin pasar por after_request."""
+    tally = g.pop("metrics_tally", None)
+    if tally is not None:
+        request_metrics.end(tally)
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """GET /metrics - Métricas de peticiones en formato de texto Prometheus."""
+    dropped = log_handler.dropped if log_handler is not None else 0
+    response = make_response(
+        request_metrics.render()
+        + "# HELP smartspaces_log_records_dropped_total Log records dropped because the log queue was full.\n"
+        + "# TYPE smartspaces_log_records_dropped_total counter\n"
+        + f"smartspaces_log_records_dropped_total {dropped}\n"
+    )
+    response.headers["Content-Type"] = "text/plain; version=0.0.4; charset=utf-8"
+    return response
 
 # ============================================================================
 # FUNCIONES AUXILIARES (Serialización)
@@ -71,63 +165,161 @@ def log_request():
 
 def format_space(space):
     """Convierte un Space a diccionario para JSON o plantilla."""
-    data = {
-        "space_id": space.space_id,
-        "space_name": space.space_name,
-        "capacity": space.capacity,
-        "space_type": space.space_type,
-        "space_status": space.space_status,
-    }
-    if isinstance(space, SpaceMeetingRoom):
-        data.update(
-            {
-                "room_number": space.room_number,
-                "floor": space.floor,
-                "equipment_list": space.equipment_list,
-                "num_power_outlets": space.num_power_outlets,
-            }
-        )
-    return data
+    return space.to_record()
 
 
 def format_user(user):
     """Convierte un User a diccionario para JSON o plantilla."""
-    return {
-        "user_id": user.user_id,
-        "name": user.name,
-        "surname1": user.surname1,
-        "surname2": user.surname2,
-        "full_name": user.full_name(),
-        "active": user.is_active(),
-    }
+    return user.to_record()
 
 
 def format_booking(booking):
     """Convierte un Booking a diccionario para JSON o plantilla."""
-    return {
-        "booking_id": booking.booking_id,
-        "space_id": booking.space.space_id,
-        "space_name": booking.space.space_name,
-        "user_id": booking.user.user_id,
-        "user_name": booking.user.full_name(),
-        "start_time": (
-            booking.start_time.isoformat()
-            if hasattr(booking.start_time, "isoformat")
-            else str(booking.start_time)
-        ),
-        "end_time": (
-            booking.end_time.isoformat()
-            if hasattr(booking.end_time, "isoformat")
-            else str(booking.end_time)
-        ),
-        "booking_status": booking.status,
-    }
+    return booking.to_record()
 
 
 def error_response(message, code):
     """Devuelve una respuesta de error en JSON."""
     return jsonify({"error": message}), code
 
+# ============================================================================
+# PAGINACIÓN POR CLAVE (?limit=&after=)
+# ============================================================================
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def page_args():
+    """Lee los parámetros ?limit=&after= de la petición.
+
+    Raises:
+        ValueError: Si limit no es un entero entre 1 y MAX_PAGE_SIZE.
+    """
+    after = request.args.get("after") or None
+    raw_limit = request.args.get("limit")
+    try:
+        limit = DEFAULT_PAGE_SIZE if raw_limit is None else int(raw_limit)
+    except ValueError:
+        raise ValueError(f"limit debe ser un entero: '{raw_limit}'")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit debe estar entre 1 y {MAX_PAGE_SIZE}")
+    return after, limit
+
+
+def paginate(iter_items, key, endpoint):
+    """Obtiene una página de un iterador keyset y la URL de la página siguiente.
+
+    Se pide un elemento de más para saber si hay otra página sin contar la tabla.
+
+    Returns:
+        Una tupla (elementos de la página, URL siguiente o None).
+    """
+    after, limit = page_args()
+    items = list(iter_items(after, limit + 1))
+    next_url = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_url = url_for(endpoint, limit=limit, after=key(items[-1]))
+    return items, next_url
+
+# ============================================================================
+# API JSON v1 (/api/v1/... o Accept: application/json)
+# ============================================================================
+
+API_PREFIX = "/api/v1"
+
+
+def wants_json():
+    """Negociación de contenido: True si la ruta es de la API o el cliente
+    prefiere application/json a text/html en la cabecera Accept."""
+    if request.path.startswith(API_PREFIX + "/"):
+        return True
+    return request.accept_mimetypes.best_match(["text/html", "application/json"]) == "application/json"
+
+
+def json_response(payload, status=200):
+    """Serializa una respuesta JSON compacta (sin indentar ni ordenar claves)."""
+    return app.response_class(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+        status=status,
+        mimetype="application/json",
+    )
+
+
+def json_page(iter_records, key):
+    """Página keyset en JSON ({"items", "count", "next"}) a partir de los registros
+    de un repositorio (iter_*_records), sin construir entidades."""
+    items, next_url = paginate(iter_records, itemgetter(key), request.endpoint)
+    return json_response({"items": items, "count": len(items), "next": next_url})
+
+# ============================================================================
+# PETICIONES CONDICIONALES (ETag / Last-Modified)
+# ============================================================================
+
+# Contadores de data_versions que incrementan los triggers en cada escritura
+data_versions = {name: SQLiteDataVersion(name, DB_PATH) for name in ("spaces", "users", "bookings")}
+_versions_seen = {}
+_versions_lock = threading.Lock()
+
+
+def current_versions(tables):
+    """Lee la versión de cada tabla y el momento en que se vio por primera vez.
+
+    Ese momento (a segundos, en UTC) se usa como Last-Modified: es posterior o
+    igual a la escritura que produjo la versión, y cambia siempre que esta cambia.
+
+    Returns:
+        Un diccionario tabla -> (versión, datetime UTC).
+    """
+    versions = {table: data_versions[table]() for table in tables}
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    with _versions_lock:
+        for table, version in versions.items():
+            seen = _versions_seen.get(table)
+            if seen is None or seen[0] != version:
+                _versions_seen[table] = (version, now)
+        return {table: _versions_seen[table] for table in tables}
+
+
+def conditional_get(*tables):
+    """Decorador de rutas GET que dependen de las tablas indicadas.
+
+    Añade ETag (distinto para HTML y JSON) y Last-Modified a las respuestas
+    200 y, si el cliente ya tiene
+    la versión actual (If-None-Match o, en su defecto, If-Modified-Since),
+    responde 304 sin ejecutar la vista, es decir, sin consultar repositorios
+    ni renderizar la plantilla.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            seen = current_versions(tables)
+            # Versiones con las que se responde; el long-poll de presentation/asgi.py
+            # espera a que alguna de estas tablas las supere
+            request.environ["smartspaces.data_versions"] = {table: version for table, (version, _) in seen.items()}
+            etag = "-".join(["json" if wants_json() else "html"]
+                            + [f"{table}.{version}" for table, (version, _) in seen.items()])
+            last_modified = max(moment for _, moment in seen.values())
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains(etag)
+            else:
+                not_modified = (request.if_modified_since is not None
+                                and last_modified <= request.if_modified_since)
+            if not_modified:
+                response = app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.cache_control.no_cache = True
+            response.vary.add("Accept")
+            return response
+        return wrapper
+    return decorator
+
 # ============================================================================
 # MANEJADORES GLOBALES DE ERROR
 # ============================================================================
@@ -135,14 +327,14 @@ def error_response(message, code):
 @app.errorhandler(404)
 def error_404(error):
     """Manejador de errores 404 - Ruta no encontrada."""
-    logger.warning(f"404 Not Found: {request.method} {request.path}")
+    logger.warning("404 Not Found: %s %s", request.method, request.path)
     return render_template('error.html', code=404, path=request.path), 404
 
 
 @app.errorhandler(500)
 def error_500(error):
     """Manejador de errores 500 - Error interno del servidor."""
-    logger.error(f"500 Internal Server Error: {request.method} {request.path} - {str(error)}")
+    logger.error("500 Internal Server Error: %s %s - %s", request.method, request.path, error)
     return render_template('error.html', code=500), 500
 
 # ============================================================================
@@ -170,7 +362,7 @@ def ayuda():
         })
     
     routes.sort(key=lambda x: x['path'])
-    logger.info(f"Acceso a /ayuda - Mostrando {len(routes)} rutas")
+    logger.info("Acceso a /ayuda - Mostrando %s rutas", len(routes))
     
     return render_template('ayuda.html', routes=routes)
 
@@ -188,29 +380,48 @@ def index():
 # ============================================================================
 
 @app.route("/users", methods=["GET"])
+@app.route(API_PREFIX + "/users", methods=["GET"], endpoint="api_list_users")
+@conditional_get("users")
 def list_users():
-    """GET /users - Lista todos los usuarios."""
+    """GET /users?limit=&after= - Lista los usuarios por páginas (keyset).
+
+    En /api/v1/users, o con Accept: application/json, devuelve la página en
+    JSON a partir de los registros del repositorio.
+    """
     try:
-        users = user_service.list_users()
+        if wants_json():
+            return json_page(user_service.iter_user_records, "user_id")
+        users, next_url = paginate(
+            user_service.iter_users, lambda u: u.user_id, "list_users"
+        )
         formatted_users = [format_user(u) for u in users]
-        return render_template('users.html', users=formatted_users)
+        return render_template('users.html', users=formatted_users, paginated=True, next_url=next_url)
+    except ValueError as e:
+        logger.warning("Paginación no válida en /users: %s", e)
+        return error_response(str(e), 400)
     except Exception as e:
-        logger.error(f"Error al listar usuarios: {str(e)}")
+        logger.error("Error al listar usuarios: %s", e)
         return error_response(f"Error al listar usuarios: {str(e)}", 500)
 
 
 @app.route("/users/<user_id>", methods=["GET"])
+@app.route(API_PREFIX + "/users/<user_id>", methods=["GET"], endpoint="api_get_user")
+@conditional_get("users")
 def get_user(user_id):
-    """GET /users/<user_id> - Obtiene un usuario por ID."""
+    """GET /users/<user_id> - Obtiene un usuario por ID (HTML o JSON)."""
     try:
         user = user_service.get_user(user_id)
         formatted_user = format_user(user)
+        if wants_json():
+            return json_response(formatted_user)
         return render_template('user_detail.html', user=formatted_user)
     except UserNotFoundError:
-        logger.warning(f"Usuario no encontrado: {user_id}")
+        logger.warning("Usuario no encontrado: %s", user_id)
+        if wants_json():
+            return error_response(f"Usuario '{user_id}' no encontrado", 404)
         return render_template('error.html', code=404, path=f"/users/{user_id}"), 404
     except Exception as e:
-        logger.error(f"Error al obtener usuario {user_id}: {str(e)}")
+        logger.error("Error al obtener usuario %s: %s", user_id, e)
         return error_response(f"Error al obtener usuario: {str(e)}", 500)
 
 # ============================================================================
@@ -218,29 +429,48 @@ def get_user(user_id):
 # ============================================================================
 
 @app.route("/spaces", methods=["GET"])
+@app.route(API_PREFIX + "/spaces", methods=["GET"], endpoint="api_list_spaces")
+@conditional_get("spaces")
 def list_spaces():
-    """GET /spaces - Lista todos los espacios."""
+    """GET /spaces?limit=&after= - Lista los espacios por páginas (keyset).
+
+    En /api/v1/spaces, o con Accept: application/json, devuelve la página en
+    JSON a partir de los registros del repositorio.
+    """
     try:
-        spaces = space_service.list_spaces()
+        if wants_json():
+            return json_page(space_service.iter_space_records, "space_id")
+        spaces, next_url = paginate(
+            space_service.iter_spaces, lambda s: s.space_id, "list_spaces"
+        )
         formatted_spaces = [format_space(s) for s in spaces]
-        return render_template('spaces.html', spaces=formatted_spaces)
+        return render_template('spaces.html', spaces=formatted_spaces, paginated=True, next_url=next_url)
+    except ValueError as e:
+        logger.warning("Paginación no válida en /spaces: %s", e)
+        return error_response(str(e), 400)
     except Exception as e:
-        logger.error(f"Error al listar espacios: {str(e)}")
+        logger.error("Error al listar espacios: %s", e)
         return error_response(f"Error al listar espacios: {str(e)}", 500)
 
 
 @app.route("/spaces/<space_id>", methods=["GET"])
+@app.route(API_PREFIX + "/spaces/<space_id>", methods=["GET"], endpoint="api_get_space")
+@conditional_get("spaces")
 def get_space(space_id):
-    """GET /spaces/<space_id> - Obtiene un espacio por ID."""
+    """GET /spaces/<space_id> - Obtiene un espacio por ID (HTML o JSON)."""
     try:
         space = space_service.get_space(space_id)
         formatted_space = format_space(space)
+        if wants_json():
+            return json_response(formatted_space)
         return render_template('space_detail.html', space=formatted_space)
     except SpaceNotFoundError:
-        logger.warning(f"Espacio no encontrado: {space_id}")
+        logger.warning("Espacio no encontrado: %s", space_id)
+        if wants_json():
+            return error_response(f"Espacio '{space_id}' no encontrado", 404)
         return render_template('error.html', code=404, path=f"/spaces/{space_id}"), 404
     except Exception as e:
-        logger.error(f"Error al obtener espacio {space_id}: {str(e)}")
+        logger.error("Error al obtener espacio %s: %s", space_id, e)
         return error_response(f"Error al obtener espacio: {str(e)}", 500)
 
 # ============================================================================
@@ -248,33 +478,53 @@ def get_space(space_id):
 # ============================================================================
 
 @app.route("/bookings", methods=["GET"])
+@app.route(API_PREFIX + "/bookings", methods=["GET"], endpoint="api_list_bookings")
+@conditional_get("bookings", "spaces", "users")
 def list_bookings():
-    """GET /bookings - Lista todas las reservas."""
+    """GET /bookings?limit=&after= - Lista las reservas por páginas (keyset).
+
+    En /api/v1/bookings, o con Accept: application/json, devuelve la página en
+    JSON a partir de los registros del repositorio.
+    """
     try:
-        bookings = booking_service.list_bookings()
+        if wants_json():
+            return json_page(booking_service.iter_booking_records, "booking_id")
+        bookings, next_url = paginate(
+            booking_service.iter_bookings, lambda b: b.booking_id, "list_bookings"
+        )
         formatted_bookings = [format_booking(b) for b in bookings]
-        return render_template('bookings.html', bookings=formatted_bookings)
+        return render_template('bookings.html', bookings=formatted_bookings, paginated=True, next_url=next_url)
+    except ValueError as e:
+        logger.warning("Paginación no válida en /bookings: %s", e)
+        return error_response(str(e), 400)
     except Exception as e:
-        logger.error(f"Error al listar reservas: {str(e)}")
+        logger.error("Error al listar reservas: %s", e)
         return error_response(f"Error al listar reservas: {str(e)}", 500)
 
 
 @app.route("/bookings/<booking_id>", methods=["GET"])
+@app.route(API_PREFIX + "/bookings/<booking_id>", methods=["GET"], endpoint="api_get_booking")
+@conditional_get("bookings", "spaces", "users")
 def get_booking(booking_id):
-    """GET /bookings/<booking_id> - Obtiene una reserva por ID."""
+    """GET /bookings/<booking_id> - Obtiene una reserva por ID (HTML o JSON)."""
     try:
         booking = booking_service.get_booking(booking_id)
         formatted_booking = format_booking(booking)
+        if wants_json():
+            return json_response(formatted_booking)
         return render_template('booking_detail.html', booking=formatted_booking)
     except BookingNotFoundError:
-        logger.warning(f"Reserva no encontrada: {booking_id}")
+        logger.warning("Reserva no encontrada: %s", booking_id)
+        if wants_json():
+            return error_response(f"Reserva '{booking_id}' no encontrada", 404)
         return render_template('error.html', code=404, path=f"/bookings/{booking_id}"), 404
     except Exception as e:
-        logger.error(f"Error al obtener reserva {booking_id}: {str(e)}")
+        logger.error("Error al obtener reserva %s: %s", booking_id, e)
         return error_response(f"Error al obtener reserva: {str(e)}", 500)
 
 
 @app.route("/spaces/disponibles/<fecha_inicio>/<fecha_fin>", methods=["GET"])
+@conditional_get("spaces", "bookings")
 def get_available_spaces(fecha_inicio, fecha_fin):
     """GET /spaces/disponibles/<fecha_inicio>/<fecha_fin> - Espacios libres en rango."""
     try:
@@ -284,14 +534,71 @@ def get_available_spaces(fecha_inicio, fecha_fin):
         formatted_spaces = [format_space(s) for s in spaces]
         return render_template('spaces.html', spaces=formatted_spaces)
     except ValueError:
-        logger.warning(f"Formato de fecha inválido: {fecha_inicio}/{fecha_fin}")
+        logger.warning("Formato de fecha inválido: %s/%s", fecha_inicio, fecha_fin)
         return error_response(
             f"Formato de fecha inválido. Use ISO 8601: YYYY-MM-DDTHH:MM:SS", 400
         )
     except Exception as e:
-        logger.error(f"Error al buscar espacios disponibles: {str(e)}")
+        logger.error("Error al buscar espacios disponibles: %s", e)
         return error_response(f"Error al buscar espacios disponibles: {str(e)}", 500)
 
+@app.route("/spaces/<space_id>/huecos/<fecha_inicio>/<fecha_fin>", methods=["GET"])
+@conditional_get("spaces", "bookings")
+def get_free_slots(space_id, fecha_inicio, fecha_fin):
+    """GET /spaces/<space_id>/huecos/<fecha_inicio>/<fecha_fin>?duracion_min=&limite=
+
+    Próximos huecos libres de un espacio en el rango. duracion_min en minutos
+    (por defecto 30) y limite de huecos (por defecto 10).
+    """
+    try:
+        start = datetime.fromisoformat(fecha_inicio)
+        end = datetime.fromisoformat(fecha_fin)
+        min_duration = timedelta(minutes=int(request.args.get("duracion_min", 30)))
+        limit = int(request.args.get("limite", 10))
+        space = space_service.get_space(space_id)
+        slots = space_service.find_free_slots(space, start, end, min_duration, limit)
+        formatted_slots = [
+            {"start_time": slot_start.isoformat(), "end_time": slot_end.isoformat()}
+            for slot_start, slot_end in slots
+        ]
+        return render_template('free_slots.html', space=format_space(space), slots=formatted_slots)
+    except SpaceNotFoundError:
+        logger.warning("Espacio no encontrado: %s", space_id)
+        return render_template('error.html', code=404, path=request.path), 404
+    except ValueError as e:
+        logger.warning("Parámetros de búsqueda de huecos inválidos: %s", e)
+        return error_response(f"Parámetros inválidos: {str(e)}", 400)
+    except Exception as e:
+        logger.error("Error al buscar huecos libres: %s", e)
+        return error_response(f"Error al buscar huecos libres: {str(e)}", 500)
+
+# ============================================================================
+# ANALÍTICA DE OCUPACIÓN (JSON)
+# ============================================================================
+
+@app.route("/analytics/ocupacion/<fecha_inicio>/<fecha_fin>", methods=["GET"])
+@conditional_get("spaces", "bookings")
+def get_occupancy(fecha_inicio, fecha_fin):
+    """GET /analytics/ocupacion/<fecha_inicio>/<fecha_fin>?intervalo=hour|day&agrupar=space|floor
+
+    Ocupación, ratio de utilización y horas punta por espacio o por planta.
+    """
+    try:
+        start = datetime.fromisoformat(fecha_inicio)
+        end = datetime.fromisoformat(fecha_fin)
+        report = analytics_service.occupancy(
+            start, end,
+            bucket=request.args.get("intervalo", "hour"),
+            group_by=request.args.get("agrupar", "space"),
+        )
+        return jsonify(report)
+    except ValueError as e:
+        logger.warning("Parámetros de analítica inválidos: %s", e)
+        return error_response(f"Parámetros inválidos: {str(e)}", 400)
+    except Exception as e:
+        logger.error("Error al calcular la ocupación: %s", e)
+        return error_response(f"Error al calcular la ocupación: {str(e)}", 500)
+
 # ============================================================================
 # CREACIÓN DE USUARIOS (POST con redirect)
 # ============================================================================
@@ -301,16 +608,16 @@ def create_user_route(user_id, name, surname1, surname2):
     """POST /users/nuevo/<user_id>/<name>/<surname1>/<surname2> - Crea un usuario."""
     try:
         user = user_service.create_user(user_id, name, surname1, surname2)
-        logger.info(f"Usuario creado: {user_id}")
+        logger.info("Usuario creado: %s", user_id)
         return redirect(url_for("get_user", user_id=user_id))
     except UserAlreadyExistsException:
-        logger.warning(f"Intento de crear usuario duplicado: {user_id}")
+        logger.warning("Intento de crear usuario duplicado: %s", user_id)
         return error_response(f"Usuario con ID '{user_id}' ya existe", 409)
     except ValueError as e:
-        logger.warning(f"Datos inválidos al crear usuario: {str(e)}")
+        logger.warning("Datos inválidos al crear usuario: %s", e)
         return error_response(str(e), 400)
     except Exception as e:
-        logger.error(f"Error al crear usuario: {str(e)}")
+        logger.error("Error al crear usuario: %s", e)
         return error_response(f"Error al crear usuario: {str(e)}", 500)
 
 # ============================================================================
@@ -322,16 +629,16 @@ def create_space_route(space_name, capacity, space_type):
     """POST /spaces/nuevo/<space_name>/<capacity>/<space_type> - Crea un espacio."""
     try:
         space = space_service.create_space(space_name, capacity, space_type)
-        logger.info(f"Espacio creado: {space.space_id}")
+        logger.info("Espacio creado: %s", space.space_id)
         return redirect(url_for("get_space", space_id=space.space_id))
     except SpaceAlreadyExistsException:
-        logger.warning(f"Intento de crear espacio duplicado")
+        logger.warning("Intento de crear espacio duplicado")
         return error_response(f"Espacio ya existe", 409)
     except ValueError as e:
-        logger.warning(f"Datos inválidos al crear espacio: {str(e)}")
+        logger.warning("Datos inválidos al crear espacio: %s", e)
         return error_response(str(e), 400)
     except Exception as e:
-        logger.error(f"Error al crear espacio: {str(e)}")
+        logger.error("Error al crear espacio: %s", e)
         return error_response(f"Error al crear espacio: {str(e)}", 500)
 
 # ============================================================================
@@ -348,22 +655,22 @@ def create_booking_route(user_name, space_name, fecha_inicio, fecha_fin):
         start = datetime.fromisoformat(fecha_inicio)
         end = datetime.fromisoformat(fecha_fin)
         booking = booking_service.create_booking(user_name, space_name, start, end)
-        logger.info(f"Reserva creada: {booking.booking_id}")
+        logger.info("Reserva creada: %s", booking.booking_id)
         return redirect(url_for("get_booking", booking_id=booking.booking_id))
     except ValueError as e:
         if "ISO" in str(e):
-            logger.warning(f"Formato de fecha inválido: {fecha_inicio}/{fecha_fin}")
+            logger.warning("Formato de fecha inválido: %s/%s", fecha_inicio, fecha_fin)
             return error_response(
                 f"Formato de fecha inválido. Use ISO 8601: YYYY-MM-DDTHH:MM:SS", 400
             )
         else:
-            logger.warning(f"Datos inválidos al crear reserva: {str(e)}")
+            logger.warning("Datos inválidos al crear reserva: %s", e)
             return error_response(str(e), 400)
     except BookingAlreadyExistsException:
-        logger.warning(f"Intento de crear reserva duplicada")
+        logger.warning("Intento de crear reserva duplicada")
         return error_response("Reserva ya existe", 409)
     except Exception as e:
-        logger.error(f"Error al crear reserva: {str(e)}")
+        logger.error("Error al crear reserva: %s", e)
         return error_response(f"Error al crear reserva: {str(e)}", 500)
 
 # ============================================================================
@@ -375,16 +682,16 @@ def cancel_booking_route(booking_id):
     """POST /bookings/<booking_id>/cancelar - Cancela una reserva."""
     try:
         booking = booking_service.cancel_booking(booking_id)
-        logger.info(f"Reserva cancelada: {booking_id}")
+        logger.info("Reserva cancelada: %s", booking_id)
         return redirect(url_for("get_booking", booking_id=booking_id))
     except BookingNotFoundError:
-        logger.warning(f"Intento de cancelar reserva inexistente: {booking_id}")
+        logger.warning("Intento de cancelar reserva inexistente: %s", booking_id)
         return error_response(f"Reserva '{booking_id}' no encontrada", 404)
     except ValueError as e:
-        logger.warning(f"Error al cancelar reserva: {str(e)}")
+        logger.warning("Error al cancelar reserva: %s", e)
         return error_response(str(e), 400)
     except Exception as e:
-        logger.error(f"Error al cancelar reserva: {str(e)}")
+        logger.error("Error al cancelar reserva: %s", e)
         return error_response(f"Error al cancelar reserva: {str(e)}", 500)
 
 
@@ -393,16 +700,16 @@ def finish_booking_route(booking_id):
     """POST /bookings/<booking_id>/finalizar - Finaliza una reserva."""
     try:
         booking = booking_service.finish_booking(booking_id)
-        logger.info(f"Reserva finalizada: {booking_id}")
+        logger.info("Reserva finalizada: %s", booking_id)
         return redirect(url_for("get_booking", booking_id=booking_id))
     except BookingNotFoundError:
-        logger.warning(f"Intento de finalizar reserva inexistente: {booking_id}")
+        logger.warning("Intento de finalizar reserva inexistente: %s", booking_id)
         return error_response(f"Reserva '{booking_id}' no encontrada", 404)
     except ValueError as e:
-        logger.warning(f"Error al finalizar reserva: {str(e)}")
+        logger.warning("Error al finalizar reserva: %s", e)
         return error_response(str(e), 400)
     except Exception as e:
-        logger.error(f"Error al finalizar reserva: {str(e)}")
+        logger.error("Error al finalizar reserva: %s", e)
         return error_response(f"Error al finalizar reserva: {str(e)}", 500)
 
 # ============================================================================
@@ -414,13 +721,13 @@ def deactivate_user_route(user_id):
     """POST /users/<user_id>/desactivar - Desactiva un usuario."""
     try:
         user = user_service.deactivate_user(user_id)
-        logger.info(f"Usuario desactivado: {user_id}")
+        logger.info("Usuario desactivado: %s", user_id)
         return redirect(url_for("get_user", user_id=user_id))
     except UserNotFoundError:
-        logger.warning(f"Intento de desactivar usuario inexistente: {user_id}")
+        logger.warning("Intento de desactivar usuario inexistente: %s", user_id)
         return error_response(f"Usuario '{user_id}' no encontrado", 404)
     except Exception as e:
-        logger.error(f"Error al desactivar usuario: {str(e)}")
+        logger.error("Error al desactivar usuario: %s", e)
         return error_response(f"Error al desactivar usuario: {str(e)}", 500)
 
 # ============================================================================
@@ -442,16 +749,16 @@ def create_meeting_room_route(
         space = space_service.create_meeting_room(
             space_name, capacity, room_number, floor, num_power_outlets, equipment_list
         )
-        logger.info(f"Sala de reuniones creada: {space.space_id}")
+        logger.info("Sala de reuniones creada: %s", space.space_id)
         return redirect(url_for("get_space", space_id=space.space_id))
     except SpaceAlreadyExistsException:
-        logger.warning(f"Intento de crear sala duplicada")
+        logger.warning("Intento de crear sala duplicada")
         return error_response(f"Sala ya existe", 409)
     except ValueError as e:
-        logger.warning(f"Datos inválidos al crear sala: {str(e)}")
+        logger.warning("Datos inválidos al crear sala: %s", e)
         return error_response(str(e), 400)
     except Exception as e:
-        logger.error(f"Error al crear sala: {str(e)}")
+        logger.error("Error al crear sala: %s", e)
         return error_response(f"Error al crear sala: {str(e)}", 500)
 
 # ============================================================================
@@ -468,22 +775,22 @@ def reschedule_booking_route(booking_id, nueva_fecha_inicio, nueva_fecha_fin):
         new_start = datetime.fromisoformat(nueva_fecha_inicio)
         new_end = datetime.fromisoformat(nueva_fecha_fin)
         booking = booking_service.modify_booking(booking_id, new_start, new_end)
-        logger.info(f"Reserva reprogramada: {booking_id}")
+        logger.info("Reserva reprogramada: %s", booking_id)
         return redirect(url_for("get_booking", booking_id=booking_id))
     except ValueError as e:
         if "ISO" in str(e):
-            logger.warning(f"Formato de fecha inválido: {nueva_fecha_inicio}/{nueva_fecha_fin}")
+            logger.warning("Formato de fecha inválido: %s/%s", nueva_fecha_inicio, nueva_fecha_fin)
             return error_response(
                 f"Formato de fecha inválido. Use ISO 8601: YYYY-MM-DDTHH:MM:SS", 400
             )
         else:
-            logger.warning(f"Error al reprogramar reserva: {str(e)}")
+            logger.warning("Error al reprogramar reserva: %s", e)
             return error_response(str(e), 400)
     except BookingNotFoundError:
-        logger.warning(f"Intento de reprogramar reserva inexistente: {booking_id}")
+        logger.warning("Intento de reprogramar reserva inexistente: %s", booking_id)
         return error_response(f"Reserva '{booking_id}' no encontrada", 404)
     except Exception as e:
-        logger.error(f"Error al reprogramar reserva: {str(e)}")
+        logger.error("Error al reprogramar reserva: %s", e)
         return error_response(f"Error al reprogramar reserva: {str(e)}", 500)
 
 # ============================================================================
@@ -491,6 +798,7 @@ def reschedule_booking_route(booking_id, nueva_fecha_inicio, nueva_fecha_fin):
 # ============================================================================
 
 @app.route("/bookings/usuario/<user_name>", methods=["GET"])
+@conditional_get("bookings", "spaces", "users")
 def get_bookings_for_user_route(user_name):
     """GET /bookings/usuario/<user_name> - Reservas de un usuario."""
     try:
@@ -498,14 +806,15 @@ def get_bookings_for_user_route(user_name):
         formatted_bookings = [format_booking(b) for b in bookings]
         return render_template('bookings.html', bookings=formatted_bookings)
     except ValueError as e:
-        logger.warning(f"Usuario no encontrado: {user_name}")
+        logger.warning("Usuario no encontrado: %s", user_name)
         return render_template('error.html', code=404, path=f"/bookings/usuario/{user_name}"), 404
     except Exception as e:
-        logger.error(f"Error al obtener reservas: {str(e)}")
+        logger.error("Error al obtener reservas: %s", e)
         return error_response(f"Error al obtener reservas: {str(e)}", 500)
 
 
 @app.route("/bookings/espacio/<space_name>", methods=["GET"])
+@conditional_get("bookings", "spaces", "users")
 def get_bookings_for_space_route(space_name):
     """GET /bookings/espacio/<space_name> - Reservas de un espacio."""
     try:
@@ -513,12 +822,95 @@ def get_bookings_for_space_route(space_name):
         formatted_bookings = [format_booking(b) for b in bookings]
         return render_template('bookings.html', bookings=formatted_bookings)
     except ValueError as e:
-        logger.warning(f"Espacio no encontrado: {space_name}")
+        logger.warning("Espacio no encontrado: %s", space_name)
         return render_template('error.html', code=404, path=f"/bookings/espacio/{space_name}"), 404
     except Exception as e:
-        logger.error(f"Error al obtener reservas: {str(e)}")
+        logger.error("Error al obtener reservas: %s", e)
         return error_response(f"Error al obtener reservas: {str(e)}", 500)
 
+# ============================================================================
+# ADMINISTRACIÓN - PERFIL DE CONSULTAS SQL (JSON)
+# ============================================================================
+
+def admin_route(view):
+    """Decorador de las rutas de administración.
+
+    Responde 404, como si la ruta no existiera, salvo que ``ADMIN_ROUTES``
+    esté activo en la configuración o la aplicación esté en modo debug.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not (app.config["ADMIN_ROUTES"] or app.debug):
+            return error_response("Recurso no encontrado", 404)
+        return view(*args, **kwargs)
+    return wrapper
+
+
+@app.route("/admin/consultas", methods=["GET"])
+@admin_route
+def get_query_profile():
+    """GET /admin/consultas?orden=seconds|count|mean_ms|max_ms|slow&limite=
+
+    Contadores y latencias de las sentencias SQL agregados por plantilla.
+    """
+    try:
+        limit = request.args.get("limite", type=int)
+        statements = query_profiler.snapshot(sort_by=request.args.get("orden", "seconds"), limit=limit)
+        return json_response({
+            "slow_threshold_ms": SLOW_QUERY_MS,
+            "slow_count": query_profiler.slow_count(),
+            "statements": statements,
+        })
+    except ValueError as e:
+        logger.warning("Parámetros de perfil de consultas inválidos: %s", e)
+        return error_response(f"Parámetros inválidos: {str(e)}", 400)
+
+
+@app.route("/admin/consultas/reiniciar", methods=["POST"])
+@admin_route
+def reset_query_profile():
+    """POST /admin/consultas/reiniciar - Borra los agregados del perfil de consultas."""
+    query_profiler.reset()
+    logger.info("Perfil de consultas SQL reiniciado")
+    return redirect(url_for("get_query_profile"))
+
+# ============================================================================
+# ARRANQUE
+# ============================================================================
+
+_startup_lock = threading.Lock()
+_started = False
+
+
+def create_app():
+    """Prepara el registro y la base de datos y devuelve la aplicación lista para servir.
+
+    Configura el registro en LOG_FILE (y las consultas lentas, sin propagarse
+    a él, en SLOW_QUERY_LOG_FILE), aplica las migraciones pendientes del esquema
+    (infrastructure/sqlite_migrations.py) y avisa si alguna consulta crítica
+    no usa su índice. Importar el módulo no toca la base de datos: lo hace la
+    primera llamada a esta función (``python -m presentation.app``, el
+    lifespan de presentation/asgi.py o ``gunicorn "presentation.app:create_app()"``).
+    """
+    global _started, log_handler, slow_query_log_handler
+    with _startup_lock:
+        if not _started:
+            log_handler, _ = configure_logging(LOG_FILE, logging.INFO, LOG_MAX_BYTES, LOG_BACKUP_COUNT)
+            slow_query_logger.propagate = False
+            slow_query_log_handler, _ = configure_logging(SLOW_QUERY_LOG_FILE, logging.WARNING, LOG_MAX_BYTES,
+                                                          LOG_BACKUP_COUNT, logger=slow_query_logger)
+            logger.info("=" * 80)
+            logger.info("SmartSpaces API iniciada (UT4E3 - Templates)")
+            logger.info("=" * 80)
+            applied_migrations = migrate_database(DB_PATH)
+            if applied_migrations:
+                logger.info("Esquema de la base de datos actualizado a la versión %s", applied_migrations[-1])
+            with SQLiteConnectionPool.for_path(DB_PATH).connection() as conn:
+                for query_name, plan in check_hot_query_plans(conn.cursor()).items():
+                    logger.warning("La consulta %s no usa su índice: %s", query_name, plan)
+            _started = True
+    return app
+
 # ============================================================================
 # PUNTO DE ENTRADA
 # ============================================================================
@@ -526,11 +918,11 @@ def get_bookings_for_space_route(space_name):
 if __name__ == "__main__":
     print("=" * 80)
     print("🚀 Iniciando SmartSpaces API (UT4E3 - Templates)...")
-    print("📌 Base de datos: smartspaces.db")
-    print("📊 Logging: smartspaces.log")
+    print(f"📌 Base de datos: {DB_PATH}")
+    print(f"📊 Logging: {LOG_FILE}")
     print("🌐 Servidor: http://localhost:5000")
     print("📚 Ayuda: http://localhost:5000/ayuda")
     print("🎨 Templates: presentation/templates/")
     print("=" * 80)
     logger.info("Iniciando servidor Flask con templates")
-    app.run(debug=True, host="0.0.0.0", port=5000)
\ No newline at end of file
+    create_app().run(debug=True, host="0.0.0.0", port=5000)
\ No newline at end of file
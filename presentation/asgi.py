@@ -0,0 +1,388 @@
+"""
+SmartSpaces - Punto de entrada ASGI
+
+Expone las mismas rutas que presentation/app.py a servidores ASGI
+(p. ej. ``uvicorn presentation.asgi:app``) sin dependencias adicionales.
+
+El bucle de eventos atiende las conexiones: lee el cuerpo de la petición y
+envía la respuesta de forma asíncrona, trozo a trozo, de modo que un cliente
+lento no ocupa ningún hilo. Solo la ejecución de la vista Flask (servicios y
+consultas a SQLite) y la lectura de cada trozo de su respuesta se delegan a
+un pool de hilos acotado, del mismo tamaño que el pool de conexiones SQLite
+para que ningún hilo espere por una conexión. Si el cliente se desconecta
+antes de terminar de enviar el cuerpo, la vista no llega a ejecutarse.
+
+Las peticiones condicionales admiten long-polling con la cabecera
+``Prefer: wait=<segundos>`` (RFC 7240): si la respuesta sería 304 Not
+Modified, la conexión queda en espera en el bucle de eventos, sin hilo, hasta
+que cambien los datos o venza el plazo. La espera no repite la petición: un
+único DataVersionWatcher por proceso lee los contadores de data_versions y
+despierta a las conexiones que dependen de la tabla que ha cambiado, que solo
+entonces vuelven a ejecutar la vista. Una conexión que el cliente abandona
+deja de esperar en cuanto llega su ``http.disconnect``.
+"""
+
+import asyncio
+import io
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+
+DEFAULT_MAX_WORKERS = SQLiteConnectionPool.DEFAULT_MAX_SIZE
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+DEFAULT_POLL_INTERVAL = 0.5
+MAX_WAIT_SECONDS = 60
+
+# Clave del entorno WSGI donde una vista condicional deja las versiones de
+# data_versions con las que ha respondido ({tabla: versión})
+DATA_VERSIONS_ENVIRON_KEY = "smartspaces.data_versions"
+
+_PREFER_WAIT = re.compile(r"(?:^|[,;\s])wait\s*=\s*(\d+)", re.IGNORECASE)
+
+
+class _ClientDisconnected(Exception):
+    """El cliente cerró la conexión antes de recibir la respuesta."""
+
+
+class _WsgiBody:
+    """Cuerpo de una respuesta WSGI que se consume trozo a trozo desde el bucle de eventos.
+
+    ``next_chunk`` y ``close`` se ejecutan en el pool de hilos: el iterable
+    puede ser un generador que consulte SQLite o la app Flask al cerrarse.
+    """
+
+    def __init__(self, result):
+        self._result, self._chunks, self._pending = result, iter(result), None
+
+    def prefetch(self):
+        """Lee por adelantado el primer trozo (y con él un start_response aplazado)."""
+        self._pending = self.next_chunk()
+
+    def next_chunk(self):
+        """Devuelve el siguiente trozo no vacío, o None al terminar."""
+        if self._pending is not None:
+            chunk, self._pending = self._pending, None
+            return chunk
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return None
+
+    def close(self):
+        if hasattr(self._result, "close"):
+            self._result.close()
+
+
+class DataVersionWatcher:
+    """Vigila los contadores de data_versions para los long-polls.
+
+    Una sola tarea de sondeo lee todos los contadores cada ``poll_interval``
+    (una consulta por tabla en el pool de hilos, sin pasar por la aplicación
+    WSGI) mientras haya alguna conexión esperando, y se detiene cuando no
+    queda ninguna. Cada tabla tiene un ``asyncio.Event`` que se activa, y se
+    sustituye por uno nuevo, cuando su contador cambia.
+    """
+
+    def __init__(self, sources, executor, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """Inicializa el vigilante sin empezar a sondear.
+
+        Args:
+            sources: Diccionario tabla -> función sin argumentos que devuelve
+                su versión (p. ej. los SQLiteDataVersion de la aplicación).
+            executor: Pool de hilos donde se leen los contadores.
+            poll_interval: Segundos entre lecturas.
+        """
+        self._sources, self._executor, self._poll_interval = sources, executor, poll_interval
+        self._versions, self._events = {}, {}
+        self._waiters, self._task = 0, None
+
+    async def wait_for_change(self, seen, timeout: float) -> bool:
+        """Espera a que alguna tabla supere la versión con la que se respondió.
+
+        Args:
+            seen: Diccionario tabla -> versión vista por la vista.
+            timeout: Segundos máximos de espera.
+
+        Returns:
+            True si alguna tabla ha cambiado; False si vence el plazo.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self._waiters += 1
+        try:
+            if self._task is None or self._task.done():
+                self._events = {}
+                self._task = loop.create_task(self._poll())
+            while not self._changed(seen):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                waits = [asyncio.ensure_future(self._event(table).wait()) for table in seen]
+                try:
+                    await asyncio.wait(waits, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    for waiting in waits:
+                        waiting.cancel()
+            return True
+        finally:
+            self._waiters -= 1
+
+    def _changed(self, seen):
+        # Los contadores solo crecen: una lectura anterior a la de la vista no cuenta como cambio
+        return any(self._versions.get(table, version) > version for table, version in seen.items())
+
+    def _event(self, table):
+        if table not in self._events:
+            self._events[table] = asyncio.Event()
+        return self._events[table]
+
+    async def _poll(self):
+        loop = asyncio.get_running_loop()
+        while self._waiters:
+            try:
+                versions = await loop.run_in_executor(self._executor, self._read)
+            except Exception:
+                # Un fallo de lectura (p. ej. la base de datos bloqueada) se reintenta en la siguiente vuelta
+                versions = {}
+            for table, version in versions.items():
+                if self._versions.get(table) != version:
+                    self._versions[table] = version
+                    event = self._events.pop(table, None)
+                    if event is not None:
+                        event.set()
+            await asyncio.sleep(self._poll_interval)
+
+    def _read(self):
+        return {table: source() for table, source in self._sources.items()}
+
+
+class AsgiBridge:
+    """Adaptador ASGI para una aplicación WSGI.
+
+    Cada petición HTTP se convierte en un entorno WSGI y se ejecuta en el
+    pool de hilos; el resto del ciclo de vida de la conexión es asíncrono.
+    También responde al protocolo ``lifespan``: ejecuta la preparación de la
+    aplicación al arrancar y libera el pool al parar.
+    """
+
+    def __init__(self, wsgi_app, max_workers: int = DEFAULT_MAX_WORKERS,
+                 max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, on_startup=None, data_versions=None):
+        """Inicializa el adaptador.
+
+        Args:
+            wsgi_app: Aplicación WSGI (la app Flask).
+            max_workers: Hilos que ejecutan vistas a la vez.
+            max_body_size: Tamaño máximo del cuerpo de una petición, en bytes.
+            poll_interval: Segundos entre lecturas de data_versions durante
+                un long-poll.
+            on_startup: Función sin argumentos que se ejecuta en el pool al
+                recibir ``lifespan.startup`` (p. ej. las migraciones).
+            data_versions: Diccionario tabla -> fuente de versión que vigilan
+                los long-polls; sin él, ``Prefer: wait`` se ignora.
+        """
+        self._wsgi_app = wsgi_app
+        self._on_startup = on_startup
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="smartspaces-asgi")
+        self._max_body_size = max_body_size
+        self._watcher = (DataVersionWatcher(data_versions, self._executor, poll_interval)
+                         if data_versions is not None else None)
+
+    async def __call__(self, scope, receive, send):
+        """Atiende una conexión ASGI (``http`` o ``lifespan``)."""
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+        else:
+            raise RuntimeError(f"Tipo de conexión ASGI no soportado: {scope['type']}")
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                if self._on_startup is not None:
+                    try:
+                        await asyncio.get_running_loop().run_in_executor(self._executor, self._on_startup)
+                    except Exception as e:
+                        await send({"type": "lifespan.startup.failed", "message": str(e)})
+                        return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self._executor.shutdown(wait=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send):
+        try:
+            body = await self._read_body(receive)
+        except _ClientDisconnected:
+            return
+        if body is None:
+            await self._send(send, 413, [(b"content-type", b"text/plain; charset=utf-8")],
+                             _WsgiBody([b"Request body too large"]))
+            return
+
+        response = await asyncio.get_running_loop().run_in_executor(self._executor, self._run_wsgi, scope, body)
+
+        wait = self._requested_wait(scope)
+        status, _, _, seen = response
+        if status == 304 and wait and seen and self._watcher is not None:
+            try:
+                response = await self._long_poll(scope, body, receive, wait, response)
+            except _ClientDisconnected:
+                return
+            status, headers, response_body, _ = response
+            headers.append((b"preference-applied", f"wait={wait}".encode("latin-1")))
+
+        status, headers, response_body, _ = response
+        await self._send(send, status, headers, response_body)
+
+    async def _long_poll(self, scope, body, receive, wait, response):
+        """Repite la vista mientras responda 304 y el vigilante vea cambiar una de sus tablas.
+
+        La espera compite con la recepción de ``http.disconnect``: si el
+        cliente se va, se cierra la respuesta pendiente y se lanza
+        _ClientDisconnected sin volver a ejecutar la vista.
+
+        Returns:
+            La última respuesta de _run_wsgi.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        disconnect = asyncio.ensure_future(self._wait_for_disconnect(receive))
+        try:
+            while response[0] == 304:
+                change = asyncio.ensure_future(self._watcher.wait_for_change(response[3], deadline - loop.time()))
+                await asyncio.wait({change, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+                if disconnect.done():
+                    change.cancel()
+                    await asyncio.gather(change, return_exceptions=True)
+                    await loop.run_in_executor(self._executor, response[2].close)
+                    raise _ClientDisconnected
+                if not change.result():
+                    break
+                await loop.run_in_executor(self._executor, response[2].close)
+                response = await loop.run_in_executor(self._executor, self._run_wsgi, scope, body)
+        finally:
+            disconnect.cancel()
+        return response
+
+    @staticmethod
+    async def _wait_for_disconnect(receive):
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    async def _read_body(self, receive):
+        """Lee el cuerpo completo; devuelve None si supera el tamaño máximo.
+
+        Lanza _ClientDisconnected si el cliente se desconecta antes de
+        terminar de enviarlo.
+        """
+        parts, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise _ClientDisconnected
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self._max_body_size:
+                return None
+            parts.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(parts)
+
+    async def _send(self, send, status, headers, response_body):
+        """Envía la respuesta con un mensaje ``http.response.body`` por trozo.
+
+        Cada trozo se lee en el pool de hilos y se envía con ``more_body``;
+        un mensaje vacío final cierra el cuerpo.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            while (chunk := await loop.run_in_executor(self._executor, response_body.next_chunk)) is not None:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            await loop.run_in_executor(self._executor, response_body.close)
+
+    @staticmethod
+    def _requested_wait(scope):
+        """Segundos de espera pedidos con ``Prefer: wait=N`` (acotados), o 0."""
+        for name, value in scope.get("headers", []):
+            if name.lower() == b"prefer":
+                match = _PREFER_WAIT.search(value.decode("latin-1"))
+                if match:
+                    return min(int(match.group(1)), MAX_WAIT_SECONDS)
+        return 0
+
+    def _run_wsgi(self, scope, body):
+        """Ejecuta la aplicación WSGI en un hilo del pool.
+
+        Devuelve el estado, las cabeceras, el cuerpo sin consumir (_WsgiBody)
+        y las versiones de data_versions que la vista dejó en el entorno
+        (None si no es una ruta condicional).
+        """
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                                   for name, value in headers]
+
+        environ = self._environ(scope, body)
+        response_body = _WsgiBody(self._wsgi_app(environ, start_response))
+        if "status" not in response:
+            # PEP 3333 permite aplazar start_response hasta el primer trozo del cuerpo
+            try:
+                response_body.prefetch()
+            except BaseException:
+                response_body.close()
+                raise
+        return response["status"], response["headers"], response_body, environ.get(DATA_VERSIONS_ENVIRON_KEY)
+
+    @staticmethod
+    def _environ(scope, body):
+        """Construye el entorno WSGI (PEP 3333) a partir del scope ASGI."""
+        server_name, server_port = scope.get("server") or ("localhost", 80)
+        client = scope.get("client") or ("", 0)
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+            "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": server_name,
+            "SERVER_PORT": str(server_port),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "REMOTE_ADDR": client[0],
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in scope.get("headers", []):
+            key = name.decode("latin-1").upper().replace("-", "_")
+            value = value.decode("latin-1")
+            if key == "CONTENT_TYPE":
+                environ["CONTENT_TYPE"] = value
+                continue
+            if key == "CONTENT_LENGTH":
+                continue
+            key = "HTTP_" + key
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+
+def _create_app():
+    from presentation.app import app as flask_app, create_app, data_versions
+    return AsgiBridge(flask_app, on_startup=create_app, data_versions=data_versions)
+
+
+app = _create_app()
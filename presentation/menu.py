@@ -1,9 +1,16 @@
 """presentation/menu.py"""
 
+import os
 from datetime import datetime
 from infrastructure.space_sqlite_repository import SpaceSQLiteRepository
 from infrastructure.user_sqlite_repository import UserSQLiteRepository
 from infrastructure.booking_sqlite_repository import BookingSQLiteRepository
+from infrastructure.availability_sqlite_repository import AvailabilitySQLiteRepository
+from infrastructure.slot_availability_index import SlotAvailabilityIndex
+from infrastructure.caching_space_repository import CachingSpaceRepository
+from infrastructure.caching_user_repository import CachingUserRepository
+from infrastructure.sqlite_data_version import SQLiteDataVersion
+from infrastructure.sqlite_migrations import migrate_database
 from application.booking_service import BookingService
 from application.space_service import SpaceService
 from application.user_service import UserService
@@ -37,6 +44,26 @@ def parse_datetime(value: str) -> datetime:
     raise ValueError("Invalid date format. Use YYYY-MM-DD HH:MM or YYYY/MM/DD HH:MM")
 
 
+PAGE_SIZE = 20
+
+
+def print_paged(iter_items, key, render):
+    """Prints a listing page by page using keyset pagination (limit/after).
+
+    Only one page is loaded at a time; the user is asked before the next one.
+    """
+    after = None
+    while True:
+        page = list(iter_items(after, PAGE_SIZE + 1))
+        for item in page[:PAGE_SIZE]:
+            print(render(item))
+        if len(page) <= PAGE_SIZE:
+            return
+        after = key(page[PAGE_SIZE - 1])
+        if input("Press Enter for more or 'q' to stop: ").strip().lower() == "q":
+            return
+
+
 def select_user(user_service):
     print("\nAvailable users:")
     for user in user_service.list_users():
@@ -81,14 +108,19 @@ def create_space(space_service):
 
 def main():
     """Main entry point for the Smart Spaces menu-driven application."""
-    DB_PATH = "smartspaces.db"
+    # SMARTSPACES_DB points the menu at another database, as in presentation/app.py
+    DB_PATH = os.environ.get("SMARTSPACES_DB", "smartspaces.db")
+    migrate_database(DB_PATH)
 
-    space_repo   = SpaceSQLiteRepository(DB_PATH)
-    user_repo    = UserSQLiteRepository(DB_PATH)
+    space_repo   = CachingSpaceRepository(SpaceSQLiteRepository(DB_PATH), version=SQLiteDataVersion("spaces", DB_PATH))
+    user_repo    = CachingUserRepository(UserSQLiteRepository(DB_PATH), version=SQLiteDataVersion("users", DB_PATH))
     booking_repo = BookingSQLiteRepository(DB_PATH)
+    availability_repo = AvailabilitySQLiteRepository(DB_PATH)
+    availability_index = SlotAvailabilityIndex(space_repo, booking_repo, availability_repo,
+                                               version=SQLiteDataVersion("bookings", DB_PATH))
 
-    booking_service = BookingService(booking_repo, space_repo, user_repo)
-    space_service   = SpaceService(space_repo, booking_repo)
+    booking_service = BookingService(booking_repo, space_repo, user_repo, availability_repo, availability_index)
+    space_service   = SpaceService(space_repo, booking_repo, availability_repo, availability_index)
     user_service    = UserService(user_repo)
 
     seed_all(space_repo, user_repo, booking_repo)
@@ -98,14 +130,13 @@ def main():
         option = input("Choose an option: ").strip()
         try:
             if option == "1":
-                for space in space_service.list_spaces():
-                    print(space)
+                print_paged(space_service.iter_spaces, lambda space: space.space_id, str)
             elif option == "2":
-                for user in user_service.list_users():
-                    print(f"{user.user_id} - {user.full_name()} - Active: {user.is_active()}")
+                print_paged(user_service.iter_users, lambda user: user.user_id,
+                            lambda user: f"{user.user_id} - {user.full_name()} - Active: {user.is_active()}")
             elif option == "3":
-                for booking in booking_service.list_bookings():
-                    print(f"{booking.booking_id} - {booking.user.full_name()} booked {booking.space.space_name} from {booking.start_time} to {booking.end_time} - Status: {booking.status}")
+                print_paged(booking_service.iter_bookings, lambda booking: booking.booking_id,
+                            lambda booking: f"{booking.booking_id} - {booking.user.full_name()} booked {booking.space.space_name} from {booking.start_time} to {booking.end_time} - Status: {booking.status}")
             elif option == "4":
                 user_name  = select_user(user_service)
                 space_name = select_space(space_service)
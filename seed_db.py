@@ -0,0 +1,288 @@
+"""Generador masivo de datos sintéticos para SmartSpaces.
+
+A diferencia de create_db.py (cinco espacios, cinco usuarios y tres reservas
+de ejemplo), genera una base de datos a la escala indicada: plantas y salas de
+reuniones, usuarios, meses de histórico y tasa de ocupación. La generación es
+determinista para una misma semilla y un mismo instante actual (``--now``); sin
+``--now`` se toma la hora en punto actual, de modo que dos ejecuciones en horas
+distintas reparten de otra forma las reservas pasadas y futuras.
+
+Las reservas de cada sala no se solapan y caen en horario laboral (lunes a
+viernes, 8:00-20:00, en tramos de media hora y con una duración de 1 a 2
+horas, el máximo de User.DEFAULT_MAX_BOOKING_DURATION). Las pasadas quedan
+finalizadas (o canceladas) y las futuras activas, con una como máximo por
+usuario (User.DEFAULT_MAX_ACTIVE_BOOKINGS); las salas con reservas activas
+quedan reservadas, como en create_db.py.
+
+La carga usa un perfil de PRAGMAs de carga masiva (sin diario ni fsync),
+inserta con executemany en lotes grandes dentro de una única transacción y
+reconstruye los índices y triggers al final, por lo que un millón de reservas
+se carga en segundos.
+
+Uso:
+    python seed_db.py --db carga.db --floors 10 --rooms-per-floor 20 --users 5000 --months 24 --occupancy 0.7 \
+        --now 2025-06-11T12:00
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+from itertools import islice, product
+
+from create_db import create_schema
+from domain.booking import Booking
+from domain.space import Space
+from domain.space_meetingroom import SpaceMeetingRoom
+from domain.user import User
+from infrastructure.sqlite_id_sequence import sync_id_sequences
+
+BATCH_SIZE = 50000
+
+WORKDAY_START, WORKDAY_END = 8, 20
+SLOT = timedelta(minutes=30)
+# Duraciones posibles en tramos de media hora (1 h, 1,5 h y 2 h)
+DURATION_SLOTS = (2, 3, 4)
+CANCELLED_RATE = 0.05
+
+EQUIPMENT = ("Projector", "Whiteboard", "TV", "Videoconference", "Speakers")
+CAPACITIES = (4, 6, 8, 10, 12, 20)
+FIRST_NAMES = ("Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Hugo", "Irene", "Javier",
+               "Laura", "Marta", "Nicolas", "Olga", "Pablo", "Rosa", "Sergio", "Teresa", "Victor", "Yolanda")
+SURNAMES = ("Smith", "Johnson", "Brown", "Taylor", "Wilson", "Anderson", "Martinez", "Lopez", "Davis", "Clark",
+            "Garcia", "Fernandez", "Gonzalez", "Rodriguez", "Sanchez", "Perez", "Gomez", "Ruiz", "Diaz", "Moreno")
+
+# Perfil de carga masiva: sin diario ni fsync y con la base de datos en uso exclusivo.
+# Si la carga se interrumpe, el fichero no es recuperable y hay que volver a generarlo.
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA locking_mode = EXCLUSIVE",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",
+    "PRAGMA foreign_keys = OFF",
+)
+
+
+def generate_spaces(rng, floors, rooms_per_floor):
+    """Genera las salas de reuniones de cada planta.
+
+    Returns:
+        Una tupla (filas de spaces, filas de meeting_rooms).
+    """
+    spaces, rooms = [], []
+    for n, (floor, room) in enumerate(product(range(1, floors + 1), range(1, rooms_per_floor + 1)), start=1):
+        space_id, room_number = f"SM{n}", f"{floor}{room:02d}"
+        equipment = rng.sample(EQUIPMENT, rng.randint(1, 3))
+        spaces.append((space_id, f"Room {room_number}", rng.choice(CAPACITIES), SpaceMeetingRoom.TYPE,
+                       Space.STATUS_AVAILABLE, Space.normalize_name(f"Room {room_number}")))
+        rooms.append((space_id, room_number, floor, ",".join(equipment), rng.randint(2, 8)))
+    return spaces, rooms
+
+
+def generate_users(rng, count):
+    """Genera usuarios activos con nombres completos distintos entre sí."""
+    combinations = list(product(FIRST_NAMES, SURNAMES, SURNAMES))
+    rng.shuffle(combinations)
+    users = []
+    for n in range(1, count + 1):
+        name, surname1, surname2 = combinations[(n - 1) % len(combinations)]
+        if n > len(combinations):
+            surname2 = f"{surname2}{(n - 1) // len(combinations)}"
+        full_name = User.normalize_full_name(f"{name} {surname1} {surname2}")
+        users.append((f"U{n}", name, surname1, surname2, 1, full_name))
+    return users
+
+
+def _start_probability(occupancy):
+    """Probabilidad de empezar una reserva en un tramo libre para lograr la ocupación pedida.
+
+    En cada tramo libre se empieza una reserva (de media DURATION_SLOTS tramos)
+    con probabilidad p o se avanza un tramo; la fracción ocupada esperada es
+    p·d / (p·d + 1 - p), de donde se despeja p.
+    """
+    mean = sum(DURATION_SLOTS) / len(DURATION_SLOTS)
+    return occupancy / (mean - (mean - 1) * occupancy)
+
+
+def generate_bookings(rng, space_ids, user_ids, first_day, days, now, occupancy):
+    """Genera las reservas de cada sala, día a día, sin solapamientos.
+
+    Args:
+        rng: Generador aleatorio.
+        space_ids: IDs de las salas.
+        user_ids: IDs de los usuarios.
+        first_day: Primer día generado (fecha).
+        days: Número de días generados.
+        now: Instante que separa las reservas pasadas de las futuras.
+        occupancy: Fracción del horario laboral ocupada, entre 0 y 1.
+
+    Yields:
+        Filas (booking_id, space_id, user_id, start_time, end_time, booking_status).
+    """
+    probability = _start_probability(occupancy)
+    slots_per_day = (WORKDAY_END - WORKDAY_START) * 2
+    free_users = list(user_ids)
+    rng.shuffle(free_users)
+    booking_number = 0
+    for offset in range(days):
+        day = first_day + timedelta(days=offset)
+        if day.weekday() >= 5:
+            continue
+        opening = datetime(day.year, day.month, day.day, WORKDAY_START)
+        for space_id in space_ids:
+            slot = 0
+            while slot < slots_per_day:
+                if rng.random() >= probability:
+                    slot += 1
+                    continue
+                length = min(rng.choice(DURATION_SLOTS), slots_per_day - slot)
+                start = opening + slot * SLOT
+                end = start + length * SLOT
+                slot += length
+                if end <= now:
+                    status = Booking.STATUS_CANCELLED if rng.random() < CANCELLED_RATE else Booking.STATUS_FINISHED
+                    user_id = rng.choice(user_ids)
+                elif free_users:
+                    status, user_id = Booking.STATUS_ACTIVE, free_users.pop()
+                else:
+                    continue
+                booking_number += 1
+                yield (f"B{booking_number}", space_id, user_id, start.isoformat(), end.isoformat(), status)
+
+
+def _insert_batches(cursor, sql, rows):
+    """Inserta las filas con executemany en lotes de BATCH_SIZE y devuelve cuántas son."""
+    rows, total = iter(rows), 0
+    while batch := list(islice(rows, BATCH_SIZE)):
+        cursor.executemany(sql, batch)
+        total += len(batch)
+    return total
+
+
+def seed_database(db_path, floors=5, rooms_per_floor=10, users=500, months=12, future_days=14,
+                  occupancy=0.6, seed=42, now=None):
+    """Crea una base de datos nueva con datos sintéticos.
+
+    Args:
+        db_path: Ruta del fichero SQLite; no debe existir.
+        floors: Número de plantas.
+        rooms_per_floor: Salas de reuniones por planta.
+        users: Número de usuarios.
+        months: Meses de histórico (de 30 días) hasta ``now``.
+        future_days: Días de reservas futuras (activas) a partir de ``now``.
+        occupancy: Fracción del horario laboral ocupada, entre 0 y 1.
+        seed: Semilla del generador aleatorio.
+        now: Instante actual; por defecto la hora en punto actual.
+
+    Returns:
+        Un diccionario con el número de filas de cada tabla.
+
+    Raises:
+        FileExistsError: Si la base de datos ya existe.
+        ValueError: Si algún parámetro está fuera de rango.
+    """
+    if os.path.exists(db_path):
+        raise FileExistsError(f"La base de datos {db_path} ya existe")
+    if floors < 1 or rooms_per_floor < 1 or users < 1 or months < 0 or future_days < 0:
+        raise ValueError("Plantas, salas y usuarios deben ser al menos 1, y los meses y días no negativos")
+    if not 0 <= occupancy < 1:
+        raise ValueError("La ocupación debe estar entre 0 y 1 (sin incluir 1)")
+
+    rng = random.Random(seed)
+    now = now or datetime.now().replace(minute=0, second=0, microsecond=0)
+    first_day = (now - timedelta(days=30 * months)).date()
+    days = (now.date() - first_day).days + future_days + 1
+
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        create_schema(cursor)
+        conn.commit()
+        for pragma in BULK_LOAD_PRAGMAS:
+            cursor.execute(pragma)
+
+        # Índices y triggers se quitan durante la carga y se recrean al final:
+        # construir un índice de golpe es más rápido que mantenerlo fila a fila
+        cursor.execute("""
+            SELECT sql FROM sqlite_master
+            WHERE type IN ('index', 'trigger') AND sql IS NOT NULL
+        """)
+        deferred = [sql for (sql,) in cursor.fetchall()]
+        cursor.execute("SELECT type, name FROM sqlite_master WHERE type IN ('index', 'trigger') AND sql IS NOT NULL")
+        for kind, name in cursor.fetchall():
+            cursor.execute(f"DROP {kind.upper()} {name}")
+
+        space_rows, room_rows = generate_spaces(rng, floors, rooms_per_floor)
+        user_rows = generate_users(rng, users)
+        cursor.execute("BEGIN")
+        cursor.executemany("INSERT INTO spaces VALUES (?, ?, ?, ?, ?, ?)", space_rows)
+        cursor.executemany("INSERT INTO meeting_rooms VALUES (?, ?, ?, ?, ?)", room_rows)
+        cursor.executemany("INSERT INTO users VALUES (?, ?, ?, ?, ?, ?)", user_rows)
+        booking_count = _insert_batches(
+            cursor, "INSERT INTO bookings VALUES (?, ?, ?, ?, ?, ?)",
+            generate_bookings(rng, [row[0] for row in space_rows], [row[0] for row in user_rows],
+                              first_day, days, now, occupancy),
+        )
+        cursor.execute("""
+            UPDATE spaces SET space_status = ?
+            WHERE space_id IN (SELECT space_id FROM bookings WHERE booking_status = ?)
+        """, (Space.STATUS_RESERVED, Booking.STATUS_ACTIVE))
+        for sql in deferred:
+            cursor.execute(sql)
+        cursor.execute("UPDATE data_versions SET version = version + 1")
+        sync_id_sequences(cursor)
+        conn.commit()
+
+        cursor.execute("ANALYZE")
+        cursor.execute("PRAGMA locking_mode = NORMAL")
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute("PRAGMA synchronous = NORMAL")
+    finally:
+        conn.close()
+
+    return {
+        "spaces": len(space_rows),
+        "meeting_rooms": len(room_rows),
+        "users": len(user_rows),
+        "bookings": booking_count,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera una base de datos SmartSpaces con datos sintéticos.")
+    parser.add_argument("--db", default="smartspaces.db", help="Fichero SQLite a crear.")
+    parser.add_argument("--floors", type=int, default=5, help="Número de plantas.")
+    parser.add_argument("--rooms-per-floor", type=int, default=10, help="Salas de reuniones por planta.")
+    parser.add_argument("--users", type=int, default=500, help="Número de usuarios.")
+    parser.add_argument("--months", type=int, default=12, help="Meses de histórico.")
+    parser.add_argument("--future-days", type=int, default=14, help="Días de reservas futuras.")
+    parser.add_argument("--occupancy", type=float, default=0.6, help="Fracción del horario laboral ocupada.")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla del generador aleatorio.")
+    parser.add_argument("--now", type=datetime.fromisoformat, default=None,
+                        help="Instante actual en ISO 8601 (p. ej. 2025-06-11T12:00); por defecto la hora en punto actual.")
+    parser.add_argument("--force", action="store_true", help="Sobrescribe la base de datos si ya existe.")
+    args = parser.parse_args(argv)
+
+    if args.force:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(args.db + suffix):
+                os.remove(args.db + suffix)
+    started = time.perf_counter()
+    try:
+        counts = seed_database(args.db, args.floors, args.rooms_per_floor, args.users, args.months,
+                               args.future_days, args.occupancy, args.seed, args.now)
+    except (FileExistsError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"Base de datos {args.db} generada en {time.perf_counter() - started:.1f} s:")
+    for table, count in counts.items():
+        print(f"  {table}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
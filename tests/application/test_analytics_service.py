@@ -0,0 +1,163 @@
+"""tests/application/test_analytics_service.py
+
+Tests for AnalyticsService and the vectorized occupancy kernel.
+"""
+
+import time
+import unittest
+from datetime import datetime, timedelta
+import numpy as np
+from application.analytics_service import AnalyticsService, hour_of_day_seconds, occupied_seconds
+from domain.booking import Booking
+from domain.space import Space
+from domain.space_meetingroom import SpaceMeetingRoom
+from domain.user import User
+from infrastructure.booking_memory_repository import BookingMemoryRepository
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class TestOccupiedSeconds(unittest.TestCase):
+
+    def test_matches_interval_clipping(self):
+        rng = np.random.default_rng(7)
+        n_groups, bucket, n_buckets = 5, 60, 50
+        starts = rng.integers(-500, 3200, 400)
+        ends = starts + rng.integers(1, 400, 400)
+        groups = rng.integers(0, n_groups, 400)
+
+        expected = np.zeros((n_groups, n_buckets), dtype=np.int64)
+        for g, s, e in zip(groups, starts, ends):
+            for b in range(n_buckets):
+                lo, hi = b * bucket, (b + 1) * bucket
+                expected[g, b] += max(0, min(e, hi) - max(s, lo))
+
+        result = occupied_seconds(groups, starts, ends, n_groups, 0, bucket, n_buckets)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_hundreds_of_rooms_over_years_is_fast(self):
+        rng = np.random.default_rng(1)
+        rooms, days, per_day = 300, 730, 6
+        n = rooms * days * per_day
+        groups = np.repeat(np.arange(rooms), days * per_day)
+        starts = (np.tile(np.repeat(np.arange(days), per_day), rooms) * 86400
+                  + rng.integers(8, 18, n) * 3600)
+        ends = starts + rng.integers(1, 3, n) * 3600
+
+        began = time.perf_counter()
+        result = occupied_seconds(groups, starts, ends, rooms, 0, 3600, days * 24)
+        elapsed = time.perf_counter() - began
+
+        self.assertEqual(result.shape, (rooms, days * 24))
+        self.assertEqual(int(result.sum()), int((ends - starts).sum()))
+        self.assertLess(elapsed, 5.0)
+
+
+class TestHourOfDaySeconds(unittest.TestCase):
+
+    def test_matches_folding_the_hourly_series(self):
+        rng = np.random.default_rng(3)
+        n_groups, days = 4, 6
+        starts = rng.integers(-86400, (days + 1) * 86400, 300)
+        ends = starts + rng.integers(1, 3 * 86400, 300)
+        groups = rng.integers(0, n_groups, 300)
+
+        hourly = occupied_seconds(groups, starts, ends, n_groups, 0, 3600, days * 24)
+        expected = hourly.reshape(n_groups, days, 24).sum(axis=1)
+        np.testing.assert_array_equal(hour_of_day_seconds(groups, starts, ends, n_groups, 0, days), expected)
+
+
+class AnalyticsScenario:
+    """Two meeting rooms on floor 1 and a plain space, with a fixed set of bookings."""
+
+    def populate(self, space_repo, booking_repo, user_repo=None):
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        if user_repo is not None:
+            user_repo.save(self.user)
+        self.hall = Space("S1", "Hall", 20)
+        self.room_a = SpaceMeetingRoom("SM1", "Room A", 6, "101", 1, [], 4)
+        self.room_b = SpaceMeetingRoom("SM2", "Room B", 6, "102", 1, [], 4)
+        for space in (self.hall, self.room_a, self.room_b):
+            space_repo.save(space)
+        self.day = datetime(2026, 3, 2)
+        self.book(booking_repo, self.room_a, 9, 11)
+        self.book(booking_repo, self.room_b, 10, 11)
+        self.book(booking_repo, self.hall, 23, 25)
+        cancelled = self.book(booking_repo, self.hall, 14, 15)
+        self.hall.reserve()
+        cancelled.cancel()
+        booking_repo.update(cancelled)
+
+    def book(self, booking_repo, space, start, end):
+        booking = Booking(space, self.user, self.day + timedelta(hours=start), self.day + timedelta(hours=end))
+        booking_repo.save(booking)
+        return booking
+
+    def check_report(self, service):
+        report = service.occupancy(self.day, self.day + timedelta(days=2), bucket="hour")
+        groups = {group["key"]: group for group in report["groups"]}
+        self.assertEqual(len(report["bucket_starts"]), 48)
+        self.assertEqual(groups["SM1"]["occupied_hours"], 2.0)
+        self.assertEqual(groups["SM1"]["occupancy"][9:12], [1.0, 1.0, 0.0])
+        self.assertEqual(groups["SM1"]["peak_hour"], 9)
+        self.assertEqual(groups["S1"]["occupied_hours"], 2.0)
+        self.assertEqual(groups["S1"]["occupancy"][23:25], [1.0, 1.0])
+        self.assertEqual(groups["S1"]["hour_of_day_hours"][0], 1.0)
+        self.assertEqual(groups["S1"]["hour_of_day_hours"][14], 0.0)
+        self.assertAlmostEqual(groups["S1"]["utilization"], round(2 / 48, 4))
+        self.assertEqual(report["peak_hour"], 10)
+
+        by_floor = service.occupancy(self.day, self.day + timedelta(days=1), bucket="day", group_by="floor")
+        floors = {group["key"]: group for group in by_floor["groups"]}
+        self.assertEqual(floors["1"]["spaces"], 2)
+        self.assertEqual(floors["1"]["occupied_hours"], 3.0)
+        self.assertEqual(floors["1"]["occupancy"], [round(3 / 48, 4)])
+        self.assertEqual(floors[AnalyticsService.NO_FLOOR]["occupied_hours"], 1.0)
+
+
+class TestAnalyticsServiceMemory(AnalyticsScenario, unittest.TestCase):
+
+    def setUp(self):
+        self.space_repo = SpaceMemoryRepository()
+        self.booking_repo = BookingMemoryRepository()
+        self.populate(self.space_repo, self.booking_repo)
+        self.service = AnalyticsService(self.booking_repo, self.space_repo)
+
+    def test_occupancy_report(self):
+        self.check_report(self.service)
+
+    def test_range_is_aligned_to_days(self):
+        report = self.service.occupancy(self.day + timedelta(hours=5), self.day + timedelta(hours=6), bucket="day")
+        self.assertEqual(report["start_time"], self.day.isoformat())
+        self.assertEqual(report["end_time"], (self.day + timedelta(days=1)).isoformat())
+
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(ValueError):
+            self.service.occupancy(self.day, self.day + timedelta(days=1), bucket="week")
+        with self.assertRaises(ValueError):
+            self.service.occupancy(self.day, self.day + timedelta(days=1), group_by="building")
+        with self.assertRaises(ValueError):
+            self.service.occupancy(self.day, self.day)
+        with self.assertRaises(ValueError):
+            self.service.occupancy(self.day, self.day + timedelta(days=AnalyticsService.MAX_RANGE_DAYS + 1))
+
+    def test_longest_range_is_accepted(self):
+        report = self.service.occupancy(self.day, self.day + timedelta(days=AnalyticsService.MAX_RANGE_DAYS),
+                                        bucket="day")
+        self.assertEqual(len(report["bucket_starts"]), AnalyticsService.MAX_RANGE_DAYS)
+        self.assertEqual({g["key"]: g["occupied_hours"] for g in report["groups"]}, {"S1": 2.0, "SM1": 2.0, "SM2": 1.0})
+
+
+class TestAnalyticsServiceSQLite(AnalyticsScenario, SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.populate(self.space_repo, self.booking_repo, self.user_repo)
+        self.service = AnalyticsService(self.booking_repo, self.space_repo)
+
+    def test_occupancy_report(self):
+        self.check_report(self.service)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+"""tests/application/test_booking_service_batch.py
+
+Tests for BookingService.create_bookings and the repositories' save_many.
+"""
+
+import sqlite3
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from application.booking_service import BookingService
+from domain.booking import Booking
+from domain.exceptions import BookingAlreadyExistsException
+from domain.space import Space
+from domain.user import User
+from infrastructure.availability_memory_repository import AvailabilityMemoryRepository
+from infrastructure.availability_sqlite_repository import AvailabilitySQLiteRepository
+from infrastructure.booking_memory_repository import BookingMemoryRepository
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+from infrastructure.user_memory_repository import UserMemoryRepository
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class BatchFixtures:
+    """Users, spaces and request builder shared by the batch scenarios."""
+
+    def seed(self, max_active_bookings=10):
+        """Creates the service and seed data.
+
+        Args:
+            max_active_bookings: Active booking limit patched onto User so a
+                user can hold several bookings of a batch, or None to keep the
+                real default.
+        """
+        if max_active_bookings is not None:
+            limit = patch.object(User, "DEFAULT_MAX_ACTIVE_BOOKINGS", max_active_bookings)
+            limit.start()
+            self.addCleanup(limit.stop)
+        self.service = BookingService(self.booking_repo, self.space_repo, self.user_repo, self.availability_repo)
+        self.teacher = User("U1", "Alice", "Smith", "Johnson")
+        self.student = User("U2", "Bob", "Brown", "Taylor")
+        for user in (self.teacher, self.student):
+            self.user_repo.save(user)
+        self.room = Space("S1", "Room A", 5)
+        self.lab = Space("S2", "Lab", 5)
+        for space in (self.room, self.lab):
+            self.space_repo.save(space)
+        self.base = datetime(2026, 1, 5, 9, 0)
+
+    def request(self, user_name, space_name, hour, hours=1):
+        return {
+            "user_name": user_name,
+            "space_name": space_name,
+            "start_time": self.base + timedelta(hours=hour),
+            "end_time": self.base + timedelta(hours=hour + hours),
+        }
+
+
+class BatchContract(BatchFixtures):
+    """Shared scenarios; subclasses provide the repositories."""
+
+    def test_creates_every_valid_booking_in_one_call(self):
+        results = self.service.create_bookings(
+            [self.request("Alice Smith Johnson", "Room A", hour) for hour in range(0, 10, 2)])
+        self.assertEqual([r["status"] for r in results], ["created"] * 5)
+        self.assertEqual(len(self.booking_repo.list()), 5)
+        self.assertEqual(len({r["booking"].booking_id for r in results}), 5)
+
+    def test_conflicts_inside_the_batch_are_rejected(self):
+        results = self.service.create_bookings([
+            self.request("Alice Smith Johnson", "Room A", 0, hours=2),
+            self.request("Alice Smith Johnson", "Room A", 1),
+            self.request("Alice Smith Johnson", "Lab", 1),
+        ])
+        self.assertEqual([r["status"] for r in results], ["created", "rejected", "created"])
+        self.assertIn("already booked", results[1]["reason"])
+
+    def test_conflicts_with_stored_bookings_are_rejected(self):
+        self.service.create_booking("Bob Brown Taylor", "Room A",
+                                    self.base + timedelta(hours=3), self.base + timedelta(hours=4))
+        results = self.service.create_bookings([
+            self.request("Alice Smith Johnson", "Room A", 2),
+            self.request("Alice Smith Johnson", "room a", 3),
+            self.request("Alice Smith Johnson", "Room A", 4),
+        ])
+        self.assertEqual([r["status"] for r in results], ["created", "rejected", "created"])
+
+    def test_user_rules_are_applied_per_item(self):
+        results = self.service.create_bookings(
+            [self.request("Bob Brown Taylor", "Room A", hour) for hour in range(0, 22, 2)] + [
+                self.request("Nobody Here At All", "Lab", 2),
+                self.request("Alice Smith Johnson", "Nowhere", 2),
+                self.request("Alice Smith Johnson", "Lab", 4, hours=3),
+            ])
+        self.assertEqual([r["status"] for r in results], ["created"] * 10 + ["rejected"] * 4)
+        self.assertIn("maximum of 10", results[10]["reason"])
+        self.assertEqual(results[11]["reason"], "User not found")
+        self.assertEqual(results[12]["reason"], "Space not found")
+        self.assertIn("duration", results[13]["reason"])
+
+    def test_names_are_resolved_once_per_distinct_name(self):
+        with patch.object(self.user_repo, "find_by_full_name", wraps=self.user_repo.find_by_full_name) as users, \
+             patch.object(self.booking_repo, "find_overlapping", wraps=self.booking_repo.find_overlapping) as overlaps:
+            self.service.create_bookings(
+                [self.request("Alice Smith Johnson", "Room A", hour) for hour in range(0, 20, 2)])
+        self.assertEqual(users.call_count, 1)
+        self.assertEqual(overlaps.call_count, 1)
+
+    def test_save_many_stores_nothing_when_an_id_already_exists(self):
+        stored = Booking(self.room, self.teacher, self.base, self.base + timedelta(hours=1))
+        self.booking_repo.save(stored)
+        duplicate = Booking(self.lab, self.teacher, self.base, self.base + timedelta(hours=1))
+        duplicate._booking_id = stored.booking_id
+        fresh = Booking(self.lab, self.teacher, self.base + timedelta(hours=2), self.base + timedelta(hours=3))
+        with self.assertRaises(BookingAlreadyExistsException):
+            self.booking_repo.save_many([fresh, duplicate])
+        self.assertEqual(len(self.booking_repo.list()), 1)
+
+
+class DefaultLimitContract(BatchFixtures):
+    """Scenarios run with the real User defaults (one active booking per user)."""
+
+    def test_second_booking_of_a_user_is_rejected(self):
+        self.assertEqual(User.DEFAULT_MAX_ACTIVE_BOOKINGS, 1)
+        results = self.service.create_bookings([
+            self.request("Bob Brown Taylor", "Room A", 0),
+            self.request("Bob Brown Taylor", "Lab", 2),
+            self.request("Alice Smith Johnson", "Lab", 4),
+        ])
+        self.assertEqual([r["status"] for r in results], ["created", "rejected", "created"])
+        self.assertEqual(results[1]["reason"], "User 'Bob Brown Taylor' has reached the maximum of 1 active booking(s).")
+        self.assertEqual(self.booking_repo.count_active_for_user("U2"), 1)
+
+    def test_stored_active_booking_counts_against_the_batch(self):
+        self.service.create_booking("Alice Smith Johnson", "Lab", self.base, self.base + timedelta(hours=1))
+        results = self.service.create_bookings([self.request("Alice Smith Johnson", "Room A", 2)])
+        self.assertEqual(results[0]["status"], "rejected")
+        self.assertIn("maximum of 1 active booking", results[0]["reason"])
+
+
+class TestBatchMemory(BatchContract, unittest.TestCase):
+
+    def setUp(self):
+        self.space_repo = SpaceMemoryRepository()
+        self.user_repo = UserMemoryRepository()
+        self.booking_repo = BookingMemoryRepository()
+        self.availability_repo = AvailabilityMemoryRepository(self.space_repo, self.booking_repo)
+        self.seed()
+
+
+class TestBatchSQLite(BatchContract, SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.availability_repo = AvailabilitySQLiteRepository(self.db_path)
+        self.seed()
+
+    def test_batch_is_inserted_in_a_single_transaction(self):
+        statements = []
+        with self.booking_repo._pool.connection() as conn:
+            conn.set_trace_callback(statements.append)
+            self.service.create_bookings(
+                [self.request("Alice Smith Johnson", "Room A", hour) for hour in range(0, 10, 2)])
+            conn.set_trace_callback(None)
+        self.assertEqual(sum(s.startswith("BEGIN") for s in statements), 1)
+        self.assertEqual(sum(s.startswith("COMMIT") for s in statements), 1)
+        self.assertEqual(len(self.booking_repo.list()), 5)
+
+    def test_failed_batch_releases_its_ids(self):
+        stored = Booking(self.room, self.teacher, self.base, self.base + timedelta(hours=1))
+        self.booking_repo.save(stored)
+        duplicate = Booking(self.lab, self.teacher, self.base, self.base + timedelta(hours=1))
+        duplicate._booking_id = stored.booking_id
+        fresh = Booking(self.lab, self.teacher, self.base + timedelta(hours=2), self.base + timedelta(hours=3))
+        with self.assertRaises(BookingAlreadyExistsException):
+            self.booking_repo.save_many([fresh, duplicate])
+        self.assertIsNone(fresh.booking_id)
+        self.booking_repo.save(fresh)
+        self.assertEqual(fresh.booking_id, "B2")
+
+
+class TestDefaultLimitMemory(DefaultLimitContract, unittest.TestCase):
+
+    def setUp(self):
+        self.space_repo = SpaceMemoryRepository()
+        self.user_repo = UserMemoryRepository()
+        self.booking_repo = BookingMemoryRepository()
+        self.availability_repo = AvailabilityMemoryRepository(self.space_repo, self.booking_repo)
+        self.seed(max_active_bookings=None)
+
+
+class TestDefaultLimitSQLite(DefaultLimitContract, SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.availability_repo = AvailabilitySQLiteRepository(self.db_path)
+        self.seed(max_active_bookings=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""tests/application/test_booking_service_recurring.py
+
+Tests for recurring booking series created through BookingService.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from application.booking_service import BookingService
+from domain.exceptions import BookingConflictError
+from domain.recurrence_rule import RecurrenceRule
+from domain.space import Space
+from domain.user import User
+from infrastructure.availability_memory_repository import AvailabilityMemoryRepository
+from infrastructure.availability_sqlite_repository import AvailabilitySQLiteRepository
+from infrastructure.booking_memory_repository import BookingMemoryRepository
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+from infrastructure.user_memory_repository import UserMemoryRepository
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class RecurringContract:
+    """Shared scenarios; subclasses provide the repositories."""
+
+    def seed(self):
+        self.service = BookingService(self.booking_repo, self.space_repo, self.user_repo, self.availability_repo)
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.other = User("U2", "Bob", "Brown", "Taylor")
+        self.user_repo.save(self.user)
+        self.user_repo.save(self.other)
+        self.room = Space("S1", "Room A", 5)
+        self.space_repo.save(self.room)
+        self.start = datetime(2026, 1, 5, 9, 0)
+        self.end = self.start + timedelta(hours=1)
+
+    def test_weekly_series_for_a_year(self):
+        bookings = self.service.create_recurring_booking(
+            "Alice Smith Johnson", "Room A", self.start, self.end, RecurrenceRule.weekly(count=52))
+        self.assertEqual(len(bookings), 52)
+        self.assertEqual(bookings[-1].start_time, self.start + timedelta(weeks=51))
+        self.assertEqual(len(self.booking_repo.list()), 52)
+        self.assertEqual(self.booking_repo.count_active_for_user("U1"), 52)
+
+    def test_series_costs_a_single_overlap_query(self):
+        with patch.object(self.booking_repo, "find_overlapping",
+                          wraps=self.booking_repo.find_overlapping) as overlaps:
+            self.service.create_recurring_booking(
+                "Alice Smith Johnson", "Room A", self.start, self.end, RecurrenceRule.weekly(count=52))
+        overlaps.assert_called_once_with("S1", self.start, self.end + timedelta(weeks=51))
+
+    def test_one_conflicting_occurrence_rejects_the_whole_series(self):
+        taken = self.start + timedelta(weeks=10, minutes=30)
+        self.service.create_booking("Bob Brown Taylor", "Room A", taken, taken + timedelta(hours=1))
+        with self.assertRaises(BookingConflictError):
+            self.service.create_recurring_booking(
+                "Alice Smith Johnson", "Room A", self.start, self.end, RecurrenceRule.weekly(count=52))
+        self.assertEqual(self.booking_repo.count_active_for_user("U1"), 0)
+        self.assertEqual(len(self.booking_repo.list()), 1)
+
+    def test_bookings_between_occurrences_do_not_conflict(self):
+        between = self.start + timedelta(days=3)
+        self.service.create_booking("Bob Brown Taylor", "Room A", between, between + timedelta(hours=1))
+        bookings = self.service.create_recurring_booking(
+            "Alice Smith Johnson", "Room A", self.start, self.end, RecurrenceRule.weekly(count=4))
+        self.assertEqual(len(bookings), 4)
+
+    def test_series_larger_than_the_series_limit_is_rejected(self):
+        with self.assertRaises(BookingConflictError):
+            self.service.create_recurring_booking(
+                "Alice Smith Johnson", "Room A", self.start, self.end,
+                RecurrenceRule.daily(count=User.DEFAULT_MAX_SERIES_OCCURRENCES + 1))
+        self.assertEqual(self.booking_repo.list(), [])
+
+    def test_series_counts_as_one_booking_against_the_active_limit(self):
+        self.assertEqual(User.DEFAULT_MAX_ACTIVE_BOOKINGS, 1)
+        bookings = self.service.create_recurring_booking(
+            "Alice Smith Johnson", "Room A", self.start, self.end, RecurrenceRule.weekly(count=4))
+        self.assertEqual(len(bookings), 4)
+        later = self.start + timedelta(days=1)
+        with self.assertRaises(BookingConflictError):
+            self.service.create_booking("Alice Smith Johnson", "Room A", later, later + timedelta(hours=1))
+        with self.assertRaises(BookingConflictError):
+            self.service.create_recurring_booking(
+                "Alice Smith Johnson", "Room A", later, later + timedelta(hours=1), RecurrenceRule.weekly(count=2))
+
+    def test_user_with_an_active_booking_cannot_start_a_series(self):
+        earlier = self.start - timedelta(days=1)
+        self.service.create_booking("Alice Smith Johnson", "Room A", earlier, earlier + timedelta(hours=1))
+        with self.assertRaises(BookingConflictError):
+            self.service.create_recurring_booking(
+                "Alice Smith Johnson", "Room A", self.start, self.end, RecurrenceRule.weekly(count=2))
+        self.assertEqual(self.booking_repo.count_active_for_user("U1"), 1)
+
+    def test_overlapping_occurrences_are_invalid(self):
+        with self.assertRaises(ValueError):
+            self.service.create_recurring_booking(
+                "Alice Smith Johnson", "Room A", self.start, self.end,
+                RecurrenceRule(timedelta(minutes=30), count=3))
+
+
+class TestRecurringMemory(RecurringContract, unittest.TestCase):
+
+    def setUp(self):
+        self.space_repo = SpaceMemoryRepository()
+        self.user_repo = UserMemoryRepository()
+        self.booking_repo = BookingMemoryRepository()
+        self.availability_repo = AvailabilityMemoryRepository(self.space_repo, self.booking_repo)
+        self.seed()
+
+
+class TestRecurringSQLite(RecurringContract, SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.availability_repo = AvailabilitySQLiteRepository(self.db_path)
+        self.seed()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""tests/application/test_space_service_free_slots.py
+
+Tests for SpaceService.find_free_slots.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from application.space_service import SpaceService
+from domain.booking import Booking
+from domain.space import Space
+from domain.user import User
+from infrastructure.availability_memory_repository import AvailabilityMemoryRepository
+from infrastructure.booking_memory_repository import BookingMemoryRepository
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+
+
+class TestFindFreeSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.space_repo = SpaceMemoryRepository()
+        self.booking_repo = BookingMemoryRepository()
+        self.service = SpaceService(self.space_repo, self.booking_repo,
+                                    AvailabilityMemoryRepository(self.space_repo, self.booking_repo))
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.room = Space("S1", "Room A", 5)
+        self.space_repo.save(self.room)
+        self.day = datetime(2026, 1, 5, 8, 0)
+
+    def at(self, hours):
+        return self.day + timedelta(hours=hours)
+
+    def book(self, start, end):
+        self.booking_repo.save(Booking(self.room, self.user, self.at(start), self.at(end)))
+
+    def slots(self, start=0, end=12, min_minutes=30, limit=10):
+        return [(s - self.day, e - self.day) for s, e in self.service.find_free_slots(
+            self.room, self.at(start), self.at(end), timedelta(minutes=min_minutes), limit)]
+
+    def test_gaps_between_bookings(self):
+        self.book(1, 2)
+        self.book(3, 4)
+        self.assertEqual(self.slots(0, 5), [
+            (timedelta(hours=0), timedelta(hours=1)),
+            (timedelta(hours=2), timedelta(hours=3)),
+            (timedelta(hours=4), timedelta(hours=5)),
+        ])
+
+    def test_long_gaps_are_split_by_max_booking_duration(self):
+        self.assertEqual(self.slots(0, 5), [
+            (timedelta(hours=0), timedelta(hours=2)),
+            (timedelta(hours=2), timedelta(hours=4)),
+            (timedelta(hours=4), timedelta(hours=5)),
+        ])
+
+    def test_short_gaps_and_limit(self):
+        self.book(0, 1)
+        self.book(1.25, 3)
+        self.assertEqual(self.slots(0, 12, min_minutes=30, limit=2), [
+            (timedelta(hours=3), timedelta(hours=5)),
+            (timedelta(hours=5), timedelta(hours=7)),
+        ])
+
+    def test_booking_started_before_the_window(self):
+        self.book(-1, 1)
+        self.assertEqual(self.slots(0, 2), [(timedelta(hours=1), timedelta(hours=2))])
+
+    def test_cancelled_bookings_leave_the_slot_free(self):
+        booking = Booking(self.room, self.user, self.at(0), self.at(2))
+        self.booking_repo.save(booking)
+        self.room.reserve()
+        booking.cancel()
+        self.booking_repo.update(booking)
+        self.assertEqual(self.slots(0, 2), [(timedelta(hours=0), timedelta(hours=2))])
+
+    def test_policy_override_changes_the_window_size(self):
+        with patch.object(User, "DEFAULT_MAX_BOOKING_DURATION", timedelta(hours=4)):
+            self.assertEqual(self.slots(0, 5, limit=1), [(timedelta(hours=0), timedelta(hours=4))])
+
+    def test_space_under_maintenance_has_no_slots(self):
+        self.room.space_status = Space.STATUS_MAINTENANCE
+        self.assertEqual(self.slots(), [])
+
+    def test_single_sweep_over_one_query(self):
+        for hour in range(0, 12, 2):
+            self.book(hour, hour + 1)
+        with patch.object(self.booking_repo, "find_overlapping",
+                          wraps=self.booking_repo.find_overlapping) as overlaps:
+            self.assertEqual(len(self.slots(0, 12)), 6)
+        overlaps.assert_called_once()
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.slots(2, 1)
+        with self.assertRaises(ValueError):
+            self.slots(min_minutes=0)
+        with self.assertRaises(ValueError):
+            self.slots(min_minutes=180)
+        with self.assertRaises(ValueError):
+            self.slots(limit=0)
+
+    def test_the_given_space_is_not_looked_up_again(self):
+        with patch.object(self.space_repo, "get", side_effect=AssertionError("unexpected lookup")):
+            self.assertEqual(len(self.slots(0, 4)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""tests/benchmarks/test_booking_benchmarks.py
+
+Smoke tests for the booking benchmark suite at a tiny scale, and for the
+baseline comparison.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from benchmarks.booking_benchmarks import Dataset, run_benchmarks, compare_to_baseline, main
+
+TINY = {"spaces": 3, "users": 8, "bookings": 40, "runs": 3, "scan_runs": 1}
+
+
+class TestDataset(unittest.TestCase):
+
+    def test_seeded_volumes_match_on_both_backends(self):
+        for backend in ("memory", "sqlite"):
+            dataset = Dataset(backend, spaces=3, users=8, bookings=40, runs=3, active_ratio=0.1)
+            try:
+                bookings = dataset.booking_repo.list()
+                self.assertEqual(len(bookings), 40)
+                self.assertEqual(len(dataset.active_ids), 4)
+                self.assertEqual(len(dataset.free_user_names), 3)
+            finally:
+                dataset.close()
+
+    def test_more_users_than_runs_are_required(self):
+        with self.assertRaises(ValueError):
+            Dataset("memory", spaces=1, users=3, bookings=1, runs=3)
+
+
+class TestRunBenchmarks(unittest.TestCase):
+
+    def test_every_operation_is_timed_on_every_backend(self):
+        results = run_benchmarks(log=lambda message: None, **TINY)
+        operations = {(r["backend"], r["operation"]) for r in results["results"]}
+        for backend in ("memory", "sqlite"):
+            for operation in ("create_booking", "modify_booking", "get_available_spaces",
+                              "get_bookings_for_user", "get_bookings_for_space", "booking_repo.list"):
+                self.assertIn((backend, operation), operations)
+        self.assertEqual(results["meta"]["volumes"]["bookings"], 40)
+        create = next(r for r in results["results"] if r["operation"] == "create_booking")
+        self.assertEqual(create["runs"], 3)
+        self.assertLessEqual(create["min_ms"], create["median_ms"])
+
+
+class TestBaseline(unittest.TestCase):
+
+    def results(self, median):
+        return {"results": [{"backend": "sqlite", "operation": "create_booking", "median_ms": median}]}
+
+    def test_regression_beyond_tolerance_is_reported(self):
+        regressions = compare_to_baseline(self.results(1.5), self.results(1.0), tolerance=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]["change"], 0.5)
+        self.assertEqual(compare_to_baseline(self.results(1.2), self.results(1.0), tolerance=0.25), [])
+
+    def test_main_exits_with_1_on_regression(self):
+        directory = tempfile.mkdtemp()
+        baseline = os.path.join(directory, "baseline.json")
+        output = os.path.join(directory, "results.json")
+        with open(baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump({"results": [{"backend": "memory", "operation": "create_booking", "median_ms": 1e-9}]},
+                      baseline_file)
+        args = ["--backend", "memory", "--spaces", "3", "--users", "8", "--bookings", "40",
+                "--runs", "3", "--scan-runs", "1", "--output", output]
+        self.assertEqual(main(args), 0)
+        with open(output, encoding="utf-8") as output_file:
+            self.assertEqual(json.load(output_file)["meta"]["volumes"]["spaces"], 3)
+        self.assertEqual(main(args + ["--baseline", baseline]), 1)
+        self.assertEqual(main(args + ["--baseline", output, "--tolerance", "1000"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
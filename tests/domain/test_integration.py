@@ -26,6 +26,13 @@ class TestIntegrationBookingSystem(unittest.TestCase):
             def list(self):
                 return list(self.bookings)
 
+            def find_overlapping(self, space_id, start_time, end_time, exclude_booking_id=None):
+                return [
+                    b for b in self.bookings
+                    if b.space.space_id == space_id and b.booking_id != exclude_booking_id
+                    and b.is_active() and b.start_time < end_time and start_time < b.end_time
+                ]
+
             def save(self, booking):
                 self._last_id += 1
                 booking._booking_id = f"B{self._last_id}"
@@ -0,0 +1,55 @@
+"""tests/domain/test_recurrence_rule.py"""
+
+import unittest
+from datetime import date, datetime, timedelta
+from domain.recurrence_rule import RecurrenceRule
+
+
+class TestRecurrenceRule(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime(2026, 1, 5, 9, 0)
+        self.end = datetime(2026, 1, 5, 10, 0)
+
+    def test_weekly_rule_with_count(self):
+        rule = RecurrenceRule.weekly(count=3)
+        self.assertEqual(list(rule.occurrences(self.start, self.end)), [
+            (self.start, self.end),
+            (self.start + timedelta(weeks=1), self.end + timedelta(weeks=1)),
+            (self.start + timedelta(weeks=2), self.end + timedelta(weeks=2)),
+        ])
+        self.assertEqual(rule.window(self.start, self.end), (self.start, self.end + timedelta(weeks=2)))
+
+    def test_daily_rule_until_a_date_includes_that_day(self):
+        rule = RecurrenceRule.daily(interval=2, until=date(2026, 1, 11))
+        starts = [start for start, _ in rule.occurrences(self.start, self.end)]
+        self.assertEqual([s.day for s in starts], [5, 7, 9, 11])
+        self.assertEqual(rule.occurrence_count(self.start), 4)
+
+    def test_custom_step(self):
+        rule = RecurrenceRule(timedelta(hours=3), until=self.start + timedelta(hours=7))
+        self.assertEqual(rule.occurrence_count(self.start), 3)
+
+    def test_until_before_start_yields_nothing(self):
+        rule = RecurrenceRule.weekly(until=self.start - timedelta(days=1))
+        self.assertEqual(list(rule.occurrences(self.start, self.end)), [])
+        self.assertIsNone(rule.window(self.start, self.end))
+
+    def test_occurrences_are_lazy(self):
+        rule = RecurrenceRule.daily(count=10**9)
+        occurrences = rule.occurrences(self.start, self.end)
+        self.assertEqual(next(occurrences), (self.start, self.end))
+
+    def test_invalid_rules(self):
+        with self.assertRaises(ValueError):
+            RecurrenceRule(timedelta(0), count=2)
+        with self.assertRaises(ValueError):
+            RecurrenceRule.weekly()
+        with self.assertRaises(ValueError):
+            RecurrenceRule.weekly(until=self.end, count=2)
+        with self.assertRaises(ValueError):
+            RecurrenceRule.weekly(count=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
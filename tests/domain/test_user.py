@@ -46,6 +46,13 @@ class TestUser(unittest.TestCase):
         self.assertEqual(user.max_active_bookings, 1)
         self.assertEqual(user.max_booking_duration, timedelta(hours=2))
 
+    def test_policy_defaults_are_shared_and_slots_only(self):
+        first, second = User("U5", "Ann", "Gray", "Rose"), User("U6", "Tom", "Gray", "Rose")
+        self.assertIs(first.max_booking_duration, second.max_booking_duration)
+        self.assertFalse(hasattr(first, "__dict__"))
+        with self.assertRaises(AttributeError):
+            first.nickname = "Annie"
+
 
 if __name__ == "__main__":
     unittest.main()
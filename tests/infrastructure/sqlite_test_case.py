@@ -0,0 +1,35 @@
+"""tests/infrastructure/sqlite_test_case.py
+
+Base test case that provides SQLite repositories over a temporary database.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from create_db import create_schema
+from infrastructure.booking_sqlite_repository import BookingSQLiteRepository
+from infrastructure.space_sqlite_repository import SpaceSQLiteRepository
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+from infrastructure.user_sqlite_repository import UserSQLiteRepository
+
+
+class SQLiteTestCase(unittest.TestCase):
+    """Creates an empty SmartSpaces database for each test."""
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_schema(conn.cursor())
+        conn.commit()
+        conn.close()
+        self.space_repo = SpaceSQLiteRepository(self.db_path)
+        self.user_repo = UserSQLiteRepository(self.db_path)
+        self.booking_repo = BookingSQLiteRepository(self.db_path)
+
+    def tearDown(self):
+        SQLiteConnectionPool.for_path(self.db_path).close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
@@ -0,0 +1,91 @@
+"""tests/infrastructure/test_availability_repository.py
+
+Tests for the memory and SQLite availability repositories.
+Both implementations must return the same free spaces for a time range.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from domain.booking import Booking
+from domain.space import Space
+from domain.space_meetingroom import SpaceMeetingRoom
+from domain.user import User
+from infrastructure.availability_memory_repository import AvailabilityMemoryRepository
+from infrastructure.availability_sqlite_repository import AvailabilitySQLiteRepository
+from infrastructure.booking_memory_repository import BookingMemoryRepository
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+from infrastructure.user_memory_repository import UserMemoryRepository
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class AvailabilityContract:
+    """Shared scenarios; subclasses provide the repositories."""
+
+    def seed(self):
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.user_repo.save(self.user)
+        self.spaces = [
+            Space("S1", "Room A", 5),
+            Space("S2", "Room B", 5),
+            SpaceMeetingRoom("SM1", "Meeting Room", 8, "101", 1, ["TV"], 2),
+        ]
+        for space in self.spaces:
+            self.space_repo.save(space)
+        self.base = datetime(2026, 1, 5, 9, 0)
+
+    def book(self, space, hour, hours=1):
+        booking = Booking(space, self.user, self.base + timedelta(hours=hour),
+                          self.base + timedelta(hours=hour + hours))
+        self.booking_repo.save(booking)
+        return booking
+
+    def available_ids(self, hour, hours=1):
+        spaces = self.availability_repo.list_available_spaces(
+            self.base + timedelta(hours=hour), self.base + timedelta(hours=hour + hours))
+        return sorted(space.space_id for space in spaces)
+
+    def test_all_spaces_free_without_bookings(self):
+        self.assertEqual(self.available_ids(0), ["S1", "S2", "SM1"])
+
+    def test_overlapping_booking_blocks_only_its_space(self):
+        self.book(self.spaces[0], 0, hours=2)
+        self.book(self.spaces[2], 5)
+        self.assertEqual(self.available_ids(1), ["S2", "SM1"])
+
+    def test_adjacent_booking_does_not_block(self):
+        self.book(self.spaces[0], 0)
+        self.assertEqual(self.available_ids(1), ["S1", "S2", "SM1"])
+
+    def test_cancelled_booking_does_not_block(self):
+        booking = self.book(self.spaces[1], 0)
+        self.spaces[1].reserve()
+        booking.cancel()
+        self.booking_repo.update(booking)
+        self.assertEqual(self.available_ids(0), ["S1", "S2", "SM1"])
+
+    def test_meeting_rooms_keep_their_type(self):
+        rooms = [s for s in self.availability_repo.list_available_spaces(
+            self.base, self.base + timedelta(hours=1)) if s.space_id == "SM1"]
+        self.assertIsInstance(rooms[0], SpaceMeetingRoom)
+
+
+class TestAvailabilityMemoryRepository(AvailabilityContract, unittest.TestCase):
+
+    def setUp(self):
+        self.space_repo = SpaceMemoryRepository()
+        self.user_repo = UserMemoryRepository()
+        self.booking_repo = BookingMemoryRepository()
+        self.availability_repo = AvailabilityMemoryRepository(self.space_repo, self.booking_repo)
+        self.seed()
+
+
+class TestAvailabilitySQLiteRepository(AvailabilityContract, SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.availability_repo = AvailabilitySQLiteRepository(self.db_path)
+        self.seed()
+
+
+if __name__ == "__main__":
+    unittest.main()
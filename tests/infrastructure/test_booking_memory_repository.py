@@ -0,0 +1,202 @@
+"""tests/infrastructure/test_booking_memory_repository.py
+
+Tests for BookingMemoryRepository and its per-space interval index.
+"""
+
+import gc
+import tracemalloc
+import unittest
+from datetime import datetime, timedelta
+from domain.booking import Booking
+from domain.exceptions import BookingConflictError
+from domain.space import Space
+from domain.space_meetingroom import SpaceMeetingRoom
+from domain.user import User
+from infrastructure.booking_memory_repository import BookingMemoryRepository
+
+
+class TestBookingMemoryRepositoryOverlap(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = BookingMemoryRepository()
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.space1 = Space("S1", "Room A", 5)
+        self.space2 = Space("S2", "Room B", 5)
+        self.base = datetime(2026, 1, 5, 9, 0)
+
+    def add(self, space, hour, hours=1):
+        booking = Booking(space, self.user, self.base + timedelta(hours=hour),
+                          self.base + timedelta(hours=hour + hours))
+        self.repo.save(booking)
+        return booking
+
+    def test_finds_only_overlapping_bookings_of_the_space(self):
+        b1 = self.add(self.space1, 0)
+        b2 = self.add(self.space1, 2)
+        self.add(self.space1, 4)
+        self.add(self.space2, 2)
+        found = self.repo.find_overlapping(
+            "S1", self.base + timedelta(minutes=30), self.base + timedelta(hours=2, minutes=30))
+        self.assertEqual(found, [b1, b2])
+
+    def test_adjacent_bookings_do_not_overlap(self):
+        self.add(self.space1, 0)
+        self.add(self.space1, 2)
+        found = self.repo.find_overlapping(
+            "S1", self.base + timedelta(hours=1), self.base + timedelta(hours=2))
+        self.assertEqual(found, [])
+
+    def test_long_booking_before_range_is_found(self):
+        long_booking = self.add(self.space1, 0, hours=10)
+        self.add(self.space1, 11)
+        found = self.repo.find_overlapping(
+            "S1", self.base + timedelta(hours=8), self.base + timedelta(hours=9))
+        self.assertEqual(found, [long_booking])
+
+    def test_excluded_booking_is_skipped(self):
+        b1 = self.add(self.space1, 0)
+        found = self.repo.find_overlapping(
+            "S1", b1.start_time, b1.end_time, exclude_booking_id=b1.booking_id)
+        self.assertEqual(found, [])
+
+    def test_cancelled_booking_leaves_the_index(self):
+        self.space1.reserve()
+        b1 = self.add(self.space1, 0)
+        b1.cancel()
+        self.repo.update(b1)
+        self.assertEqual(self.repo.find_overlapping("S1", b1.start_time, b1.end_time), [])
+
+    def test_rescheduled_booking_is_reindexed(self):
+        b1 = self.add(self.space1, 0)
+        b1.reschedule(self.base + timedelta(hours=5), self.base + timedelta(hours=6), self.repo)
+        self.repo.update(b1)
+        self.assertEqual(self.repo.find_overlapping(
+            "S1", self.base, self.base + timedelta(hours=1)), [])
+        self.assertEqual(self.repo.find_overlapping(
+            "S1", self.base + timedelta(hours=5), self.base + timedelta(hours=6)), [b1])
+
+    def test_deleted_booking_leaves_the_index(self):
+        b1 = self.add(self.space1, 0)
+        self.repo.delete(b1.booking_id)
+        self.assertEqual(self.repo.find_overlapping("S1", b1.start_time, b1.end_time), [])
+
+    def test_create_uses_index_for_conflicts(self):
+        self.add(self.space1, 0)
+        other = User("U2", "Bob", "Brown", "Taylor")
+        with self.assertRaises(BookingConflictError):
+            Booking.create(self.space1, other, self.base + timedelta(minutes=30),
+                           self.base + timedelta(hours=2), self.repo)
+        booking = Booking.create(self.space2, other, self.base, self.base + timedelta(hours=1), self.repo)
+        self.assertTrue(booking.is_active())
+
+
+class TestBookingMemoryRepositoryActiveCount(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = BookingMemoryRepository()
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.other = User("U2", "Bob", "Brown", "Taylor")
+        self.space = Space("S1", "Room A", 5)
+        self.base = datetime(2026, 1, 5, 9, 0)
+
+    def add(self, user, hour):
+        booking = Booking(self.space, user, self.base + timedelta(hours=hour),
+                          self.base + timedelta(hours=hour + 1))
+        self.repo.save(booking)
+        return booking
+
+    def test_counts_active_bookings_per_user(self):
+        self.add(self.user, 0)
+        self.add(self.user, 2)
+        self.add(self.other, 4)
+        self.assertEqual(self.repo.count_active_for_user("U1"), 2)
+        self.assertEqual(self.repo.count_active_for_user("U2"), 1)
+        self.assertEqual(self.repo.count_active_for_user("U3"), 0)
+
+    def test_counter_follows_status_changes_and_deletes(self):
+        b1 = self.add(self.user, 0)
+        b2 = self.add(self.user, 2)
+        self.space.reserve()
+        b1.cancel()
+        self.repo.update(b1)
+        self.repo.update(b1)
+        self.assertEqual(self.repo.count_active_for_user("U1"), 1)
+        self.repo.delete(b2.booking_id)
+        self.assertEqual(self.repo.count_active_for_user("U1"), 0)
+
+
+class TestBookingMemoryRepositoryGroups(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = BookingMemoryRepository()
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.other = User("U2", "Bob", "Brown", "Taylor")
+        self.room, self.hall = Space("S1", "Room A", 5), Space("S2", "Hall", 20)
+        self.base = datetime(2026, 1, 5, 9, 0)
+
+    def add(self, space, user, hour):
+        booking = Booking(space, user, self.base + timedelta(hours=hour), self.base + timedelta(hours=hour + 1))
+        self.repo.save(booking)
+        return booking
+
+    def test_bookings_by_user_and_space_in_start_order(self):
+        late = self.add(self.room, self.user, 4)
+        early = self.add(self.hall, self.user, 0)
+        other = self.add(self.room, self.other, 2)
+        self.assertEqual(self.repo.find_by_user("U1"), [early, late])
+        self.assertEqual(self.repo.find_by_space("S1"), [other, late])
+        self.assertEqual(self.repo.find_by_user("U9"), [])
+
+    def test_groups_follow_updates_and_deletes(self):
+        booking = self.add(self.room, self.user, 0)
+        self.room.reserve()
+        booking.cancel()
+        self.repo.update(booking)
+        self.assertEqual(self.repo.find_by_user("U1"), [booking])
+        self.repo.delete(booking.booking_id)
+        self.assertEqual(self.repo.find_by_user("U1"), [])
+        self.assertEqual(self.repo.find_by_space("S1"), [])
+
+
+class TestBookingMemoryFootprint(unittest.TestCase):
+    """Memory budget for large in-memory booking sets.
+
+    The budget covers the booking, its two datetimes, its ID and every
+    repository structure (dict entry, interval index, active counter, user and
+    space groups). It is measured with tracemalloc, which counts Python
+    allocations exactly, so the result does not depend on the allocator or on
+    the rest of the process. 25 000 bookings land just after the containers
+    grow, when their spare capacity per booking is near its maximum; the cost
+    per booking measured there (~476 B) is what one million bookings cost.
+    """
+
+    BOOKINGS = 25_000
+    BYTES_PER_BOOKING_BUDGET = 512
+
+    def test_bookings_fit_the_per_booking_budget(self):
+        spaces = [Space(f"S{n}", f"Room {n}", 5) for n in range(50)]
+        users = [User(f"U{n}", "Alice", "Smith", "Johnson") for n in range(100)]
+        base, slot = datetime(2026, 1, 5, 9, 0), timedelta(minutes=30)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            repo = BookingMemoryRepository()
+            for n in range(self.BOOKINGS):
+                start = base + timedelta(hours=n // 50)
+                repo.save(Booking(spaces[n % 50], users[n % 100], start, start + slot))
+            used = tracemalloc.get_traced_memory()[0] / self.BOOKINGS
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(repo.count_active_for_user("U0"), self.BOOKINGS // 100)
+        self.assertLess(used, self.BYTES_PER_BOOKING_BUDGET)
+
+    def test_entities_have_no_instance_dict(self):
+        room = SpaceMeetingRoom("SM1", "Meeting Room", 8, "101", 1, ["TV"], 2)
+        booking = Booking(room, User("U1", "Alice", "Smith", "Johnson"),
+                          datetime(2026, 1, 5, 9, 0), datetime(2026, 1, 5, 10, 0))
+        for entity in (room, booking, booking.user, Space("S1", "Room", 2)):
+            self.assertFalse(hasattr(entity, "__dict__"), type(entity).__name__)
+
+
+if __name__ == "__main__":
+    unittest.main()
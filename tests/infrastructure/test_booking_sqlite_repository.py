@@ -0,0 +1,174 @@
+"""tests/infrastructure/test_booking_sqlite_repository.py
+
+Tests for BookingSQLiteRepository against a temporary SQLite database.
+"""
+
+import sqlite3
+import unittest
+from datetime import datetime, timedelta
+from domain.booking import Booking
+from domain.space import Space
+from domain.space_meetingroom import SpaceMeetingRoom
+from domain.user import User
+from infrastructure.booking_sqlite_repository import (
+    BookingSQLiteRepository,
+    _SELECT_BOOKINGS,
+    _WHERE_OVERLAPPING,
+)
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class TestFindOverlapping(SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.space1 = Space("S1", "Room A", 5)
+        self.space2 = Space("S2", "Room B", 5)
+        self.user_repo.save(self.user)
+        self.space_repo.save(self.space1)
+        self.space_repo.save(self.space2)
+        self.base = datetime(2026, 1, 5, 9, 0)
+
+    def add(self, space, hour, hours=1):
+        booking = Booking(space, self.user, self.base + timedelta(hours=hour),
+                          self.base + timedelta(hours=hour + hours))
+        self.booking_repo.save(booking)
+        return booking
+
+    def test_returns_only_conflicting_active_bookings(self):
+        b1 = self.add(self.space1, 0)
+        b2 = self.add(self.space1, 2)
+        self.add(self.space1, 4)
+        self.add(self.space2, 2)
+        found = self.booking_repo.find_overlapping(
+            "S1", self.base + timedelta(minutes=30), self.base + timedelta(hours=2, minutes=30))
+        self.assertEqual([b.booking_id for b in found], [b1.booking_id, b2.booking_id])
+
+    def test_ignores_cancelled_and_excluded_bookings(self):
+        b1 = self.add(self.space1, 0)
+        b2 = self.add(self.space1, 1)
+        self.space1.reserve()
+        b2.cancel()
+        self.booking_repo.update(b2)
+        found = self.booking_repo.find_overlapping(
+            "S1", self.base, self.base + timedelta(hours=2), exclude_booking_id=b1.booking_id)
+        self.assertEqual(found, [])
+
+    def test_query_uses_composite_index(self):
+        conn = sqlite3.connect(self.db_path)
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN " + _SELECT_BOOKINGS + _WHERE_OVERLAPPING,
+            ("S1", Booking.STATUS_ACTIVE, "", "", None),
+        ))
+        conn.close()
+        self.assertIn("idx_bookings_space_status_time", plan)
+
+
+class TestCountActiveForUser(SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.other = User("U2", "Bob", "Brown", "Taylor")
+        self.space = Space("S1", "Room A", 5)
+        self.user_repo.save(self.user)
+        self.user_repo.save(self.other)
+        self.space_repo.save(self.space)
+        self.base = datetime(2026, 1, 5, 9, 0)
+
+    def add(self, user, hour):
+        booking = Booking(self.space, user, self.base + timedelta(hours=hour),
+                          self.base + timedelta(hours=hour + 1))
+        self.booking_repo.save(booking)
+        return booking
+
+    def test_counts_only_active_bookings_of_the_user(self):
+        b1 = self.add(self.user, 0)
+        self.add(self.user, 2)
+        self.add(self.other, 4)
+        self.space.reserve()
+        b1.cancel()
+        self.booking_repo.update(b1)
+        self.assertEqual(self.booking_repo.count_active_for_user("U1"), 1)
+        self.assertEqual(self.booking_repo.count_active_for_user("U2"), 1)
+        self.assertEqual(self.booking_repo.count_active_for_user("U3"), 0)
+
+    def test_count_uses_user_status_index(self):
+        conn = sqlite3.connect(self.db_path)
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM bookings WHERE user_id = ? AND booking_status = ?",
+            ("U1", Booking.STATUS_ACTIVE),
+        ))
+        conn.close()
+        self.assertIn("idx_bookings_user_status", plan)
+
+
+class TestFindByUserAndSpace(SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.other = User("U2", "Bob", "Brown", "Taylor")
+        self.room, self.hall = Space("S1", "Room A", 5), Space("S2", "Hall", 20)
+        for user in (self.user, self.other):
+            self.user_repo.save(user)
+        for space in (self.room, self.hall):
+            self.space_repo.save(space)
+        base = datetime(2026, 1, 5, 9, 0)
+        for hour, space, user in ((4, self.room, self.user), (0, self.hall, self.user),
+                                  (2, self.room, self.other), (6, self.room, self.user)):
+            self.booking_repo.save(Booking(space, user, base + timedelta(hours=hour),
+                                           base + timedelta(hours=hour + 1)))
+
+    def test_bookings_of_a_user_in_start_order(self):
+        bookings = self.booking_repo.find_by_user("U1")
+        self.assertEqual([b.booking_id for b in bookings], ["B2", "B1", "B4"])
+        self.assertEqual({b.user.user_id for b in bookings}, {"U1"})
+        self.assertEqual(self.booking_repo.find_by_user("U9"), [])
+
+    def test_bookings_of_a_space_in_start_order(self):
+        self.assertEqual([b.booking_id for b in self.booking_repo.find_by_space("S1")], ["B3", "B1", "B4"])
+        self.assertEqual([b.booking_id for b in self.booking_repo.find_by_space("S2")], ["B2"])
+
+
+class TestListIdentityMap(SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.other = User("U2", "Bob", "Brown", "Taylor")
+        self.room = SpaceMeetingRoom("SM1", "Meeting Room", 8, "101", 1, ["TV", "Projector"], 2)
+        self.space = Space("S1", "Room A", 5)
+        for user in (self.user, self.other):
+            self.user_repo.save(user)
+        for space in (self.room, self.space):
+            self.space_repo.save(space)
+        base = datetime(2026, 1, 5, 9, 0)
+        for hour, space, user in ((0, self.room, self.user), (2, self.room, self.other),
+                                  (4, self.space, self.user), (6, self.room, self.user)):
+            self.booking_repo.save(Booking(space, user, base + timedelta(hours=hour),
+                                           base + timedelta(hours=hour + 1)))
+
+    def test_bookings_share_space_and_user_objects(self):
+        bookings = {b.booking_id: b for b in self.booking_repo.list()}
+        self.assertIs(bookings["B1"].space, bookings["B2"].space)
+        self.assertIs(bookings["B1"].space, bookings["B4"].space)
+        self.assertIs(bookings["B1"].user, bookings["B3"].user)
+        self.assertIsNot(bookings["B1"].user, bookings["B2"].user)
+        self.assertIsNot(bookings["B1"].space, bookings["B3"].space)
+        self.assertEqual(bookings["B1"].space.equipment_list, ["TV", "Projector"])
+
+    def test_space_mutations_are_visible_across_bookings(self):
+        bookings = {b.booking_id: b for b in self.booking_repo.list()}
+        bookings["B1"].space.reserve()
+        self.assertTrue(bookings["B2"].space.is_reserved())
+
+    def test_separate_calls_do_not_share_objects(self):
+        first = self.booking_repo.list()[0]
+        second = self.booking_repo.list()[0]
+        self.assertIsNot(first.space, second.space)
+
+
+if __name__ == "__main__":
+    unittest.main()
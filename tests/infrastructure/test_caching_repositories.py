@@ -0,0 +1,126 @@
+"""tests/infrastructure/test_caching_repositories.py
+
+Tests for the read-through caching space and user repositories.
+"""
+
+import unittest
+from unittest.mock import patch
+from domain.exceptions import SpaceAlreadyExistsException
+from domain.space import Space
+from domain.user import User
+from infrastructure.caching_space_repository import CachingSpaceRepository
+from infrastructure.caching_user_repository import CachingUserRepository
+from infrastructure.repository_cache import RepositoryCache
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+from infrastructure.space_sqlite_repository import SpaceSQLiteRepository
+from infrastructure.sqlite_data_version import SQLiteDataVersion
+from infrastructure.user_memory_repository import UserMemoryRepository
+from infrastructure.user_sqlite_repository import UserSQLiteRepository
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class TestCachingSpaceRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.inner = SpaceMemoryRepository()
+        self.inner.save(Space("S1", "Room A", 5))
+        self.repo = CachingSpaceRepository(self.inner, cache=RepositoryCache(ttl=10, clock=lambda: self.now))
+
+    def test_reads_are_served_from_cache(self):
+        with patch.object(self.inner, "list", wraps=self.inner.list) as inner_list:
+            self.assertEqual([s.space_id for s in self.repo.list()], ["S1"])
+            self.assertEqual([s.space_id for s in self.repo.list()], ["S1"])
+            self.assertEqual(inner_list.call_count, 1)
+        with patch.object(self.inner, "find_by_name", wraps=self.inner.find_by_name) as inner_find:
+            self.assertEqual(self.repo.find_by_name("Room A").space_id, "S1")
+            self.assertEqual(self.repo.find_by_name("Room A").space_id, "S1")
+            self.assertIsNone(self.repo.find_by_name("Nowhere"))
+            self.assertEqual(inner_find.call_count, 2)
+        self.assertEqual(self.repo.cache_stats()["hits"], 2)
+
+    def test_writes_invalidate(self):
+        self.repo.list()
+        self.repo.save(Space("S2", "Room B", 5))
+        self.assertEqual([s.space_id for s in self.repo.list()], ["S1", "S2"])
+        self.repo.delete("S1")
+        self.assertEqual([s.space_id for s in self.repo.list()], ["S2"])
+        space = self.repo.get("S2")
+        space.set_maintenance()
+        self.repo.update(space)
+        self.assertTrue(self.repo.get("S2").is_maintenance())
+
+    def test_ttl_expires_entries(self):
+        self.repo.list()
+        self.inner.save(Space("S2", "Room B", 5))
+        self.now = 9.9
+        self.assertEqual(len(self.repo.list()), 1)
+        self.now = 10.0
+        self.assertEqual(len(self.repo.list()), 2)
+
+    def test_version_change_invalidates(self):
+        version = [1]
+        repo = CachingSpaceRepository(self.inner, ttl=None, version=lambda: version[0])
+        repo.list()
+        self.inner.save(Space("S2", "Room B", 5))
+        self.assertEqual(len(repo.list()), 1)
+        version[0] = 2
+        self.assertEqual(len(repo.list()), 2)
+
+    def test_failed_write_still_invalidates(self):
+        self.repo.list()
+        self.inner.save(Space("S2", "Room B", 5))
+        with self.assertRaises(SpaceAlreadyExistsException):
+            self.repo.save(Space("S2", "Room B", 5))
+        self.assertEqual(len(self.repo.list()), 2)
+
+    def test_find_by_name_shares_normalized_key(self):
+        with patch.object(self.inner, "find_by_name", wraps=self.inner.find_by_name) as inner_find:
+            self.assertEqual(self.repo.find_by_name("Room A").space_id, "S1")
+            self.assertEqual(self.repo.find_by_name("ROOM a").space_id, "S1")
+            self.assertEqual(inner_find.call_count, 1)
+
+    def test_callers_get_copies(self):
+        self.repo.get("S1").reserve()
+        self.assertTrue(self.repo.get("S1").is_available())
+        self.assertTrue(self.repo.list()[0].is_available())
+
+
+class TestCachingUserRepository(unittest.TestCase):
+
+    def test_find_by_full_name_shares_normalized_key(self):
+        inner = UserMemoryRepository()
+        inner.save(User("U1", "Alice", "Smith", "Johnson"))
+        repo = CachingUserRepository(inner)
+        with patch.object(inner, "find_by_full_name", wraps=inner.find_by_full_name) as inner_find:
+            self.assertEqual(repo.find_by_full_name("Alice Smith Johnson").user_id, "U1")
+            self.assertEqual(repo.find_by_full_name("  alice SMITH johnson").user_id, "U1")
+            self.assertEqual(inner_find.call_count, 1)
+        repo.save(User("U2", "Bob", "Brown", "Lee"))
+        self.assertEqual([u.user_id for u in repo.list()], ["U1", "U2"])
+
+
+class TestCrossProcessInvalidation(SQLiteTestCase):
+
+    def test_writes_through_another_repository_bump_the_version(self):
+        spaces = CachingSpaceRepository(SpaceSQLiteRepository(self.db_path), ttl=None,
+                                        version=SQLiteDataVersion("spaces", self.db_path))
+        users = CachingUserRepository(UserSQLiteRepository(self.db_path), ttl=None,
+                                      version=SQLiteDataVersion("users", self.db_path))
+        self.assertEqual(spaces.list(), [])
+        self.assertEqual(users.list(), [])
+
+        # Another worker writes straight to the database.
+        self.space_repo.save(Space("S1", "Room A", 5))
+        self.assertEqual([s.space_id for s in spaces.list()], ["S1"])
+        self.assertEqual(users.cache_stats()["entries"], 1)
+
+        self.user_repo.save(User("U1", "Alice", "Smith", "Johnson"))
+        self.assertEqual([u.user_id for u in users.list()], ["U1"])
+        self.assertEqual(spaces.cache_stats()["hits"], 0)
+        spaces.list()
+        self.assertEqual(spaces.cache_stats()["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
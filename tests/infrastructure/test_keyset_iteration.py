@@ -0,0 +1,165 @@
+"""tests/infrastructure/test_keyset_iteration.py
+
+Tests for the keyset-paginated iter_* listings of the memory and SQLite
+repositories. Both implementations must yield the same pages.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from domain.booking import Booking
+from domain.space import Space
+from domain.space_meetingroom import SpaceMeetingRoom
+from domain.user import User
+from infrastructure.booking_memory_repository import BookingMemoryRepository
+from infrastructure.booking_sqlite_repository import BookingSQLiteRepository
+from infrastructure.id_order import IdOrder
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+from infrastructure.space_sqlite_repository import SpaceSQLiteRepository
+from infrastructure.sqlite_keyset import iter_keyset
+from infrastructure.user_memory_repository import UserMemoryRepository
+from infrastructure.user_sqlite_repository import UserSQLiteRepository
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class KeysetContract:
+    """Shared scenarios; subclasses provide the repositories."""
+
+    def seed(self):
+        self.users = [User(f"U{n}", f"Name{n}", "Smith", "Johnson") for n in range(1, 6)]
+        for user in self.users:
+            self.user_repo.save(user)
+        self.spaces = [Space("S1", "Room A", 5), Space("S2", "Room B", 5),
+                       SpaceMeetingRoom("SM1", "Meeting Room", 8, "101", 1, ["TV"], 2)]
+        for space in self.spaces:
+            self.space_repo.save(space)
+        base = datetime(2026, 1, 5, 9, 0)
+        for hour in range(12):
+            self.booking_repo.save(Booking(self.spaces[0], self.users[0], base + timedelta(hours=hour),
+                                           base + timedelta(hours=hour, minutes=30)))
+        self.booking_ids = [f"B{n}" for n in range(1, 13)]
+
+    def test_iterates_in_identifier_order(self):
+        self.assertEqual([b.booking_id for b in self.booking_repo.iter_bookings()], self.booking_ids)
+        self.assertEqual([s.space_id for s in self.space_repo.iter_spaces()], ["S1", "S2", "SM1"])
+        self.assertEqual([u.user_id for u in self.user_repo.iter_users()], ["U1", "U2", "U3", "U4", "U5"])
+
+    def test_limit_and_after_walk_the_pages(self):
+        first = [b.booking_id for b in self.booking_repo.iter_bookings(limit=5)]
+        second = [b.booking_id for b in self.booking_repo.iter_bookings(after=first[-1], limit=5)]
+        self.assertEqual(first + second, self.booking_ids[:10])
+        self.assertEqual([u.user_id for u in self.user_repo.iter_users(after="U4")], ["U5"])
+        self.assertEqual(list(self.space_repo.iter_spaces(after="SM1")), [])
+
+    def test_identifiers_are_ordered_by_sequence_number(self):
+        self.assertEqual([b.booking_id for b in self.booking_repo.iter_bookings(after="B2", limit=3)],
+                         ["B3", "B4", "B5"])
+        self.assertEqual([b.booking_id for b in self.booking_repo.iter_bookings(after="B9")], ["B10", "B11", "B12"])
+        self.space_repo.save(Space("S10", "Room J", 5))
+        self.assertEqual([s.space_id for s in self.space_repo.iter_spaces()], ["S1", "S2", "S10", "SM1"])
+
+    def test_deleted_identifiers_leave_the_order(self):
+        self.booking_repo.delete("B5")
+        self.assertEqual([b.booking_id for b in self.booking_repo.iter_bookings(after="B4", limit=2)], ["B6", "B7"])
+        self.assertEqual([b.booking_id for b in self.booking_repo.iter_bookings(after="B5", limit=1)], ["B6"])
+
+    def test_records_match_entity_encoders(self):
+        self.users[1].deactivate()
+        self.user_repo.update(self.users[1])
+        self.assertEqual(list(self.booking_repo.iter_records(after="B10")),
+                         [b.to_record() for b in self.booking_repo.iter_bookings(after="B10")])
+        self.assertEqual(list(self.space_repo.iter_records()),
+                         [s.to_record() for s in self.space_repo.iter_spaces()])
+        records = list(self.user_repo.iter_records(limit=2))
+        self.assertEqual(records, [u.to_record() for u in self.user_repo.iter_users(limit=2)])
+        self.assertIs(records[1]["active"], False)
+
+    def test_meeting_rooms_keep_their_type(self):
+        rooms = list(self.space_repo.iter_spaces(after="S2"))
+        self.assertIsInstance(rooms[0], SpaceMeetingRoom)
+
+
+class TestMemoryKeysetIteration(KeysetContract, unittest.TestCase):
+
+    def setUp(self):
+        self.space_repo = SpaceMemoryRepository()
+        self.user_repo = UserMemoryRepository()
+        self.booking_repo = BookingMemoryRepository()
+        self.seed()
+
+
+class TestSQLiteKeysetIteration(KeysetContract, SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.seed()
+
+    def test_pages_do_not_hold_a_connection_between_batches(self):
+        iterator = iter_keyset(self.booking_repo._fetch_page, lambda b: b.booking_id, batch_size=4)
+        next(iterator)
+        self.assertEqual(self.booking_repo._pool.stats()["in_use"], 0)
+        self.assertEqual(len(list(iterator)), 11)
+
+    def test_pages_cross_to_longer_identifiers(self):
+        calls = []
+
+        def fetch_page(after, size):
+            calls.append(after)
+            return self.booking_repo._fetch_page(after, size)
+
+        ids = [b.booking_id for b in iter_keyset(fetch_page, lambda b: b.booking_id, batch_size=4)]
+        self.assertEqual(ids, self.booking_ids)
+        self.assertEqual(calls, ["", "B4", "B8", "B12"])
+
+    def test_records_are_built_without_entities(self):
+        with patch.object(BookingSQLiteRepository, "_row_to_booking", side_effect=AssertionError), \
+                patch.object(SpaceSQLiteRepository, "_row_to_space", side_effect=AssertionError), \
+                patch.object(UserSQLiteRepository, "_row_to_user", side_effect=AssertionError):
+            self.assertEqual(len(list(self.booking_repo.iter_records())), 12)
+            self.assertEqual(len(list(self.space_repo.iter_records())), 3)
+            self.assertEqual(len(list(self.user_repo.iter_records())), 5)
+
+
+class TestIdOrder(unittest.TestCase):
+
+    def test_pages_follow_sequence_order_whatever_the_insertion_order(self):
+        order = IdOrder()
+        for entity_id in ("S10", "S2", "SM1", "S1"):
+            order.add(entity_id)
+        self.assertEqual(order.page(), ["S1", "S2", "S10", "SM1"])
+        self.assertEqual(order.page(after="S2", limit=1), ["S10"])
+        self.assertEqual(order.page(after="SM1"), [])
+
+    def test_discard_ignores_missing_identifiers(self):
+        order = IdOrder()
+        order.add("B1")
+        order.discard("B2")
+        order.discard("B1")
+        self.assertEqual(order.page(), [])
+
+
+class TestIterKeyset(unittest.TestCase):
+
+    def test_requests_pages_until_a_short_one(self):
+        calls, rows = [], [str(n) for n in range(10)]
+
+        def fetch_page(after, size):
+            calls.append((after, size))
+            return [r for r in rows if r > after][:size]
+
+        self.assertEqual(list(iter_keyset(fetch_page, str, batch_size=4)), rows)
+        self.assertEqual(calls, [("", 4), ("3", 4), ("7", 4)])
+
+    def test_limit_caps_the_last_page(self):
+        calls = []
+
+        def fetch_page(after, size):
+            calls.append(size)
+            return [str(n) for n in range(size)]
+
+        self.assertEqual(len(list(iter_keyset(fetch_page, str, limit=6, batch_size=4))), 6)
+        self.assertEqual(calls, [4, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
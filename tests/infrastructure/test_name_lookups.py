@@ -0,0 +1,86 @@
+"""tests/infrastructure/test_name_lookups.py
+
+Tests for the indexed name lookups of the user and space repositories
+(find_by_full_name / find_by_name) in their memory and SQLite versions.
+"""
+
+import sqlite3
+import unittest
+from domain.space import Space
+from domain.space_meetingroom import SpaceMeetingRoom
+from domain.user import User
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+from infrastructure.user_memory_repository import UserMemoryRepository
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class NameLookupContract:
+    """Shared scenarios; subclasses provide the repositories."""
+
+    def seed(self):
+        self.user_repo.save(User("U1", "Alice", "Smith", "Johnson"))
+        self.user_repo.save(User("U2", "Bob", "Brown", "Taylor"))
+        self.space_repo.save(Space("S1", "Conference Room", 5))
+        self.space_repo.save(SpaceMeetingRoom("SM1", "Main Meeting Room", 8, "101", 1, ["TV"], 2))
+
+    def test_find_user_ignores_case_and_extra_spaces(self):
+        user = self.user_repo.find_by_full_name("  alice SMITH   johnson ")
+        self.assertEqual(user.user_id, "U1")
+
+    def test_find_user_missing_returns_none(self):
+        self.assertIsNone(self.user_repo.find_by_full_name("Alice Smith"))
+
+    def test_find_user_after_delete_returns_none(self):
+        self.user_repo.delete("U2")
+        self.assertIsNone(self.user_repo.find_by_full_name("Bob Brown Taylor"))
+
+    def test_find_space_ignores_case(self):
+        space = self.space_repo.find_by_name("main MEETING room")
+        self.assertEqual(space.space_id, "SM1")
+        self.assertIsInstance(space, SpaceMeetingRoom)
+
+    def test_find_space_folds_accented_letters(self):
+        self.space_repo.save(Space("S2", "Sala Ñandú", 4))
+        self.assertEqual(self.space_repo.find_by_name("sala ñandú").space_id, "S2")
+        self.assertEqual(self.space_repo.find_by_name("SALA ÑANDÚ").space_id, "S2")
+
+    def test_find_space_missing_returns_none(self):
+        self.assertIsNone(self.space_repo.find_by_name("Roof"))
+
+    def test_find_space_follows_renames(self):
+        space = self.space_repo.get("S1")
+        space.space_name = "Board Room"
+        self.space_repo.update(space)
+        self.assertIsNone(self.space_repo.find_by_name("Conference Room"))
+        self.assertEqual(self.space_repo.find_by_name("board room").space_id, "S1")
+
+
+class TestMemoryNameLookups(NameLookupContract, unittest.TestCase):
+
+    def setUp(self):
+        self.user_repo = UserMemoryRepository()
+        self.space_repo = SpaceMemoryRepository()
+        self.seed()
+
+
+class TestSQLiteNameLookups(NameLookupContract, SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.seed()
+
+    def test_lookups_use_indexes(self):
+        conn = sqlite3.connect(self.db_path)
+        space_plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT space_id FROM spaces WHERE space_name_normalized = ?",
+            ("x",)).fetchall()
+        user_plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT user_id FROM users WHERE full_name_normalized = ?",
+            ("x",)).fetchall()
+        conn.close()
+        self.assertIn("idx_spaces_name_normalized", space_plan[0][3])
+        self.assertIn("idx_users_full_name_normalized", user_plan[0][3])
+
+
+if __name__ == "__main__":
+    unittest.main()
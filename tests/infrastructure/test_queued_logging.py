@@ -0,0 +1,131 @@
+"""tests/infrastructure/test_queued_logging.py
+
+Tests for the queued JSON logging pipeline.
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from infrastructure.queued_logging import (
+    JsonFormatter,
+    SamplingFilter,
+    DroppingQueueHandler,
+    configure_logging,
+)
+
+
+class TestJsonFormatter(unittest.TestCase):
+
+    def test_record_with_extra_fields(self):
+        record = logging.makeLogRecord({"name": "smartspaces.access", "levelno": logging.INFO,
+                                        "levelname": "INFO", "msg": "%s %s", "args": ("GET", "/users"),
+                                        "status": 200, "duration_ms": 1.5})
+        entry = json.loads(JsonFormatter().format(record))
+        self.assertEqual(entry["message"], "GET /users")
+        self.assertEqual(entry["logger"], "smartspaces.access")
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["status"], 200)
+        self.assertEqual(entry["duration_ms"], 1.5)
+        self.assertTrue(entry["ts"].endswith("+00:00"))
+
+    def test_exception_is_included(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.getLogger("test").makeRecord("test", logging.ERROR, __file__, 1, "failed",
+                                                          None, __import__("sys").exc_info())
+        entry = json.loads(JsonFormatter().format(record))
+        self.assertIn("ValueError: boom", entry["exc"])
+
+
+class TestSamplingFilter(unittest.TestCase):
+
+    def record(self, level):
+        return logging.makeLogRecord({"levelno": level})
+
+    def test_keeps_the_configured_fraction(self):
+        draws = iter([0.1, 0.3, 0.6, 0.9])
+        sampler = SamplingFilter(0.5, random_source=lambda: next(draws))
+        kept = [sampler.filter(self.record(logging.INFO)) for _ in range(4)]
+        self.assertEqual(kept, [True, True, False, False])
+
+    def test_warnings_are_never_dropped(self):
+        sampler = SamplingFilter(0.0)
+        self.assertFalse(sampler.filter(self.record(logging.INFO)))
+        self.assertTrue(sampler.filter(self.record(logging.WARNING)))
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            SamplingFilter(1.5)
+
+
+class TestDroppingQueueHandler(unittest.TestCase):
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+        logger = logging.getLogger("test.dropping")
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        logger.warning("first %s", 1)
+        logger.warning("second %s", 2)
+        self.assertEqual(handler.dropped, 1)
+        record = handler.queue.get_nowait()
+        self.assertEqual((record.msg, record.args), ("first 1", None))
+
+
+class TestConfigureLogging(unittest.TestCase):
+
+    def test_records_are_written_by_the_listener_thread(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "app.log")
+        logger = logging.getLogger("test.configure")
+        logger.propagate = False
+        writers = set()
+        original_emit = logging.handlers.RotatingFileHandler.emit
+
+        def tracking_emit(handler, record):
+            writers.add(threading.current_thread().name)
+            original_emit(handler, record)
+
+        with patch.object(logging.handlers.RotatingFileHandler, "emit", tracking_emit):
+            handler, listener = configure_logging(path, max_bytes=200, backup_count=2, logger=logger)
+            for n in range(10):
+                logger.info("line %s", n)
+            listener.stop()
+        logger.removeHandler(handler)
+        listener.handlers[0].close()
+
+        self.assertNotIn(threading.current_thread().name, writers)
+        self.assertTrue(os.path.exists(path + ".1"))
+        with open(path, encoding="utf-8") as log_file:
+            last = [json.loads(line) for line in log_file][-1]
+        self.assertEqual(last["message"], "line 9")
+
+    def test_reconfiguring_replaces_the_previous_handler(self):
+        directory = tempfile.mkdtemp()
+        logger = logging.getLogger("test.reconfigure")
+        logger.propagate = False
+        first, first_listener = configure_logging(os.path.join(directory, "a.log"), logger=logger)
+        second, second_listener = configure_logging(os.path.join(directory, "b.log"), logger=logger)
+        logger.info("once")
+        second_listener.stop()
+        logger.removeHandler(second)
+        for listener in (first_listener, second_listener):
+            listener.handlers[0].close()
+
+        self.assertEqual(logger.handlers, [])
+        self.assertIsNone(first_listener._thread)
+        self.assertFalse(os.path.exists(os.path.join(directory, "a.log")))
+        with open(os.path.join(directory, "b.log"), encoding="utf-8") as log_file:
+            self.assertEqual([json.loads(line)["message"] for line in log_file], ["once"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""tests/infrastructure/test_request_metrics.py
+
+Tests for RequestMetrics, InstrumentedRepository and the SQL statement
+listener of the SQLite connection pool.
+"""
+
+import threading
+import unittest
+from domain.user import User
+from infrastructure.request_metrics import RequestMetrics, InstrumentedRepository
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+from infrastructure.user_memory_repository import UserMemoryRepository
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRequestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.metrics = RequestMetrics(clock=self.clock)
+
+    def test_latency_histogram_per_route_and_status(self):
+        for seconds, status in ((0.02, 200), (0.3, 200), (0.004, 404)):
+            tally = self.metrics.start()
+            self.clock.now += seconds
+            self.metrics.observe(tally, "/users/<user_id>", "GET", status)
+            self.metrics.end(tally)
+        text = self.metrics.render()
+        labels = 'route="/users/<user_id>",method="GET",status="200"'
+        self.assertIn(f'smartspaces_http_request_duration_seconds_bucket{{{labels},le="0.025"}} 1', text)
+        self.assertIn(f'smartspaces_http_request_duration_seconds_bucket{{{labels},le="0.5"}} 2', text)
+        self.assertIn(f'smartspaces_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', text)
+        self.assertIn(f"smartspaces_http_request_duration_seconds_count{{{labels}}} 2", text)
+        self.assertIn('status="404",le="0.005"} 1', text)
+        self.assertIn("# TYPE smartspaces_http_request_duration_seconds histogram", text)
+
+    def test_in_flight_gauge(self):
+        first, second = self.metrics.start(), self.metrics.start()
+        self.assertIn("smartspaces_http_requests_in_flight 2\n", self.metrics.render())
+        self.metrics.end(first)
+        self.metrics.end(second)
+        self.assertIn("smartspaces_http_requests_in_flight 0\n", self.metrics.render())
+
+    def test_counts_are_attributed_to_the_current_request_only(self):
+        RequestMetrics.count_statement("SELECT 1")
+        tally = self.metrics.start()
+        RequestMetrics.count_statement("SELECT 1")
+        RequestMetrics.count_repository_call("users", "get")
+        other_thread = threading.Thread(target=RequestMetrics.count_statement, args=("SELECT 2",))
+        other_thread.start()
+        other_thread.join()
+        self.assertEqual(tally.sql_statements, 1)
+        self.assertEqual(tally.repository_calls, {("users", "get"): 1})
+        self.metrics.observe(tally, "/users", "GET", 200)
+        self.metrics.end(tally)
+        RequestMetrics.count_statement("SELECT 3")
+        self.assertEqual(tally.sql_statements, 1)
+        text = self.metrics.render()
+        self.assertIn('smartspaces_repository_calls_total{route="/users",repository="users",operation="get"} 1', text)
+        self.assertIn('smartspaces_http_request_sql_statements_bucket{route="/users",method="GET",le="1"} 1', text)
+
+    def test_label_values_are_escaped(self):
+        tally = self.metrics.start()
+        self.metrics.observe(tally, 'a"b\\c', "GET", 200)
+        self.metrics.end(tally)
+        self.assertIn('route="a\\"b\\\\c"', self.metrics.render())
+
+
+class TestInstrumentedRepository(unittest.TestCase):
+
+    def test_calls_are_forwarded_and_counted(self):
+        metrics = RequestMetrics()
+        repo = InstrumentedRepository(UserMemoryRepository(), "users")
+        tally = metrics.start()
+        repo.save(User("U1", "Alice", "Smith", "Johnson"))
+        self.assertEqual(repo.get("U1").user_id, "U1")
+        repo.get("U1")
+        metrics.end(tally)
+        self.assertEqual(tally.repository_calls, {("users", "save"): 1, ("users", "get"): 2})
+
+
+class TestPoolStatementListener(SQLiteTestCase):
+
+    def test_listener_receives_each_statement(self):
+        statements = []
+        SQLiteConnectionPool.for_path(self.db_path).add_statement_listener(statements.append)
+        self.user_repo.save(User("U1", "Alice", "Smith", "Johnson"))
+        self.user_repo.get("U1")
+        self.assertTrue(any(sql.lstrip().upper().startswith("INSERT") for sql in statements))
+        self.assertTrue(any(sql.lstrip().upper().startswith("SELECT") for sql in statements))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""tests/infrastructure/test_seed_db.py
+
+Tests for the bulk synthetic-data seeder (seed_db.py) at a tiny scale.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from seed_db import seed_database, main
+
+NOW = datetime(2025, 6, 11, 12)
+SMALL = {"floors": 2, "rooms_per_floor": 3, "users": 20, "months": 1, "future_days": 7, "occupancy": 0.5}
+
+
+class TestSeedDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def seed(self, name="seed.db", **kwargs):
+        path = os.path.join(self.directory, name)
+        counts = seed_database(path, now=NOW, **{**SMALL, **kwargs})
+        self.addCleanup(lambda: [os.remove(path + s) for s in ("", "-wal", "-shm") if os.path.exists(path + s)])
+        return path, counts
+
+    def query(self, path, sql, params=()):
+        with sqlite3.connect(path) as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def test_same_seed_generates_the_same_data(self):
+        first, counts = self.seed("a.db")
+        second, _ = self.seed("b.db")
+        other, _ = self.seed("c.db", seed=7)
+        sql = "SELECT * FROM bookings ORDER BY booking_id"
+        self.assertEqual(self.query(first, sql), self.query(second, sql))
+        self.assertNotEqual(self.query(first, sql), self.query(other, sql))
+        self.assertEqual(counts["spaces"], 6)
+        self.assertEqual(counts["bookings"], self.query(first, "SELECT COUNT(*) FROM bookings")[0][0])
+
+    def test_bookings_respect_the_domain_rules(self):
+        path, _ = self.seed()
+        overlaps = self.query(path, """
+            SELECT COUNT(*) FROM bookings a JOIN bookings b
+            ON a.space_id = b.space_id AND a.booking_id < b.booking_id
+            AND a.start_time < b.end_time AND b.start_time < a.end_time
+        """)[0][0]
+        self.assertEqual(overlaps, 0)
+        self.assertEqual(self.query(path, """
+            SELECT COUNT(*) FROM (SELECT user_id FROM bookings WHERE booking_status = 'ACTIVE'
+                                  GROUP BY user_id HAVING COUNT(*) > 1)
+        """)[0][0], 0)
+        self.assertEqual(self.query(path, """
+            SELECT COUNT(*) FROM bookings WHERE booking_status = 'ACTIVE' AND end_time <= ?
+        """, (NOW.isoformat(),))[0][0], 0)
+        self.assertEqual(self.query(path, """
+            SELECT COUNT(*) FROM spaces WHERE space_status = 'RESERVED'
+        """), self.query(path, "SELECT COUNT(DISTINCT space_id) FROM bookings WHERE booking_status = 'ACTIVE'"))
+
+    def test_indexes_triggers_and_sequences_are_restored(self):
+        path, counts = self.seed()
+        names = {name for (name,) in self.query(path, "SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger')")}
+        self.assertIn("idx_bookings_space_status_time", names)
+        self.assertIn("trg_bookings_insert_version", names)
+        self.assertEqual(self.query(path, "PRAGMA journal_mode"), [("wal",)])
+        self.assertEqual(self.query(path, "SELECT value FROM id_sequences WHERE name = 'bookings'"),
+                         [(counts["bookings"],)])
+
+    def test_low_occupancy_generates_fewer_bookings(self):
+        _, low = self.seed("low.db", occupancy=0.1)
+        _, high = self.seed("high.db", occupancy=0.9)
+        self.assertLess(low["bookings"], high["bookings"])
+
+    def test_invalid_parameters_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.seed(occupancy=1)
+        path, _ = self.seed()
+        with self.assertRaises(FileExistsError):
+            seed_database(path)
+
+    def test_main_refuses_an_existing_database_without_force(self):
+        path, _ = self.seed()
+        args = ["--db", path, "--floors", "1", "--rooms-per-floor", "2", "--users", "5", "--months", "0"]
+        self.assertEqual(main(args), 1)
+        self.assertEqual(main(args + ["--force"]), 0)
+        self.assertEqual(self.query(path, "SELECT COUNT(*) FROM spaces")[0][0], 2)
+
+    def test_main_with_now_is_reproducible(self):
+        paths = [os.path.join(self.directory, name) for name in ("x.db", "y.db")]
+        self.addCleanup(lambda: [os.remove(p + s) for p in paths for s in ("", "-wal", "-shm")
+                                 if os.path.exists(p + s)])
+        args = ["--floors", "1", "--rooms-per-floor", "2", "--users", "5", "--months", "1", "--now", NOW.isoformat()]
+        for path in paths:
+            self.assertEqual(main(["--db", path] + args), 0)
+        sql = "SELECT * FROM bookings ORDER BY booking_id"
+        self.assertEqual(self.query(paths[0], sql), self.query(paths[1], sql))
+        direct, _ = self.seed(floors=1, rooms_per_floor=2, users=5, future_days=14, occupancy=0.6)
+        self.assertEqual(self.query(paths[0], sql), self.query(direct, sql))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+"""tests/infrastructure/test_slot_availability_index.py
+
+Tests for the slot bitmap availability index and its use by BookingService.
+"""
+
+import random
+import sqlite3
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from application.booking_service import BookingService
+from application.space_service import SpaceService
+from domain.booking import Booking
+from domain.space import Space
+from domain.user import User
+from infrastructure.availability_memory_repository import AvailabilityMemoryRepository
+from infrastructure.availability_sqlite_repository import AvailabilitySQLiteRepository
+from infrastructure.booking_memory_repository import BookingMemoryRepository
+from infrastructure.slot_availability_index import SlotAvailabilityIndex
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+from infrastructure.sqlite_data_version import SQLiteDataVersion
+from infrastructure.user_memory_repository import UserMemoryRepository
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class SlotIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.now = datetime(2026, 1, 5, 7, 30)
+        self.day = datetime(2026, 1, 5)
+        self.space_repo = SpaceMemoryRepository()
+        self.booking_repo = BookingMemoryRepository()
+        self.user_repo = UserMemoryRepository()
+        self.exact = AvailabilityMemoryRepository(self.space_repo, self.booking_repo)
+        self.index = SlotAvailabilityIndex(self.space_repo, self.booking_repo, self.exact,
+                                           horizon_days=7, clock=lambda: self.now)
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        self.user_repo.save(self.user)
+        self.spaces = [Space(f"S{i}", f"Room {i}", 5) for i in range(1, 5)]
+        for space in self.spaces:
+            self.space_repo.save(space)
+
+    def at(self, minutes):
+        return self.day + timedelta(minutes=minutes)
+
+    def free_ids(self, start, end, repo=None):
+        repo = repo or self.index
+        return [space.space_id for space in repo.list_available_spaces(self.at(start), self.at(end))]
+
+
+class TestSlotAvailabilityIndex(SlotIndexTestCase):
+
+    def book(self, space, start, end):
+        booking = Booking(space, self.user, self.at(start), self.at(end))
+        self.booking_repo.save(booking)
+        self.index.update(booking)
+        return booking
+
+    def test_aligned_bookings(self):
+        self.book(self.spaces[0], 540, 600)
+        self.book(self.spaces[1], 600, 660)
+        self.assertEqual(self.free_ids(540, 600), ["S2", "S3", "S4"])
+        self.assertEqual(self.free_ids(600, 615), ["S1", "S3", "S4"])
+        self.assertEqual(self.free_ids(595, 605), ["S3", "S4"])
+
+    def test_unaligned_bookings_are_exact(self):
+        self.book(self.spaces[0], 545, 550)
+        self.book(self.spaces[0], 553, 558)
+        self.assertNotIn("S1", self.free_ids(549, 554))
+        self.assertIn("S1", self.free_ids(550, 553))
+        self.assertIn("S1", self.free_ids(558, 570))
+
+    def test_shared_partial_slot_survives_removal(self):
+        first = self.book(self.spaces[0], 545, 550)
+        self.book(self.spaces[0], 553, 558)
+        self.spaces[0].reserve()
+        first.cancel()
+        self.booking_repo.update(first)
+        self.index.update(first)
+        self.assertIn("S1", self.free_ids(545, 550))
+        self.assertNotIn("S1", self.free_ids(554, 556))
+
+    def test_reschedule_moves_slots(self):
+        booking = self.book(self.spaces[2], 600, 660)
+        booking.reschedule(self.at(720), self.at(780), self.booking_repo)
+        self.booking_repo.update(booking)
+        self.index.update(booking)
+        self.assertIn("S3", self.free_ids(600, 660))
+        self.assertNotIn("S3", self.free_ids(750, 765))
+
+    def test_matches_exact_repository_on_random_bookings(self):
+        rng = random.Random(5)
+        for space in self.spaces:
+            start = 0
+            while start < 7 * 24 * 60:
+                start += rng.randrange(0, 180)
+                length = rng.randrange(5, 120)
+                self.book(space, start, start + length)
+                start += length
+        for _ in range(300):
+            start = rng.randrange(0, 7 * 24 * 60 - 200)
+            end = start + rng.randrange(1, 200)
+            self.assertEqual(self.free_ids(start, end), self.free_ids(start, end, self.exact))
+
+    def test_ranges_outside_horizon_use_fallback(self):
+        self.book(self.spaces[0], 0, 60)
+        with patch.object(self.exact, "list_available_spaces", wraps=self.exact.list_available_spaces) as fallback:
+            self.assertEqual(self.free_ids(-60, 30), ["S2", "S3", "S4"])
+            self.assertEqual(self.free_ids(8 * 24 * 60, 8 * 24 * 60 + 60), ["S1", "S2", "S3", "S4"])
+            self.assertEqual(fallback.call_count, 2)
+
+    def test_index_rolls_over_to_next_day(self):
+        self.book(self.spaces[0], 7 * 24 * 60 + 600, 7 * 24 * 60 + 660)
+        self.now += timedelta(days=1)
+        with patch.object(self.exact, "list_available_spaces") as fallback:
+            self.assertNotIn("S1", self.free_ids(7 * 24 * 60 + 600, 7 * 24 * 60 + 615))
+            fallback.assert_not_called()
+
+    def test_own_writes_are_applied_and_other_writes_rebuild(self):
+        version = [0]
+        self.index = SlotAvailabilityIndex(self.space_repo, self.booking_repo, self.exact,
+                                           horizon_days=7, clock=lambda: self.now, version=lambda: version[0])
+        self.assertEqual(self.free_ids(540, 600), ["S1", "S2", "S3", "S4"])
+        with patch.object(self.booking_repo, "load_active_intervals",
+                          wraps=self.booking_repo.load_active_intervals) as rebuilds:
+            version[0] += 1
+            self.book(self.spaces[0], 540, 600)
+            self.assertEqual(self.free_ids(540, 600), ["S2", "S3", "S4"])
+            self.assertEqual(rebuilds.call_count, 0)
+
+            version[0] += 1
+            self.booking_repo.save(Booking(self.spaces[1], self.user, self.at(540), self.at(600)))
+            self.assertEqual(self.free_ids(540, 600), ["S3", "S4"])
+            self.assertEqual(rebuilds.call_count, 1)
+
+
+    def test_rebuild_loads_only_active_bookings_inside_the_horizon(self):
+        self.booking_repo.save(Booking(self.spaces[0], self.user, self.at(540), self.at(600)))
+        cancelled = Booking(self.spaces[1], self.user, self.at(540), self.at(600))
+        self.spaces[1].reserve()
+        cancelled.cancel()
+        self.booking_repo.save(cancelled)
+        self.booking_repo.save(Booking(self.spaces[2], self.user, self.at(8 * 24 * 60), self.at(8 * 24 * 60 + 60)))
+        with patch.object(self.booking_repo, "list", side_effect=AssertionError("full listing")):
+            self.assertEqual(self.free_ids(540, 600), ["S2", "S3", "S4"])
+        self.assertEqual(sorted(self.index._entries), ["B1"])
+
+
+class TestBookingServiceWithSlotIndex(SlotIndexTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.service = BookingService(self.booking_repo, self.space_repo, self.user_repo,
+                                      self.exact, availability_index=self.index)
+
+    def test_space_service_reads_the_index(self):
+        space_service = SpaceService(self.space_repo, self.booking_repo, self.exact, availability_index=self.index)
+        self.service.create_booking("Alice Smith Johnson", "Room 1", self.at(600), self.at(660))
+        with patch.object(self.exact, "list_available_spaces") as exact:
+            free = space_service.get_available_spaces(self.at(615), self.at(630))
+        exact.assert_not_called()
+        self.assertEqual([s.space_id for s in free], ["S2", "S3", "S4"])
+
+    def test_booking_changes_update_the_index(self):
+        booking = self.service.create_booking("Alice Smith Johnson", "Room 1", self.at(600), self.at(660))
+        self.assertNotIn("S1", [s.space_id for s in self.service.get_available_spaces(self.at(615), self.at(630))])
+
+        self.service.modify_booking(booking.booking_id, self.at(700), self.at(760))
+        self.assertIn("S1", [s.space_id for s in self.service.get_available_spaces(self.at(615), self.at(630))])
+
+        self.service.cancel_booking(booking.booking_id)
+        self.assertIn("S1", [s.space_id for s in self.service.get_available_spaces(self.at(700), self.at(760))])
+
+    def test_batch_creation_updates_the_index(self):
+        with patch.object(User, "DEFAULT_MAX_ACTIVE_BOOKINGS", 5):
+            self.service.create_bookings([
+                {"user_name": "Alice Smith Johnson", "space_name": f"Room {i}",
+                 "start_time": self.at(600), "end_time": self.at(660)}
+                for i in (1, 2, 3)
+            ])
+        self.assertEqual([s.space_id for s in self.service.get_available_spaces(self.at(630), self.at(640))], ["S4"])
+
+
+class TestSlotIndexAcrossProcesses(SQLiteTestCase):
+    """Writes made through another repository on the same database (as another process would)."""
+
+    def setUp(self):
+        super().setUp()
+        self.day = datetime(2026, 1, 5)
+        user = User("U1", "Alice", "Smith", "Johnson")
+        self.user_repo.save(user)
+        for i in (1, 2):
+            self.space_repo.save(Space(f"S{i}", f"Room {i}", 5))
+        fallback = AvailabilitySQLiteRepository(self.db_path)
+        self.index = SlotAvailabilityIndex(self.space_repo, self.booking_repo, fallback, horizon_days=7,
+                                           clock=lambda: self.day, version=SQLiteDataVersion("bookings", self.db_path))
+        self.service = BookingService(self.booking_repo, self.space_repo, self.user_repo, fallback,
+                                      availability_index=self.index)
+
+    def free_ids(self, hour):
+        start = self.day + timedelta(hours=hour)
+        return [s.space_id for s in self.index.list_available_spaces(start, start + timedelta(hours=1))]
+
+    def test_index_follows_own_and_foreign_writes(self):
+        self.assertEqual(self.free_ids(9), ["S1", "S2"])
+        self.service.create_booking("Alice Smith Johnson", "Room 1", self.day + timedelta(hours=9),
+                                    self.day + timedelta(hours=10))
+        self.assertEqual(self.free_ids(9), ["S2"])
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("UPDATE bookings SET space_id = 'S2'")
+        self.assertEqual(self.free_ids(9), ["S1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""tests/infrastructure/test_sqlite_connection_pool.py
+
+Tests for the shared SQLite connection pool.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+
+
+class TestSQLiteConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.pool = SQLiteConnectionPool(self.db_path, max_size=2, timeout=0.1)
+
+    def tearDown(self):
+        self.pool.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+    def test_connections_are_configured_once(self):
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+            self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 5000)
+
+    def test_connection_is_reused(self):
+        with self.pool.connection() as first:
+            pass
+        with self.pool.connection() as second:
+            pass
+        self.assertIs(first, second)
+        stats = self.pool.stats()
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["reused"], 1)
+        self.assertEqual(stats["acquired"], 2)
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["idle"], 1)
+
+    def test_nested_acquire_in_same_thread_shares_connection(self):
+        with self.pool.connection() as outer:
+            with self.pool.connection() as inner:
+                self.assertIs(outer, inner)
+            self.assertEqual(self.pool.stats()["in_use"], 1)
+        self.assertEqual(self.pool.stats()["in_use"], 0)
+
+    def test_exhausted_pool_times_out(self):
+        holding, done = threading.Barrier(3), threading.Event()
+
+        def hold():
+            with self.pool.connection():
+                holding.wait()
+                done.wait()
+
+        threads = [threading.Thread(target=hold) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        holding.wait()
+        with self.assertRaises(sqlite3.OperationalError):
+            self.pool.acquire()
+        done.set()
+        for thread in threads:
+            thread.join()
+        stats = self.pool.stats()
+        self.assertEqual(stats["timeouts"], 1)
+        self.assertEqual(stats["peak_in_use"], 2)
+
+    def test_pending_transaction_is_rolled_back_on_release(self):
+        with self.pool.connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.commit()
+            conn.execute("INSERT INTO t VALUES (1)")
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM t").fetchone()[0], 0)
+
+    def test_for_path_shares_one_pool_per_database(self):
+        pool = SQLiteConnectionPool.for_path(self.db_path)
+        self.assertIs(pool, SQLiteConnectionPool.for_path(self.db_path))
+        pool.close()
+        self.assertIsNot(pool, SQLiteConnectionPool.for_path(self.db_path))
+        SQLiteConnectionPool.for_path(self.db_path).close()
+
+
+if __name__ == "__main__":
+    unittest.main()
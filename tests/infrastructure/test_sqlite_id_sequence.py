@@ -0,0 +1,92 @@
+"""tests/infrastructure/test_sqlite_id_sequence.py
+
+Tests for ID allocation through the id_sequences table.
+"""
+
+import sqlite3
+import threading
+import unittest
+from datetime import datetime, timedelta
+from create_db import create_schema
+from domain.booking import Booking
+from domain.space import Space
+from domain.space_meetingroom import SpaceMeetingRoom
+from domain.user import User
+from infrastructure.sqlite_id_sequence import BOOKING_IDS, SPACE_IDS
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class TestSQLiteIdSequence(SQLiteTestCase):
+
+    def test_spaces_and_meeting_rooms_use_separate_sequences(self):
+        first, room, second = Space(None, "A", 2), SpaceMeetingRoom(None, "B", 4, "1", 1, [], 1), Space(None, "C", 2)
+        for space in (first, room, second):
+            self.space_repo.save(space)
+        self.assertEqual([first.space_id, room.space_id, second.space_id], ["S1", "SM1", "S2"])
+
+    def test_explicit_ids_advance_the_sequence(self):
+        self.space_repo.save(Space("S7", "Manual", 2))
+        generated = Space(None, "Generated", 2)
+        self.space_repo.save(generated)
+        self.assertEqual(generated.space_id, "S8")
+
+    def test_booking_ids_are_sequential(self):
+        user, space = User("U1", "Alice", "Smith", "Johnson"), Space("S1", "Room", 2)
+        self.user_repo.save(user)
+        self.space_repo.save(space)
+        base = datetime(2026, 1, 5, 9, 0)
+        ids = []
+        for hour in range(3):
+            booking = Booking(space, user, base + timedelta(hours=hour), base + timedelta(hours=hour + 1))
+            self.booking_repo.save(booking)
+            ids.append(booking.booking_id)
+        self.assertEqual(ids, ["B1", "B2", "B3"])
+
+    def test_reserve_hands_out_a_contiguous_block(self):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            self.assertEqual(BOOKING_IDS.reserve(cursor, 3), ["B1", "B2", "B3"])
+            self.assertEqual(BOOKING_IDS.next_id(cursor), "B4")
+            self.assertEqual(BOOKING_IDS.reserve(cursor, 0), [])
+
+    def test_rolled_back_allocation_is_not_consumed(self):
+        conn = sqlite3.connect(self.db_path)
+        SPACE_IDS.next_id(conn.cursor())
+        conn.rollback()
+        self.assertEqual(SPACE_IDS.next_id(conn.cursor()), "S1")
+        conn.close()
+
+    def test_concurrent_writers_never_share_an_id(self):
+        ids, lock = [], threading.Lock()
+
+        def allocate():
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            for _ in range(20):
+                with conn:
+                    new_id = BOOKING_IDS.next_id(conn.cursor())
+                with lock:
+                    ids.append(new_id)
+            conn.close()
+
+        threads = [threading.Thread(target=allocate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(ids)), 80)
+
+    def test_schema_sync_starts_after_existing_ids(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""CREATE TABLE spaces (space_id TEXT PRIMARY KEY, space_name TEXT NOT NULL,
+                        capacity INTEGER NOT NULL, space_type TEXT NOT NULL, space_status TEXT NOT NULL)""")
+        conn.execute("INSERT INTO spaces VALUES ('S4', 'Old', 2, 'Basic', 'AVAILABLE')")
+        conn.execute("INSERT INTO spaces VALUES ('SM9', 'Old room', 2, 'Meeting room', 'AVAILABLE')")
+        create_schema(conn.cursor())
+        self.assertEqual(SPACE_IDS.next_id(conn.cursor()), "S5")
+        self.assertEqual(
+            conn.execute("SELECT value FROM id_sequences WHERE name = 'meeting_rooms'").fetchone()[0], 9)
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
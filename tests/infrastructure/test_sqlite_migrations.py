@@ -0,0 +1,101 @@
+"""tests/infrastructure/test_sqlite_migrations.py
+
+Tests for the versioned schema migrations and the hot-query index check.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from infrastructure.sqlite_migrations import SCHEMA_VERSION, apply_migrations, migrate_database, schema_version
+from infrastructure.sqlite_query_plans import HOT_QUERIES, check_hot_query_plans
+
+# Schema of the original create_db.py, before the database recorded a version
+LEGACY_SCHEMA = """
+    CREATE TABLE spaces (space_id TEXT PRIMARY KEY, space_name TEXT NOT NULL, capacity INTEGER NOT NULL,
+                         space_type TEXT NOT NULL, space_status TEXT NOT NULL);
+    CREATE TABLE meeting_rooms (space_id TEXT PRIMARY KEY, room_number TEXT NOT NULL, floor INTEGER NOT NULL,
+                                equipment_list TEXT NOT NULL, num_power_outlets INTEGER NOT NULL);
+    CREATE TABLE users (user_id TEXT PRIMARY KEY, name TEXT NOT NULL, surname1 TEXT NOT NULL,
+                        surname2 TEXT NOT NULL, active INTEGER NOT NULL);
+    CREATE TABLE bookings (booking_id TEXT PRIMARY KEY, space_id TEXT NOT NULL, user_id TEXT NOT NULL,
+                           start_time TEXT NOT NULL, end_time TEXT NOT NULL, booking_status TEXT NOT NULL);
+    INSERT INTO spaces VALUES ('S4', 'Conference Room', 5, 'Basic', 'RESERVED');
+    INSERT INTO users VALUES ('U1', 'Alice', 'Smith', 'JOHNSON', 1);
+    INSERT INTO bookings VALUES ('B9', 'S4', 'U1', '2025-01-01T09:00:00', '2025-01-01T10:00:00', 'ACTIVE');
+"""
+
+
+class TestMigrations(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.addCleanup(os.remove, self.db_path)
+
+    def query(self, sql):
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(sql).fetchall()
+
+    def test_empty_database_is_migrated_to_the_latest_version(self):
+        self.assertEqual(migrate_database(self.db_path), list(range(1, SCHEMA_VERSION + 1)))
+        self.assertEqual(self.query("PRAGMA user_version"), [(SCHEMA_VERSION,)])
+        self.assertEqual(migrate_database(self.db_path), [])
+
+    def test_legacy_database_is_upgraded_without_data_loss(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript(LEGACY_SCHEMA)
+        migrate_database(self.db_path)
+        self.assertEqual(self.query("SELECT booking_id, booking_status FROM bookings"), [("B9", "ACTIVE")])
+        self.assertEqual(self.query("SELECT full_name_normalized FROM users"), [("alice smith johnson",)])
+        self.assertEqual(self.query("SELECT space_name_normalized FROM spaces"), [("conference room",)])
+        self.assertEqual(self.query("SELECT name, value FROM id_sequences WHERE name != 'meeting_rooms' ORDER BY name"),
+                         [("bookings", 9), ("spaces", 4)])
+        indexes = {name for (name,) in self.query("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({index for _, _, index in HOT_QUERIES.values()} <= indexes)
+
+    def test_migrations_are_idempotent_on_an_unversioned_current_schema(self):
+        with sqlite3.connect(self.db_path) as conn:
+            apply_migrations(conn.cursor())
+            conn.execute("PRAGMA user_version = 0")
+        self.assertEqual(migrate_database(self.db_path), list(range(1, SCHEMA_VERSION + 1)))
+
+    def test_concurrent_startups_migrate_once(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(migrate_database(self.db_path)))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results, key=len), [[], [], [], list(range(1, SCHEMA_VERSION + 1))])
+
+    def test_newer_schema_is_refused(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+            with self.assertRaises(sqlite3.DatabaseError):
+                apply_migrations(conn.cursor())
+            self.assertEqual(schema_version(conn.cursor()), SCHEMA_VERSION + 1)
+
+
+class TestHotQueryPlans(unittest.TestCase):
+
+    def test_hot_queries_use_their_indexes(self):
+        conn = sqlite3.connect(":memory:")
+        self.addCleanup(conn.close)
+        apply_migrations(conn.cursor())
+        self.assertEqual(check_hot_query_plans(conn.cursor()), {})
+
+    def test_missing_index_is_reported_with_its_plan(self):
+        conn = sqlite3.connect(":memory:")
+        self.addCleanup(conn.close)
+        apply_migrations(conn.cursor())
+        conn.execute("DROP INDEX idx_bookings_time_range")
+        failures = check_hot_query_plans(conn.cursor())
+        self.assertEqual(list(failures), ["load_intervals", "load_active_intervals"])
+        self.assertTrue(any("bookings" in line for line in failures["load_intervals"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
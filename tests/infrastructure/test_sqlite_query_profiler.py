@@ -0,0 +1,87 @@
+"""tests/infrastructure/test_sqlite_query_profiler.py
+
+Tests for the SQL statement profiler attached to the SQLite connection pool.
+"""
+
+import sqlite3
+import unittest
+from domain.user import User
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+from infrastructure.sqlite_query_profiler import SQLiteQueryProfiler, statement_template
+from tests.infrastructure.sqlite_test_case import SQLiteTestCase
+
+
+class TestStatementTemplate(unittest.TestCase):
+
+    def test_literals_and_whitespace_are_normalized(self):
+        sql = """SELECT * FROM bookings
+                 WHERE booking_status = 'ACTIVE' AND space_id = 'S1' LIMIT 10"""
+        self.assertEqual(statement_template(sql),
+                         "SELECT * FROM bookings WHERE booking_status = ? AND space_id = ? LIMIT ?")
+
+    def test_identifiers_with_digits_are_kept(self):
+        self.assertEqual(statement_template("SELECT t1.a FROM t1 WHERE x = 3.5"), "SELECT t1.a FROM t1 WHERE x = ?")
+
+
+class TestSQLiteQueryProfiler(SQLiteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.pool = SQLiteConnectionPool.for_path(self.db_path)
+
+    def attach(self, **kwargs):
+        profiler = SQLiteQueryProfiler(**kwargs)
+        self.pool.set_profiler(profiler)
+        return profiler
+
+    def test_statements_are_aggregated_per_template(self):
+        profiler = self.attach()
+        for n in range(3):
+            self.user_repo.save(User(f"U{n}", "Alice", "Smith", f"Johnson{n}"))
+        for n in range(3):
+            self.user_repo.get(f"U{n}")
+        statements = {row["sql"]: row for row in profiler.snapshot()}
+        select = next(row for sql, row in statements.items() if sql.startswith("SELECT") and "WHERE user_id" in sql)
+        self.assertEqual(select["count"], 3)
+        self.assertGreaterEqual(select["total_ms"], select["max_ms"])
+        self.assertTrue(any(sql.startswith("INSERT INTO users") and row["count"] == 3
+                            for sql, row in statements.items()))
+        self.assertEqual(profiler.slow_count(), 0)
+
+    def test_connection_execute_is_profiled(self):
+        profiler = self.attach()
+        with self.pool.connection() as conn:
+            conn.execute("SELECT COUNT(*) FROM users WHERE user_id = 'U1'").fetchone()
+        self.assertEqual(profiler.snapshot()[0]["sql"], "SELECT COUNT(*) FROM users WHERE user_id = ?")
+
+    def test_slow_statements_are_logged_with_their_plan(self):
+        self.user_repo.save(User("U1", "Alice", "Smith", "Johnson"))
+        profiler = self.attach(slow_threshold_ms=0)
+        with self.assertLogs("infrastructure.sqlite.slow_queries", "WARNING") as logs:
+            self.user_repo.get("U1")
+        record = next(r for r in logs.records if "WHERE user_id" in r.sql)
+        self.assertTrue(record.plan)
+        self.assertTrue(any("users" in line for line in record.plan))
+        self.assertGreater(profiler.slow_count(), 0)
+
+    def test_snapshot_ordering_limit_and_reset(self):
+        ticks = iter(range(1000))
+        profiler = self.attach(clock=lambda: next(ticks) * 0.001)
+        with self.pool.connection() as conn:
+            for _ in range(3):
+                conn.execute("SELECT COUNT(*) FROM users")
+            conn.execute("SELECT COUNT(*) FROM spaces")
+        self.assertEqual(profiler.snapshot(sort_by="count", limit=1)[0]["count"], 3)
+        with self.assertRaises(ValueError):
+            profiler.snapshot(sort_by="unknown")
+        profiler.reset()
+        self.assertEqual(profiler.snapshot(), [])
+
+    def test_without_profiler_cursors_are_plain(self):
+        self.pool.set_profiler(None)
+        with self.pool.connection() as conn:
+            self.assertIs(type(conn.cursor()), sqlite3.Cursor)
+
+
+if __name__ == "__main__":
+    unittest.main()
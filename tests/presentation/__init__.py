@@ -0,0 +1,28 @@
+"""tests/presentation
+
+presentation.app reads SMARTSPACES_DB, SMARTSPACES_LOG_FILE and
+SMARTSPACES_SLOW_QUERY_LOG_FILE when it is imported, so the variables are set
+here, before any test module imports it: the routes under test use a
+temporary database and log files instead of the tracked smartspaces.db and
+log files in the working directory.
+"""
+
+import atexit
+import os
+import tempfile
+from infrastructure.sqlite_migrations import migrate_database
+
+_handle, _db_path = tempfile.mkstemp(suffix=".db")
+os.close(_handle)
+os.environ["SMARTSPACES_DB"] = _db_path
+os.environ["SMARTSPACES_LOG_FILE"] = _db_path[:-len(".db")] + ".log"
+os.environ["SMARTSPACES_SLOW_QUERY_LOG_FILE"] = _db_path[:-len(".db")] + "-slow-queries.log"
+migrate_database(os.environ["SMARTSPACES_DB"])
+
+
+@atexit.register
+def _remove_db():
+    for path in (_db_path, _db_path + "-wal", _db_path + "-shm",
+                 os.environ["SMARTSPACES_LOG_FILE"], os.environ["SMARTSPACES_SLOW_QUERY_LOG_FILE"]):
+        if os.path.exists(path):
+            os.remove(path)
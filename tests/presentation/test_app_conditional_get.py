@@ -0,0 +1,74 @@
+"""tests/presentation/test_app_conditional_get.py
+
+Tests for the ETag / Last-Modified handling of the Flask GET routes.
+Services and data-version sources are replaced with in-memory fakes.
+"""
+
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+import presentation.app as app_module
+from application.user_service import UserService
+from domain.user import User
+from infrastructure.user_memory_repository import UserMemoryRepository
+
+
+class TestConditionalGet(unittest.TestCase):
+
+    def setUp(self):
+        self.versions = {"spaces": 1, "users": 1, "bookings": 1}
+        sources = {table: (lambda table=table: self.versions[table]) for table in self.versions}
+        user_repo = UserMemoryRepository()
+        user_repo.save(User("U1", "Alice", "Smith", "Johnson"))
+        self.user_service = UserService(user_repo)
+        for patcher in (
+            patch.dict(app_module.data_versions, sources),
+            patch.dict(app_module._versions_seen, clear=True),
+            patch.object(app_module, "user_service", self.user_service),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = app_module.app.test_client()
+
+    def test_get_emits_validators(self):
+        response = self.client.get("/users")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["ETag"], '"html-users.1"')
+        self.assertIn("Last-Modified", response.headers)
+        self.assertIn("no-cache", response.headers["Cache-Control"])
+
+    def test_matching_etag_returns_304_without_querying(self):
+        etag = self.client.get("/users").headers["ETag"]
+        with patch.object(self.user_service, "iter_users") as iter_users:
+            response = self.client.get("/users", headers={"If-None-Match": etag})
+            iter_users.assert_not_called()
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
+    def test_write_to_the_table_changes_the_etag(self):
+        etag = self.client.get("/users").headers["ETag"]
+        self.versions["bookings"] += 1
+        self.assertEqual(self.client.get("/users", headers={"If-None-Match": etag}).status_code, 304)
+        self.versions["users"] += 1
+        response = self.client.get("/users", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["ETag"], '"html-users.2"')
+
+    def test_if_modified_since(self):
+        first = self.client.get("/users/U1")
+        since = {"If-Modified-Since": first.headers["Last-Modified"]}
+        self.assertEqual(self.client.get("/users/U1", headers=since).status_code, 304)
+        with patch.dict(app_module._versions_seen,
+                        {"users": (1, first.last_modified + timedelta(seconds=5))}):
+            response = self.client.get("/users/U1", headers=since)
+        self.assertEqual(response.status_code, 200)
+
+    def test_errors_are_not_cached(self):
+        response = self.client.get("/users/U404")
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("ETag", response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
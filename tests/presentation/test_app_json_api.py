@@ -0,0 +1,92 @@
+"""tests/presentation/test_app_json_api.py
+
+Tests for the /api/v1 JSON routes and the Accept-based content negotiation.
+Services are replaced with in-memory ones and data versions with constants.
+"""
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+import presentation.app as app_module
+from application.analytics_service import AnalyticsService
+from application.booking_service import BookingService
+from application.space_service import SpaceService
+from application.user_service import UserService
+from domain.booking import Booking
+from domain.space import Space
+from domain.space_meetingroom import SpaceMeetingRoom
+from domain.user import User
+from infrastructure.availability_memory_repository import AvailabilityMemoryRepository
+from infrastructure.booking_memory_repository import BookingMemoryRepository
+from infrastructure.space_memory_repository import SpaceMemoryRepository
+from infrastructure.user_memory_repository import UserMemoryRepository
+
+
+class TestJsonApi(unittest.TestCase):
+
+    def setUp(self):
+        space_repo, user_repo, booking_repo = SpaceMemoryRepository(), UserMemoryRepository(), BookingMemoryRepository()
+        availability_repo = AvailabilityMemoryRepository(space_repo, booking_repo)
+        self.user = User("U1", "Alice", "Smith", "Johnson")
+        user_repo.save(self.user)
+        self.room = SpaceMeetingRoom("SM1", "Room A", 6, "101", 1, ["TV"], 4)
+        space_repo.save(self.room)
+        space_repo.save(Space("S1", "Hall", 20))
+        booking_repo.save(Booking(self.room, self.user, datetime(2026, 3, 2, 9), datetime(2026, 3, 2, 10)))
+        self.services = {
+            "user_service": UserService(user_repo),
+            "space_service": SpaceService(space_repo, booking_repo, availability_repo),
+            "booking_service": BookingService(booking_repo, space_repo, user_repo, availability_repo),
+            "analytics_service": AnalyticsService(booking_repo, space_repo),
+        }
+        patchers = [patch.object(app_module, name, service) for name, service in self.services.items()]
+        patchers.append(patch.dict(app_module.data_versions, {t: (lambda: 1) for t in ("spaces", "users", "bookings")}))
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = app_module.app.test_client()
+
+    def test_list_routes_serve_records(self):
+        response = self.client.get("/api/v1/spaces")
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.json, {
+            "items": [Space("S1", "Hall", 20).to_record(), self.room.to_record()],
+            "count": 2,
+            "next": None,
+        })
+        bookings = self.client.get("/api/v1/bookings").json["items"]
+        self.assertEqual(bookings[0]["user_name"], "Alice Smith Johnson")
+        self.assertEqual(bookings[0]["start_time"], "2026-03-02T09:00:00")
+
+    def test_pagination_links_stay_in_the_api(self):
+        page = self.client.get("/api/v1/spaces?limit=1").json
+        self.assertEqual(page["next"], "/api/v1/spaces?limit=1&after=S1")
+        self.assertEqual(self.client.get(page["next"]).json["items"][0]["space_id"], "SM1")
+        self.assertEqual(self.client.get("/api/v1/users?limit=abc").status_code, 400)
+
+    def test_detail_routes(self):
+        self.assertEqual(self.client.get("/api/v1/users/U1").json, self.user.to_record())
+        self.assertEqual(self.client.get("/api/v1/spaces/SM1").json["equipment_list"], ["TV"])
+        self.assertEqual(self.client.get("/api/v1/bookings/B1").json["booking_id"], "B1")
+
+    def test_accept_header_selects_the_representation(self):
+        html = self.client.get("/users")
+        self.assertEqual(html.mimetype, "text/html")
+        as_json = self.client.get("/users", headers={"Accept": "application/json"})
+        self.assertEqual(as_json.json["items"], [self.user.to_record()])
+        self.assertNotEqual(html.headers["ETag"], as_json.headers["ETag"])
+        self.assertIn("Accept", as_json.headers["Vary"])
+
+    def test_occupancy_range_is_capped(self):
+        report = self.client.get("/analytics/ocupacion/2026-03-01/2026-03-08?intervalo=day")
+        self.assertEqual(report.status_code, 200)
+        self.assertEqual(len(report.json["bucket_starts"]), 7)
+        self.assertEqual(self.client.get("/analytics/ocupacion/2024-01-01/2026-01-01").status_code, 400)
+
+    def test_json_lists_skip_entity_iteration(self):
+        with patch.object(self.services["booking_service"], "iter_bookings", side_effect=AssertionError):
+            self.assertEqual(self.client.get("/api/v1/bookings").status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""tests/presentation/test_app_metrics.py
+
+Tests for the request metrics hooks and the /metrics route of the Flask app.
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+import presentation.app as app_module
+from application.user_service import UserService
+from domain.user import User
+from infrastructure.request_metrics import RequestMetrics, InstrumentedRepository
+from infrastructure.user_memory_repository import UserMemoryRepository
+
+
+class TestAppMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.versions = {"spaces": 1, "users": 1, "bookings": 1}
+        sources = {table: (lambda table=table: self.versions[table]) for table in self.versions}
+        user_repo = UserMemoryRepository()
+        user_repo.save(User("U1", "Alice", "Smith", "Johnson"))
+        self.metrics = RequestMetrics()
+        for patcher in (
+            patch.dict(app_module.data_versions, sources),
+            patch.dict(app_module._versions_seen, clear=True),
+            patch.object(app_module, "user_service", UserService(InstrumentedRepository(user_repo, "users"))),
+            patch.object(app_module, "request_metrics", self.metrics),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = app_module.app.test_client()
+
+    def test_metrics_route_exposes_prometheus_text(self):
+        self.client.get("/api/v1/users/U1")
+        self.client.get("/api/v1/users/U1")
+        self.client.get("/no/existe")
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain; version=0.0.4"))
+        text = response.get_data(as_text=True)
+        self.assertIn('smartspaces_http_request_duration_seconds_count'
+                      '{route="/api/v1/users/<user_id>",method="GET",status="200"} 2', text)
+        self.assertIn(f'route="{app_module.UNMATCHED_ROUTE}",method="GET",status="404"', text)
+        self.assertIn('smartspaces_repository_calls_total'
+                      '{route="/api/v1/users/<user_id>",repository="users",operation="get"} 2', text)
+
+    def test_in_flight_counts_the_metrics_request_itself(self):
+        text = self.client.get("/metrics").get_data(as_text=True)
+        self.assertIn("smartspaces_http_requests_in_flight 1\n", text)
+        text = self.client.get("/metrics").get_data(as_text=True)
+        self.assertIn("smartspaces_http_requests_in_flight 1\n", text)
+
+    def test_not_modified_responses_are_recorded(self):
+        etag = self.client.get("/api/v1/users").headers["ETag"]
+        self.client.get("/api/v1/users", headers={"If-None-Match": etag})
+        text = self.client.get("/metrics").get_data(as_text=True)
+        self.assertIn('route="/api/v1/users",method="GET",status="304"', text)
+
+    def test_dropped_log_records_are_exposed(self):
+        with patch.object(app_module, "log_handler", SimpleNamespace(dropped=3)):
+            text = self.client.get("/metrics").get_data(as_text=True)
+        self.assertIn("smartspaces_log_records_dropped_total 3\n", text)
+        with patch.object(app_module, "log_handler", None):
+            text = self.client.get("/metrics").get_data(as_text=True)
+        self.assertIn("smartspaces_log_records_dropped_total 0\n", text)
+
+    def test_access_line_is_structured(self):
+        with self.assertLogs(app_module.access_logger, "INFO") as logs:
+            self.client.get("/api/v1/users/U1")
+        record = logs.records[-1]
+        self.assertEqual(record.getMessage(), "GET /api/v1/users/U1 -> 200")
+        self.assertEqual((record.route, record.status), ("/api/v1/users/<user_id>", 200))
+        self.assertGreaterEqual(record.duration_ms, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
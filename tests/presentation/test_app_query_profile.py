@@ -0,0 +1,56 @@
+"""tests/presentation/test_app_query_profile.py
+
+Tests for the /admin/consultas query profile routes of the Flask app.
+"""
+
+import sqlite3
+import unittest
+from unittest.mock import patch
+import presentation.app as app_module
+from infrastructure.sqlite_query_profiler import SQLiteQueryProfiler, ProfiledConnection
+
+
+class TestQueryProfileRoutes(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = SQLiteQueryProfiler()
+        for patcher in (patch.object(app_module, "query_profiler", self.profiler),
+                        patch.dict(app_module.app.config, {"ADMIN_ROUTES": True})):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        conn = sqlite3.connect(":memory:", factory=ProfiledConnection)
+        self.addCleanup(conn.close)
+        conn.profiler = self.profiler
+        conn.execute("CREATE TABLE t (a INTEGER)")
+        for n in range(3):
+            conn.execute("INSERT INTO t VALUES (?)", (n,))
+        self.client = app_module.app.test_client()
+
+    def test_profile_is_served_as_json(self):
+        response = self.client.get("/admin/consultas?orden=count&limite=1")
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body["slow_threshold_ms"], app_module.SLOW_QUERY_MS)
+        self.assertEqual(body["statements"][0]["sql"], "INSERT INTO t VALUES (?)")
+        self.assertEqual(body["statements"][0]["count"], 3)
+        self.assertEqual(len(body["statements"]), 1)
+
+    def test_unknown_order_is_rejected(self):
+        self.assertEqual(self.client.get("/admin/consultas?orden=nope").status_code, 400)
+
+    def test_routes_are_hidden_unless_enabled(self):
+        with patch.dict(app_module.app.config, {"ADMIN_ROUTES": False}):
+            self.assertEqual(self.client.get("/admin/consultas").status_code, 404)
+            self.assertEqual(self.client.post("/admin/consultas/reiniciar").status_code, 404)
+            self.assertEqual(self.profiler.snapshot(sort_by="count")[0]["count"], 3)
+            with patch.dict(app_module.app.config, {"DEBUG": True}):
+                self.assertEqual(self.client.get("/admin/consultas").status_code, 200)
+
+    def test_reset_redirects_to_an_empty_profile(self):
+        response = self.client.post("/admin/consultas/reiniciar", follow_redirects=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["statements"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""tests/presentation/test_app_startup.py
+
+Tests for the startup factory of the Flask app.
+"""
+
+import logging
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+import presentation.app as app_module
+from infrastructure.sqlite_query_profiler import slow_query_logger
+from infrastructure.sqlite_connection_pool import SQLiteConnectionPool
+from infrastructure.sqlite_migrations import SCHEMA_VERSION
+
+
+class TestCreateApp(unittest.TestCase):
+
+    def test_tests_use_a_temporary_database_and_log(self):
+        self.assertEqual(app_module.DB_PATH, os.environ["SMARTSPACES_DB"])
+        self.assertNotEqual(os.path.abspath(app_module.DB_PATH), os.path.abspath("smartspaces.db"))
+        self.assertEqual(app_module.LOG_FILE, os.environ["SMARTSPACES_LOG_FILE"])
+        self.assertEqual(app_module.SLOW_QUERY_LOG_FILE, os.environ["SMARTSPACES_SLOW_QUERY_LOG_FILE"])
+
+    def test_create_app_configures_logging_and_migrates_the_database_once(self):
+        handle, db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        log_path, slow_log_path = db_path + ".log", db_path + "-slow-queries.log"
+        self.addCleanup(os.remove, log_path)
+        self.addCleanup(os.remove, slow_log_path)
+        self.addCleanup(lambda: [os.remove(db_path + s) for s in ("", "-wal", "-shm") if os.path.exists(db_path + s)])
+        self.addCleanup(lambda: SQLiteConnectionPool.for_path(db_path).close())
+        with patch.object(app_module, "DB_PATH", db_path), patch.object(app_module, "LOG_FILE", log_path), \
+                patch.object(app_module, "SLOW_QUERY_LOG_FILE", slow_log_path), \
+                patch.object(slow_query_logger, "propagate", True), \
+                patch.object(app_module, "_started", False), patch.object(app_module, "log_handler", None), \
+                patch.object(app_module, "slow_query_log_handler", None), \
+                patch.object(app_module, "migrate_database", wraps=app_module.migrate_database) as migrate:
+            self.assertIs(app_module.create_app(), app_module.app)
+            app_module.create_app()
+            handler, slow_handler = app_module.log_handler, app_module.slow_query_log_handler
+            self.assertFalse(slow_query_logger.propagate)
+            slow_query_logger.warning("Consulta lenta (150.0 ms): SELECT ?")
+        for owner, started in ((logging.getLogger(), handler), (slow_query_logger, slow_handler)):
+            owner.removeHandler(started)
+            started.listener.stop()
+            started.listener.handlers[0].close()
+        migrate.assert_called_once_with(db_path)
+        with open(log_path, encoding="utf-8") as log_file:
+            contents = log_file.read()
+        self.assertIn("SmartSpaces API iniciada", contents)
+        self.assertNotIn("Consulta lenta", contents)
+        with open(slow_log_path, encoding="utf-8") as log_file:
+            self.assertIn("Consulta lenta", log_file.read())
+        with sqlite3.connect(db_path) as conn:
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,330 @@
+"""tests/presentation/test_asgi.py
+
+Tests for the ASGI entry point. The bridge is driven directly with asyncio
+and in-memory receive/send callables, without an ASGI server.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+import presentation.app as app_module
+from application.user_service import UserService
+from domain.user import User
+from infrastructure.user_memory_repository import UserMemoryRepository
+from presentation.asgi import AsgiBridge
+
+
+def call(bridge, path, method="GET", headers=(), body_chunks=(b"",), query=b""):
+    """Runs one HTTP request through the bridge and returns (status, headers, body)."""
+    return asyncio.run(_call(bridge, path, method, headers, body_chunks, query))
+
+
+async def _call(bridge, path, method="GET", headers=(), body_chunks=(b"",), query=b"", disconnect_after=None):
+    """Runs one HTTP request; the client stays connected until ``disconnect_after`` seconds.
+
+    Returns (status, headers, body), or None if the bridge sent nothing.
+    """
+    scope = {
+        "type": "http", "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "root_path": "", "query_string": query,
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers],
+        "server": ("testserver", 80), "client": ("127.0.0.1", 5000),
+    }
+    incoming = [{"type": "http.request", "body": chunk, "more_body": i < len(body_chunks) - 1}
+                for i, chunk in enumerate(body_chunks)]
+    sent = []
+
+    async def receive():
+        if incoming:
+            return incoming.pop(0)
+        if disconnect_after is None:
+            await asyncio.Future()
+        await asyncio.sleep(disconnect_after)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await bridge(scope, receive, send)
+    if not sent:
+        return None
+    start, *frames = sent
+    assert frames[-1].get("more_body", False) is False
+    return start["status"], dict(start["headers"]), b"".join(frame["body"] for frame in frames)
+
+
+def echo_app(environ, start_response):
+    """Minimal WSGI app echoing the request method, path, query and body."""
+    payload = {
+        "method": environ["REQUEST_METHOD"],
+        "path": environ["PATH_INFO"],
+        "query": environ["QUERY_STRING"],
+        "body": environ["wsgi.input"].read().decode(),
+        "content_type": environ.get("CONTENT_TYPE"),
+        "custom": environ.get("HTTP_X_CUSTOM"),
+    }
+    start_response("200 OK", [("Content-Type", "application/json")])
+    return [json.dumps(payload).encode()]
+
+
+class TestAsgiBridge(unittest.TestCase):
+
+    def test_request_is_translated_to_wsgi(self):
+        bridge = AsgiBridge(echo_app)
+        status, headers, body = call(
+            bridge, "/echo", method="POST", query=b"a=1",
+            headers=[("Content-Type", "text/plain"), ("X-Custom", "one"), ("X-Custom", "two")],
+            body_chunks=(b"hello ", b"world"),
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b"content-type"], b"application/json")
+        self.assertEqual(json.loads(body), {
+            "method": "POST", "path": "/echo", "query": "a=1", "body": "hello world",
+            "content_type": "text/plain", "custom": "one,two",
+        })
+
+    def test_oversized_body_is_rejected_without_running_the_app(self):
+        calls = []
+        bridge = AsgiBridge(lambda environ, start_response: calls.append(environ), max_body_size=4)
+        status, _, _ = call(bridge, "/", method="POST", body_chunks=(b"abc", b"def"))
+        self.assertEqual(status, 413)
+        self.assertEqual(calls, [])
+
+    def test_response_is_sent_chunk_by_chunk(self):
+        closed = []
+
+        class Body(list):
+            def close(self):
+                closed.append(True)
+
+        def chunked_app(environ, start_response):
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            return Body([b"one", b"", b"two"])
+
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+        asyncio.run(AsgiBridge(chunked_app)(scope, receive, send))
+        self.assertEqual([(m["body"], m["more_body"]) for m in sent[1:]],
+                         [(b"one", True), (b"two", True), (b"", False)])
+        self.assertEqual(closed, [True])
+
+    def test_disconnect_before_the_body_ends_skips_the_app(self):
+        messages = [{"type": "http.request", "body": b"part", "more_body": True}, {"type": "http.disconnect"}]
+        sent, wsgi_app = [], Mock()
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "POST", "path": "/", "headers": []}
+        asyncio.run(AsgiBridge(wsgi_app)(scope, receive, send))
+        wsgi_app.assert_not_called()
+        self.assertEqual(sent, [])
+
+    def test_blocking_views_run_in_a_bounded_pool(self):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def slow_app(environ, start_response):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.1)
+            with lock:
+                active[0] -= 1
+            start_response("200 OK", [])
+            return [b"ok"]
+
+        bridge = AsgiBridge(slow_app, max_workers=2)
+
+        async def run():
+            ticks = []
+
+            async def ticker():
+                for _ in range(5):
+                    ticks.append(time.monotonic())
+                    await asyncio.sleep(0.01)
+
+            results = await asyncio.gather(*(_call(bridge, "/") for _ in range(4)), ticker())
+            return results[:-1], ticks
+
+        results, ticks = asyncio.run(run())
+        self.assertEqual([status for status, _, _ in results], [200] * 4)
+        self.assertEqual(peak[0], 2)
+        self.assertEqual(len(ticks), 5)
+        self.assertLess(ticks[-1] - ticks[0], 0.1)
+
+    def test_lifespan_shuts_down_the_pool(self):
+        bridge = AsgiBridge(echo_app)
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        asyncio.run(bridge({"type": "lifespan"}, receive, send))
+        self.assertEqual(sent, ["lifespan.startup.complete", "lifespan.shutdown.complete"])
+
+    def test_lifespan_runs_the_startup_hook_and_reports_failures(self):
+        calls = []
+        for hook, expected in ((lambda: calls.append("up"), "lifespan.startup.complete"),
+                               (lambda: 1 / 0, "lifespan.startup.failed")):
+            bridge = AsgiBridge(echo_app, on_startup=hook)
+            messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+            sent = []
+
+            async def receive():
+                return messages.pop(0)
+
+            async def send(message):
+                sent.append(message["type"])
+
+            asyncio.run(bridge({"type": "lifespan"}, receive, send))
+            self.assertEqual(sent[0], expected)
+        self.assertEqual(calls, ["up"])
+
+
+class CountingVersions(dict):
+    """Version table that records every table read."""
+
+    def __init__(self, versions, reads):
+        super().__init__(versions)
+        self._reads = reads
+
+    def __getitem__(self, table):
+        self._reads.append(table)
+        return super().__getitem__(table)
+
+
+class TestAsgiFlaskRoutes(unittest.TestCase):
+
+    def setUp(self):
+        self.versions = {"spaces": 1, "users": 1, "bookings": 1}
+        sources = {table: (lambda table=table: self.versions[table]) for table in self.versions}
+        user_repo = UserMemoryRepository()
+        user_repo.save(User("U1", "Alice", "Smith", "Johnson"))
+        for patcher in (
+            patch.dict(app_module.data_versions, sources),
+            patch.dict(app_module._versions_seen, clear=True),
+            patch.object(app_module, "user_service", UserService(user_repo)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.bridge = AsgiBridge(app_module.app, poll_interval=0.02, data_versions=app_module.data_versions)
+
+    def long_poll(self, wait):
+        """Returns the headers of a long-poll on /api/v1/users for the current ETag."""
+        _, headers, _ = call(self.bridge, "/api/v1/users")
+        return [("If-None-Match", headers[b"etag"].decode()), ("Prefer", f"wait={wait}")]
+
+    def test_same_routes_as_the_flask_app(self):
+        status, headers, body = call(self.bridge, "/api/v1/users/U1")
+        expected = app_module.app.test_client().get("/api/v1/users/U1")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), expected.get_json())
+        self.assertEqual(headers[b"etag"], expected.headers["ETag"].encode())
+
+    def test_long_poll_returns_when_the_data_changes(self):
+        _, headers, _ = call(self.bridge, "/api/v1/users")
+        etag = headers[b"etag"].decode()
+
+        async def run():
+            async def write_later():
+                await asyncio.sleep(0.1)
+                self.versions["users"] += 1
+
+            started = time.monotonic()
+            result, _ = await asyncio.gather(
+                _call(self.bridge, "/api/v1/users", headers=[("If-None-Match", etag), ("Prefer", "wait=5")]),
+                write_later(),
+            )
+            return result, time.monotonic() - started
+
+        (status, headers, _), elapsed = asyncio.run(run())
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers[b"etag"].decode(), etag)
+        self.assertEqual(headers[b"preference-applied"], b"wait=5")
+        self.assertLess(elapsed, 2)
+
+    def test_long_poll_times_out_with_304(self):
+        _, headers, _ = call(self.bridge, "/api/v1/users")
+        status, _, body = call(self.bridge, "/api/v1/users",
+                               headers=[("If-None-Match", headers[b"etag"].decode()), ("Prefer", "wait=1")])
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+
+    def test_long_poll_runs_the_view_only_when_the_data_changes(self):
+        headers = self.long_poll(5)
+
+        async def run():
+            async def write_later():
+                await asyncio.sleep(0.3)
+                self.versions["users"] += 1
+
+            return await asyncio.gather(_call(self.bridge, "/api/v1/users", headers=headers), write_later())
+
+        with patch.object(self.bridge, "_run_wsgi", wraps=self.bridge._run_wsgi) as runs:
+            (status, _, _), _ = asyncio.run(run())
+        self.assertEqual(status, 200)
+        self.assertEqual(runs.call_count, 2)
+
+    def test_long_poll_stops_when_the_client_disconnects(self):
+        headers = self.long_poll(5)
+
+        async def run():
+            started = time.monotonic()
+            result = await _call(self.bridge, "/api/v1/users", headers=headers, disconnect_after=0.1)
+            return result, time.monotonic() - started
+
+        with patch.object(self.bridge, "_run_wsgi", wraps=self.bridge._run_wsgi) as runs:
+            result, elapsed = asyncio.run(run())
+        self.assertIsNone(result)
+        self.assertLess(elapsed, 2)
+        self.assertEqual(runs.call_count, 1)
+        self.assertEqual(self.bridge._watcher._waiters, 0)
+
+    def test_waiting_requests_share_one_poller(self):
+        headers = self.long_poll(1)
+        reads = []
+        self.versions = CountingVersions(self.versions, reads)
+
+        async def run():
+            return await asyncio.gather(*(_call(self.bridge, "/api/v1/users", headers=headers) for _ in range(5)))
+
+        results = asyncio.run(run())
+        self.assertEqual([status for status, _, _ in results], [304] * 5)
+        views, polls = 5, 1 / 0.02
+        self.assertLessEqual(reads.count("users"), views + polls + 1)
+
+    def test_without_data_versions_prefer_wait_is_ignored(self):
+        bridge = AsgiBridge(app_module.app)
+        started = time.monotonic()
+        status, headers, _ = call(bridge, "/api/v1/users", headers=self.long_poll(5))
+        self.assertEqual(status, 304)
+        self.assertNotIn(b"preference-applied", headers)
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_without_prefer_a_304_is_immediate(self):
+        _, headers, _ = call(self.bridge, "/api/v1/users")
+        started = time.monotonic()
+        status, _, _ = call(self.bridge, "/api/v1/users", headers=[("If-None-Match", headers[b"etag"].decode())])
+        self.assertEqual(status, 304)
+        self.assertLess(time.monotonic() - started, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -85,14 +85,19 @@ class MenuTestBase(unittest.TestCase):
         self.booking_service.list_bookings.return_value = [
             make_booking(),
         ]
+        self.space_service.iter_spaces.return_value = self.space_service.list_spaces.return_value
+        self.user_service.iter_users.return_value = self.user_service.list_users.return_value
+        self.booking_service.iter_bookings.return_value = self.booking_service.list_bookings.return_value
 
     def run_menu(self, inputs: list[str]) -> str:
         """Runs main() with patched services and captured I/O."""
         inputs_iter = iter(inputs)
 
-        with patch("presentation.menu.SpaceSQLiteRepository"), \
+        with patch("presentation.menu.migrate_database"), \
+             patch("presentation.menu.SpaceSQLiteRepository"), \
              patch("presentation.menu.UserSQLiteRepository"), \
              patch("presentation.menu.BookingSQLiteRepository"), \
+             patch("presentation.menu.AvailabilitySQLiteRepository"), \
              patch("presentation.menu.seed_all"), \
              patch("presentation.menu.SpaceService", return_value=self.space_service), \
              patch("presentation.menu.UserService", return_value=self.user_service), \
@@ -111,7 +116,7 @@ class MenuTestBase(unittest.TestCase):
 class TestOption1ListSpaces(MenuTestBase):
     def test_lists_all_spaces(self):
         output = self.run_menu(["1", "10"])
-        self.space_service.list_spaces.assert_called()
+        self.space_service.iter_spaces.assert_called_with(None, 21)
         self.assertIn("Conference Room", output)
         self.assertIn("Main Meeting Room", output)
 
@@ -123,7 +128,7 @@ class TestOption1ListSpaces(MenuTestBase):
 class TestOption2ListUsers(MenuTestBase):
     def test_lists_all_users(self):
         output = self.run_menu(["2", "10"])
-        self.user_service.list_users.assert_called()
+        self.user_service.iter_users.assert_called()
         self.assertIn("Alice Smith Johnson", output)
 
 
@@ -134,9 +139,29 @@ class TestOption2ListUsers(MenuTestBase):
 class TestOption3ListBookings(MenuTestBase):
     def test_lists_all_bookings(self):
         output = self.run_menu(["3", "10"])
-        self.booking_service.list_bookings.assert_called()
+        self.booking_service.iter_bookings.assert_called()
         self.assertIn("B1", output)
 
+    def test_long_listing_is_paged_with_after_cursor(self):
+        bookings = [make_booking(f"B{n:02d}") for n in range(1, 26)]
+        self.booking_service.iter_bookings.side_effect = lambda after, limit: [
+            b for b in bookings if after is None or b.booking_id > after
+        ][:limit]
+        output = self.run_menu(["3", "", "10"])
+        self.assertEqual(
+            self.booking_service.iter_bookings.call_args_list[-1].args, ("B20", 21)
+        )
+        self.assertIn("B25", output)
+
+    def test_paging_can_be_stopped(self):
+        bookings = [make_booking(f"B{n:02d}") for n in range(1, 26)]
+        self.booking_service.iter_bookings.side_effect = lambda after, limit: [
+            b for b in bookings if after is None or b.booking_id > after
+        ][:limit]
+        output = self.run_menu(["3", "q", "10"])
+        self.assertIn("B20", output)
+        self.assertNotIn("B21", output)
+
 
 # ---------------------------------------------------------------------------
 # Option 4 – Create booking